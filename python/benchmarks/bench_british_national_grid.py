@@ -0,0 +1,79 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Benchmark for the British National Grid <-> WGS84 conversion.
+
+Converts a synthetic set of property locations across Great Britain in both
+directions, through grid references, and fills a half-missing property
+frame; reports rows per second and the worst round-trip error.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from ..british_national_grid import (
+    check_control_points,
+    fill_property_coordinates,
+    format_grid_references,
+    grid_to_wgs84,
+    parse_grid_references,
+    wgs84_to_grid,
+)
+
+
+def _timed(label: str, n_rows: int, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"  {label}: {elapsed:.2f}s ({n_rows / elapsed / 1e6:.1f}M rows/s)")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    errors = check_control_points()
+    print("Control points: " + ", ".join(f"{check} {error:.3f} m" for check, error in errors.items()))
+
+    rng = np.random.default_rng(42)
+    easting = rng.uniform(100_000, 650_000, args.rows)
+    northing = rng.uniform(10_000, 1_200_000, args.rows)
+
+    print(f"{args.rows:,} rows:")
+    lat, lon = _timed("grid -> WGS84", args.rows, grid_to_wgs84, easting, northing)
+    e, n = _timed("WGS84 -> grid", args.rows, wgs84_to_grid, lat, lon)
+    print(f"  round-trip error: max {np.max(np.hypot(e - easting, n - northing)) * 1000:.2f} mm")
+    references = _timed("format references", args.rows, format_grid_references, easting, northing)
+    _timed("parse references", args.rows, parse_grid_references, references)
+
+    # Half the properties arrive with only a grid reference, half with only lat/lon
+    has_reference = rng.random(args.rows) < 0.5
+    frame = pd.DataFrame({
+        "latitude": np.where(has_reference, np.nan, lat),
+        "longitude": np.where(has_reference, np.nan, lon),
+        "british_national_grid": np.where(has_reference, references, None),
+    })
+    filled = _timed("fill property coordinates", args.rows, fill_property_coordinates, frame)
+    print(f"  filled: {filled}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Field lookup benchmark for the flat compiled field-path table.
+
+Runs 1M dotted-path lookups against the compiled table and against a
+walk of the nested schema, as PropertyCDM.get_field_info used to do.
+"""
+
+import argparse
+import random
+import time
+
+from ..mortgage_cdm import MortgageCDM
+from ..property_cdm import PropertyCDM
+
+
+def _walk(schema: dict, field_path: str) -> dict:
+    current = schema
+    for part in field_path.split('.'):
+        current = current[part]
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    for cdm in (PropertyCDM(), MortgageCDM()):
+        table = cdm._fields
+        paths = [rng.choice(table.paths) for _ in range(args.lookups)]
+
+        start = time.perf_counter()
+        for path in paths:
+            _walk(cdm.schema, path)
+        walk_s = time.perf_counter() - start
+
+        get = table.get
+        start = time.perf_counter()
+        for path in paths:
+            get(path)
+        table_s = time.perf_counter() - start
+
+        print(f"{type(cdm).__name__}: {len(table)} fields, {args.lookups:,} lookups")
+        print(f"  nested walk : {walk_s:.3f}s ({args.lookups / walk_s / 1e6:.2f}M/s)")
+        print(f"  field table : {table_s:.3f}s ({args.lookups / table_s / 1e6:.2f}M/s)")
+
+
+if __name__ == "__main__":
+    main()
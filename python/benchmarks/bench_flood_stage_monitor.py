@@ -0,0 +1,66 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Throughput benchmark for the streaming flood stage monitor.
+
+Streams 5-minute readings of random-walk river levels for thousands of
+gauges through FloodStageMonitor in batches and reports readings per second.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from ..flood_stage_monitor import FloodStageMonitor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--gauges", type=int, default=5000)
+    parser.add_argument("--readings", type=int, default=10_000_000)
+    parser.add_argument("--batch-size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    alert = rng.uniform(1.0, 2.0, args.gauges)
+    levels = np.column_stack([alert, alert + 0.5, alert + 1.0])
+    monitor = FloodStageMonitor([f"G{i:05d}" for i in range(args.gauges)], levels, hysteresis=0.05)
+
+    # Each batch holds consecutive 5-minute readings of every gauge
+    steps = args.batch_size // args.gauges
+    gauge = np.tile(np.arange(args.gauges), steps)
+    level = rng.uniform(0.5, 2.5, args.gauges)
+    step_ns = np.int64(300 * 10**9)
+
+    n_batches = args.readings // (steps * args.gauges)
+    elapsed = 0.0
+    n_events = 0
+    for batch in range(n_batches):
+        walk = level + np.cumsum(rng.normal(0.0, 0.02, (steps, args.gauges)), axis=0)
+        level = walk[-1]
+        times = (batch * steps + np.repeat(np.arange(steps, dtype=np.int64), args.gauges)) * step_ns
+
+        start = time.perf_counter()
+        events = monitor.process(gauge, times, walk.ravel())
+        elapsed += time.perf_counter() - start
+        n_events += len(events)
+
+    print(f"{args.gauges:,} gauges, {monitor.readings_processed:,} readings in batches of {steps * args.gauges:,}")
+    print(f"  {elapsed:.2f}s ({monitor.readings_processed / elapsed / 1e6:.2f}M readings/s), {n_events:,} crossings")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Scaling benchmark for physical risk swap gauge baskets.
+
+Validates and maps swaps holding a few and a few thousand gauges, in the
+legacy keyed layout and the parallel-array layout, for increasing maximum
+basket sizes; the cost should follow the gauges present, not the maximum.
+"""
+
+import argparse
+import time
+
+from ..physical_risk_swap_cdm import GaugeBasket, PhysicalRiskSwapCDM
+
+
+def make_swap(n_gauges: int, arrays: bool) -> dict:
+    """Return a raw swap record with n_gauges gauges in the requested basket layout."""
+    basket = GaugeBasket(range(1, n_gauges + 1), [f"GAUGE-{i:05d}" for i in range(n_gauges)],
+                         [100_000.0] * n_gauges)
+    gauge_set = {"Gauges": basket.to_record()} if arrays else basket.to_keyed()
+    return {"PhysicalSwap": {
+        "Header": {"TradeType": "ParametricGaugeBasket", "CounterParty": "001B456BCDEFGH67XY89",
+                   "PartyId": "549300A08LH2961IPN13"},
+        "GaugeSet": {"GaugeBasketSize": n_gauges, **gauge_set},
+    }}
+
+
+def _per_call_us(func, record, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(record)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'max size':>9} {'gauges':>7} {'layout':>7} {'validate us':>12} {'mapping us':>11}")
+    for max_size in (20, 1000, 10000):
+        cdm = PhysicalRiskSwapCDM(gauge_basket_size=max_size)
+        for n_gauges in (5, min(max_size, 5000)):
+            for arrays in (False, True):
+                record = make_swap(n_gauges, arrays)
+                validate_us = _per_call_us(cdm.validate_swap, record, args.iterations)
+                mapping_us = _per_call_us(cdm.create_swap_mapping, record, args.iterations)
+                print(f"{max_size:>9} {n_gauges:>7} {'arrays' if arrays else 'keyed':>7} "
+                      f"{validate_us:>12.1f} {mapping_us:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
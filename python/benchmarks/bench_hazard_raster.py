@@ -0,0 +1,93 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark for the memory-mapped hazard raster sampler.
+
+Writes a tiled ground-level raster and a categorical flood zone raster
+over Great Britain, then samples them at synthetic property locations
+clustered in a few regions (nearest and bilinear) and backfills the
+RiskAssessment columns, reporting points/s, tiles touched and peak RSS.
+"""
+
+import argparse
+import resource
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from ..hazard_raster import HazardRaster, backfill_risk_fields
+
+ORIGIN_LAT, ORIGIN_LON = 61.0, -8.0
+ZONES = ["Zone 1", "Zone 2", "Zone 3a", "Zone 3b"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=2_000_000)
+    parser.add_argument("--pixels", type=int, default=8_000, help="raster edge in pixels")
+    parser.add_argument("--tile-size", type=int, default=1_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    pixel_deg = (11.0 / args.pixels, 10.0 / args.pixels)
+    rows = np.arange(args.pixels, dtype=np.float32)[:, None]
+    cols = np.arange(args.pixels, dtype=np.float32)[None, :]
+    ground = (50.0 + 40.0 * np.sin(rows / 700.0) * np.cos(cols / 900.0)).astype(np.float32)
+    zones = np.digitize(ground, [15.0, 20.0, 25.0]).astype(np.int8)
+
+    # Properties clustered around a few towns, so only some tiles are touched
+    towns = rng.integers(0, 40, args.points)
+    town_lat = rng.uniform(50.5, 56.0, 40)[towns] + rng.normal(0, 0.1, args.points)
+    town_lon = rng.uniform(-4.5, 1.0, 40)[towns] + rng.normal(0, 0.1, args.points)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        HazardRaster.create(f"{tmp}/ground", ground, ORIGIN_LAT, ORIGIN_LON, pixel_deg, tile_size=args.tile_size)
+        HazardRaster.create(f"{tmp}/zones", zones, ORIGIN_LAT, ORIGIN_LON, pixel_deg, tile_size=args.tile_size,
+                            categories=ZONES)
+        print(f"write {args.pixels:,}^2 rasters: {time.perf_counter() - start:.2f}s")
+        del ground, zones
+
+        for method in ("nearest", "bilinear"):
+            raster = HazardRaster.open(f"{tmp}/ground")
+            start = time.perf_counter()
+            values = raster.sample(town_lat, town_lon, method=method)
+            elapsed = time.perf_counter() - start
+            n_tiles = (-(-args.pixels // args.tile_size)) ** 2
+            print(f"{method} {args.points:,} points: {elapsed:.2f}s ({args.points / elapsed:,.0f} points/s), "
+                  f"{raster.tiles_opened} of {n_tiles} tiles touched, mean {np.nanmean(values):.2f}")
+
+        properties = pd.DataFrame({
+            "property_id": np.char.add("P", np.arange(args.points).astype("U9")),
+            "latitude": town_lat,
+            "longitude": town_lon,
+            "ground_level_meters": np.where(rng.random(args.points) < 0.5, 12.0, 30.0),
+            "flood_zone": None,
+        })
+        rasters = {"ground_level_meters": HazardRaster.open(f"{tmp}/ground"),
+                   "flood_zone": HazardRaster.open(f"{tmp}/zones")}
+        start = time.perf_counter()
+        filled = backfill_risk_fields(properties, rasters)
+        print(f"backfill: {time.perf_counter() - start:.2f}s, filled {filled}")
+
+    # ru_maxrss is the process high-water mark in KB
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"peak RSS {peak:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
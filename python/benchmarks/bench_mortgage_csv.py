@@ -0,0 +1,129 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark for the chunked mortgage CSV feed loader.
+
+Writes synthetic feed files in the mortgage/mortgage-portfolio-csv.txt
+layout, streams them through MortgageFeedLoader and reports rows/s and
+peak RSS for two file sizes (which should match, the load being chunked).
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from ..mortgage_csv import MortgageFeedLoader
+
+FEED_HEADER = os.path.join(os.path.dirname(__file__), "..", "..", "mortgage", "mortgage-portfolio-csv.txt")
+
+BLOCK_ROWS = 100_000
+
+
+def feed_block(rng: np.random.Generator, n_rows: int) -> pd.DataFrame:
+    """Return n_rows synthetic feed rows."""
+    loan = rng.uniform(50_000, 600_000, n_rows).round(2)
+    purchase = (loan / rng.uniform(0.5, 0.95, n_rows)).round(2)
+    balance = (loan * rng.uniform(0.3, 1.0, n_rows)).round(2)
+    disbursal = np.datetime64("2015-01-01") + rng.integers(0, 3000, n_rows).astype("timedelta64[D]")
+    defaulted = rng.random(n_rows) < 0.02
+    return pd.DataFrame({
+        'snapshot_date': "2024-12-31",
+        'encrypted_loan_id': [f"L{i:010d}" for i in range(n_rows)],
+        'encrypted_member_id': [f"M{i:010d}" for i in range(n_rows)],
+        'disbursal_date': disbursal,
+        'original_loan_amount': loan,
+        'term': rng.choice([300, 360], n_rows),
+        'lending_rate': rng.uniform(0.02, 0.07, n_rows).round(4),
+        'spread': rng.uniform(0.005, 0.03, n_rows).round(4),
+        'rate_type': rng.choice(["Fixed", "Variable", "Tracker"], n_rows),
+        'maturity_date': disbursal + np.timedelta64(9131, "D"),
+        'principal_collected': (loan - balance).round(2),
+        'interest_collected': (loan * 0.1).round(2),
+        'total_number_of_payments': rng.integers(1, 120, n_rows),
+        'last_payment_date': "2024-12-01",
+        'outstanding_balance': balance,
+        'latest_status': np.where(defaulted, "Defaulted", "Current"),
+        'date_of_default': np.where(defaulted, "2024-06-30", ""),
+        'is_in_arrears': np.where(defaulted, "Y", "N"),
+        'days_past_due': np.where(defaulted, 180, 0),
+        'default_flag': np.where(defaulted, "Y", "N"),
+        'purchase_value': purchase,
+        'current_property_value': (purchase * rng.uniform(0.9, 1.4, n_rows)).round(2),
+        'ltv_ratio': (balance / purchase).round(4),
+        'property_type': rng.choice(["Detached", "Semi-Detached", "Terraced", "Flat"], n_rows),
+        'flood_risk_zone': rng.choice(["1", "2", "3a", "3b"], n_rows),
+        'flood_risk_score': rng.uniform(0, 10, n_rows).round(2),
+        'eps_score': rng.integers(1, 100, n_rows),
+        'property_address': "1 High Street",
+        'city': rng.choice(["London", "Leeds", "York", "Bristol"], n_rows),
+        'state_province': "England",
+        'zip_postal_code': "SW1A 1AA",
+        'country': "GB",
+        'latitude': rng.uniform(50.0, 55.0, n_rows).round(6),
+        'longitude': rng.uniform(-3.0, 1.0, n_rows).round(6),
+        'borrower_credit_score': rng.integers(400, 999, n_rows),
+        'borrower_income': rng.uniform(20_000, 200_000, n_rows).round(2),
+        'borrower_employment_status': rng.choice(["Employed", "Self-employed", "Retired"], n_rows),
+        'marital_status': rng.choice(["Single", "Married", "Divorced"], n_rows),
+        'boe_base_rate': 0.0475,
+        'prepayment_risk': rng.integers(1, 10, n_rows),
+        'refinance_incentive': rng.integers(1, 10, n_rows),
+    })
+
+
+def write_feed(path: str, n_rows: int) -> None:
+    """Write a feed file of n_rows rows by repeating one synthetic block."""
+    with open(FEED_HEADER, encoding="utf-8") as f:
+        header = f.readline().strip().split(",")
+    block = feed_block(np.random.default_rng(42), BLOCK_ROWS)[header].to_csv(index=False, header=False)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(",".join(header) + "\n")
+        for start in range(0, n_rows, BLOCK_ROWS):
+            rows = min(BLOCK_ROWS, n_rows - start)
+            f.write(block if rows == BLOCK_ROWS else "".join(block.splitlines(True)[:rows]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--chunk-rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    loader = MortgageFeedLoader(chunk_rows=args.chunk_rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in (args.rows // 10, args.rows):
+            path = os.path.join(tmp, f"feed_{n_rows}.csv")
+            write_feed(path, n_rows)
+
+            start = time.perf_counter()
+            rows = invalid = 0
+            for frame, errors in loader.iter_chunks(path):
+                rows += len(frame)
+                invalid += int(errors.any(axis=1).sum())
+            elapsed = time.perf_counter() - start
+            # ru_maxrss is the process high-water mark in KB
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"{rows:,} rows ({os.path.getsize(path) / 2**20:,.0f} MB): {elapsed:.2f}s "
+                  f"({rows / elapsed:,.0f} rows/s), {invalid:,} invalid, peak RSS {peak:.0f} MB")
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark for the streaming ORE portfolio XML exporter.
+
+Generates swap mappings lazily (so the book is never held in memory),
+writes them as one portfolio file sequentially and over shards in a
+process pool, and reports trades/s and peak RSS for each.
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+from ..ore_xml import write_swap_portfolio, write_swap_portfolio_parallel
+
+BASE_MAPPING = {
+    'trade_type': 'PhysicalRiskSwap', 'counter_party': '001B456BCDEFGH67XY89',
+    'party_id': '549300A08LH2961IPN13', 'valuation_date': '2024-12-19',
+    'protection_start': '2024-12-19', 'settles_accrual': True, 'pays_at_default_time': False,
+    'leg_type': 'Fixed', 'payer': True, 'currency': 'GBP', 'day_counter': 'A360',
+    'payment_convention': 'F', 'fixed_leg_rate': 0.0114, 'start_date': '2024-12-19',
+    'end_date': '2029-12-19', 'tenor': '3M', 'calendar': 'UK', 'convention': 'MF',
+    'term_convention': 'U', 'rule': 'Forward', 'gauge_set': 'ThamesRiver',
+}
+
+
+def swap_mappings(n_trades: int, basket_size: int = 5):
+    """Yield n_trades synthetic create_swap_mapping outputs."""
+    for n in range(n_trades):
+        mapping = dict(BASE_MAPPING, gauge_set_id=f"GS{n % 1000:04d}", notional=1_000_000.0 + n,
+                       gauge_basket_size=basket_size)
+        for i in range(1, basket_size + 1):
+            mapping[f"gauge_{i}_index"] = i
+            mapping[f"gauge_{i}_id"] = f"GAUGE-{(n + i) % 10000:05d}"
+            mapping[f"gauge_{i}_payout_severe_flood"] = 100000.0
+        yield mapping
+
+
+def _report(label: str, count: int, elapsed: float, path: str) -> None:
+    # ru_maxrss is the process high-water mark in KB
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"  {label}: {elapsed:.2f}s ({count / elapsed:,.0f} trades/s), "
+          f"{os.path.getsize(path) / 2**20:,.0f} MB, peak RSS {peak:.0f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trades", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--shard-size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    print(f"{args.trades:,} trades")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "portfolio.xml")
+        start = time.perf_counter()
+        count = write_swap_portfolio(path, swap_mappings(args.trades))
+        _report("sequential", count, time.perf_counter() - start, path)
+        sequential_size = os.path.getsize(path)
+        os.remove(path)
+
+        start = time.perf_counter()
+        count = write_swap_portfolio_parallel(path, swap_mappings(args.trades), max_workers=args.workers,
+                                              shard_size=args.shard_size)
+        _report(f"{args.workers} worker(s), {args.shard_size:,}-trade shards", count,
+                time.perf_counter() - start, path)
+        assert os.path.getsize(path) == sequential_size
+
+
+if __name__ == "__main__":
+    main()
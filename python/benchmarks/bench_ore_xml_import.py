@@ -0,0 +1,132 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark for the streaming ORE portfolio XML importer.
+
+Writes a portfolio of bespoke-basket trades modelled on
+physicalriskswap/Index_Credit_Default_Swap_Bespoke_Basket.xml, then
+streams it sequentially (reporting trades/s and peak RSS for two
+file sizes) and over byte-range shards in a process pool.
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+from ..ore_xml import iter_swap_records, iter_swap_records_parallel
+
+TRADE_TEMPLATE = """<Trade id="PRS_{n:08d}">
+    <TradeType>PhysicalRiskSwap</TradeType>
+    <Envelope>
+        <CounterParty>001B456BCDEFGH67XY89</CounterParty>
+        <NettingSetId>GS{gauge_set:04d}</NettingSetId>
+        <AdditionalFields>
+            <party_id>549300A08LH2961IPN13</party_id>
+            <valuation_date>2024-12-19</valuation_date>
+        </AdditionalFields>
+    </Envelope>
+    <PhysicalRiskSwapData>
+        <CreditCurveId>ThamesRiver</CreditCurveId>
+        <SettlesAccrual>Y</SettlesAccrual>
+        <PaysAtDefaultTime>N</PaysAtDefaultTime>
+        <ProtectionStart>20241219</ProtectionStart>
+        <LegData>
+            <LegType>Fixed</LegType>
+            <Payer>true</Payer>
+            <Currency>GBP</Currency>
+            <Notionals>
+                <Notional>{notional}.000000</Notional>
+            </Notionals>
+            <DayCounter>A360</DayCounter>
+            <PaymentConvention>F</PaymentConvention>
+            <FixedLegData>
+                <Rates>
+                    <Rate>0.0114</Rate>
+                </Rates>
+            </FixedLegData>
+            <ScheduleData>
+                <Rules>
+                    <StartDate>20241219</StartDate>
+                    <EndDate>20291219</EndDate>
+                    <Tenor>3M</Tenor>
+                    <Calendar>UK</Calendar>
+                    <Convention>MF</Convention>
+                    <TermConvention>U</TermConvention>
+                    <Rule>Forward</Rule>
+                    <EndOfMonth/>
+                    <FirstDate/>
+                    <LastDate/>
+                </Rules>
+            </ScheduleData>
+        </LegData>
+        <BasketData>
+{names}        </BasketData>
+    </PhysicalRiskSwapData>
+</Trade>
+"""
+
+NAME_TEMPLATE = """            <Name>
+                <IssuerId>GAUGE-{gauge:05d}</IssuerId>
+                <Notional>100000.0</Notional>
+            </Name>
+"""
+
+
+def write_portfolio(path: str, n_trades: int, basket_size: int = 5) -> None:
+    """Write a synthetic portfolio file of n_trades trades."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<Portfolio>\n")
+        for n in range(n_trades):
+            names = "".join(NAME_TEMPLATE.format(gauge=(n + i) % 10000) for i in range(basket_size))
+            f.write(TRADE_TEMPLATE.format(n=n, gauge_set=n % 1000, notional=1_000_000 + n, names=names))
+        f.write("</Portfolio>\n")
+
+
+def _stream(path: str):
+    start = time.perf_counter()
+    count = sum(1 for _ in iter_swap_records(path))
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is the process high-water mark in KB: it only grows if a run needs more
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return count, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trades", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--shard-mb", type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_trades in (args.trades // 10, args.trades):
+            path = os.path.join(tmp, f"portfolio_{n_trades}.xml")
+            write_portfolio(path, n_trades)
+            count, elapsed, peak = _stream(path)
+            print(f"{count:,} trades ({os.path.getsize(path) / 2**20:.0f} MB): sequential {elapsed:.2f}s "
+                  f"({count / elapsed:,.0f} trades/s), peak RSS {peak / 2**20:.0f} MB")
+
+        start = time.perf_counter()
+        count = sum(1 for _ in iter_swap_records_parallel(path, max_workers=args.workers,
+                                                          shard_bytes=args.shard_mb * 2**20))
+        elapsed = time.perf_counter() - start
+        print(f"{count:,} trades: {args.workers} worker(s) over {args.shard_mb} MB shards {elapsed:.2f}s "
+              f"({count / elapsed:,.0f} trades/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Scaling benchmark for the parallel CDM executor.
+
+Validates a synthetic mortgage portfolio with validate_mortgage on 1, 2,
+4, ... workers (up to --max-workers) and reports throughput and speed-up
+over the serial loop.
+"""
+
+import argparse
+import os
+import time
+
+from ..mortgage_cdm import MortgageCDM
+from ..parallel import ParallelCDMExecutor
+from .bench_mortgage_batch import make_portfolio
+
+
+def _prune(node: dict) -> dict:
+    pruned = {}
+    for key, value in node.items():
+        if isinstance(value, dict):
+            value = _prune(value)
+            if value:
+                pruned[key] = value
+        elif value is not None:
+            pruned[key] = value
+    return pruned
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=min(16, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    cdm = MortgageCDM()
+    records = [_prune(cdm._fields.unmap_record(row)) for row in make_portfolio(args.records).to_dict("records")]
+
+    start = time.perf_counter()
+    for record in records:
+        cdm.validate_mortgage(record)
+    serial_s = time.perf_counter() - start
+    print(f"{args.records:,} records, chunk size {args.chunk_size}")
+    print(f"  serial     : {serial_s:.2f}s ({args.records / serial_s / 1e3:.0f}k rec/s)")
+
+    workers = 1
+    while workers <= args.max_workers:
+        with ParallelCDMExecutor('mortgage', max_workers=workers, chunk_size=args.chunk_size) as executor:
+            executor.map('validate_mortgage', records[:workers])  # start the workers
+            start = time.perf_counter()
+            executor.map('validate_mortgage', records)
+            elapsed = time.perf_counter() - start
+        print(f"  {workers:2d} workers : {elapsed:.2f}s ({args.records / elapsed / 1e3:.0f}k rec/s, "
+              f"{serial_s / elapsed:.2f}x)")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark for the property grid spatial index.
+
+Builds an index over synthetic properties clustered around UK towns,
+then times bulk radius and k-nearest queries, a polygon query, an
+incremental add and a save/open round trip, reporting peak RSS.
+"""
+
+import argparse
+import resource
+import tempfile
+import time
+
+import numpy as np
+
+from ..property_spatial_index import PropertySpatialIndex
+
+
+def make_points(n_points: int, rng: np.random.Generator):
+    """Return (lat, lon) of n_points properties clustered around random town centres."""
+    n_towns = max(1, n_points // 20_000)
+    town_lat = rng.uniform(50.2, 57.5, n_towns)
+    town_lon = rng.uniform(-5.0, 1.5, n_towns)
+    town = rng.integers(0, n_towns, n_points)
+    spread = rng.uniform(0.02, 0.15, n_towns)[town]
+    return town_lat[town] + rng.normal(0, 1, n_points) * spread, town_lon[town] + rng.normal(0, 1, n_points) * spread
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--properties", type=int, default=10_000_000)
+    parser.add_argument("--queries", type=int, default=100_000)
+    parser.add_argument("--radius-km", type=float, default=1.0)
+    parser.add_argument("--k", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    lat, lon = make_points(args.properties, rng)
+    ids = np.char.add("P", np.arange(args.properties).astype("U9"))
+
+    start = time.perf_counter()
+    index = PropertySpatialIndex.from_arrays(ids, lat, lon)
+    print(f"build {args.properties:,} properties: {time.perf_counter() - start:.2f}s")
+
+    # Query at existing properties so the windows land in populated areas
+    sample = rng.integers(0, args.properties, args.queries)
+    q_lat, q_lon = lat[sample] + rng.normal(0, 0.005, args.queries), lon[sample] + rng.normal(0, 0.005, args.queries)
+
+    start = time.perf_counter()
+    result = index.query_radius(q_lat, q_lon, args.radius_km)
+    elapsed = time.perf_counter() - start
+    print(f"radius {args.radius_km} km x {args.queries:,} queries: {elapsed:.2f}s "
+          f"({args.queries / elapsed:,.0f} queries/s), {len(result.rows):,} matches")
+
+    start = time.perf_counter()
+    _, distances = index.query_knn(q_lat, q_lon, args.k)
+    elapsed = time.perf_counter() - start
+    print(f"k={args.k} nearest x {args.queries:,} queries: {elapsed:.2f}s, "
+          f"median k-th distance {np.median(distances[:, -1]):.3f} km")
+
+    c_lat, c_lon = q_lat[0], q_lon[0]
+    polygon = [(c_lat - 0.05, c_lon - 0.08), (c_lat + 0.06, c_lon - 0.02), (c_lat + 0.02, c_lon + 0.09),
+               (c_lat - 0.04, c_lon + 0.05)]
+    start = time.perf_counter()
+    inside = index.query_polygon(polygon)
+    print(f"polygon: {time.perf_counter() - start:.3f}s, {len(inside):,} properties")
+
+    n_new = max(1, args.properties // 100)
+    new_lat, new_lon = make_points(n_new, rng)
+    start = time.perf_counter()
+    index.add(np.char.add("N", np.arange(n_new).astype("U9")), new_lat, new_lon)
+    print(f"add {n_new:,} properties: {time.perf_counter() - start:.2f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        index.save(tmp)
+        save_time = time.perf_counter() - start
+        start = time.perf_counter()
+        reopened = PropertySpatialIndex.open(tmp)
+        open_time = time.perf_counter() - start
+        start = time.perf_counter()
+        reopened.query_radius(q_lat, q_lon, args.radius_km)
+        print(f"save {save_time:.2f}s, open {open_time * 1000:.1f} ms, "
+              f"radius queries on the memory-mapped index {time.perf_counter() - start:.2f}s")
+        del reopened
+
+    # ru_maxrss is the process high-water mark in KB
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"peak RSS {peak:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
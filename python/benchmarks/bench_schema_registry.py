@@ -0,0 +1,69 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Startup and instantiation benchmark for the compiled schema registry.
+
+Compares the cost of building each CDM schema from its literal definition
+(what every instance used to pay) with the cost of instantiating a CDM
+class once the compiled schema is held by the registry.
+"""
+
+import argparse
+import time
+
+from ..flood_gauge_cdm import FloodGaugeCDM
+from ..mortgage_cdm import MortgageCDM
+from ..physical_risk_swap_cdm import PhysicalRiskSwapCDM
+from ..property_cdm import PropertyCDM
+from ..schema_registry import clear_schema_registry
+from ..tc_event_cdm import TCEventCDM
+from ..tc_event_ts_cdm import TCEventTSCDM
+
+CDM_CLASSES = [MortgageCDM, PropertyCDM, FloodGaugeCDM, TCEventCDM, TCEventTSCDM, PhysicalRiskSwapCDM]
+
+
+def _per_call_us(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=10_000)
+    args = parser.parse_args()
+
+    clear_schema_registry()
+    print(f"{'CDM':<22}{'first (us)':>12}{'rebuild (us)':>14}{'instance (us)':>15}{'speedup':>10}")
+    for cls in CDM_CLASSES:
+        start = time.perf_counter()
+        cls()
+        first_us = (time.perf_counter() - start) * 1e6
+
+        if cls is TCEventTSCDM:
+            rebuild = lambda: cls._build_schema(None)
+        elif cls is PhysicalRiskSwapCDM:
+            rebuild = lambda: cls._build_schema(20)
+        else:
+            rebuild = cls._build_schema
+        rebuild_us = _per_call_us(rebuild, args.iterations)
+        instance_us = _per_call_us(cls, args.iterations)
+        print(f"{cls.__name__:<22}{first_us:>12.1f}{rebuild_us:>14.2f}{instance_us:>15.2f}"
+              f"{rebuild_us / instance_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
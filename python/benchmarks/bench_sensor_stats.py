@@ -0,0 +1,68 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark for the incremental SensorStats aggregator.
+
+Streams 15-minute readings for a set of gauges through the aggregator and
+times the updates, a state save and a restore.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from ..sensor_stats import SensorStatsAggregator
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--gauges", type=int, default=1000)
+    parser.add_argument("--readings", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    gauges = [{'gauge_id': f"G{i:05d}", 'severe_flood_warning': 2.0} for i in range(args.gauges)]
+    aggregator = SensorStatsAggregator.from_gauge_mappings(gauges, hysteresis=0.05)
+
+    steps = args.readings // args.gauges
+    ids = np.tile([g['gauge_id'] for g in gauges], steps)
+    times = np.repeat(np.arange(steps, dtype=np.int64) * 900 * 10**9, args.gauges)
+    levels = 1.0 + np.cumsum(rng.normal(0.0, 0.05, (steps, args.gauges)), axis=0).ravel() % 1.5
+
+    start = time.perf_counter()
+    applied = aggregator.update_many(ids, times, levels)
+    update_s = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "sensor_stats.json")
+        start = time.perf_counter()
+        aggregator.save(path)
+        save_s = time.perf_counter() - start
+        start = time.perf_counter()
+        SensorStatsAggregator.load(path)
+        load_s = time.perf_counter() - start
+
+    records = aggregator.updated_records()
+    print(f"{args.gauges:,} gauges, {applied:,} readings")
+    print(f"  updates : {update_s:.2f}s ({applied / update_s / 1e6:.2f}M readings/s)")
+    print(f"  save    : {save_s * 1e3:.1f} ms, load: {load_s * 1e3:.1f} ms")
+    print(f"  {len(records):,} updated records, e.g. {records[0]}")
+
+
+if __name__ == "__main__":
+    main()
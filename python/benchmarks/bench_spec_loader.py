@@ -0,0 +1,69 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Cold versus warm start benchmark for the specification CSV loader.
+
+Loads the spec CSVs kept in the repository once with an empty cache
+directory (CSV parsing) and then again from the on-disk cache.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from ..spec_loader import load_spec_schema
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SPEC_FILES = [
+    "hazard/Flood_Gauge_CDM v1.csv",
+    "mortgage/Mortgage_CDM v5.csv",
+    "property/Property_CDM_v9.csv",
+    "property/Commercial_Property_CDM_v1.csv",
+    "insurance/Flood_insurance_CDM v2.csv",
+    "insurance/Household_insurance_CDM v2.csv",
+    "physicalriskswap/Physical_Risk_Swap_CDM v1.csv",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    paths = [os.path.join(REPO_ROOT, name) for name in SPEC_FILES]
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for path in paths:
+                load_spec_schema(path, use_cache=False)
+        cold_s = (time.perf_counter() - start) / args.repeat
+
+        for path in paths:
+            load_spec_schema(path, cache_dir)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for path in paths:
+                load_spec_schema(path, cache_dir)
+        warm_s = (time.perf_counter() - start) / args.repeat
+
+    print(f"{len(paths)} spec files")
+    print(f"  parse CSV  : {cold_s * 1e3:.2f} ms")
+    print(f"  warm cache : {warm_s * 1e3:.2f} ms ({cold_s / warm_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
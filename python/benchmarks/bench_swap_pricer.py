@@ -0,0 +1,75 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Throughput benchmark for the physical risk swap Monte Carlo pricer.
+
+Prices a 5-year quarterly swap on a basket of gauges scattered along a
+river corridor and reports PV, standard error and paths per second for an
+increasing number of worker processes.
+"""
+
+import argparse
+
+import numpy as np
+
+from ..flood_gauge_cdm import FloodGaugeCDM
+from ..physical_risk_swap_cdm import PhysicalRiskSwapCDM
+from ..swap_pricer import SwapMonteCarloPricer
+
+
+def make_swap(n_gauges: int, seed: int = 42):
+    """Return (swap mapping, gauge mappings) for a synthetic gauge basket."""
+    rng = np.random.default_rng(seed)
+    gauge_cdm = FloodGaugeCDM()
+    swap_cdm = PhysicalRiskSwapCDM(gauge_basket_size=n_gauges)
+    gauges = [gauge_cdm.create_gauge_mapping({"FloodGauge": {
+        "Header": {"GaugeID": f"GAUGE-{i:04d}"},
+        "SensorStats": {"FrequencyExceedLevel3": int(rng.integers(0, 3))},
+        "SensorDetails": {"GaugeInformation": {
+            "GaugeLatitude": 51.5 + rng.normal(0.0, 0.2),
+            "GaugeLongitude": -1.5 + 1.5 * i / n_gauges + rng.normal(0.0, 0.05),
+        }},
+    }}) for i in range(n_gauges)]
+    swap = swap_cdm.create_swap_mapping({"PhysicalSwap": {
+        "Header": {"ValuationDate": "2024-12-19", "GaugeSetID": "ThamesRiver", "SettlesAccrual": True},
+        "LegData": {"LegType": "Fixed", "Payer": True, "Currency": "GBP", "Notional": 100_000_000,
+                    "DayCounter": "A360", "FixedLegRate": 0.0114},
+        "ScheduleData": {"StartDate": "2024-12-19", "EndDate": "2029-12-19", "Tenor": "3M"},
+        "GaugeSet": {"GaugeBasketSize": n_gauges, **{
+            f"Gauge{i + 1}": {"GaugeIndex": i + 1, "GaugeID": f"GAUGE-{i:04d}", "PayoutSevereFlood": 100_000}
+            for i in range(n_gauges)}},
+    }})
+    return swap, gauges
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--gauges", type=int, default=90)
+    parser.add_argument("--paths", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    swap, gauges = make_swap(args.gauges)
+    pricer = SwapMonteCarloPricer(swap, gauges, discount_rate=0.04)
+    print(f"{args.gauges} gauges x {pricer.n_periods} periods, {args.paths:,} paths")
+    for workers in args.workers:
+        result = pricer.price(args.paths, seed=7, max_workers=workers, batch_size=args.batch_size)
+        print(f"  {workers} worker(s): PV {result['pv']:,.0f} +/- {result['std_error']:,.0f}, "
+              f"{result['paths_per_second']:,.0f} paths/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark for the swap schedule engine.
+
+Generates the schedules of a trade book whose trades share a small set of
+terms, trade by trade without the memo and then for the whole book at
+once, cold and with the memo warm.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from ..swap_schedule import ScheduleEngine
+
+
+def make_book(n_trades: int, n_terms: int, seed: int = 42) -> list:
+    """Return create_swap_mapping-like schedule fields for a synthetic trade book."""
+    rng = np.random.default_rng(seed)
+    starts = np.datetime64("2024-01-01") + rng.integers(0, 365, n_terms)
+    years = rng.integers(1, 11, n_terms)
+    terms = [{
+        "start_date": str(start),
+        "end_date": str(start + np.timedelta64(int(365.25 * n), "D")),
+        "tenor": str(rng.choice(["3M", "6M", "1Y"])),
+        "calendar": str(rng.choice(["UK", "TARGET", "US", "UK,US"])),
+        "convention": "MF",
+        "term_convention": "U",
+        "rule": str(rng.choice(["Forward", "Backward", "CDS2015"])),
+        "day_counter": str(rng.choice(["A360", "A365F", "30/360", "ActAct"])),
+        "payment_convention": "F",
+    } for start, n in zip(starts, years)]
+    return [dict(terms[i]) for i in rng.integers(0, n_terms, n_trades)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trades", type=int, default=100_000)
+    parser.add_argument("--terms", type=int, default=500)
+    parser.add_argument("--loop-trades", type=int, default=2_000)
+    args = parser.parse_args()
+
+    book = make_book(args.trades, args.terms)
+
+    engine = ScheduleEngine(max_cached=0)
+    engine.schedules(book[:1])
+    start = time.perf_counter()
+    for swap in book[:args.loop_trades]:
+        engine.schedule(swap)
+    loop_s = (time.perf_counter() - start) / args.loop_trades * args.trades
+
+    engine = ScheduleEngine()
+    start = time.perf_counter()
+    periods = engine.schedules(book)
+    cold_s = time.perf_counter() - start
+    start = time.perf_counter()
+    engine.schedules(book)
+    warm_s = time.perf_counter() - start
+
+    print(f"{args.trades:,} trades, {args.terms} distinct terms, {len(periods):,} periods")
+    print(f"  per trade (est.) : {loop_s:.2f}s")
+    print(f"  book, cold       : {cold_s:.2f}s ({loop_s / cold_s:.0f}x)")
+    print(f"  book, warm memo  : {warm_s:.2f}s ({loop_s / warm_s:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
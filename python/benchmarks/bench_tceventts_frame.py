@@ -0,0 +1,78 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+DataFrame benchmark for TC event timeseries.
+
+Builds a DataFrame from synthetic mapped timeseries entries with the
+existing to_dataframe and with to_typed_dataframe, and reports build time
+and memory footprint (deep) of both.
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from ..tc_event_ts_cdm import TCEventTSCDM
+
+
+def make_entries(cdm: TCEventTSCDM, n_events: int, n_steps: int, seed: int = 42) -> list:
+    """Build mapped timeseries entries: n_events tracks of n_steps 6-hourly steps."""
+    rng = random.Random(seed)
+    variables = [col.column for col in cdm._fields.columns if col.field.type == "decimal"]
+    start = datetime(2024, 8, 1)
+    entries = []
+    for event in range(n_events):
+        event_id = f"AL{event:04d}"
+        for step in range(n_steps):
+            entry = {
+                'event_id': event_id,
+                'time': (start + timedelta(hours=6 * step)).isoformat(),
+                'lead_time': 6 * step,
+            }
+            for name in variables:
+                entry[name] = rng.uniform(0.0, 1000.0)
+            entries.append(entry)
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--steps", type=int, default=1000)
+    args = parser.parse_args()
+
+    cdm = TCEventTSCDM()
+    entries = make_entries(cdm, args.events, args.steps)
+
+    start = time.perf_counter()
+    legacy = cdm.to_dataframe(entries)
+    legacy_s = time.perf_counter() - start
+    legacy_mb = legacy.memory_usage(deep=True).sum() / 1e6
+    del legacy
+
+    start = time.perf_counter()
+    typed = cdm.to_typed_dataframe(entries)
+    typed_s = time.perf_counter() - start
+    typed_mb = typed.memory_usage(deep=True).sum() / 1e6
+
+    print(f"{len(entries):,} entries x {typed.shape[1]} columns")
+    print(f"  to_dataframe       : {legacy_s:.2f}s, {legacy_mb:,.1f} MB")
+    print(f"  to_typed_dataframe : {typed_s:.2f}s, {typed_mb:,.1f} MB "
+          f"({legacy_mb - typed_mb:,.1f} MB saved, {legacy_mb / typed_mb:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
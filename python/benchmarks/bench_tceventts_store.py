@@ -0,0 +1,74 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Open and slice benchmark for the memory-mapped TC timeseries cube store.
+
+Creates a synthetic store, then times opening it, reducing one variable
+across all events, and loading a single event track.
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from ..tc_event_ts_store import TCEventTSCubeStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--steps", type=int, default=480)
+    parser.add_argument("--path", default=None, help="Store directory (default: temporary)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.path or tmp_dir
+        event_ids = [f"AL{i:05d}" for i in range(args.events)]
+        times = pd.date_range("2024-06-01", periods=args.steps, freq="6h")
+
+        start = time.perf_counter()
+        store = TCEventTSCubeStore.create(path, event_ids, times)
+        rng = np.random.default_rng(42)
+        create_s = time.perf_counter() - start
+        for name in store.variables:
+            store.writable_variable(name)[...] = rng.random((args.events, args.steps), dtype=np.float32)
+        store.flush()
+        write_s = time.perf_counter() - start - create_s
+        size_mb = store.cube.nbytes / 1e6
+        del store
+
+        start = time.perf_counter()
+        store = TCEventTSCubeStore.open(path)
+        open_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        peak_t2m = np.nanmax(store.variable("t2m"), axis=1)
+        variable_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        track = store.to_frame(event_ids[len(event_ids) // 2])
+        event_s = time.perf_counter() - start
+
+        print(f"cube {store.shape} = {size_mb:,.0f} MB (created in {create_s * 1e3:.2f} ms, written in {write_s:.2f}s)")
+        print(f"  open                      : {open_s * 1e3:.2f} ms")
+        print(f"  t2m peak over all events  : {variable_s * 1e3:.2f} ms ({peak_t2m.shape[0]:,} events)")
+        print(f"  one event, all variables  : {event_s * 1e3:.2f} ms {track.shape}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Throughput benchmark for the Holland wind-field engine.
+
+Computes peak gusts for a synthetic property portfolio scattered around
+a synthetic 6-hourly track and reports property x step cells per second.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from ..wind_field import HollandWindField, track_from_timeseries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--properties", type=int, default=1_000_000)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--max-cells", type=int, default=250_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    steps = np.arange(args.steps)
+    track = track_from_timeseries(pd.DataFrame({
+        'time': pd.date_range("2024-08-01", periods=args.steps, freq="6h"),
+        'lat': 20.0 + 0.1 * steps,
+        'lon': -75.0 - 0.05 * steps,
+        'mrr': 30.0 + 0.1 * steps,
+        'msl': 96000.0 + 20.0 * steps,
+    }))
+    prop_lat = rng.uniform(20.0, 40.0, args.properties)
+    prop_lon = rng.uniform(-90.0, -70.0, args.properties)
+
+    engine = HollandWindField(max_cells=args.max_cells)
+    start = time.perf_counter()
+    peak, _ = engine.peak_gusts(prop_lat, prop_lon, track)
+    elapsed = time.perf_counter() - start
+
+    cells = args.properties * args.steps
+    print(f"{args.properties:,} properties x {args.steps} steps = {cells / 1e6:,.0f}M cells")
+    print(f"  peak gusts : {elapsed:.1f}s ({cells / elapsed / 1e6:.1f}M cells/s), "
+          f"max {peak.max():.1f} m/s, {(peak > 33).sum():,} properties above 33 m/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,537 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Vectorized British National Grid <-> WGS84 conversion.
+
+Conversions follow the Ordnance Survey "A guide to coordinate systems in
+Great Britain": the National Grid transverse Mercator projection on the
+Airy 1830 ellipsoid (OSGB36), and a 7-parameter Helmert transformation
+between OSGB36 and WGS84 through geocentric Cartesian coordinates. Every
+step is NumPy array maths, including grid reference letters ("TG 51409
+13177") and their parsing, so millions of rows convert without per-row
+Python calls.
+
+The projection agrees with the OS worked example to the millimetre and
+round trips to within a centimetre. The single Helmert transformation is
+the OS's approximation to OSTN15 and is good to about 5 m across Great
+Britain (checked against the OSTN15 test points), which is ample for
+locating a property but not for surveying. check_control_points asserts
+both bounds.
+
+fill_property_coordinates fills whichever of the PropertyCDM Location
+columns (latitude/longitude or british_national_grid) is missing.
+"""
+
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Ellipsoids (semi-major axis a, semi-minor axis b) in metres
+AIRY_1830 = (6377563.396, 6356256.909)
+WGS84 = (6378137.000, 6356752.314245)
+
+# National Grid true origin and scale factor on the central meridian
+NATIONAL_GRID = {
+    "scale": 0.9996012717,
+    "lat0": np.radians(49.0),
+    "lon0": np.radians(-2.0),
+    "easting0": 400000.0,
+    "northing0": -100000.0,
+}
+
+# WGS84 -> OSGB36 Helmert parameters: translations (m), scale (ppm), rotations (arc-seconds)
+HELMERT_WGS84_TO_OSGB36 = {
+    "tx": -446.448, "ty": 125.157, "tz": -542.060,
+    "s_ppm": 20.4894,
+    "rx": -0.1502, "ry": -0.2470, "rz": -0.8421,
+}
+
+# National Grid extent in metres
+GRID_EXTENT = (700000.0, 1300000.0)
+
+# Control points of the projection from the OS guide's worked examples:
+# (OSGB36 latitude, OSGB36 longitude) in degrees and (easting, northing) in metres
+CONTROL_POINTS = [
+    ((52.0 + 39.0 / 60 + 27.2531 / 3600, 1.0 + 43.0 / 60 + 4.5177 / 3600), (651409.903, 313177.270)),
+]
+
+# OSTN15 test points published by the OS (OSTN15_OSGM15 test input/output):
+# (name, ETRS89 latitude, ETRS89 longitude) in degrees and (easting, northing)
+# in metres. ETRS89 and WGS84 agree to within a metre in Great Britain.
+OSTN15_TEST_POINTS = [
+    ("TP01", 49.92226393730, -6.29977752014, 91492.146, 11318.804),
+    ("TP02", 49.96006137820, -5.20304609998, 170370.718, 11572.405),
+    ("TP03", 50.43885825610, -4.10864563561, 250359.811, 62016.569),
+    ("TP04", 50.57563665000, -1.29782277163, 449816.371, 75335.861),
+    ("TP05", 50.93127937910, -1.45051433700, 438710.920, 114792.250),
+    ("TP06", 51.40078220140, -3.55128349240, 292184.870, 168003.465),
+    ("TP07", 51.37447025550, 1.44454730409, 639821.835, 169565.858),
+    ("TP08", 51.42754743020, -2.54407618349, 362269.981, 169978.690),
+    ("TP09", 51.48936564950, -0.11992557180, 530624.964, 178388.464),
+    ("TP10", 51.85890896400, -4.30852476960, 241124.584, 220332.641),
+    ("TP11", 51.89436637350, 0.89724327012, 599445.590, 225722.826),
+    ("TP12", 52.25529381630, -2.15458614387, 389544.190, 261912.153),
+    ("TP13", 52.25160951230, -0.91248956970, 474335.969, 262047.755),
+    ("TP14", 52.75136687170, 0.40153547065, 562180.547, 319784.995),
+    ("TP15", 52.96219109410, -1.19747655922, 454002.834, 340834.943),
+    ("TP16", 53.34480280190, -2.64049320810, 357455.843, 383290.436),
+    ("TP17", 53.41628516040, -4.28918069756, 247958.971, 393492.909),
+    ("TP18", 53.41630925420, -4.28917792869, 247959.241, 393495.583),
+    ("TP19", 53.77911025760, -3.04045490691, 331534.564, 431920.794),
+    ("TP20", 53.80021519630, -1.66379168242, 422242.186, 433818.701),
+    ("TP21", 54.08666318080, -4.63452168212, 227778.330, 468847.388),
+    ("TP22", 54.11685144290, -0.07773133187, 525745.670, 470703.214),
+    ("TP23", 54.32919541010, -4.38849118133, 244780.636, 495254.887),
+    ("TP24", 54.89542340420, -2.93827741149, 339921.145, 556034.761),
+    ("TP25", 54.97912273660, -1.61657685184, 424639.355, 565012.703),
+    ("TP26", 55.85399952950, -4.29649016251, 256340.925, 664697.269),
+    ("TP27", 55.92478265510, -3.29479219337, 319188.434, 670947.534),
+    ("TP28", 57.00606696050, -5.82836691850, 167634.202, 797067.144),
+    ("TP29", 57.13902518960, -2.04856030746, 397160.491, 805349.736),
+    ("TP30", 57.48625000720, -4.21926398555, 267056.768, 846176.972),
+    ("TP31", 57.81351838410, -8.57854456076, 9587.901, 899448.996),
+    ("TP32", 58.21262247180, -7.59255560556, 71713.129, 938516.404),
+    ("TP33", 58.51560361300, -6.26091455533, 151968.642, 966483.780),
+    ("TP34", 58.58120461280, -3.72631022121, 299721.879, 967202.990),
+    ("TP35", 59.03743871190, -3.21454001115, 330398.311, 1017347.013),
+    ("TP36", 59.09335035320, -4.41757674598, 261596.767, 1025447.599),
+    ("TP37", 59.09671617400, -5.82799339844, 180862.449, 1029604.111),
+    ("TP38", 59.53470794490, -1.62516966058, 421300.513, 1072147.236),
+    ("TP39", 59.85409913890, -1.27486910356, 440725.060, 1107878.445),
+    ("TP40", 60.13308091660, -2.07382822798, 395999.656, 1138728.948),
+]
+
+# Accuracy of the Helmert transformation against OSTN15 in metres
+HELMERT_ACCURACY_M = 5.0
+
+_LETTERS = "ABCDEFGHJKLMNOPQRSTUVWXYZ"  # no I
+
+
+def _grid_square_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return the 100 km square letters by (northing, easting) index, the
+    (easting, northing) index of each letter pair (-1 outside the grid) and
+    the letter index of each ASCII code (-1 for non-letters and I).
+    """
+    names = np.empty((13, 7), dtype="U2")
+    offsets = np.full((25, 25, 2), -1, dtype=np.int64)
+    for n100k in range(13):
+        for e100k in range(7):
+            first = (19 - n100k) - (19 - n100k) % 5 + (e100k + 10) // 5
+            second = ((19 - n100k) * 5) % 25 + e100k % 5
+            names[n100k, e100k] = _LETTERS[first] + _LETTERS[second]
+            offsets[first, second] = (e100k, n100k)
+    letter_index = np.full(128, -1, dtype=np.int64)
+    for i, letter in enumerate(_LETTERS):
+        letter_index[ord(letter)] = letter_index[ord(letter.lower())] = i
+    return names, offsets, letter_index
+
+
+_SQUARE_NAMES, _SQUARE_OFFSETS, _LETTER_INDEX = _grid_square_tables()
+
+
+def _meridional_arc(phi: np.ndarray, b: float, scale: float, n: float, phi0: float) -> np.ndarray:
+    """Return the scaled meridional arc M from the true origin latitude to phi."""
+    d, s = phi - phi0, phi + phi0
+    return b * scale * ((1 + n + 1.25 * n ** 2 + 1.25 * n ** 3) * d
+                        - (3 * n + 3 * n ** 2 + 2.625 * n ** 3) * np.sin(d) * np.cos(s)
+                        + (1.875 * n ** 2 + 1.875 * n ** 3) * np.sin(2 * d) * np.cos(2 * s)
+                        - (35.0 / 24.0) * n ** 3 * np.sin(3 * d) * np.cos(3 * s))
+
+
+def osgb36_to_grid(lat, lon) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Project OSGB36 coordinates onto the National Grid.
+
+    Args:
+        lat: OSGB36 latitudes in degrees
+        lon: OSGB36 longitudes in degrees
+
+    Returns:
+        Tuple of (easting, northing) arrays in metres
+    """
+    a, b = AIRY_1830
+    g = NATIONAL_GRID
+    scale = g["scale"]
+    e2 = 1 - (b / a) ** 2
+    n = (a - b) / (a + b)
+    phi, lam = np.radians(np.asarray(lat, dtype=np.float64)), np.radians(np.asarray(lon, dtype=np.float64))
+
+    # The OS series terms I..VI, written with products rather than array powers
+    sin_phi, cos_phi = np.sin(phi), np.cos(phi)
+    tan2 = (sin_phi / cos_phi) ** 2
+    w = 1 - e2 * sin_phi ** 2
+    nu = a * scale / np.sqrt(w)
+    nu_rho = w / (1 - e2)
+    eta2 = nu_rho - 1
+    cos2 = cos_phi ** 2
+    nu_sin_cos = nu * sin_phi * cos_phi
+
+    i = _meridional_arc(phi, b, scale, n, g["lat0"]) + g["northing0"]
+    ii = nu_sin_cos / 2
+    iii = nu_sin_cos * cos2 / 24 * (5 - tan2 + 9 * eta2)
+    iiia = nu_sin_cos * cos2 ** 2 / 720 * (61 - 58 * tan2 + tan2 ** 2)
+    iv = nu * cos_phi
+    v = iv * cos2 / 6 * (nu_rho - tan2)
+    vi = iv * cos2 ** 2 / 120 * (5 - 18 * tan2 + tan2 ** 2 + 14 * eta2 - 58 * tan2 * eta2)
+
+    dl = lam - g["lon0"]
+    dl2 = dl ** 2
+    northing = i + dl2 * (ii + dl2 * (iii + dl2 * iiia))
+    easting = g["easting0"] + dl * (iv + dl2 * (v + dl2 * vi))
+    return easting, northing
+
+
+def grid_to_osgb36(easting, northing) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert National Grid eastings/northings to OSGB36 coordinates.
+
+    Args:
+        easting: Eastings in metres
+        northing: Northings in metres
+
+    Returns:
+        Tuple of (latitude, longitude) arrays in OSGB36 degrees
+    """
+    a, b = AIRY_1830
+    g = NATIONAL_GRID
+    scale = g["scale"]
+    e2 = 1 - (b / a) ** 2
+    n = (a - b) / (a + b)
+    easting = np.asarray(easting, dtype=np.float64)
+    northing = np.asarray(northing, dtype=np.float64)
+
+    # Latitude whose meridional arc matches the northing, to 0.01 mm
+    target = northing - g["northing0"]
+    phi = target / (a * scale) + g["lat0"]
+    for _ in range(20):
+        residual = target - _meridional_arc(phi, b, scale, n, g["lat0"])
+        phi = phi + residual / (a * scale)
+        if not np.any(np.abs(residual) >= 1e-5):
+            break
+
+    # The OS series terms VII..XIIA, written with products rather than array powers
+    sin_phi, cos_phi = np.sin(phi), np.cos(phi)
+    tan_phi = sin_phi / cos_phi
+    tan2 = tan_phi ** 2
+    w = 1 - e2 * sin_phi ** 2
+    inv_nu = np.sqrt(w) / (a * scale)
+    inv_nu2 = inv_nu ** 2
+    nu_rho = w / (1 - e2)
+    eta2 = nu_rho - 1
+    # 1 / (rho * nu) = (nu / rho) / nu^2
+    tan_rho_nu = tan_phi * nu_rho * inv_nu2
+    sec_nu = inv_nu / cos_phi
+
+    vii = tan_rho_nu / 2
+    viii = tan_rho_nu * inv_nu2 / 24 * (5 + 3 * tan2 + eta2 - 9 * tan2 * eta2)
+    ix = tan_rho_nu * inv_nu2 ** 2 / 720 * (61 + 90 * tan2 + 45 * tan2 ** 2)
+    x = sec_nu
+    xi = sec_nu * inv_nu2 / 6 * (nu_rho + 2 * tan2)
+    xii = sec_nu * inv_nu2 ** 2 / 120 * (5 + 28 * tan2 + 24 * tan2 ** 2)
+    xiia = sec_nu * inv_nu2 ** 3 / 5040 * (61 + 662 * tan2 + 1320 * tan2 ** 2 + 720 * tan2 ** 3)
+
+    de = easting - g["easting0"]
+    de2 = de ** 2
+    lat = phi - de2 * (vii - de2 * (viii - de2 * ix))
+    lon = g["lon0"] + de * (x - de2 * (xi - de2 * (xii - de2 * xiia)))
+    return np.degrees(lat), np.degrees(lon)
+
+
+def _to_cartesian(lat: np.ndarray, lon: np.ndarray, ellipsoid: Tuple[float, float]) -> Tuple[np.ndarray, ...]:
+    a, b = ellipsoid
+    e2 = 1 - (b / a) ** 2
+    phi, lam = np.radians(lat), np.radians(lon)
+    sin_phi, cos_phi = np.sin(phi), np.cos(phi)
+    nu = a / np.sqrt(1 - e2 * sin_phi ** 2)
+    return nu * cos_phi * np.cos(lam), nu * cos_phi * np.sin(lam), (1 - e2) * nu * sin_phi
+
+
+def _from_cartesian(x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                    ellipsoid: Tuple[float, float]) -> Tuple[np.ndarray, np.ndarray]:
+    a, b = ellipsoid
+    e2 = 1 - (b / a) ** 2
+    p = np.hypot(x, y)
+    phi = np.arctan2(z, p * (1 - e2))
+    # Fixed-point iteration on the latitude; converges to sub-millimetre in a few steps
+    for _ in range(5):
+        sin_phi = np.sin(phi)
+        nu = a / np.sqrt(1 - e2 * sin_phi ** 2)
+        phi = np.arctan2(z + e2 * nu * sin_phi, p)
+    return np.degrees(phi), np.degrees(np.arctan2(y, x))
+
+
+def _helmert(x: np.ndarray, y: np.ndarray, z: np.ndarray, sign: float) -> Tuple[np.ndarray, ...]:
+    """Apply the WGS84 -> OSGB36 Helmert transformation (sign=1) or its inverse (sign=-1)."""
+    h = HELMERT_WGS84_TO_OSGB36
+    tx, ty, tz = sign * h["tx"], sign * h["ty"], sign * h["tz"]
+    s = 1 + sign * h["s_ppm"] * 1e-6
+    rx, ry, rz = (sign * np.radians(h[name] / 3600.0) for name in ("rx", "ry", "rz"))
+    return (tx + s * (x - rz * y + ry * z),
+            ty + s * (rz * x + y - rx * z),
+            tz + s * (-ry * x + rx * y + z))
+
+
+def wgs84_to_osgb36(lat, lon) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert WGS84 latitudes/longitudes in degrees to OSGB36 latitudes/longitudes."""
+    x, y, z = _to_cartesian(np.asarray(lat, dtype=np.float64), np.asarray(lon, dtype=np.float64), WGS84)
+    return _from_cartesian(*_helmert(x, y, z, 1.0), AIRY_1830)
+
+
+def osgb36_to_wgs84(lat, lon) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert OSGB36 latitudes/longitudes in degrees to WGS84 latitudes/longitudes."""
+    x, y, z = _to_cartesian(np.asarray(lat, dtype=np.float64), np.asarray(lon, dtype=np.float64), AIRY_1830)
+    return _from_cartesian(*_helmert(x, y, z, -1.0), WGS84)
+
+
+def wgs84_to_grid(lat, lon) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert WGS84 coordinates to National Grid eastings/northings.
+
+    Args:
+        lat: WGS84 latitudes in degrees
+        lon: WGS84 longitudes in degrees
+
+    Returns:
+        Tuple of (easting, northing) arrays in metres
+    """
+    return osgb36_to_grid(*wgs84_to_osgb36(lat, lon))
+
+
+def grid_to_wgs84(easting, northing) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert National Grid eastings/northings to WGS84 coordinates.
+
+    Args:
+        easting: Eastings in metres
+        northing: Northings in metres
+
+    Returns:
+        Tuple of (latitude, longitude) arrays in WGS84 degrees
+    """
+    return osgb36_to_wgs84(*grid_to_osgb36(easting, northing))
+
+
+def _parse_grid_references(references: Sequence) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (easting, northing, square size) arrays in metres; size is 0 for numeric pairs."""
+    values = pd.Series(references, dtype=object)
+    values = values.where(values.notna(), "").to_numpy(dtype=str)
+    count = len(values)
+    easting = np.full(count, np.nan)
+    northing = np.full(count, np.nan)
+    size = np.full(count, np.nan)
+    if not count or values.dtype.itemsize == 0:
+        return easting, northing, size
+
+    # Work on the code points as an (N, width) matrix with spaces squeezed to the end
+    codes = values.view(np.uint32).reshape(count, -1)
+    blank = (codes == 0) | (codes == ord(" ")) | (codes == ord("\t"))
+    codes = np.take_along_axis(codes, np.argsort(blank, axis=1, kind="stable"), axis=1)
+    length = codes.shape[1] - blank.sum(axis=1)
+    codes = np.where(codes < 128, codes, 0).astype(np.int64)
+    if codes.shape[1] < 12:
+        codes = np.pad(codes, ((0, 0), (0, 12 - codes.shape[1])))
+
+    # Lettered references: a 100 km square then an even number (0 to 10) of digits
+    first, second = _LETTER_INDEX[codes[:, 0]], _LETTER_INDEX[codes[:, 1]]
+    square = _SQUARE_OFFSETS[first, second]
+    n_digits = length - 2
+    digits = codes[:, 2:12] - ord("0")
+    in_reference = np.arange(10) < n_digits[:, None]
+    valid = ((first >= 0) & (second >= 0) & (square[:, 0] >= 0)
+             & (n_digits >= 0) & (n_digits <= 10) & (n_digits % 2 == 0)
+             & np.all(~in_reference | ((digits >= 0) & (digits <= 9)), axis=1))
+    for half in range(6):
+        rows = np.flatnonzero(valid & (n_digits == 2 * half))
+        if not len(rows):
+            continue
+        unit = 10.0 ** (5 - half)
+        powers = 10 ** np.arange(half - 1, -1, -1)
+        easting[rows] = square[rows, 0] * 100000.0 + (digits[rows, :half] @ powers) * unit
+        northing[rows] = square[rows, 1] * 100000.0 + (digits[rows, half:2 * half] @ powers) * unit
+        size[rows] = unit
+
+    # Numeric pairs, e.g. "651409,313177"
+    numeric = np.flatnonzero(~valid & (codes[:, 0] >= ord("0")) & (codes[:, 0] <= ord("9")))
+    if len(numeric):
+        pairs = pd.Series(values[numeric]).str.replace(r"\s", "", regex=True).str.extract(
+            r"^(\d+(?:\.\d+)?),(\d+(?:\.\d+)?)$")
+        parsed = pairs[0].notna().to_numpy(dtype=bool)
+        rows = numeric[parsed]
+        easting[rows] = pairs.loc[parsed, 0].astype(float).to_numpy()
+        northing[rows] = pairs.loc[parsed, 1].astype(float).to_numpy()
+        size[rows] = 0.0
+    return easting, northing, size
+
+
+def parse_grid_references(references: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse grid references ("TG 51409 13177", "TG5140913177", "TG 514 131") or
+    numeric "easting,northing" pairs into the south-west corner of the square they denote.
+
+    Args:
+        references: Grid reference strings; None or unparseable entries give NaN
+
+    Returns:
+        Tuple of (easting, northing) arrays in metres
+    """
+    easting, northing, _ = _parse_grid_references(references)
+    return easting, northing
+
+
+def format_grid_references(easting, northing, digits: int = 10) -> np.ndarray:
+    """
+    Format National Grid eastings/northings as lettered grid references.
+
+    Args:
+        easting: Eastings in metres
+        northing: Northings in metres
+        digits: Total number of digits (even, 0 to 10); coordinates are truncated
+            to the square they fall in, as is conventional
+
+    Returns:
+        Object array of references such as "TG 51409 13177"; None outside the grid
+
+    Raises:
+        ValueError: If digits is not an even number from 0 to 10
+    """
+    if digits not in (0, 2, 4, 6, 8, 10):
+        raise ValueError(f"digits must be an even number from 0 to 10, got {digits}")
+    easting = np.atleast_1d(np.asarray(easting, dtype=np.float64))
+    northing = np.atleast_1d(np.asarray(northing, dtype=np.float64))
+    inside = ((easting >= 0) & (easting < GRID_EXTENT[0]) & (northing >= 0) & (northing < GRID_EXTENT[1]))
+    result = np.full(easting.shape, None, dtype=object)
+    if not inside.any():
+        return result
+
+    e, n = np.floor(easting[inside]).astype(np.int64), np.floor(northing[inside]).astype(np.int64)
+    square = _SQUARE_NAMES[n // 100000, e // 100000]
+    if digits == 0:
+        result[inside] = square
+        return result
+    half = digits // 2
+    unit = 10 ** (5 - half)
+    east = np.char.zfill(((e % 100000) // unit).astype(str), half)
+    north = np.char.zfill(((n % 100000) // unit).astype(str), half)
+    result[inside] = np.char.add(np.char.add(np.char.add(square, " "), np.char.add(east, " ")), north)
+    return result
+
+
+def check_control_points(tolerance_m: float = 0.01,
+                         datum_tolerance_m: float = HELMERT_ACCURACY_M) -> Dict[str, float]:
+    """
+    Check the conversions against CONTROL_POINTS and OSTN15_TEST_POINTS.
+
+    The forward projection reproduces the OS worked example to the millimetre;
+    the truncated inverse series and the negated Helmert parameters each add a
+    few millimetres to the round trips, hence the centimetre default. The
+    WGS84 <-> grid conversions in both directions are held to the Helmert
+    accuracy at the OSTN15 test points.
+
+    Args:
+        tolerance_m: Largest acceptable projection and round-trip error in metres
+        datum_tolerance_m: Largest acceptable error at the OSTN15 test points in metres
+
+    Returns:
+        Largest error in metres per check: "projection", "round_trip",
+        "wgs84_to_grid" and "grid_to_wgs84"
+
+    Raises:
+        ValueError: If any error exceeds its tolerance
+    """
+    points = np.array(CONTROL_POINTS, dtype=np.float64)
+    lat, lon, easting, northing = points[:, 0, 0], points[:, 0, 1], points[:, 1, 0], points[:, 1, 1]
+    e, n = osgb36_to_grid(lat, lon)
+    worst = {"projection": np.max(np.hypot(e - easting, n - northing))}
+    # Inverse projection, and the forward and inverse Helmert transformations, back onto the grid
+    test_points = np.array([point[1:] for point in OSTN15_TEST_POINTS], dtype=np.float64)
+    easting = np.concatenate([easting, test_points[:, 2]])
+    northing = np.concatenate([northing, test_points[:, 3]])
+    round_trips = [osgb36_to_grid(*grid_to_osgb36(easting, northing)),
+                   wgs84_to_grid(*grid_to_wgs84(easting, northing))]
+    worst["round_trip"] = max(np.max(np.hypot(e - easting, n - northing)) for e, n in round_trips)
+
+    lat, lon, easting, northing = test_points.T
+    e, n = wgs84_to_grid(lat, lon)
+    worst["wgs84_to_grid"] = np.max(np.hypot(e - easting, n - northing))
+    # Angular error to metres on the mean Earth radius
+    back_lat, back_lon = grid_to_wgs84(easting, northing)
+    d_lat = np.radians(back_lat - lat)
+    d_lon = np.radians(back_lon - lon) * np.cos(np.radians(lat))
+    worst["grid_to_wgs84"] = np.max(6371008.8 * np.hypot(d_lat, d_lon))
+
+    worst = {check: float(error) for check, error in worst.items()}
+    for check, error in worst.items():
+        limit = datum_tolerance_m if check in ("wgs84_to_grid", "grid_to_wgs84") else tolerance_m
+        if error > limit:
+            raise ValueError(f"National Grid {check} error {error:.4f} m exceeds {limit} m")
+    return worst
+
+
+def fill_property_coordinates(properties: Union[pd.DataFrame, List[dict]], digits: int = 10) -> Dict[str, int]:
+    """
+    Fill whichever of latitude/longitude (WGS84) and british_national_grid is missing, in place.
+
+    Args:
+        properties: Mapped properties (create_property_mapping output) as a frame or list of mappings
+        digits: Digits of the grid references written
+
+    Returns:
+        Number of properties filled per side: {"latitude_longitude": ..., "british_national_grid": ...}
+    """
+    is_frame = isinstance(properties, pd.DataFrame)
+    columns = ("latitude", "longitude", "british_national_grid")
+    frame = properties if is_frame else pd.DataFrame.from_records(
+        [{column: p.get(column) for column in columns} for p in properties], columns=list(columns))
+
+    def number(name: str) -> np.ndarray:
+        if name not in frame.columns:
+            return np.full(len(frame), np.nan)
+        return pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+    lat, lon = number("latitude"), number("longitude")
+    references = frame["british_national_grid"] if "british_national_grid" in frame.columns \
+        else pd.Series(None, index=frame.index, dtype=object)
+    has_lat_lon = ~(np.isnan(lat) | np.isnan(lon))
+    has_reference = (references.notna() & (references != "")).to_numpy(dtype=bool)
+
+    # Grid references denote a square; convert from its centre
+    to_lat_lon = np.flatnonzero(has_reference & ~has_lat_lon)
+    easting, northing, size = _parse_grid_references(references.to_numpy(dtype=object)[to_lat_lon])
+    new_lat, new_lon = grid_to_wgs84(easting + size / 2, northing + size / 2)
+    parsed = ~np.isnan(new_lat)
+    to_lat_lon, new_lat, new_lon = to_lat_lon[parsed], new_lat[parsed], new_lon[parsed]
+
+    to_reference = np.flatnonzero(has_lat_lon & ~has_reference)
+    new_refs = format_grid_references(*wgs84_to_grid(lat[to_reference], lon[to_reference]), digits=digits)
+    formatted = pd.notna(new_refs)
+    to_reference, new_refs = to_reference[formatted], new_refs[formatted]
+
+    if is_frame:
+        for name in ("latitude", "longitude"):
+            frame[name] = number(name)
+        frame.loc[frame.index[to_lat_lon], "latitude"] = new_lat
+        frame.loc[frame.index[to_lat_lon], "longitude"] = new_lon
+        if "british_national_grid" not in frame.columns:
+            frame["british_national_grid"] = None
+        frame["british_national_grid"] = frame["british_national_grid"].astype(object)
+        frame.loc[frame.index[to_reference], "british_national_grid"] = new_refs
+    else:
+        for row, la, lo in zip(to_lat_lon.tolist(), new_lat.tolist(), new_lon.tolist()):
+            properties[row]["latitude"], properties[row]["longitude"] = la, lo
+        for row, reference in zip(to_reference.tolist(), new_refs.tolist()):
+            properties[row]["british_national_grid"] = reference
+    return {"latitude_longitude": len(to_lat_lon), "british_national_grid": len(to_reference)}
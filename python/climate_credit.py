@@ -0,0 +1,355 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Climate-adjusted LTV and expected-loss engine for mortgage portfolios.
+
+Mortgages (MortgageCDM mapping columns) are hash-joined to their
+collateral (PropertyCDM mapping columns) on PropertyID, falling back to
+UPRN. Each hazard scenario haircuts the property value by its EA flood
+zone and overall flood risk, less a reduction for raised floor levels,
+and by low ground elevation; the stressed value gives a stressed LTV
+(OutstandingBalance over value, as in MortgageCDM's LTV check) and from
+it a PD, an LGD and the expected loss PD x LGD x EAD of every loan in
+every scenario, as (loans x scenarios) arrays. Results aggregate by
+region and flood zone.
+
+PD is a logistic function of the stressed LTV, with an uplift for loans
+in arrears and PD = 1 for defaulted loans; LGD is the shortfall of the
+forced-sale recovery of the stressed value against the exposure, with a
+floor.
+"""
+
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+# Group label of mortgages without a matching property
+UNMATCHED = "Unmatched"
+
+
+class HazardScenario:
+    """Property value haircuts of one hazard scenario."""
+
+    def __init__(self, name: str, zone_haircuts: Optional[Dict[str, float]] = None,
+                 risk_haircuts: Optional[Dict[str, float]] = None, floor_protection_m: float = 1.0,
+                 low_elevation_m: float = 0.0, low_elevation_haircut: float = 0.0, pd_multiplier: float = 1.0):
+        """
+        Initialize the scenario.
+
+        Args:
+            name: Scenario name
+            zone_haircuts: Value haircut by EAFloodZone (flood_zone), as a fraction
+            risk_haircuts: Value haircut by OverallFloodRisk (overall_flood_risk); the
+                larger of the zone and risk haircuts applies
+            floor_protection_m: Floor level above ground that avoids the flood haircut;
+                lower floors scale it down linearly
+            low_elevation_m: Ground elevation (elevation) below which the low-elevation haircut applies
+            low_elevation_haircut: Additional haircut of low-lying properties
+            pd_multiplier: Multiplier of the PD in this scenario
+        """
+        self.name = name
+        self.zone_haircuts = dict(zone_haircuts or {})
+        self.risk_haircuts = dict(risk_haircuts or {})
+        self.floor_protection_m = floor_protection_m
+        self.low_elevation_m = low_elevation_m
+        self.low_elevation_haircut = low_elevation_haircut
+        self.pd_multiplier = pd_multiplier
+
+    def __repr__(self) -> str:
+        return f"HazardScenario(name={self.name!r})"
+
+
+DEFAULT_SCENARIOS = (
+    HazardScenario("baseline"),
+    HazardScenario(
+        "moderate",
+        zone_haircuts={"Zone 2": 0.03, "Zone 3a": 0.08, "Zone 3b": 0.15},
+        risk_haircuts={"Medium": 0.03, "High": 0.08, "Very high": 0.15},
+        low_elevation_m=2.0, low_elevation_haircut=0.05, pd_multiplier=1.2,
+    ),
+    HazardScenario(
+        "severe",
+        zone_haircuts={"Zone 2": 0.08, "Zone 3a": 0.20, "Zone 3b": 0.35},
+        risk_haircuts={"Medium": 0.08, "High": 0.20, "Very high": 0.35},
+        floor_protection_m=2.0, low_elevation_m=5.0, low_elevation_haircut=0.15, pd_multiplier=1.5,
+    ),
+)
+
+
+class ClimateLossResult:
+    """Loan-level results of ClimateLossEngine.run; arrays are (loans x scenarios)."""
+
+    def __init__(self, loans: pd.DataFrame, scenarios: Sequence[str], stressed_ltv: np.ndarray,
+                 probability_of_default: np.ndarray, loss_given_default: np.ndarray):
+        self.loans = loans
+        self.scenarios = list(scenarios)
+        self.stressed_ltv = stressed_ltv
+        self.probability_of_default = probability_of_default
+        self.loss_given_default = loss_given_default
+        self.expected_loss = probability_of_default * loss_given_default * loans["exposure"].to_numpy()[:, None]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Return the results in long form, one row per loan and scenario.
+
+        Returns:
+            DataFrame with the loan columns, scenario, stressed_ltv,
+            probability_of_default, loss_given_default and expected_loss
+        """
+        n_scenarios = len(self.scenarios)
+        frame = self.loans.loc[self.loans.index.repeat(n_scenarios)].reset_index(drop=True)
+        frame["scenario"] = np.tile(self.scenarios, len(self.loans))
+        for name in ("stressed_ltv", "probability_of_default", "loss_given_default", "expected_loss"):
+            frame[name] = getattr(self, name).ravel()
+        return frame
+
+    def aggregate(self, by: Sequence[str] = ("region", "flood_zone")) -> pd.DataFrame:
+        """
+        Aggregate the results by loan columns and scenario.
+
+        Args:
+            by: Columns of loans to group by (unmatched loans are labelled UNMATCHED)
+
+        Returns:
+            DataFrame indexed by the by columns and scenario, with n_loans,
+            exposure, expected_loss, loss_rate, exposure-weighted
+            stressed_ltv and the exposure share with a stressed LTV above 1
+        """
+        by = list(by)
+        # Factorize each column (nulls as UNMATCHED) and combine the codes
+        column_codes, labels = [], []
+        for name in by:
+            codes, uniques = pd.factorize(self.loans[name])
+            codes = np.where(codes < 0, len(uniques), codes)
+            column_codes.append(codes)
+            labels.append(list(uniques) + [UNMATCHED])
+        flat = np.ravel_multi_index(column_codes, [len(values) for values in labels]) if by \
+            else np.zeros(len(self.loans), dtype=np.int64)
+        group_flat, codes = np.unique(flat, return_inverse=True)
+        groups = [tuple(values[i] for values, i in zip(labels, np.unravel_index(g, [len(v) for v in labels])))
+                  for g in group_flat.tolist()]
+        n_groups = len(groups)
+        exposure = self.loans["exposure"].to_numpy()
+
+        def total(weights: np.ndarray) -> np.ndarray:
+            # (groups x scenarios) sums of per-loan (loans x scenarios) weights
+            return np.stack([np.bincount(codes, weights[:, s], minlength=n_groups)
+                             for s in range(weights.shape[1])], axis=1)
+
+        n_scenarios = len(self.scenarios)
+        exposures = np.repeat(exposure[:, None], n_scenarios, axis=1)
+        group_exposure = total(exposures)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = {
+                "n_loans": np.repeat(np.bincount(codes, minlength=n_groups)[:, None], n_scenarios, axis=1),
+                "exposure": group_exposure,
+                "expected_loss": total(self.expected_loss),
+                "loss_rate": total(self.expected_loss) / group_exposure,
+                "stressed_ltv": total(np.nan_to_num(self.stressed_ltv) * exposures) / group_exposure,
+                "negative_equity_share": total((self.stressed_ltv > 1.0) * exposures) / group_exposure,
+            }
+        index = pd.MultiIndex.from_tuples([group + (scenario,) for group in groups for scenario in self.scenarios],
+                                          names=by + ["scenario"])
+        return pd.DataFrame({name: values.ravel() for name, values in result.items()}, index=index)
+
+
+class ClimateLossEngine:
+    """
+    Portfolio engine of climate-stressed LTV and expected loss.
+
+    Example:
+        engine = ClimateLossEngine()
+        result = engine.run(mortgages, properties)
+        by_region = result.aggregate(("region", "flood_zone"))
+    """
+
+    def __init__(self, scenarios: Sequence[HazardScenario] = DEFAULT_SCENARIOS,
+                 forced_sale_discount: float = 0.25, sale_costs: float = 0.05, lgd_floor: float = 0.10,
+                 pd_intercept: float = -7.5, pd_ltv_slope: float = 4.0, pd_arrears_uplift: float = 2.0):
+        """
+        Initialize the engine.
+
+        Args:
+            scenarios: Hazard scenarios
+            forced_sale_discount: Discount of a forced sale on the stressed value
+            sale_costs: Costs of the sale, as a fraction of the stressed value
+            lgd_floor: Minimum LGD
+            pd_intercept: Logit of the PD at zero LTV
+            pd_ltv_slope: Increase of the PD logit per unit of stressed LTV
+            pd_arrears_uplift: Increase of the PD logit of loans in arrears
+        """
+        self.scenarios = list(scenarios)
+        self.forced_sale_discount = forced_sale_discount
+        self.sale_costs = sale_costs
+        self.lgd_floor = lgd_floor
+        self.pd_intercept = pd_intercept
+        self.pd_ltv_slope = pd_ltv_slope
+        self.pd_arrears_uplift = pd_arrears_uplift
+
+    @staticmethod
+    def join(mortgages: pd.DataFrame, properties: pd.DataFrame) -> np.ndarray:
+        """
+        Hash-join mortgages to properties on PropertyID, then UPRN.
+
+        Args:
+            mortgages: Mortgage mapping columns (PropertyID, UPRN)
+            properties: Property mapping columns (property_id, uprn)
+
+        Returns:
+            Row position in properties of every mortgage's property, -1 if none;
+            the first of duplicated property keys is used
+        """
+        position = np.full(len(mortgages), -1, dtype=np.int64)
+        for mortgage_key, property_key in (("PropertyID", "property_id"), ("UPRN", "uprn")):
+            if mortgage_key not in mortgages.columns or property_key not in properties.columns:
+                continue
+            unmatched = position < 0
+            if not unmatched.any():
+                break
+            table = pd.Index(properties[property_key].astype(object))
+            rows = np.arange(len(table))
+            if not table.is_unique or table.hasnans:
+                first = ~table.duplicated() & table.notna()
+                table, rows = table[first], rows[first]
+            found = table.get_indexer(pd.Index(mortgages[mortgage_key].astype(object)[unmatched]))
+            position[unmatched] = np.where(found >= 0, rows[found], -1)
+        return position
+
+    def property_haircuts(self, properties: pd.DataFrame) -> np.ndarray:
+        """
+        Compute the value haircut of every property in every scenario.
+
+        Args:
+            properties: Property mapping columns (flood_zone, overall_flood_risk,
+                floor_level_metres, elevation)
+
+        Returns:
+            (properties x scenarios) haircuts between 0 and 1
+        """
+        n_rows = len(properties)
+
+        def codes(name: str):
+            # Category codes (-1 for nulls) and categories of a column
+            if name not in properties.columns:
+                return np.full(n_rows, -1), []
+            return pd.factorize(properties[name])
+
+        def number(name: str) -> np.ndarray:
+            if name not in properties.columns:
+                return np.full(n_rows, np.nan)
+            return pd.to_numeric(properties[name], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+        def lookup(factorized, haircuts: Dict[str, float]) -> np.ndarray:
+            # Haircut per row from one lookup per category; nulls (code -1) take the appended 0.0
+            values, categories = factorized
+            return np.array([haircuts.get(category, 0.0) for category in categories] + [0.0])[values]
+
+        zone, risk = codes("flood_zone"), codes("overall_flood_risk")
+        floor_level = np.nan_to_num(number("floor_level_metres"))
+        elevation = number("elevation")
+        haircuts = np.empty((n_rows, len(self.scenarios)))
+        for s, scenario in enumerate(self.scenarios):
+            flood = np.maximum(lookup(zone, scenario.zone_haircuts), lookup(risk, scenario.risk_haircuts))
+            if scenario.floor_protection_m > 0:
+                flood *= np.clip(1.0 - floor_level / scenario.floor_protection_m, 0.0, 1.0)
+            low_lying = np.where(elevation < scenario.low_elevation_m, scenario.low_elevation_haircut, 0.0)
+            haircuts[:, s] = np.clip(1.0 - (1.0 - flood) * (1.0 - low_lying), 0.0, 1.0)
+        return haircuts
+
+    def run(self, mortgages: Union[pd.DataFrame, Dict[str, np.ndarray]],
+            properties: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> ClimateLossResult:
+        """
+        Compute stressed LTV, PD, LGD and expected loss of every loan in every scenario.
+
+        Args:
+            mortgages: Mortgage mapping columns (MortgageID, PropertyID, UPRN,
+                OutstandingBalance, PurchaseValue, InArrearsFlag, DefaultFlag)
+            properties: Property mapping columns (property_id, uprn, value, region,
+                flood_zone, overall_flood_risk, floor_level_metres, elevation)
+
+        Returns:
+            ClimateLossResult; loans without a matched property are valued at
+            PurchaseValue without haircut
+        """
+        try:
+            mortgages = mortgages if isinstance(mortgages, pd.DataFrame) else pd.DataFrame(mortgages)
+            properties = properties if isinstance(properties, pd.DataFrame) else pd.DataFrame(properties)
+            n_loans = len(mortgages)
+
+            def number(frame: pd.DataFrame, name: str) -> np.ndarray:
+                if name not in frame.columns:
+                    return np.full(len(frame), np.nan)
+                return pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+            def flag(name: str) -> np.ndarray:
+                result = np.zeros(n_loans, dtype=bool)
+                if name in mortgages.columns:
+                    values = mortgages[name]
+                    present = values.notna().to_numpy()
+                    result[present] = values[present].astype(bool).to_numpy()
+                return result
+
+            position = self.join(mortgages, properties)
+            matched = position >= 0
+            rows = np.where(matched, position, 0)
+
+            def joined(name: str) -> pd.Series:
+                # Property column in loan order (keeping its dtype), null where unmatched
+                if name not in properties.columns or not len(properties):
+                    return pd.Series(np.full(n_loans, None, dtype=object), index=mortgages.index)
+                values = properties[name].take(rows).where(matched)
+                return values.set_axis(mortgages.index)
+
+            # Current value of the collateral, PurchaseValue where it is unknown
+            value = np.full(n_loans, np.nan)
+            if len(properties):
+                value[matched] = number(properties, "value")[rows[matched]]
+            value = np.where(np.isnan(value) | (value <= 0), number(mortgages, "PurchaseValue"), value)
+
+            haircut = np.zeros((n_loans, len(self.scenarios)))
+            if len(properties):
+                haircut[matched] = self.property_haircuts(properties)[rows[matched]]
+
+            exposure = np.nan_to_num(number(mortgages, "OutstandingBalance"))
+            stressed_value = value[:, None] * (1.0 - haircut)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                stressed_ltv = exposure[:, None] / stressed_value
+                recovery = stressed_value * (1.0 - self.forced_sale_discount - self.sale_costs)
+                loss_given_default = np.where(exposure[:, None] > 0,
+                                              np.clip(1.0 - recovery / exposure[:, None], self.lgd_floor, 1.0), 0.0)
+            # Loans without a collateral value lose their whole exposure
+            loss_given_default = np.where(np.isnan(loss_given_default), 1.0, loss_given_default)
+
+            logit = self.pd_intercept + self.pd_ltv_slope * np.nan_to_num(stressed_ltv, nan=1.0, posinf=10.0)
+            logit += np.where(flag("InArrearsFlag"), self.pd_arrears_uplift, 0.0)[:, None]
+            multipliers = np.array([scenario.pd_multiplier for scenario in self.scenarios])
+            probability_of_default = np.minimum(multipliers / (1.0 + np.exp(-logit)), 1.0)
+            probability_of_default[flag("DefaultFlag")] = 1.0
+
+            loans = pd.DataFrame({
+                "MortgageID": mortgages["MortgageID"].to_numpy() if "MortgageID" in mortgages.columns else None,
+                "property_row": position,
+                "region": joined("region"),
+                "flood_zone": joined("flood_zone"),
+                "exposure": exposure,
+                "value": value,
+                "ltv": exposure / value,
+            }, index=mortgages.index)
+            return ClimateLossResult(loans, [scenario.name for scenario in self.scenarios],
+                                     stressed_ltv, probability_of_default, loss_given_default)
+
+        except Exception as e:
+            raise ValueError(f"Error computing climate-adjusted losses: {str(e)}")
@@ -0,0 +1,258 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Flat compiled field-path table for CDM schemas.
+
+This module flattens a nested CDM schema into an indexed table of
+(section path, field name, type, menu options, output column name) rows,
+which drives field lookup, record mapping and validation. Each table also
+generates a specialised mapper function from its columns at first use.
+"""
+
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Read-only stand-in for sections missing from a record
+_EMPTY_SECTION = MappingProxyType({})
+
+
+class FieldSpec:
+    """Single leaf field of a compiled CDM schema."""
+    __slots__ = ("path", "section", "name", "type", "options", "column", "definition")
+
+    def __init__(self, section: Tuple[str, ...], name: str, definition: dict):
+        """
+        Initialize the field specification.
+
+        Args:
+            section: Keys of the enclosing sections, from the schema root
+            name: Field name
+            definition: Schema definition of the field
+        """
+        self.section = section
+        self.name = name
+        self.path = ".".join(section + (name,))
+        self.type = definition.get("type")
+        self.options = tuple(definition.get("options", ()))
+        self.column = None
+        self.definition = definition
+
+    def __repr__(self) -> str:
+        return f"FieldSpec(path={self.path!r}, type={self.type!r}, column={self.column!r})"
+
+
+class ColumnSpec:
+    """Output column of a CDM mapping, bound to a schema field."""
+    __slots__ = ("column", "field", "default", "fallback")
+
+    def __init__(self, column: str, field: FieldSpec, default: Any = None, fallback: Any = None):
+        """
+        Initialize the column specification.
+
+        Args:
+            column: Output column name
+            field: Schema field the column reads from
+            default: Value used when the field is absent from its section
+            fallback: Value used when the field value is falsy
+        """
+        self.column = column
+        self.field = field
+        self.default = default
+        self.fallback = fallback
+
+    def __repr__(self) -> str:
+        return f"ColumnSpec(column={self.column!r}, path={self.field.path!r})"
+
+
+class FieldTable:
+    """
+    Flat, indexed table of all leaf fields in a CDM schema, together with
+    the ordered output columns of the CDM's mapping.
+    """
+    def __init__(self, schema: dict, columns: Optional[Dict[str, str]] = None,
+                 defaults: Optional[Dict[str, Any]] = None,
+                 fallbacks: Optional[Dict[str, Any]] = None):
+        """
+        Compile the field table.
+
+        Args:
+            schema: Nested schema definition
+            columns: Ordered mapping of output column name to dotted field path
+            defaults: Output column defaults applied when a field is absent
+            fallbacks: Output column fallbacks applied when a value is falsy
+
+        Raises:
+            ValueError: If a column refers to a path that is not a schema field
+        """
+        self.fields: Tuple[FieldSpec, ...] = tuple(self._flatten(schema, ()))
+        self._index: Dict[str, FieldSpec] = {spec.path: spec for spec in self.fields}
+
+        sections: Dict[str, List[FieldSpec]] = {}
+        for spec in self.fields:
+            sections.setdefault(".".join(spec.section), []).append(spec)
+        self._sections: Dict[str, Tuple[FieldSpec, ...]] = {
+            key: tuple(specs) for key, specs in sections.items()
+        }
+        self._menus: Dict[str, Tuple[FieldSpec, ...]] = {
+            key: tuple(spec for spec in specs if spec.type == "menu") for key, specs in sections.items()
+        }
+
+        defaults = defaults or {}
+        fallbacks = fallbacks or {}
+        column_specs = []
+        for column, path in (columns or {}).items():
+            spec = self._index.get(path)
+            if spec is None:
+                raise ValueError(f"Column {column} refers to unknown field path {path}")
+            if spec.column is None:
+                spec.column = column
+            column_specs.append(ColumnSpec(column, spec, defaults.get(column), fallbacks.get(column)))
+        self.columns: Tuple[ColumnSpec, ...] = tuple(column_specs)
+        self._mapper: Optional[Callable[[dict], dict]] = None
+
+    def __getstate__(self) -> dict:
+        # Generated functions cannot be pickled; workers regenerate on first use
+        state = self.__dict__.copy()
+        state["_mapper"] = None
+        return state
+
+    @staticmethod
+    def _flatten(node: dict, section: Tuple[str, ...]) -> Iterator[FieldSpec]:
+        for key, value in node.items():
+            if not isinstance(value, dict):
+                continue
+            if "type" in value:
+                yield FieldSpec(section, key, value)
+            else:
+                yield from FieldTable._flatten(value, section + (key,))
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __iter__(self) -> Iterator[FieldSpec]:
+        return iter(self.fields)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._index
+
+    def get(self, path: str) -> Optional[FieldSpec]:
+        """Return the field at a dotted path, or None if it does not exist."""
+        return self._index.get(path)
+
+    def field(self, path: str) -> FieldSpec:
+        """Return the field at a dotted path, raising KeyError if it does not exist."""
+        return self._index[path]
+
+    @property
+    def paths(self) -> List[str]:
+        """Return the dotted paths of all fields in schema order."""
+        return [spec.path for spec in self.fields]
+
+    def section_fields(self, section: str) -> Tuple[FieldSpec, ...]:
+        """Return the fields directly contained in a dotted section path."""
+        return self._sections.get(section, ())
+
+    def menu_fields(self, section: str) -> Tuple[FieldSpec, ...]:
+        """Return the menu fields directly contained in a dotted section path."""
+        return self._menus.get(section, ())
+
+    def map_record(self, record: dict) -> dict:
+        """
+        Map a nested CDM record onto the output columns.
+
+        Args:
+            record: Nested CDM record
+
+        Returns:
+            Dictionary of output column to value, in column order, including None values
+        """
+        mapped = {}
+        for col in self.columns:
+            node = record
+            for key in col.field.section:
+                node = node.get(key, {})
+            value = node.get(col.field.name, col.default)
+            if col.fallback is not None:
+                value = value or col.fallback
+            mapped[col.column] = value
+        return mapped
+
+    def unmap_record(self, flat: dict) -> dict:
+        """
+        Build a nested CDM record from output columns (the reverse of map_record).
+
+        Args:
+            flat: Dictionary of output column to value
+
+        Returns:
+            Nested CDM record, in column order, including None values
+        """
+        nested = {}
+        for col in self.columns:
+            node = nested
+            for key in col.field.section:
+                node = node.setdefault(key, {})
+            node[col.field.name] = flat.get(col.column)
+        return nested
+
+    @property
+    def mapper(self) -> Callable[[dict], dict]:
+        """
+        Return the specialised mapper function of this table, generating it on first use.
+
+        The mapper is equivalent to map_record followed by dropping None
+        values, but resolves each section once per record and builds the
+        output dict in a single pass.
+        """
+        if self._mapper is None:
+            self._mapper = self.compile_mapper()
+        return self._mapper
+
+    def compile_mapper(self) -> Callable[[dict], dict]:
+        """
+        Generate a mapper function specialised to the output columns.
+
+        Returns:
+            Function mapping a nested CDM record onto the output columns, without None values
+        """
+        namespace: Dict[str, Any] = {"_EMPTY": _EMPTY_SECTION}
+        lines = ["def _map_record(record):", "    mapped = {}"]
+        section_vars: Dict[Tuple[str, ...], str] = {(): "record"}
+
+        def section_var(section: Tuple[str, ...]) -> str:
+            if section not in section_vars:
+                parent = section_var(section[:-1])
+                var = f"s{len(section_vars)}"
+                lines.append(f"    {var} = {parent}.get({section[-1]!r}, _EMPTY)")
+                section_vars[section] = var
+            return section_vars[section]
+
+        for i, col in enumerate(self.columns):
+            node = section_var(col.field.section)
+            if col.default is None:
+                lines.append(f"    value = {node}.get({col.field.name!r})")
+            else:
+                namespace[f"_default{i}"] = col.default
+                lines.append(f"    value = {node}.get({col.field.name!r}, _default{i})")
+            if col.fallback is not None:
+                namespace[f"_fallback{i}"] = col.fallback
+                lines.append(f"    value = value or _fallback{i}")
+            lines.append("    if value is not None:")
+            lines.append(f"        mapped[{col.column!r}] = value")
+        lines.append("    return mapped")
+
+        exec(compile("\n".join(lines), "<cdm field table mapper>", "exec"), namespace)
+        return namespace["_map_record"]
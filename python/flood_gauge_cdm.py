@@ -23,15 +23,67 @@ enabling consistent processing across different data sources.
 import pandas as pd
 from typing import Dict, List, Optional
 
+from .schema_registry import get_compiled_schema
+
 class FloodGaugeCDM:
     """
     Flood Gauge Common Data Model (CDM) implementation.
     Provides a standardized schema and data transformation methods
     for flood gauge data.
     """
+    SCHEMA_VERSION = "v2"
+
+    # Output column name -> dotted schema path, in mapping order
+    _FIELD_COLUMNS = {
+        # Header section
+        'gauge_id': 'FloodGauge.Header.GaugeID',
+
+        # SensorStats section
+        'historical_high_level': 'FloodGauge.SensorStats.HistoricalHighLevel',
+        'historical_high_date': 'FloodGauge.SensorStats.HistoricalHighDate',
+        'last_date_level_exceed_level3': 'FloodGauge.SensorStats.LastDateLevelExceedLevel3',
+        'frequency_exceed_level3': 'FloodGauge.SensorStats.FrequencyExceedLevel3',
+
+        # SensorDetails.GaugeInformation section
+        'data_source_type': 'FloodGauge.SensorDetails.GaugeInformation.DataSourceType',
+        'gauge_owner': 'FloodGauge.SensorDetails.GaugeInformation.GaugeOwner',
+        'gauge_type': 'FloodGauge.SensorDetails.GaugeInformation.GaugeType',
+        'manufacturer_name': 'FloodGauge.SensorDetails.GaugeInformation.ManufacturerName',
+        'installation_date': 'FloodGauge.SensorDetails.GaugeInformation.InstallationDate',
+        'last_inspection_date': 'FloodGauge.SensorDetails.GaugeInformation.LastInspectionDate',
+        'maintenance_schedule': 'FloodGauge.SensorDetails.GaugeInformation.MaintenanceSchedule',
+        'operational_status': 'FloodGauge.SensorDetails.GaugeInformation.OperationalStatus',
+        'certification_status': 'FloodGauge.SensorDetails.GaugeInformation.CertificationStatus',
+        'gauge_latitude': 'FloodGauge.SensorDetails.GaugeInformation.GaugeLatitude',
+        'gauge_longitude': 'FloodGauge.SensorDetails.GaugeInformation.GaugeLongitude',
+        'ground_level_meters': 'FloodGauge.SensorDetails.GaugeInformation.GroundLevelMeters',
+
+        # SensorDetails.Measurements section
+        'measurement_frequency': 'FloodGauge.SensorDetails.Measurements.MeasurementFrequency',
+        'measurement_method': 'FloodGauge.SensorDetails.Measurements.MeasurementMethod',
+        'data_transmission': 'FloodGauge.SensorDetails.Measurements.DataTransmission',
+        'data_curator': 'FloodGauge.SensorDetails.Measurements.DataCurator',
+        'data_access_method': 'FloodGauge.SensorDetails.Measurements.DataAccessMethod',
+
+        # FloodStage.UK section
+        'decision_body': 'FloodGauge.FloodStage.UK.DecisionBody',
+        'flood_alert': 'FloodGauge.FloodStage.UK.FloodAlert',
+        'flood_warning': 'FloodGauge.FloodStage.UK.FloodWarning',
+        'severe_flood_warning': 'FloodGauge.FloodStage.UK.SevereFloodWarning',
+    }
+
     def __init__(self):
-        """Initialize the Flood Gauge CDM with schema definition."""
-        self.schema = {
+        """Initialize the Flood Gauge CDM with the shared compiled schema definition."""
+        self._compiled = get_compiled_schema(
+            "FloodGauge", self.SCHEMA_VERSION, self._build_schema, columns=self._FIELD_COLUMNS
+        )
+        self.schema = self._compiled.schema
+        self._fields = self._compiled.fields
+
+    @staticmethod
+    def _build_schema() -> dict:
+        """Build the Flood Gauge schema definition."""
+        return {
             "FloodGauge": {
                 "Header": {
                     "GaugeID": {
@@ -198,21 +250,9 @@ class FloodGaugeCDM:
             gauge_info = gauge_data.get("FloodGauge", {}).get("SensorDetails", {}).get("GaugeInformation", {})
             
             # Validate menu fields
-            menu_fields = {
-                "DataSourceType": ["SensorGauge", "Satellite", "WeatherStation"],
-                "GaugeType": ["Staff gauge", "Wire-weight gauge", "Shaft encoder", 
-                             "Bubbler system", "Pressure transducer", "Radar gauge", 
-                             "Ultrasonic gauge"],
-                "MaintenanceSchedule": ["Monthly", "Quarterly", "Bi-annual", "Annual"],
-                "OperationalStatus": ["Fully operational", "Maintenance required", 
-                                    "Temporarily offline", "Decommissioned"],
-                "CertificationStatus": ["Fully certified", "Provisional", 
-                                      "Under review", "Non-certified"]
-            }
-            
-            for field, valid_options in menu_fields.items():
-                if field in gauge_info and gauge_info[field] not in valid_options:
-                    sensor_errors.append(f"Invalid value for {field}")
+            for spec in self._fields.menu_fields("FloodGauge.SensorDetails.GaugeInformation"):
+                if spec.name in gauge_info and gauge_info[spec.name] not in spec.options:
+                    sensor_errors.append(f"Invalid value for {spec.name}")
                     
             if sensor_errors:
                 errors["SensorDetails"] = sensor_errors
@@ -233,46 +273,8 @@ class FloodGaugeCDM:
             Structured flood gauge data according to CDM schema
         """
         try:
-            gauge_data = {
-                # Header section
-                'gauge_id': gauge.get('FloodGauge', {}).get('Header', {}).get('GaugeID'),
-                
-                # SensorStats section
-                'historical_high_level': gauge.get('FloodGauge', {}).get('SensorStats', {}).get('HistoricalHighLevel'),
-                'historical_high_date': gauge.get('FloodGauge', {}).get('SensorStats', {}).get('HistoricalHighDate'),
-                'last_date_level_exceed_level3': gauge.get('FloodGauge', {}).get('SensorStats', {}).get('LastDateLevelExceedLevel3'),
-                'frequency_exceed_level3': gauge.get('FloodGauge', {}).get('SensorStats', {}).get('FrequencyExceedLevel3'),
-                
-                # SensorDetails.GaugeInformation section
-                'data_source_type': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('GaugeInformation', {}).get('DataSourceType'),
-                'gauge_owner': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('GaugeInformation', {}).get('GaugeOwner'),
-                'gauge_type': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('GaugeInformation', {}).get('GaugeType'),
-                'manufacturer_name': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('GaugeInformation', {}).get('ManufacturerName'),
-                'installation_date': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('GaugeInformation', {}).get('InstallationDate'),
-                'last_inspection_date': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('GaugeInformation', {}).get('LastInspectionDate'),
-                'maintenance_schedule': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('GaugeInformation', {}).get('MaintenanceSchedule'),
-                'operational_status': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('GaugeInformation', {}).get('OperationalStatus'),
-                'certification_status': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('GaugeInformation', {}).get('CertificationStatus'),
-                'gauge_latitude': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('GaugeInformation', {}).get('GaugeLatitude'),
-                'gauge_longitude': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('GaugeInformation', {}).get('GaugeLongitude'),
-                'ground_level_meters': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('GaugeInformation', {}).get('GroundLevelMeters'),
-                
-                # SensorDetails.Measurements section
-                'measurement_frequency': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('Measurements', {}).get('MeasurementFrequency'),
-                'measurement_method': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('Measurements', {}).get('MeasurementMethod'),
-                'data_transmission': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('Measurements', {}).get('DataTransmission'),
-                'data_curator': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('Measurements', {}).get('DataCurator'),
-                'data_access_method': gauge.get('FloodGauge', {}).get('SensorDetails', {}).get('Measurements', {}).get('DataAccessMethod'),
-                
-                # FloodStage.UK section
-                'decision_body': gauge.get('FloodGauge', {}).get('FloodStage', {}).get('UK', {}).get('DecisionBody'),
-                'flood_alert': gauge.get('FloodGauge', {}).get('FloodStage', {}).get('UK', {}).get('FloodAlert'),
-                'flood_warning': gauge.get('FloodGauge', {}).get('FloodStage', {}).get('UK', {}).get('FloodWarning'),
-                'severe_flood_warning': gauge.get('FloodGauge', {}).get('FloodStage', {}).get('UK', {}).get('SevereFloodWarning')
-            }
-            
-            # Remove None values from the dictionary
-            return {k: v for k, v in gauge_data.items() if v is not None}
+            # Single pass over the compiled columns, skipping None values
+            return self._fields.mapper(gauge)
             
         except Exception as e:
             raise ValueError(f"Error creating gauge mapping: {str(e)}")
\ No newline at end of file
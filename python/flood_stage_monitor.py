@@ -0,0 +1,217 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Streaming flood stage monitor for flood gauge readings.
+
+This module ingests batches of (gauge, timestamp, level) readings and emits
+stage-crossing events against the FloodGauge FloodStage.UK trigger levels
+(FloodAlert, FloodWarning, SevereFloodWarning), with hysteresis on the way
+down. Per-gauge state is held in flat NumPy arrays indexed by gauge.
+
+With trigger levels t_k and release levels t_k - hysteresis, a reading L
+moves the stage s to clamp(s, up(L), down(L)), where up(L) counts the
+trigger levels reached and down(L) the release levels reached. Clamps
+compose into clamps, so a batch is resolved with a segmented parallel
+prefix scan per gauge instead of a Python loop over readings.
+"""
+
+from typing import Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+STAGE_NAMES = ("Normal", "FloodAlert", "FloodWarning", "SevereFloodWarning")
+
+# Stage trigger columns of FloodGaugeCDM.create_gauge_mapping, in stage order
+STAGE_COLUMNS = ("flood_alert", "flood_warning", "severe_flood_warning")
+
+
+class FloodStageMonitor:
+    """
+    Streaming stage-crossing engine with hysteresis for many flood gauges.
+
+    Example:
+        monitor = FloodStageMonitor.from_gauge_mappings(gauges, hysteresis=0.05)
+        events = monitor.process(readings["gauge_id"], readings["time"], readings["level"])
+    """
+    def __init__(self, gauge_ids: Sequence[str], trigger_levels: np.ndarray,
+                 hysteresis: Union[float, np.ndarray] = 0.05):
+        """
+        Initialize the monitor with every gauge in the Normal stage.
+
+        Args:
+            gauge_ids: Gauge IDs
+            trigger_levels: Array of shape (gauges, 3) with the FloodAlert, FloodWarning
+                and SevereFloodWarning levels in metres; NaN disables a stage
+            hysteresis: Drop below a trigger level (metres) needed to leave its stage,
+                scalar or per gauge
+
+        Raises:
+            ValueError: If the trigger levels do not match the gauges or IDs are duplicated
+        """
+        self.gauge_ids = pd.Index([str(gauge_id) for gauge_id in gauge_ids])
+        if not self.gauge_ids.is_unique:
+            raise ValueError("Duplicate gauge IDs")
+        trigger_levels = np.asarray(trigger_levels, dtype=np.float64)
+        if trigger_levels.shape != (len(self.gauge_ids), len(STAGE_COLUMNS)):
+            raise ValueError(f"trigger_levels must have shape ({len(self.gauge_ids)}, {len(STAGE_COLUMNS)}), "
+                             f"got {trigger_levels.shape}")
+
+        # Missing levels never trigger
+        self.trigger_levels = np.where(np.isnan(trigger_levels), np.inf, trigger_levels)
+        hysteresis = np.broadcast_to(np.asarray(hysteresis, dtype=np.float64), (len(self.gauge_ids),))
+        self.release_levels = self.trigger_levels - hysteresis[:, None]
+
+        n_gauges = len(self.gauge_ids)
+        self.stage = np.zeros(n_gauges, dtype=np.int8)
+        self.last_time = np.full(n_gauges, np.iinfo(np.int64).min, dtype=np.int64)
+        self.last_level = np.full(n_gauges, np.nan, dtype=np.float32)
+        self.readings_processed = 0
+        self.readings_skipped = 0
+
+    @classmethod
+    def from_gauge_mappings(cls, gauge_mappings: Sequence[dict],
+                            hysteresis: Union[float, np.ndarray] = 0.05) -> "FloodStageMonitor":
+        """
+        Build a monitor from flood gauge mappings (FloodGaugeCDM.create_gauge_mapping output).
+
+        Args:
+            gauge_mappings: Mapped gauges with gauge_id and the stage trigger levels
+            hysteresis: Drop below a trigger level (metres) needed to leave its stage
+
+        Returns:
+            FloodStageMonitor for the gauges
+        """
+        gauge_ids = [mapping["gauge_id"] for mapping in gauge_mappings]
+        levels = np.array([[mapping.get(column, np.nan) for column in STAGE_COLUMNS]
+                           for mapping in gauge_mappings], dtype=np.float64).reshape(-1, len(STAGE_COLUMNS))
+        return cls(gauge_ids, levels, hysteresis)
+
+    def gauge_index(self, gauge_ids: Sequence[str]) -> np.ndarray:
+        """
+        Resolve gauge IDs to gauge indices (-1 for unknown gauges).
+        Resolving IDs once and passing indices to process() skips the lookup per batch.
+
+        Args:
+            gauge_ids: Gauge IDs
+
+        Returns:
+            Array of gauge indices
+        """
+        return self.gauge_ids.get_indexer(pd.Index(gauge_ids).astype(str))
+
+    def process(self, gauges: Sequence, timestamps: Sequence, levels: Sequence) -> pd.DataFrame:
+        """
+        Ingest a batch of readings and return the stage crossings it causes.
+        Readings of each gauge are applied in timestamp order; readings of unknown
+        gauges, with a NaN level, or not newer than the gauge's last reading are skipped,
+        as are all but the first (in batch order) of readings sharing a timestamp.
+
+        Args:
+            gauges: Gauge IDs, or integer gauge indices from gauge_index() (out-of-range
+                indices count as unknown gauges)
+            timestamps: Reading times (datetime-like or int64 nanoseconds)
+            levels: Water levels in metres
+
+        Returns:
+            DataFrame of crossings (gauge_id, time, level, from_stage, to_stage) in
+            gauge then time order; stages index STAGE_NAMES
+        """
+        gauges = np.asarray(gauges)
+        if gauges.dtype.kind in "iu":
+            gauge = gauges.astype(np.int64)
+            gauge[(gauge < 0) | (gauge >= len(self.gauge_ids))] = -1
+        else:
+            gauge = self.gauge_index(gauges)
+        times = np.asarray(timestamps)
+        if times.dtype.kind == "M":
+            times = times.astype("datetime64[ns]").view(np.int64)
+        elif times.dtype.kind != "i":
+            times = pd.to_datetime(times, format="ISO8601").to_numpy().astype("datetime64[ns]").view(np.int64)
+        levels = np.asarray(levels, dtype=np.float64)
+
+        # Order by gauge, then time; drop unusable readings
+        order = np.lexsort((times, gauge))
+        gauge, times, levels = gauge[order], times[order], levels[order]
+        keep = (gauge >= 0) & ~np.isnan(levels)
+        keep[keep] = times[keep] > self.last_time[gauge[keep]]
+        # Of repeated (gauge, time) pairs only the first survives; lexsort is stable
+        kept = np.flatnonzero(keep)
+        repeated = (gauge[kept[1:]] == gauge[kept[:-1]]) & (times[kept[1:]] == times[kept[:-1]])
+        keep[kept[1:][repeated]] = False
+        self.readings_skipped += int(len(keep) - keep.sum())
+        gauge, times, levels = gauge[keep], times[keep], levels[keep]
+        n = len(gauge)
+        self.readings_processed += n
+        if n == 0:
+            return self._events(gauge, times, levels, np.empty(0, np.int8), np.empty(0, np.int8))
+
+        # Per-reading clamp bounds: stages whose trigger / release level is reached
+        up = (levels[:, None] >= self.trigger_levels[gauge]).sum(axis=1, dtype=np.int8)
+        down = (levels[:, None] >= self.release_levels[gauge]).sum(axis=1, dtype=np.int8)
+
+        # Segmented inclusive scan of clamp composition (Hillis-Steele)
+        segment_start = np.flatnonzero(np.r_[True, gauge[1:] != gauge[:-1]])
+        first = np.repeat(segment_start, np.diff(np.r_[segment_start, n]))
+        position = np.arange(n) - first
+        max_length = int(position.max()) + 1
+        offset = 1
+        while offset < max_length:
+            idx = np.flatnonzero(position >= offset)
+            prev_up, prev_down = up[idx - offset], down[idx - offset]
+            cur_up, cur_down = up[idx], down[idx]
+            up[idx] = np.minimum(np.maximum(prev_up, cur_up), cur_down)
+            down[idx] = np.minimum(np.maximum(prev_down, cur_up), cur_down)
+            offset *= 2
+
+        initial = self.stage[gauge]
+        stage = np.minimum(np.maximum(initial, up), down)
+        previous = np.empty_like(stage)
+        previous[1:] = stage[:-1]
+        previous[segment_start] = initial[segment_start]
+        crossed = np.flatnonzero(stage != previous)
+
+        # Persist the final state of every gauge seen in the batch
+        segment_end = np.r_[segment_start[1:], n] - 1
+        last_gauge = gauge[segment_end]
+        self.stage[last_gauge] = stage[segment_end]
+        self.last_time[last_gauge] = times[segment_end]
+        self.last_level[last_gauge] = levels[segment_end]
+
+        return self._events(gauge[crossed], times[crossed], levels[crossed], previous[crossed], stage[crossed])
+
+    def _events(self, gauge: np.ndarray, times: np.ndarray, levels: np.ndarray,
+                from_stage: np.ndarray, to_stage: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame({
+            'gauge_id': self.gauge_ids[gauge].to_numpy(),
+            'time': times.view("datetime64[ns]"),
+            'level': levels,
+            'from_stage': from_stage.astype(np.int8),
+            'to_stage': to_stage.astype(np.int8),
+        })
+
+    def current_stages(self) -> pd.DataFrame:
+        """
+        Return the current state of every gauge.
+
+        Returns:
+            DataFrame indexed by gauge_id with stage, stage_name, last_time and last_level
+        """
+        return pd.DataFrame({
+            'stage': self.stage,
+            'stage_name': np.asarray(STAGE_NAMES)[self.stage],
+            'last_time': self.last_time.view("datetime64[ns]"),  # the int64 minimum is NaT
+            'last_level': self.last_level,
+        }, index=self.gauge_ids.rename("gauge_id"))
@@ -0,0 +1,270 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Nearest flood gauge assignment for property portfolios.
+
+This module joins every PropertyCDM asset (latitude/longitude) to the
+nearest eligible FloodGaugeCDM gauge (gauge_latitude/gauge_longitude) by
+great-circle distance, optionally restricted by OperationalStatus and
+CertificationStatus. Gauges are held in a PropertySpatialIndex, so a batch
+costs a binary search per property rather than a scan of every gauge.
+
+Assignments are cached per property ID: properties whose coordinates did
+not change are not requeried, and a gauge update only requeries the
+properties of gauges that moved or became ineligible, while the others are
+compared against the new or moved gauges alone.
+"""
+
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .property_spatial_index import PropertySpatialIndex
+from .wind_field import haversine_km
+
+# Gauge grid cell in degrees (~11 km of latitude), about the spacing of a national gauge network
+GAUGE_CELL_DEG = 0.1
+
+# Gained gauges per block of the gained x assigned gauge distance matrix
+GAUGE_BLOCK = 256
+
+
+def _records_columns(records: Union[pd.DataFrame, Sequence[dict]], columns: Sequence[str]) -> pd.DataFrame:
+    """Return the given columns of mapped records (a frame or a sequence of mappings) as a frame."""
+    if isinstance(records, pd.DataFrame):
+        frame = records.reindex(columns=list(columns))
+    else:
+        frame = pd.DataFrame.from_records([{column: record.get(column) for column in columns} for record in records],
+                                          columns=list(columns))
+    return frame
+
+
+def _float_column(frame: pd.DataFrame, column: str) -> np.ndarray:
+    return pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+class GaugeAssigner:
+    """
+    Cached nearest-gauge join of properties to flood gauges.
+
+    Example:
+        assigner = GaugeAssigner(operational_statuses=["Fully operational"],
+                                 certification_statuses=["Fully certified", "Provisional"])
+        assigner.update_gauges(gauge_mappings)
+        nearest = assigner.assign(property_mappings)   # property_id -> gauge_id, distance_km
+    """
+    def __init__(self, operational_statuses: Optional[Sequence[str]] = None,
+                 certification_statuses: Optional[Sequence[str]] = None,
+                 max_distance_km: Optional[float] = None, cell_deg: float = GAUGE_CELL_DEG):
+        """
+        Initialize an assigner with no gauges or properties.
+
+        Args:
+            operational_statuses: OperationalStatus values a gauge must have (None for any)
+            certification_statuses: CertificationStatus values a gauge must have (None for any)
+            max_distance_km: Leave properties unassigned when the nearest gauge is further away
+            cell_deg: Grid cell size in degrees of the gauge spatial index
+        """
+        self.operational_statuses = None if operational_statuses is None else set(operational_statuses)
+        self.certification_statuses = None if certification_statuses is None else set(certification_statuses)
+        self.max_distance_km = max_distance_km
+        self.cell_deg = cell_deg
+
+        # Gauge table, append-only so cached gauge positions stay valid; removed gauges become ineligible
+        self.gauge_ids = pd.Index([], dtype=object)
+        self._gauge_lat = np.empty(0)
+        self._gauge_lon = np.empty(0)
+        self._eligible = np.empty(0, dtype=bool)
+        self._index = PropertySpatialIndex(cell_deg=cell_deg)
+        self._index_gauges = np.empty(0, dtype=np.int64)
+
+        # Property cache: coordinates used and the nearest eligible gauge position (-1 for none)
+        self.property_ids = pd.Index([], dtype=object)
+        self._lat = np.empty(0)
+        self._lon = np.empty(0)
+        self._gauge = np.empty(0, dtype=np.int64)
+        self._distance = np.empty(0)
+
+        # Properties requeried by the last assign/update_gauges call
+        self.last_recomputed = 0
+
+    def _gauge_eligibility(self, gauges: pd.DataFrame) -> np.ndarray:
+        eligible = ~(np.isnan(_float_column(gauges, "gauge_latitude"))
+                     | np.isnan(_float_column(gauges, "gauge_longitude")))
+        if self.operational_statuses is not None:
+            eligible &= gauges["operational_status"].isin(self.operational_statuses).to_numpy()
+        if self.certification_statuses is not None:
+            eligible &= gauges["certification_status"].isin(self.certification_statuses).to_numpy()
+        return eligible
+
+    def _gauge_index(self, positions: np.ndarray) -> Tuple[PropertySpatialIndex, np.ndarray]:
+        """Return a spatial index over the gauges at positions and the positions by index row."""
+        index = PropertySpatialIndex.from_arrays(self.gauge_ids[positions].astype(str), self._gauge_lat[positions],
+                                                 self._gauge_lon[positions], cell_deg=self.cell_deg)
+        return index, positions
+
+    def _nearest(self, index: PropertySpatialIndex, index_gauges: np.ndarray,
+                 properties: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (gauge position, distance) of the nearest indexed gauge to each cached property."""
+        rows, distances = index.query_knn(self._lat[properties], self._lon[properties], k=1)
+        rows, distances = rows[:, 0], distances[:, 0]
+        return np.where(rows >= 0, index_gauges[np.maximum(rows, 0)], -1), np.where(rows >= 0, distances, np.nan)
+
+    def update_gauges(self, gauge_mappings: Union[pd.DataFrame, Sequence[dict]]) -> int:
+        """
+        Replace the gauge set (FloodGaugeCDM.create_gauge_mapping output or a frame of it).
+
+        Gauges missing from gauge_mappings are dropped. Cached properties are
+        requeried only if their gauge moved or became ineligible; the rest
+        switch to a new, newly eligible or moved gauge only if it is nearer.
+
+        Args:
+            gauge_mappings: Mapped gauges with gauge_id, gauge_latitude, gauge_longitude,
+                operational_status and certification_status
+
+        Returns:
+            Number of gauges whose position or eligibility changed
+
+        Raises:
+            ValueError: If gauge IDs are duplicated
+        """
+        gauges = _records_columns(gauge_mappings, ("gauge_id", "gauge_latitude", "gauge_longitude",
+                                                   "operational_status", "certification_status"))
+        ids = pd.Index(gauges["gauge_id"].astype(str))
+        if not ids.is_unique:
+            raise ValueError("Duplicate gauge IDs")
+
+        positions = self.gauge_ids.get_indexer(ids)
+        added = positions < 0
+        n_old = len(self.gauge_ids)
+        positions[added] = np.arange(n_old, n_old + int(added.sum()))
+        self.gauge_ids = self.gauge_ids.append(ids[added])
+
+        lat = np.concatenate([self._gauge_lat, np.full(int(added.sum()), np.nan)])
+        lon = np.concatenate([self._gauge_lon, np.full(int(added.sum()), np.nan)])
+        old_eligible = np.concatenate([self._eligible, np.zeros(int(added.sum()), dtype=bool)])
+        new_lat, new_lon = _float_column(gauges, "gauge_latitude"), _float_column(gauges, "gauge_longitude")
+        moved = np.zeros(len(lat), dtype=bool)
+        moved[positions] = (new_lat != lat[positions]) | (new_lon != lon[positions])
+        lat[positions], lon[positions] = new_lat, new_lon
+        eligible = np.zeros(len(lat), dtype=bool)
+        eligible[positions] = self._gauge_eligibility(gauges)
+
+        lost = old_eligible & (~eligible | moved)
+        gained = eligible & (~old_eligible | moved)
+        self._gauge_lat, self._gauge_lon, self._eligible = lat, lon, eligible
+        self._index, self._index_gauges = self._gauge_index(np.flatnonzero(eligible))
+
+        # Properties of lost gauges (or of none) need a full requery; the others only race the gained gauges
+        stale = (self._gauge >= 0) & lost[np.maximum(self._gauge, 0)] | ((self._gauge < 0) & ~np.isnan(self._lat))
+        fresh = np.flatnonzero((self._gauge >= 0) & ~stale)
+        self._requery(np.flatnonzero(stale))
+        candidates = self._gained_candidates(fresh, np.flatnonzero(gained))
+        if len(candidates):
+            gained_index, gained_gauges = self._gauge_index(np.flatnonzero(gained))
+            gauge, distance = self._nearest(gained_index, gained_gauges, candidates)
+            nearer = distance < self._distance[candidates]
+            self._gauge[candidates[nearer]] = gauge[nearer]
+            self._distance[candidates[nearer]] = distance[nearer]
+        self.last_recomputed = int(stale.sum()) + len(candidates)
+        return int((lost | gained).sum())
+
+    def _gained_candidates(self, fresh: np.ndarray, gained: np.ndarray) -> np.ndarray:
+        """
+        Return the properties at fresh positions that a gained gauge could be nearer to.
+
+        A property p of gauge a at distance d_p can only switch to a gauge g
+        with dist(p, g) < d_p, which by the triangle inequality puts g within
+        2 d_p of a; so only properties of gauges within twice their furthest
+        property's distance of a gained gauge are compared.
+        """
+        if not len(fresh) or not len(gained):
+            return np.empty(0, dtype=np.int64)
+        reach = np.zeros(len(self.gauge_ids))
+        np.maximum.at(reach, self._gauge[fresh], self._distance[fresh])
+        owners = np.flatnonzero(reach > 0.0)
+        near = np.zeros(len(owners), dtype=bool)
+        for start in range(0, len(gained), GAUGE_BLOCK):
+            block = gained[start:start + GAUGE_BLOCK]
+            distance = haversine_km(self._gauge_lat[block, None], self._gauge_lon[block, None],
+                                    self._gauge_lat[None, owners], self._gauge_lon[None, owners])
+            near |= (distance <= 2.0 * reach[owners]).any(axis=0)
+        return fresh[np.isin(self._gauge[fresh], owners[near])]
+
+    def _requery(self, properties: np.ndarray) -> None:
+        """Assign the cached properties at the given positions against every eligible gauge."""
+        if not len(properties):
+            return
+        self._gauge[properties], self._distance[properties] = self._nearest(self._index, self._index_gauges,
+                                                                            properties)
+
+    def assign(self, property_mappings: Union[pd.DataFrame, Sequence[dict]]) -> pd.DataFrame:
+        """
+        Assign properties to their nearest eligible gauge, reusing cached assignments.
+
+        Only properties that are new or whose coordinates changed are queried.
+
+        Args:
+            property_mappings: Mapped properties (PropertyCDM) with property_id, latitude and longitude
+
+        Returns:
+            DataFrame indexed by property_id, in input order, with gauge_id and
+            distance_km (NaN/None where no eligible gauge is within range)
+
+        Raises:
+            ValueError: If property IDs are duplicated
+        """
+        properties = _records_columns(property_mappings, ("property_id", "latitude", "longitude"))
+        ids = pd.Index(properties["property_id"].astype(str))
+        if not ids.is_unique:
+            raise ValueError("Duplicate property IDs")
+        lat, lon = _float_column(properties, "latitude"), _float_column(properties, "longitude")
+
+        positions = self.property_ids.get_indexer(ids)
+        added = positions < 0
+        n_added = int(added.sum())
+        n_old = len(self.property_ids)
+        positions[added] = np.arange(n_old, n_old + n_added)
+        if n_added:
+            self.property_ids = self.property_ids.append(ids[added])
+            self._lat = np.concatenate([self._lat, np.full(n_added, np.nan)])
+            self._lon = np.concatenate([self._lon, np.full(n_added, np.nan)])
+            self._gauge = np.concatenate([self._gauge, np.full(n_added, -1, dtype=np.int64)])
+            self._distance = np.concatenate([self._distance, np.full(n_added, np.nan)])
+
+        # NaN != NaN, so compare coordinates with missing values treated as equal
+        changed = added | ~(((lat == self._lat[positions]) | (np.isnan(lat) & np.isnan(self._lat[positions])))
+                            & ((lon == self._lon[positions]) | (np.isnan(lon) & np.isnan(self._lon[positions]))))
+        stale = positions[changed]
+        self._lat[stale], self._lon[stale] = lat[changed], lon[changed]
+        self._gauge[stale], self._distance[stale] = -1, np.nan
+        self._requery(stale[~np.isnan(self._lat[stale]) & ~np.isnan(self._lon[stale])])
+        self.last_recomputed = len(stale)
+        return self._frame(positions)
+
+    def assignments(self) -> pd.DataFrame:
+        """Return the cached assignment of every property seen so far."""
+        return self._frame(np.arange(len(self.property_ids)))
+
+    def _frame(self, positions: np.ndarray) -> pd.DataFrame:
+        gauge, distance = self._gauge[positions], self._distance[positions]
+        if self.max_distance_km is not None:
+            gauge = np.where(distance <= self.max_distance_km, gauge, -1)
+        assigned = gauge >= 0
+        gauge_ids = np.full(len(positions), None, dtype=object)
+        gauge_ids[assigned] = self.gauge_ids.to_numpy()[gauge[assigned]]
+        return pd.DataFrame({"gauge_id": gauge_ids, "distance_km": np.where(assigned, distance, np.nan)},
+                            index=pd.Index(self.property_ids[positions], name="property_id"))
@@ -0,0 +1,383 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Memory-mapped hazard raster sampler for property coordinates.
+
+A hazard raster is a regular latitude/longitude grid split into tiles,
+stored as a directory of .npy (or headerless .raw) tile files with a JSON
+header giving the grid origin, pixel size, dtype, nodata value and the
+tiles present; all-nodata tiles are not written. Tiles are memory-mapped
+on first touch only, and points are converted to pixel coordinates and
+grouped by tile with NumPy, so sampling millions of properties reads just
+the pages of the tiles they fall in. Sampling is nearest-pixel or
+bilinear; categorical rasters (such as EA flood zones) store codes with
+their labels in the header.
+
+backfill_risk_fields fills missing PropertyCDM RiskAssessment columns
+(flood_zone, ground_level_meters, river_distance, ...) from rasters.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .property_cdm import PropertyCDM
+
+RASTER_FORMAT_VERSION = 1
+INDEX_FILE = "index.json"
+TILE_FORMATS = ("npy", "raw")
+
+# PropertyCDM mapping columns of the RiskAssessment section
+RISK_ASSESSMENT_COLUMNS = [column for column, path in PropertyCDM._FIELD_COLUMNS.items()
+                           if path.startswith("PropertyHeader.RiskAssessment.")]
+
+
+def _tile_file(tile_row: int, tile_col: int, tile_format: str) -> str:
+    return f"tile_{tile_row:04d}_{tile_col:04d}.{tile_format}"
+
+
+class HazardRaster:
+    """
+    Tiled, memory-mapped latitude/longitude hazard grid.
+
+    Pixel (row, col) covers latitudes origin_lat - (row + 1) * pixel_deg[0]
+    to origin_lat - row * pixel_deg[0] and longitudes origin_lon + col *
+    pixel_deg[1] to origin_lon + (col + 1) * pixel_deg[1]; rows run north
+    to south.
+
+    Example:
+        raster = HazardRaster.open("rasters/ground_level")
+        ground = raster.sample(lat, lon, method="bilinear")
+        zones = HazardRaster.open("rasters/ea_flood_zone").sample_labels(lat, lon)
+    """
+    def __init__(self, path: str, index: dict):
+        """
+        Initialize the raster from its header.
+        Use HazardRaster.create or HazardRaster.open instead.
+
+        Args:
+            path: Raster directory
+            index: Raster header
+        """
+        self.path = path
+        self.dtype = np.dtype(index["dtype"])
+        self.shape: Tuple[int, int] = tuple(index["shape"])
+        self.tile_shape: Tuple[int, int] = tuple(index["tile_shape"])
+        self.origin_lat = float(index["origin_lat"])
+        self.origin_lon = float(index["origin_lon"])
+        self.pixel_deg: Tuple[float, float] = tuple(index["pixel_deg"])
+        self.nodata = index.get("nodata")
+        self.categories: Optional[List[str]] = index.get("categories")
+        self.tile_format = index.get("tile_format", "npy")
+        self._n_tile_cols = -(-self.shape[1] // self.tile_shape[1])
+        self._present = {tile_row * self._n_tile_cols + tile_col for tile_row, tile_col in index["tiles"]}
+        self._tiles: Dict[int, np.ndarray] = {}
+
+    @classmethod
+    def create(cls, path: str, data: np.ndarray, origin_lat: float, origin_lon: float,
+               pixel_deg: Union[float, Sequence[float]], tile_size: int = 1024, nodata=None,
+               categories: Optional[Sequence[str]] = None, tile_format: str = "npy") -> "HazardRaster":
+        """
+        Write a raster from a 2-D array (which may itself be memory-mapped).
+
+        Args:
+            path: Raster directory (created if missing; an existing raster is overwritten)
+            data: Grid of shape (rows, cols), north row first
+            origin_lat: Latitude of the north edge in degrees
+            origin_lon: Longitude of the west edge in degrees
+            pixel_deg: Pixel size in degrees, or (latitude, longitude) sizes
+            tile_size: Tile edge in pixels
+            nodata: Value marking missing pixels (NaN always counts as missing for floats)
+            categories: Labels of a categorical raster, where pixel value k means categories[k]
+            tile_format: "npy" (NPY header per tile) or "raw" (headerless, described by index.json)
+
+        Returns:
+            Opened raster
+
+        Raises:
+            ValueError: If the data is not 2-D or the tile format is unknown
+        """
+        data = np.asarray(data) if not isinstance(data, np.ndarray) else data
+        if data.ndim != 2:
+            raise ValueError(f"Raster data must be 2-D, got shape {data.shape}")
+        if tile_format not in TILE_FORMATS:
+            raise ValueError(f"Unknown tile format {tile_format!r}, expected one of {TILE_FORMATS}")
+        pixel_deg = tuple(float(p) for p in np.broadcast_to(np.asarray(pixel_deg, dtype=np.float64), (2,)))
+
+        os.makedirs(path, exist_ok=True)
+        tiles = []
+        for tile_row in range(-(-data.shape[0] // tile_size)):
+            for tile_col in range(-(-data.shape[1] // tile_size)):
+                tile = np.ascontiguousarray(data[tile_row * tile_size:(tile_row + 1) * tile_size,
+                                                 tile_col * tile_size:(tile_col + 1) * tile_size])
+                missing = np.isnan(tile) if tile.dtype.kind == "f" else np.zeros(tile.shape, dtype=bool)
+                if nodata is not None:
+                    missing |= tile == nodata
+                if missing.all():
+                    continue
+                tile_path = os.path.join(path, _tile_file(tile_row, tile_col, tile_format))
+                if tile_format == "npy":
+                    np.save(tile_path, tile)
+                else:
+                    tile.tofile(tile_path)
+                tiles.append([tile_row, tile_col])
+
+        index = {
+            "format_version": RASTER_FORMAT_VERSION,
+            "dtype": data.dtype.str,
+            "shape": list(data.shape),
+            "tile_shape": [tile_size, tile_size],
+            "origin_lat": float(origin_lat),
+            "origin_lon": float(origin_lon),
+            "pixel_deg": list(pixel_deg),
+            "nodata": None if nodata is None else np.asarray(nodata, dtype=data.dtype).item(),
+            "categories": None if categories is None else list(categories),
+            "tile_format": tile_format,
+            "tiles": tiles,
+        }
+        tmp_path = os.path.join(path, f"{INDEX_FILE}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, os.path.join(path, INDEX_FILE))
+        return cls(path, index)
+
+    @classmethod
+    def open(cls, path: str) -> "HazardRaster":
+        """
+        Open a raster by reading its header only; tiles are mapped on first use.
+
+        Args:
+            path: Raster directory
+
+        Returns:
+            Opened raster
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        with open(os.path.join(path, INDEX_FILE), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("format_version") != RASTER_FORMAT_VERSION:
+            raise ValueError(f"Unsupported hazard raster format: {index.get('format_version')}")
+        return cls(path, index)
+
+    @property
+    def tiles_opened(self) -> int:
+        """Return the number of tiles memory-mapped so far."""
+        return len(self._tiles)
+
+    def _tile(self, tile: int) -> Optional[np.ndarray]:
+        """Return the memory-mapped tile with flat number tile, or None if it was not written."""
+        if tile in self._tiles:
+            return self._tiles[tile]
+        if tile not in self._present:
+            return None
+        tile_row, tile_col = divmod(tile, self._n_tile_cols)
+        tile_path = os.path.join(self.path, _tile_file(tile_row, tile_col, self.tile_format))
+        if self.tile_format == "npy":
+            array = np.load(tile_path, mmap_mode="r")
+        else:
+            shape = (min(self.tile_shape[0], self.shape[0] - tile_row * self.tile_shape[0]),
+                     min(self.tile_shape[1], self.shape[1] - tile_col * self.tile_shape[1]))
+            array = np.memmap(tile_path, dtype=self.dtype, mode="r", shape=shape)
+        self._tiles[tile] = array
+        return array
+
+    def pixel_coordinates(self, lat, lon) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert coordinates to fractional pixel coordinates, integers at pixel centres.
+
+        Args:
+            lat: Latitudes in degrees
+            lon: Longitudes in degrees
+
+        Returns:
+            Tuple of (row, col) float arrays
+        """
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        return (self.origin_lat - lat) / self.pixel_deg[0] - 0.5, (lon - self.origin_lon) / self.pixel_deg[1] - 0.5
+
+    def read_pixels(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """
+        Read pixels by integer row and column, touching each tile once.
+
+        Args:
+            rows: Pixel rows
+            cols: Pixel columns
+
+        Returns:
+            float64 values; NaN outside the grid, in missing tiles and for nodata
+        """
+        rows = np.asarray(rows, dtype=np.int64).ravel()
+        cols = np.asarray(cols, dtype=np.int64).ravel()
+        values = np.full(len(rows), np.nan)
+        inside = np.flatnonzero((rows >= 0) & (rows < self.shape[0]) & (cols >= 0) & (cols < self.shape[1]))
+        if not len(inside):
+            return values
+
+        tile_rows, tile_cols = self.tile_shape
+        tile = (rows[inside] // tile_rows) * self._n_tile_cols + cols[inside] // tile_cols
+        # Stable sorts of 16-bit keys are radix sorts, far faster than sorting int64
+        n_tiles = -(-self.shape[0] // tile_rows) * self._n_tile_cols
+        order = np.argsort(tile.astype(np.uint16) if n_tiles <= 1 << 16 else tile, kind="stable")
+        counts = np.bincount(tile, minlength=n_tiles)
+        touched = np.flatnonzero(counts)
+        ends = np.cumsum(counts)[touched]
+        starts = ends - counts[touched]
+        for number, start, end in zip(touched.tolist(), starts.tolist(), ends.tolist()):
+            array = self._tile(number)
+            if array is None:
+                continue
+            points = inside[order[start:end]]
+            tile_row, tile_col = divmod(number, self._n_tile_cols)
+            values[points] = array[rows[points] - tile_row * tile_rows, cols[points] - tile_col * tile_cols]
+        if self.nodata is not None:
+            values[values == self.nodata] = np.nan
+        return values
+
+    def sample(self, lat, lon, method: str = "bilinear") -> np.ndarray:
+        """
+        Sample the raster at coordinates.
+
+        Bilinear sampling weights the four surrounding pixel centres and
+        renormalizes over those that are not missing (the value is missing
+        if the nearest pixel is); categorical rasters are always sampled nearest.
+
+        Args:
+            lat: Latitudes in degrees
+            lon: Longitudes in degrees
+            method: "nearest" or "bilinear"
+
+        Returns:
+            float64 values; NaN where missing or outside the grid
+
+        Raises:
+            ValueError: If the method is unknown
+        """
+        if method not in ("nearest", "bilinear"):
+            raise ValueError(f"Unknown sampling method {method!r}, expected 'nearest' or 'bilinear'")
+        row, col = self.pixel_coordinates(lat, lon)
+        shape = row.shape
+        row, col = row.ravel(), col.ravel()
+        known = ~(np.isnan(row) | np.isnan(col))
+        row, col = np.where(known, row, -1.0), np.where(known, col, -1.0)
+        if method == "nearest" or self.categories is not None:
+            return self.read_pixels(np.floor(row + 0.5), np.floor(col + 0.5)).reshape(shape)
+
+        row0, col0 = np.floor(row), np.floor(col)
+        dr, dc = row - row0, col - col0
+        corners = self.read_pixels(np.concatenate([row0, row0, row0 + 1, row0 + 1]),
+                                   np.concatenate([col0, col0 + 1, col0, col0 + 1])).reshape(4, -1)
+        weights = np.stack([(1 - dr) * (1 - dc), (1 - dr) * dc, dr * (1 - dc), dr * dc])
+        # Missing where the nearest pixel is missing, else renormalize over the valid corners.
+        # The nearest corner is found with the rounding of nearest sampling, so ties agree.
+        nearest = 2 * (np.floor(row + 0.5) > row0) + (np.floor(col + 0.5) > col0)
+        nearest_missing = np.isnan(corners[nearest, np.arange(len(row))])
+        weights[np.isnan(corners)] = 0.0
+        total = weights.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = (np.nan_to_num(corners) * weights).sum(axis=0) / total
+        values[nearest_missing | (total <= 0.0)] = np.nan
+        return values.reshape(shape)
+
+    def sample_labels(self, lat, lon) -> np.ndarray:
+        """
+        Sample a categorical raster and return its labels.
+
+        Args:
+            lat: Latitudes in degrees
+            lon: Longitudes in degrees
+
+        Returns:
+            Object array of category labels; None where missing or out of range
+
+        Raises:
+            ValueError: If the raster has no categories
+        """
+        if self.categories is None:
+            raise ValueError(f"Raster {self.path} is not categorical")
+        codes = self.sample(lat, lon, method="nearest")
+        labels = np.array(list(self.categories) + [None], dtype=object)
+        valid = ~np.isnan(codes) & (codes >= 0) & (codes < len(self.categories))
+        return labels[np.where(valid, codes, len(self.categories)).astype(np.int64)]
+
+
+def backfill_risk_fields(properties: Union[pd.DataFrame, List[dict]], rasters: Dict[str, HazardRaster],
+                         method: str = "bilinear", fallback_as_missing: bool = True) -> Dict[str, int]:
+    """
+    Fill missing PropertyCDM RiskAssessment columns of properties from hazard rasters, in place.
+
+    Args:
+        properties: Mapped properties (create_property_mapping output) as a frame
+            or list of mappings, with latitude and longitude
+        rasters: Raster per RiskAssessment column (e.g. "flood_zone", "ground_level_meters",
+            "river_distance"); categorical rasters fill their labels. Filling
+            ground_level_meters writes the same values to its alias elevation
+        method: Sampling method of numeric rasters, "nearest" or "bilinear"
+        fallback_as_missing: Also fill values equal to PropertyCDM's fallback
+            (the 12.0 m default ground level), which mark an unknown value
+
+    Returns:
+        Number of values filled per column
+
+    Raises:
+        ValueError: If a raster targets a column outside RiskAssessment
+    """
+    unknown = sorted(set(rasters) - set(RISK_ASSESSMENT_COLUMNS))
+    if unknown:
+        raise ValueError(f"Error backfilling risk fields: {unknown} are not RiskAssessment columns")
+    is_frame = isinstance(properties, pd.DataFrame)
+    frame = properties if is_frame else pd.DataFrame.from_records(
+        [{column: p.get(column) for column in ["latitude", "longitude"] + list(rasters)} for p in properties])
+    lat = pd.to_numeric(frame["latitude"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    lon = pd.to_numeric(frame["longitude"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def write(column: str, rows: np.ndarray, values: np.ndarray, categorical: bool) -> None:
+        if not is_frame:
+            for row, value in zip(rows.tolist(), values.tolist()):
+                properties[row][column] = value
+            return
+        if column not in frame.columns:
+            frame[column] = None if categorical else np.nan
+        frame[column] = frame[column].astype(object) if categorical else pd.to_numeric(frame[column], errors="coerce")
+        frame.iloc[rows, frame.columns.get_loc(column)] = values
+
+    fallbacks = PropertyCDM._COLUMN_FALLBACKS if fallback_as_missing else {}
+    located = ~(np.isnan(lat) | np.isnan(lon))
+    filled = {}
+    for column, raster in rasters.items():
+        current = frame[column] if column in frame.columns else pd.Series(None, index=frame.index, dtype=object)
+        missing = current.isna().to_numpy().copy()
+        if column in fallbacks:
+            missing |= (current == fallbacks[column]).fillna(False).to_numpy(dtype=bool)
+        rows = np.flatnonzero(missing & located)
+        if raster.categories is not None:
+            sampled = raster.sample_labels(lat[rows], lon[rows])
+            found = pd.notna(sampled)
+        else:
+            sampled = raster.sample(lat[rows], lon[rows], method=method)
+            found = ~np.isnan(sampled)
+        rows, sampled = rows[found], sampled[found]
+        filled[column] = len(rows)
+        write(column, rows, sampled, raster.categories is not None)
+        # elevation maps the same GroundLevelMeters field; keep the alias in step
+        if column == "ground_level_meters" and "elevation" not in rasters:
+            write("elevation", rows, sampled, False)
+            filled["elevation"] = len(rows)
+    return filled
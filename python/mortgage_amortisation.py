@@ -0,0 +1,285 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Vectorized amortisation schedule engine for MortgageCDM portfolios.
+
+This module projects the scheduled cash flows of every loan in a
+portfolio from origination, as (loans x periods) arrays of closing
+balance, interest, principal and payment on a monthly grid. Loans are
+processed in chunks sized to a memory budget; within a chunk, each month
+is one set of vector operations over all loans.
+
+Loans pay OriginalLendingRate for the longer of InitialFixedTerm and
+IntroductoryRatePeriod, then revert to CurrentBoEBase plus OriginalSpread,
+with the level payment recomputed on the remaining balance and term at
+each rate reset. Weekly and Biweekly loans accrue at the monthly rate
+equivalent to their PaymentFrequency. InterestOnlyPayment loans repay the
+balance at maturity; BalloonPayment loans amortise down to a balloon of
+balloon_fraction of OriginalLoan, repaid at maturity. Overpayments, when
+enabled, use a share of the OverpaymentAllowance (a fraction of the
+balance per year) with the payment kept unchanged, shortening the loan.
+"""
+
+from typing import Dict, Iterator, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Payments per year by PaymentFrequency
+PAYMENTS_PER_YEAR = {"Monthly": 12, "Biweekly": 26, "Weekly": 52}
+
+# Output arrays of a schedule
+SCHEDULE_ARRAYS = ("balance", "interest", "principal", "payment")
+
+
+class AmortisationSchedule:
+    """Projected cash flows of a block of loans, each array (loans x periods)."""
+    __slots__ = SCHEDULE_ARRAYS
+
+    def __init__(self, balance: np.ndarray, interest: np.ndarray, principal: np.ndarray, payment: np.ndarray):
+        self.balance = balance      # closing balance after each period
+        self.interest = interest
+        self.principal = principal  # scheduled principal plus any overpayment
+        self.payment = payment      # interest + principal
+
+    def __len__(self) -> int:
+        return self.balance.shape[0]
+
+
+class AmortisationEngine:
+    """
+    Amortisation engine over columnar MortgageCDM mappings.
+
+    Example:
+        engine = AmortisationEngine(n_periods=360, memory_budget_mb=256)
+        for rows, schedule in engine.iter_schedules(loans):
+            interest[rows] = schedule.interest.sum(axis=1)
+    """
+
+    def __init__(self, n_periods: int = 360, memory_budget_mb: float = 512.0,
+                 balloon_fraction: float = 0.3, overpayment_utilisation: float = 0.0):
+        """
+        Initialize the engine.
+
+        Args:
+            n_periods: Number of monthly periods projected from origination
+            memory_budget_mb: Memory budget of one chunk's schedule arrays
+            balloon_fraction: Balloon of BalloonPayment loans, as a fraction of OriginalLoan
+            overpayment_utilisation: Share of the OverpaymentAllowance overpaid each year (0 to 1)
+        """
+        self.n_periods = n_periods
+        self.memory_budget_mb = memory_budget_mb
+        self.balloon_fraction = balloon_fraction
+        self.overpayment_utilisation = overpayment_utilisation
+
+    @property
+    def chunk_rows(self) -> int:
+        """Loans per chunk: the schedule arrays of a chunk fit the memory budget."""
+        bytes_per_loan = len(SCHEDULE_ARRAYS) * self.n_periods * np.dtype(np.float64).itemsize
+        return max(1, int(self.memory_budget_mb * 2**20 // bytes_per_loan))
+
+    def loan_terms(self, loans: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        """
+        Extract the amortisation terms of a portfolio as arrays.
+
+        Args:
+            loans: DataFrame or dictionary of equal-length arrays keyed by mapping column name
+
+        Returns:
+            Dictionary of per-loan arrays: loan, term, fixed_periods, fixed_rate,
+            reversion_rate (monthly rates), interest_only, balloon and overpayment
+        """
+        try:
+            frame = loans if isinstance(loans, pd.DataFrame) else pd.DataFrame(loans)
+            n_rows = len(frame)
+
+            def number(name: str, default: float = np.nan) -> np.ndarray:
+                if name not in frame.columns:
+                    return np.full(n_rows, default)
+                return pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=np.float64, na_value=default)
+
+            def flag(name: str) -> np.ndarray:
+                if name not in frame.columns:
+                    return np.zeros(n_rows, dtype=bool)
+                values = frame[name]
+                present = values.notna().to_numpy()
+                result = np.zeros(n_rows, dtype=bool)
+                result[present] = values[present].astype(bool).to_numpy()
+                return result
+
+            if "PaymentFrequency" in frame.columns:
+                payments_per_year = (frame["PaymentFrequency"].astype(object).map(PAYMENTS_PER_YEAR)
+                                     .to_numpy(dtype=np.float64, na_value=12.0))
+            else:
+                payments_per_year = np.full(n_rows, 12.0)
+
+            def monthly(annual_rate: np.ndarray) -> np.ndarray:
+                # Monthly rate equivalent to compounding at each payment
+                return (1.0 + annual_rate / payments_per_year) ** (payments_per_year / 12.0) - 1.0
+
+            fixed_rate = number("OriginalLendingRate")
+            # Without an OriginalSpread, keep the margin over the origination base
+            # rate; without either, the loan stays at OriginalLendingRate
+            margin = fixed_rate - number("OriginalBoEBase")
+            spread = np.where(np.isnan(number("OriginalSpread")), margin, number("OriginalSpread"))
+            reversion_rate = number("CurrentBoEBase") + spread
+            reversion_rate = np.where(np.isnan(reversion_rate), fixed_rate, reversion_rate)
+
+            loan = number("OriginalLoan")
+            return {
+                "loan": loan,
+                "term": np.ceil(number("OriginalTerm", 0.0)),
+                "fixed_periods": np.ceil(np.maximum(number("InitialFixedTerm", 0.0),
+                                                    number("IntroductoryRatePeriod", 0.0))),
+                "fixed_rate": monthly(fixed_rate),
+                "reversion_rate": monthly(reversion_rate),
+                "interest_only": flag("InterestOnlyPayment"),
+                "balloon": np.where(flag("BalloonPayment"), self.balloon_fraction * loan, 0.0),
+                "overpayment": self.overpayment_utilisation * number("OverpaymentAllowance", 0.0) / 12.0,
+            }
+
+        except Exception as e:
+            raise ValueError(f"Error extracting loan terms: {str(e)}")
+
+    def project_terms(self, terms: Dict[str, np.ndarray]) -> AmortisationSchedule:
+        """
+        Project the schedules of a block of loans from their loan_terms arrays.
+
+        Args:
+            terms: loan_terms output (or a slice of each of its arrays)
+
+        Returns:
+            AmortisationSchedule of the block; loans without an OriginalLoan,
+            OriginalTerm or OriginalLendingRate have NaN schedules
+        """
+        n_loans = len(terms["loan"])
+        n_periods = self.n_periods
+        term = terms["term"]
+        fixed_periods = terms["fixed_periods"]
+        balloon = terms["balloon"]
+        overpayment = terms["overpayment"]
+        valid = ~np.isnan(terms["loan"]) & (term > 0) & ~np.isnan(terms["fixed_rate"])
+
+        # Period-major, so every month writes contiguous rows; returned transposed
+        out = {name: np.empty((n_periods, n_loans)) for name in SCHEDULE_ARRAYS}
+        balance = np.where(valid, terms["loan"], 0.0)
+        rate = np.where(fixed_periods > 0, terms["fixed_rate"], terms["reversion_rate"])
+        payment = np.zeros(n_loans)
+        resets = {0: np.arange(n_loans)}
+        for period in np.unique(fixed_periods[(fixed_periods > 0) & (fixed_periods < term)]).tolist():
+            resets[int(period)] = np.flatnonzero(fixed_periods == period)
+        maturities = {int(period) - 1: np.flatnonzero(term == period)
+                      for period in np.unique(term[(term > 0) & (term <= n_periods)]).tolist()}
+        overpays = bool(overpayment.any())
+
+        # Balances are zero after maturity (and for invalid loans), so every
+        # month is the same few operations over all loans in the chunk
+        for t in range(n_periods):
+            reset = resets.get(t)
+            if reset is not None:
+                # Level payment on the remaining balance and term at each rate
+                # reset; interest-only loans pay no principal until maturity
+                if t:
+                    rate[reset] = terms["reversion_rate"][reset]
+                remaining = np.maximum(term[reset] - t, 1.0)
+                r = rate[reset]
+                discount = (1.0 + r) ** -remaining
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    annuity = np.where(r > 0, (balance[reset] - balloon[reset] * discount) * r / (1.0 - discount),
+                                       (balance[reset] - balloon[reset]) / remaining)
+                payment[reset] = np.where(terms["interest_only"][reset], 0.0, annuity)
+
+            interest, principal = out["interest"][t], out["principal"][t]
+            np.multiply(balance, rate, out=interest)
+            np.subtract(payment, interest, out=principal)
+            np.maximum(principal, 0.0, out=principal)
+            if overpays:
+                principal += overpayment * balance
+            np.minimum(principal, balance, out=principal)
+            maturing = maturities.get(t)
+            if maturing is not None:
+                principal[maturing] = balance[maturing]
+            balance = np.subtract(balance, principal, out=out["balance"][t])
+
+        np.add(out["interest"], out["principal"], out=out["payment"])
+        schedule = AmortisationSchedule(**{name: array.T for name, array in out.items()})
+        if not valid.all():
+            for name in SCHEDULE_ARRAYS:
+                getattr(schedule, name)[~valid] = np.nan
+        return schedule
+
+    def iter_schedules(self, loans: Union[pd.DataFrame, Dict[str, np.ndarray]]
+                       ) -> Iterator[Tuple[slice, AmortisationSchedule]]:
+        """
+        Project a portfolio chunk by chunk within the memory budget.
+
+        Each chunk's schedule arrays fit memory_budget_mb; drop the previous
+        chunk before requesting the next to hold only one in memory.
+
+        Args:
+            loans: DataFrame or dictionary of equal-length arrays keyed by mapping column name
+
+        Returns:
+            Iterator of (rows, schedule) with rows the slice of loans in the chunk
+        """
+        terms = self.loan_terms(loans)
+        n_loans = len(terms["loan"])
+        for start in range(0, n_loans, self.chunk_rows):
+            rows = slice(start, min(start + self.chunk_rows, n_loans))
+            yield rows, self.project_terms({name: values[rows] for name, values in terms.items()})
+
+    def project(self, loans: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> AmortisationSchedule:
+        """
+        Project a whole portfolio into one schedule (for portfolios that fit in memory).
+
+        Args:
+            loans: DataFrame or dictionary of equal-length arrays keyed by mapping column name
+
+        Returns:
+            AmortisationSchedule of all loans
+        """
+        return self.project_terms(self.loan_terms(loans))
+
+    def summary(self, loans: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> pd.DataFrame:
+        """
+        Summarise the projected schedule of every loan, chunk by chunk.
+
+        Args:
+            loans: DataFrame or dictionary of equal-length arrays keyed by mapping column name
+
+        Returns:
+            DataFrame with one row per loan: total_interest, total_principal,
+            final_balance, repaid_period (first period with a zero balance,
+            -1 if none) and weighted_average_life in years
+        """
+        terms = self.loan_terms(loans)
+        n_loans = len(terms["loan"])
+        columns = {name: np.empty(n_loans) for name in
+                   ("total_interest", "total_principal", "final_balance", "weighted_average_life")}
+        repaid_period = np.empty(n_loans, dtype=np.int64)
+        months = np.arange(1, self.n_periods + 1)
+        for start in range(0, n_loans, self.chunk_rows):
+            rows = slice(start, min(start + self.chunk_rows, n_loans))
+            schedule = self.project_terms({name: values[rows] for name, values in terms.items()})
+            total_principal = schedule.principal.sum(axis=1)
+            columns["total_interest"][rows] = schedule.interest.sum(axis=1)
+            columns["total_principal"][rows] = total_principal
+            columns["final_balance"][rows] = schedule.balance[:, -1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                columns["weighted_average_life"][rows] = schedule.principal @ months / total_principal / 12.0
+            repaid = schedule.balance <= 0.0
+            repaid_period[rows] = np.where(repaid.any(axis=1), repaid.argmax(axis=1), -1)
+        index = loans.index if isinstance(loans, pd.DataFrame) else None
+        return pd.DataFrame(dict(columns, repaid_period=repaid_period), index=index)
@@ -20,7 +20,12 @@ This module provides a standardized data model for mortgage data,
 enabling consistent processing across different data sources and applications.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Union
+
+import numpy as np
+import pandas as pd
+
+from .schema_registry import get_compiled_schema, thaw_schema
 
 class MortgageCDM:
     """
@@ -28,9 +33,197 @@ class MortgageCDM:
     Provides a standardized schema and data transformation methods
     for mortgage data with comprehensive attributes.
     """
+    SCHEMA_VERSION = "v6"
+
+    # Output column name -> dotted schema path, in mapping order
+    _FIELD_COLUMNS = {
+        # Header section
+        'MortgageID': 'Mortgage.Header.MortgageID',
+        'PropertyID': 'Mortgage.Header.PropertyID',
+        'UPRN': 'Mortgage.Header.UPRN',
+
+        # Application section
+        'MemberID': 'Mortgage.Application.MemberID',
+        'MortgageProvider': 'Mortgage.Application.MortgageProvider',
+        'ApplicationDate': 'Mortgage.Application.ApplicationDate',
+        'PreApprovalRequest': 'Mortgage.Application.PreApprovalRequest',
+        'ApplicationChannel': 'Mortgage.Application.ApplicationChannel',
+        'DenialReason': 'Mortgage.Application.DenialReason',
+        'LoanPurpose': 'Mortgage.Application.LoanPurpose',
+        'OccupancyType': 'Mortgage.Application.OccupancyType',
+        'USRN': 'Mortgage.Application.USRN',
+        'HMDALoanType': 'Mortgage.Application.HMDALoanType',
+        'ApplicationPropertyValuation': 'Mortgage.Application.ApplicationPropertyValuation',
+
+        # FinancialTerms section
+        'currency': 'Mortgage.FinancialTerms.currency',
+        'DisbursalDate': 'Mortgage.FinancialTerms.DisbursalDate',
+        'PurchaseValue': 'Mortgage.FinancialTerms.PurchaseValue',
+        'OriginalLoan': 'Mortgage.FinancialTerms.OriginalLoan',
+        'OriginalTerm': 'Mortgage.FinancialTerms.OriginalTerm',
+        'TotalLoanCosts': 'Mortgage.FinancialTerms.TotalLoanCosts',
+        'OriginationCharges': 'Mortgage.FinancialTerms.OriginationCharges',
+        'DiscountPoints': 'Mortgage.FinancialTerms.DiscountPoints',
+        'LenderCredits': 'Mortgage.FinancialTerms.LenderCredits',
+        'OriginalLendingRate': 'Mortgage.FinancialTerms.OriginalLendingRate',
+        'OriginalSpread': 'Mortgage.FinancialTerms.OriginalSpread',
+        'HMDARateSpread': 'Mortgage.FinancialTerms.HMDARateSpread',
+        'OriginalRateType': 'Mortgage.FinancialTerms.OriginalRateType',
+        'OriginalLTV': 'Mortgage.FinancialTerms.OriginalLTV',
+        'PrepaymentPenaltyTerm': 'Mortgage.FinancialTerms.PrepaymentPenaltyTerm',
+        'MaturityDate': 'Mortgage.FinancialTerms.MaturityDate',
+        'OriginalBoEBase': 'Mortgage.FinancialTerms.OriginalBoEBase',
+        'InitialFixedTerm': 'Mortgage.FinancialTerms.InitialFixedTerm',
+        'EarlyRepaymentCharge': 'Mortgage.FinancialTerms.EarlyRepaymentCharge',
+        'ProductFee': 'Mortgage.FinancialTerms.ProductFee',
+        'DebtToIncomeRatio': 'Mortgage.FinancialTerms.DebtToIncomeRatio',
+        'LoanToValueRatio': 'Mortgage.FinancialTerms.LoanToValueRatio',
+        'IntroductoryRatePeriod': 'Mortgage.FinancialTerms.IntroductoryRatePeriod',
+
+        # Features section
+        'MortgageType': 'Mortgage.Features.MortgageType',
+        'PaymentFrequency': 'Mortgage.Features.PaymentFrequency',
+        'PortabilityFlag': 'Mortgage.Features.PortabilityFlag',
+        'OverpaymentAllowance': 'Mortgage.Features.OverpaymentAllowance',
+        'PaymentHolidayEligible': 'Mortgage.Features.PaymentHolidayEligible',
+        'OffsetAccount': 'Mortgage.Features.OffsetAccount',
+        'SharedOwnershipShare': 'Mortgage.Features.SharedOwnershipShare',
+        'HelpToBuyFlag': 'Mortgage.Features.HelpToBuyFlag',
+        'RightToBuyFlag': 'Mortgage.Features.RightToBuyFlag',
+        'FirstTimeBuyerFlag': 'Mortgage.Features.FirstTimeBuyerFlag',
+        'BalloonPayment': 'Mortgage.Features.BalloonPayment',
+        'InterestOnlyPayment': 'Mortgage.Features.InterestOnlyPayment',
+        'NegativeAmortization': 'Mortgage.Features.NegativeAmortization',
+        'OtherNonAmortizingFeatures': 'Mortgage.Features.OtherNonAmortizingFeatures',
+
+        # CurrentStatus section
+        'LatestStatus': 'Mortgage.CurrentStatus.LatestStatus',
+        'PrincipalPayed': 'Mortgage.CurrentStatus.PrincipalPayed',
+        'InterestPayed': 'Mortgage.CurrentStatus.InterestPayed',
+        'TotalPayments': 'Mortgage.CurrentStatus.TotalPayments',
+        'OutstandingBalance': 'Mortgage.CurrentStatus.OutstandingBalance',
+        'LastPaymentDate': 'Mortgage.CurrentStatus.LastPaymentDate',
+        'InArrearsFlag': 'Mortgage.CurrentStatus.InArrearsFlag',
+        'CurrentLTV': 'Mortgage.CurrentStatus.CurrentLTV',
+        'CurrentBoEBase': 'Mortgage.CurrentStatus.CurrentBoEBase',
+        'CurrentLendingRate': 'Mortgage.CurrentStatus.CurrentLendingRate',
+        'CurrentPayment': 'Mortgage.CurrentStatus.CurrentPayment',
+        'MissedPayments12M': 'Mortgage.CurrentStatus.MissedPayments12M',
+        'HighestArrearsLast24M': 'Mortgage.CurrentStatus.HighestArrearsLast24M',
+        'PaymentHolidaysTaken': 'Mortgage.CurrentStatus.PaymentHolidaysTaken',
+        'LastPaymentHolidayDate': 'Mortgage.CurrentStatus.LastPaymentHolidayDate',
+        'TotalPaymentHolidays': 'Mortgage.CurrentStatus.TotalPaymentHolidays',
+        'ArrearsHighestBalance': 'Mortgage.CurrentStatus.ArrearsHighestBalance',
+
+        # Revaluation section
+        'RevaluationTimestamp': 'Mortgage.Revaluation.Revaluation1.RevaluationTimestamp',
+        'RevaluationSource': 'Mortgage.Revaluation.Revaluation1.RevaluationSource',
+        'RevaluationMortgage': 'Mortgage.Revaluation.Revaluation1.RevaluationMortgage',
+        'RevaluationInterestRate': 'Mortgage.Revaluation.Revaluation1.RevaluationInterestRate',
+
+        # Default section
+        'DefaultFlag': 'Mortgage.Default.DefaultFlag',
+        'DaysInArrears': 'Mortgage.Default.DaysInArrears',
+        'DefaultDate': 'Mortgage.Default.DefaultDate',
+        'RestructureFlag': 'Mortgage.Default.RestructureFlag',
+        'RestructureDate': 'Mortgage.Default.RestructureDate',
+        'WriteOffAmount': 'Mortgage.Default.WriteOffAmount',
+        'RepossessionFlag': 'Mortgage.Default.RepossessionFlag',
+        'RepossessionDate': 'Mortgage.Default.RepossessionDate',
+
+        # BorrowerDetails section
+        'MaritalStatus': 'Mortgage.BorrowerDetails.MaritalStatus',
+        'FamilyMembers': 'Mortgage.BorrowerDetails.FamilyMembers',
+        'BorrowerIncome': 'Mortgage.BorrowerDetails.BorrowerIncome',
+        'BorrowerCreditScore': 'Mortgage.BorrowerDetails.BorrowerCreditScore',
+        'BorrowerEmployment': 'Mortgage.BorrowerDetails.BorrowerEmployment',
+        'YearsInCurrentEmployment': 'Mortgage.BorrowerDetails.YearsInCurrentEmployment',
+        'SecondaryIncome': 'Mortgage.BorrowerDetails.SecondaryIncome',
+        'IncomeVerificationType': 'Mortgage.BorrowerDetails.IncomeVerificationType',
+        'BorrowerAge': 'Mortgage.BorrowerDetails.BorrowerAge',
+        'BorrowerNationality': 'Mortgage.BorrowerDetails.BorrowerNationality',
+        'ResidencyStatus': 'Mortgage.BorrowerDetails.ResidencyStatus',
+
+        # RiskMetrics section
+        'AffordabilityRatio': 'Mortgage.RiskMetrics.AffordabilityRatio',
+        'DebtServiceRatio': 'Mortgage.RiskMetrics.DebtServiceRatio',
+        'StressTestRate': 'Mortgage.RiskMetrics.StressTestRate',
+        'RefinanceIncentive': 'Mortgage.RiskMetrics.RefinanceIncentive',
+        'PrepaymentRisk': 'Mortgage.RiskMetrics.PrepaymentRisk',
+        'BehavioralScore': 'Mortgage.RiskMetrics.BehavioralScore',
+
+        # HouseholdInsurance section
+        'InsurerName': 'Mortgage.HouseholdInsurance.InsurerName',
+        'InsurancePolicyID': 'Mortgage.HouseholdInsurance.InsurancePolicyID',
+
+        # Regulatory.Common section
+        'BusinessOrCommercialPurpose': 'Mortgage.Regulatory.Common.BusinessOrCommercialPurpose',
+        'FCAReferenceNumber': 'Mortgage.Regulatory.Common.FCAReferenceNumber',
+        'AdvisedFlag': 'Mortgage.Regulatory.Common.AdvisedFlag',
+        'ExecutionOnlyFlag': 'Mortgage.Regulatory.Common.ExecutionOnlyFlag',
+        'ExecutionOnlyEligibilityFlag': 'Mortgage.Regulatory.Common.ExecutionOnlyEligibilityFlag',
+        'InteractiveSaleFlag': 'Mortgage.Regulatory.Common.InteractiveSaleFlag',
+        'DistanceMarketingFlag': 'Mortgage.Regulatory.Common.DistanceMarketingFlag',
+        'RecordKeepingCompliantFlag': 'Mortgage.Regulatory.Common.RecordKeepingCompliantFlag',
+        'VulnerableCustomerFlag': 'Mortgage.Regulatory.Common.VulnerableCustomerFlag',
+
+        # Regulatory.MCOB section
+        'MMRCompliantFlag': 'Mortgage.Regulatory.MCOB.MMRCompliantFlag',
+        'CrossBorderPassportingFlag': 'Mortgage.Regulatory.MCOB.CrossBorderPassportingFlag',
+        'OriginatingMemberState': 'Mortgage.Regulatory.MCOB.OriginatingMemberState',
+        'ESISProvidedDate': 'Mortgage.Regulatory.MCOB.ESISProvidedDate',
+        'ESISVersion': 'Mortgage.Regulatory.MCOB.ESISVersion',
+        'CoolingOffPeriodDays': 'Mortgage.Regulatory.MCOB.CoolingOffPeriodDays',
+        'ForeignCurrencyLoanFlag': 'Mortgage.Regulatory.MCOB.ForeignCurrencyLoanFlag',
+        'ExchangeRateProtectionType': 'Mortgage.Regulatory.MCOB.ExchangeRateProtectionType',
+        'AdviceRejectionFlag': 'Mortgage.Regulatory.MCOB.AdviceRejectionFlag',
+        'AdviceRejectionReason': 'Mortgage.Regulatory.MCOB.AdviceRejectionReason',
+        'APRCInitialRate': 'Mortgage.Regulatory.MCOB.APRCInitialRate',
+        'APRCSecondaryRate': 'Mortgage.Regulatory.MCOB.APRCSecondaryRate',
+        'StressTestCompliantFlag': 'Mortgage.Regulatory.MCOB.StressTestCompliantFlag',
+        'AffordabilityAssessmentDate': 'Mortgage.Regulatory.MCOB.AffordabilityAssessmentDate',
+        'MortgageClubCode': 'Mortgage.Regulatory.MCOB.MortgageClubCode',
+        'IntermediaryCode': 'Mortgage.Regulatory.MCOB.IntermediaryCode',
+        'InitialDisclosureProvidedDate': 'Mortgage.Regulatory.MCOB.InitialDisclosureProvidedDate',
+        'InitialDisclosureMethod': 'Mortgage.Regulatory.MCOB.InitialDisclosureMethod',
+        'CancellationRightsFlag': 'Mortgage.Regulatory.MCOB.CancellationRightsFlag',
+        'SuitabilityAssessmentDate': 'Mortgage.Regulatory.MCOB.SuitabilityAssessmentDate',
+        'AdviceRetentionPeriod': 'Mortgage.Regulatory.MCOB.AdviceRetentionPeriod',
+
+        # Regulatory.HMDA section
+        'HMDAReportableFlag': 'Mortgage.Regulatory.HMDA.HMDAReportableFlag',
+        'HMDAHOEPAStatus': 'Mortgage.Regulatory.HMDA.HMDAHOEPAStatus',
+        'ManufacturedHomeSecured': 'Mortgage.Regulatory.HMDA.ManufacturedHomeSecured',
+        'ManufacturedHomeLandPropertyInterest': 'Mortgage.Regulatory.HMDA.ManufacturedHomeLandPropertyInterest',
+    }
+
+    # Relationship rule codes of validate_mortgages_batch, after the header
+    # and menu membership codes
+    _BATCH_RULE_CODES = (
+        'ORIGINAL_LTV_MISMATCH',
+        'CURRENT_LTV_MISMATCH',
+        'BTL_PRIMARY_RESIDENCE',
+        'SHARED_OWNERSHIP_SHARE',
+        'RETIRED_UNDER_55',
+        'EMPLOYMENT_YEARS_EXCEED_AGE',
+        'DEFAULT_FLAG_NOT_DEFAULTED',
+        'DEFAULTED_WITHOUT_FLAG',
+    )
+
+    _BATCH_MENU_SECTIONS = ("Application", "Features", "CurrentStatus")
+
     def __init__(self):
-        """Initialize the Mortgage CDM with complete schema definition."""
-        self.schema = {
+        """Initialize the Mortgage CDM with the shared compiled schema definition."""
+        self._compiled = get_compiled_schema(
+            "Mortgage", self.SCHEMA_VERSION, self._build_schema, columns=self._FIELD_COLUMNS
+        )
+        self.schema = self._compiled.schema
+        self._fields = self._compiled.fields
+
+    @staticmethod
+    def _build_schema() -> dict:
+        """Build the complete Mortgage schema definition."""
+        return {
             "Mortgage": {
                 "Header": {
                     "MortgageID": {
@@ -647,36 +840,21 @@ class MortgageCDM:
             app = mortgage_data.get("Mortgage", {}).get("Application", {})
             
             # Validate menu fields
-            menu_fields = {
-                "PreApprovalRequest": ["Preapproval", "NotPreapproval"],
-                "ApplicationChannel": ["Retail", "Broker", "Correspondent"],
-                "DenialReason": ["Credit History", "DTI", "Collateral", "Other"],
-                "LoanPurpose": ["Purchase", "Refinancing", "Home Improvement", "Other"],
-                "OccupancyType": ["PrimaryResidence", "SecondResidence", "Investment"],
-                "HMDALoanType": ["Conventional", "FHA", "VA", "FSA"]
-            }
-            
-            for field, valid_options in menu_fields.items():
-                if field in app and app[field] not in valid_options:
-                    app_errors.append(f"Invalid value for {field}: {app[field]}")
+            for spec in self._fields.menu_fields("Mortgage.Application"):
+                if spec.name in app and app[spec.name] not in spec.options:
+                    app_errors.append(f"Invalid value for {spec.name}: {app[spec.name]}")
                     
             # Validate Features section menu fields
             features = mortgage_data.get("Mortgage", {}).get("Features", {})
-            features_menu_fields = {
-                "MortgageType": ["Residential", "Buy-to-Let", "Second Home", "Holiday Home", "Shared Ownership"],
-                "PaymentFrequency": ["Monthly", "Biweekly", "Weekly"]
-            }
-            
-            for field, valid_options in features_menu_fields.items():
-                if field in features and features[field] not in valid_options:
-                    app_errors.append(f"Invalid value for Features.{field}: {features[field]}")
+            for spec in self._fields.menu_fields("Mortgage.Features"):
+                if spec.name in features and features[spec.name] not in spec.options:
+                    app_errors.append(f"Invalid value for Features.{spec.name}: {features[spec.name]}")
                     
             # Validate CurrentStatus section menu fields
             status = mortgage_data.get("Mortgage", {}).get("CurrentStatus", {})
-            if "LatestStatus" in status:
-                valid_statuses = ["Current", "Defaulted", "Completed", "Redeemed"]
-                if status["LatestStatus"] not in valid_statuses:
-                    app_errors.append(f"Invalid value for CurrentStatus.LatestStatus: {status['LatestStatus']}")
+            for spec in self._fields.menu_fields("Mortgage.CurrentStatus"):
+                if spec.name in status and status[spec.name] not in spec.options:
+                    app_errors.append(f"Invalid value for CurrentStatus.{spec.name}: {status[spec.name]}")
                     
             if app_errors:
                 errors["Application"] = app_errors
@@ -777,6 +955,107 @@ class MortgageCDM:
             
         return errors
 
+    def batch_error_codes(self) -> List[str]:
+        """
+        Return the error codes (columns) of validate_mortgages_batch, in order.
+
+        Returns:
+            List of error codes
+        """
+        codes = [f"MISSING_{field}" for field in ("MortgageID", "PropertyID", "UPRN")]
+        for section in self._BATCH_MENU_SECTIONS:
+            codes.extend(f"INVALID_{section}.{spec.name}"
+                         for spec in self._fields.menu_fields(f"Mortgage.{section}"))
+        codes.extend(self._BATCH_RULE_CODES)
+        return codes
+
+    def validate_mortgages_batch(self, mortgages: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> pd.DataFrame:
+        """
+        Validates a whole portfolio of mortgages in columnar form.
+        Applies the checks of validate_mortgage as vectorized expressions over
+        the flat mapping columns (as produced by create_mortgage_mapping).
+        Missing columns and null values are treated as absent fields.
+        
+        Args:
+            mortgages: DataFrame or dictionary of equal-length arrays keyed by mapping column name
+            
+        Returns:
+            Boolean DataFrame with one row per mortgage (same index as the input)
+            and one column per error code (see batch_error_codes); True marks an error
+        """
+        try:
+            frame = mortgages if isinstance(mortgages, pd.DataFrame) else pd.DataFrame(mortgages)
+            n_rows = len(frame)
+            absent = pd.Series(np.full(n_rows, None, dtype=object), index=frame.index)
+
+            def column(name: str) -> pd.Series:
+                return frame[name] if name in frame.columns else absent
+
+            def number(name: str) -> pd.Series:
+                return pd.to_numeric(column(name), errors="coerce")
+
+            def truthy(values: pd.Series) -> np.ndarray:
+                # bool(value) per row, with nulls counted as absent (also for
+                # nullable and categorical dtypes, whose nulls cannot be cast)
+                present = values.notna().to_numpy()
+                result = np.zeros(n_rows, dtype=bool)
+                result[present] = values[present].astype(bool).to_numpy()
+                return result
+
+            def equals(name: str, value: str) -> np.ndarray:
+                return (column(name) == value).to_numpy()
+
+            checks = []
+
+            # Header required fields
+            for field in ("MortgageID", "PropertyID", "UPRN"):
+                checks.append(~truthy(column(field)))
+
+            # Menu field membership
+            for section in self._BATCH_MENU_SECTIONS:
+                for spec in self._fields.menu_fields(f"Mortgage.{section}"):
+                    values = column(spec.name)
+                    checks.append((values.notna() & ~values.isin(spec.options)).to_numpy())
+
+            # LTV consistency (1% tolerance for rounding)
+            purchase_value = number("PurchaseValue")
+            has_purchase_value = truthy(purchase_value)
+            for loan_column, ltv_column in (("OriginalLoan", "OriginalLTV"),
+                                            ("OutstandingBalance", "CurrentLTV")):
+                loan = number(loan_column)
+                calculated_ltv = (loan / purchase_value.where(has_purchase_value)).to_numpy()
+                reported_ltv = number(ltv_column).fillna(0).to_numpy()
+                with np.errstate(invalid="ignore"):
+                    mismatch = np.abs(calculated_ltv - reported_ltv) > 0.01
+                checks.append(has_purchase_value & truthy(loan) & mismatch)
+
+            # Mortgage type consistency
+            checks.append(equals("MortgageType", "Buy-to-Let") & equals("OccupancyType", "PrimaryResidence"))
+
+            share = number("SharedOwnershipShare")
+            invalid_share = ~truthy(share) | ((share <= 0) | (share >= 1)).to_numpy()
+            checks.append(equals("MortgageType", "Shared Ownership") & invalid_share)
+
+            # Age and employment consistency
+            age = number("BorrowerAge")
+            years_employment = number("YearsInCurrentEmployment")
+            has_age = truthy(age)
+            checks.append(has_age & equals("BorrowerEmployment", "Retired") & (age < 55).to_numpy())
+            checks.append(has_age & truthy(years_employment)
+                          & (years_employment > age - 16).to_numpy())
+
+            # Default status consistency
+            default_flag = truthy(column("DefaultFlag"))
+            defaulted = equals("LatestStatus", "Defaulted")
+            checks.append(default_flag & ~defaulted)
+            checks.append(defaulted & ~default_flag)
+
+            matrix = np.column_stack(checks) if n_rows else np.zeros((0, len(checks)), dtype=bool)
+            return pd.DataFrame(matrix, index=frame.index, columns=self.batch_error_codes())
+
+        except Exception as e:
+            raise ValueError(f"Error validating mortgage batch: {str(e)}")
+
     def create_mortgage_mapping(self, mort: dict) -> dict:
         """
         Creates a standardized mortgage data dictionary based on the CDM schema.
@@ -788,169 +1067,8 @@ class MortgageCDM:
             Structured mortgage data according to CDM schema
         """
         try:
-            mortgage_data = {
-                # Header section
-                'MortgageID': mort.get('Mortgage', {}).get('Header', {}).get('MortgageID'),
-                'PropertyID': mort.get('Mortgage', {}).get('Header', {}).get('PropertyID'),
-                'UPRN': mort.get('Mortgage', {}).get('Header', {}).get('UPRN'),
-                
-                # Application section
-                'MemberID': mort.get('Mortgage', {}).get('Application', {}).get('MemberID'),
-                'MortgageProvider': mort.get('Mortgage', {}).get('Application', {}).get('MortgageProvider'),
-                'ApplicationDate': mort.get('Mortgage', {}).get('Application', {}).get('ApplicationDate'),
-                'PreApprovalRequest': mort.get('Mortgage', {}).get('Application', {}).get('PreApprovalRequest'),
-                'ApplicationChannel': mort.get('Mortgage', {}).get('Application', {}).get('ApplicationChannel'),
-                'DenialReason': mort.get('Mortgage', {}).get('Application', {}).get('DenialReason'),
-                'LoanPurpose': mort.get('Mortgage', {}).get('Application', {}).get('LoanPurpose'),
-                'OccupancyType': mort.get('Mortgage', {}).get('Application', {}).get('OccupancyType'),
-                'USRN': mort.get('Mortgage', {}).get('Application', {}).get('USRN'),
-                'HMDALoanType': mort.get('Mortgage', {}).get('Application', {}).get('HMDALoanType'),
-                'ApplicationPropertyValuation': mort.get('Mortgage', {}).get('Application', {}).get('ApplicationPropertyValuation'),
-                
-                # FinancialTerms section
-                'currency': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('currency'),
-                'DisbursalDate': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('DisbursalDate'),
-                'PurchaseValue': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('PurchaseValue'),
-                'OriginalLoan': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('OriginalLoan'),
-                'OriginalTerm': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('OriginalTerm'),
-                'TotalLoanCosts': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('TotalLoanCosts'),
-                'OriginationCharges': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('OriginationCharges'),
-                'DiscountPoints': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('DiscountPoints'),
-                'LenderCredits': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('LenderCredits'),
-                'OriginalLendingRate': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('OriginalLendingRate'),
-                'OriginalSpread': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('OriginalSpread'),
-                'HMDARateSpread': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('HMDARateSpread'),
-                'OriginalRateType': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('OriginalRateType'),
-                'OriginalLTV': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('OriginalLTV'),
-                'PrepaymentPenaltyTerm': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('PrepaymentPenaltyTerm'),
-                'MaturityDate': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('MaturityDate'),
-                'OriginalBoEBase': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('OriginalBoEBase'),
-                'InitialFixedTerm': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('InitialFixedTerm'),
-                'EarlyRepaymentCharge': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('EarlyRepaymentCharge'),
-                'ProductFee': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('ProductFee'),
-                'DebtToIncomeRatio': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('DebtToIncomeRatio'),
-                'LoanToValueRatio': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('LoanToValueRatio'),
-                'IntroductoryRatePeriod': mort.get('Mortgage', {}).get('FinancialTerms', {}).get('IntroductoryRatePeriod'),
-                
-                # Features section
-                'MortgageType': mort.get('Mortgage', {}).get('Features', {}).get('MortgageType'),
-                'PaymentFrequency': mort.get('Mortgage', {}).get('Features', {}).get('PaymentFrequency'),
-                'PortabilityFlag': mort.get('Mortgage', {}).get('Features', {}).get('PortabilityFlag'),
-                'OverpaymentAllowance': mort.get('Mortgage', {}).get('Features', {}).get('OverpaymentAllowance'),
-                'PaymentHolidayEligible': mort.get('Mortgage', {}).get('Features', {}).get('PaymentHolidayEligible'),
-                'OffsetAccount': mort.get('Mortgage', {}).get('Features', {}).get('OffsetAccount'),
-                'SharedOwnershipShare': mort.get('Mortgage', {}).get('Features', {}).get('SharedOwnershipShare'),
-                'HelpToBuyFlag': mort.get('Mortgage', {}).get('Features', {}).get('HelpToBuyFlag'),
-                'RightToBuyFlag': mort.get('Mortgage', {}).get('Features', {}).get('RightToBuyFlag'),
-                'FirstTimeBuyerFlag': mort.get('Mortgage', {}).get('Features', {}).get('FirstTimeBuyerFlag'),
-                'BalloonPayment': mort.get('Mortgage', {}).get('Features', {}).get('BalloonPayment'),
-                'InterestOnlyPayment': mort.get('Mortgage', {}).get('Features', {}).get('InterestOnlyPayment'),
-                'NegativeAmortization': mort.get('Mortgage', {}).get('Features', {}).get('NegativeAmortization'),
-                'OtherNonAmortizingFeatures': mort.get('Mortgage', {}).get('Features', {}).get('OtherNonAmortizingFeatures'),
-                
-                # CurrentStatus section
-                'LatestStatus': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('LatestStatus'),
-                'PrincipalPayed': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('PrincipalPayed'),
-                'InterestPayed': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('InterestPayed'),
-                'TotalPayments': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('TotalPayments'),
-                'OutstandingBalance': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('OutstandingBalance'),
-                'LastPaymentDate': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('LastPaymentDate'),
-                'InArrearsFlag': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('InArrearsFlag'),
-                'CurrentLTV': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('CurrentLTV'),
-                'CurrentBoEBase': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('CurrentBoEBase'),
-                'CurrentLendingRate': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('CurrentLendingRate'),
-                'CurrentPayment': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('CurrentPayment'),
-                'MissedPayments12M': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('MissedPayments12M'),
-                'HighestArrearsLast24M': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('HighestArrearsLast24M'),
-                'PaymentHolidaysTaken': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('PaymentHolidaysTaken'),
-                'LastPaymentHolidayDate': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('LastPaymentHolidayDate'),
-                'TotalPaymentHolidays': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('TotalPaymentHolidays'),
-                'ArrearsHighestBalance': mort.get('Mortgage', {}).get('CurrentStatus', {}).get('ArrearsHighestBalance'),
-                
-                # Revaluation section
-                'RevaluationTimestamp': mort.get('Mortgage', {}).get('Revaluation', {}).get('Revaluation1', {}).get('RevaluationTimestamp'),
-                'RevaluationSource': mort.get('Mortgage', {}).get('Revaluation', {}).get('Revaluation1', {}).get('RevaluationSource'),
-                'RevaluationMortgage': mort.get('Mortgage', {}).get('Revaluation', {}).get('Revaluation1', {}).get('RevaluationMortgage'),
-                'RevaluationInterestRate': mort.get('Mortgage', {}).get('Revaluation', {}).get('Revaluation1', {}).get('RevaluationInterestRate'),
-                
-                # Default section
-                'DefaultFlag': mort.get('Mortgage', {}).get('Default', {}).get('DefaultFlag'),
-                'DaysInArrears': mort.get('Mortgage', {}).get('Default', {}).get('DaysInArrears'),
-                'DefaultDate': mort.get('Mortgage', {}).get('Default', {}).get('DefaultDate'),
-                'RestructureFlag': mort.get('Mortgage', {}).get('Default', {}).get('RestructureFlag'),
-                'RestructureDate': mort.get('Mortgage', {}).get('Default', {}).get('RestructureDate'),
-                'WriteOffAmount': mort.get('Mortgage', {}).get('Default', {}).get('WriteOffAmount'),
-                'RepossessionFlag': mort.get('Mortgage', {}).get('Default', {}).get('RepossessionFlag'),
-                'RepossessionDate': mort.get('Mortgage', {}).get('Default', {}).get('RepossessionDate'),
-                
-                # BorrowerDetails section
-                'MaritalStatus': mort.get('Mortgage', {}).get('BorrowerDetails', {}).get('MaritalStatus'),
-                'FamilyMembers': mort.get('Mortgage', {}).get('BorrowerDetails', {}).get('FamilyMembers'),
-                'BorrowerIncome': mort.get('Mortgage', {}).get('BorrowerDetails', {}).get('BorrowerIncome'),
-                'BorrowerCreditScore': mort.get('Mortgage', {}).get('BorrowerDetails', {}).get('BorrowerCreditScore'),
-                'BorrowerEmployment': mort.get('Mortgage', {}).get('BorrowerDetails', {}).get('BorrowerEmployment'),
-                'YearsInCurrentEmployment': mort.get('Mortgage', {}).get('BorrowerDetails', {}).get('YearsInCurrentEmployment'),
-                'SecondaryIncome': mort.get('Mortgage', {}).get('BorrowerDetails', {}).get('SecondaryIncome'),
-                'IncomeVerificationType': mort.get('Mortgage', {}).get('BorrowerDetails', {}).get('IncomeVerificationType'),
-                'BorrowerAge': mort.get('Mortgage', {}).get('BorrowerDetails', {}).get('BorrowerAge'),
-                'BorrowerNationality': mort.get('Mortgage', {}).get('BorrowerDetails', {}).get('BorrowerNationality'),
-                'ResidencyStatus': mort.get('Mortgage', {}).get('BorrowerDetails', {}).get('ResidencyStatus'),
-                
-                # RiskMetrics section
-                'AffordabilityRatio': mort.get('Mortgage', {}).get('RiskMetrics', {}).get('AffordabilityRatio'),
-                'DebtServiceRatio': mort.get('Mortgage', {}).get('RiskMetrics', {}).get('DebtServiceRatio'),
-                'StressTestRate': mort.get('Mortgage', {}).get('RiskMetrics', {}).get('StressTestRate'),
-                'RefinanceIncentive': mort.get('Mortgage', {}).get('RiskMetrics', {}).get('RefinanceIncentive'),
-                'PrepaymentRisk': mort.get('Mortgage', {}).get('RiskMetrics', {}).get('PrepaymentRisk'),
-                'BehavioralScore': mort.get('Mortgage', {}).get('RiskMetrics', {}).get('BehavioralScore'),
-                
-                # HouseholdInsurance section
-                'InsurerName': mort.get('Mortgage', {}).get('HouseholdInsurance', {}).get('InsurerName'),
-                'InsurancePolicyID': mort.get('Mortgage', {}).get('HouseholdInsurance', {}).get('InsurancePolicyID'),
-                
-                # Regulatory.Common section
-                'BusinessOrCommercialPurpose': mort.get('Mortgage', {}).get('Regulatory', {}).get('Common', {}).get('BusinessOrCommercialPurpose'),
-                'FCAReferenceNumber': mort.get('Mortgage', {}).get('Regulatory', {}).get('Common', {}).get('FCAReferenceNumber'),
-                'AdvisedFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('Common', {}).get('AdvisedFlag'),
-                'ExecutionOnlyFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('Common', {}).get('ExecutionOnlyFlag'),
-                'ExecutionOnlyEligibilityFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('Common', {}).get('ExecutionOnlyEligibilityFlag'),
-                'InteractiveSaleFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('Common', {}).get('InteractiveSaleFlag'),
-                'DistanceMarketingFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('Common', {}).get('DistanceMarketingFlag'),
-                'RecordKeepingCompliantFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('Common', {}).get('RecordKeepingCompliantFlag'),
-                'VulnerableCustomerFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('Common', {}).get('VulnerableCustomerFlag'),
-                
-                # Regulatory.MCOB section
-                'MMRCompliantFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('MMRCompliantFlag'),
-                'CrossBorderPassportingFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('CrossBorderPassportingFlag'),
-                'OriginatingMemberState': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('OriginatingMemberState'),
-                'ESISProvidedDate': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('ESISProvidedDate'),
-                'ESISVersion': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('ESISVersion'),
-                'CoolingOffPeriodDays': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('CoolingOffPeriodDays'),
-                'ForeignCurrencyLoanFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('ForeignCurrencyLoanFlag'),
-                'ExchangeRateProtectionType': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('ExchangeRateProtectionType'),
-                'AdviceRejectionFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('AdviceRejectionFlag'),
-                'AdviceRejectionReason': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('AdviceRejectionReason'),
-                'APRCInitialRate': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('APRCInitialRate'),
-                'APRCSecondaryRate': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('APRCSecondaryRate'),
-                'StressTestCompliantFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('StressTestCompliantFlag'),
-                'AffordabilityAssessmentDate': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('AffordabilityAssessmentDate'),
-                'MortgageClubCode': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('MortgageClubCode'),
-                'IntermediaryCode': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('IntermediaryCode'),
-                'InitialDisclosureProvidedDate': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('InitialDisclosureProvidedDate'),
-                'InitialDisclosureMethod': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('InitialDisclosureMethod'),
-                'CancellationRightsFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('CancellationRightsFlag'),
-                'SuitabilityAssessmentDate': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('SuitabilityAssessmentDate'),
-                'AdviceRetentionPeriod': mort.get('Mortgage', {}).get('Regulatory', {}).get('MCOB', {}).get('AdviceRetentionPeriod'),
-                
-                # Regulatory.HMDA section
-                'HMDAReportableFlag': mort.get('Mortgage', {}).get('Regulatory', {}).get('HMDA', {}).get('HMDAReportableFlag'),
-                'HMDAHOEPAStatus': mort.get('Mortgage', {}).get('Regulatory', {}).get('HMDA', {}).get('HMDAHOEPAStatus'),
-                'ManufacturedHomeSecured': mort.get('Mortgage', {}).get('Regulatory', {}).get('HMDA', {}).get('ManufacturedHomeSecured'),
-                'ManufacturedHomeLandPropertyInterest': mort.get('Mortgage', {}).get('Regulatory', {}).get('HMDA', {}).get('ManufacturedHomeLandPropertyInterest'),
-            }
-            
-            # Remove None values from the dictionary
-            return {k: v for k, v in mortgage_data.items() if v is not None}
+            # Single pass over the compiled columns, skipping None values
+            return self._fields.mapper(mort)
             
         except Exception as e:
             raise ValueError(f"Error creating mortgage mapping: {str(e)}")
@@ -961,25 +1079,25 @@ class MortgageCDM:
     
     def get_section_fields(self, section: str) -> Dict[str, dict]:
         """Return all fields for a specific section."""
-        return self.schema["Mortgage"].get(section, {})
+        return thaw_schema(self.schema["Mortgage"].get(section, {}))
     
     def get_menu_options(self, section: str, field: str) -> List[str]:
         """Return menu options for a specific field."""
-        field_def = self.schema["Mortgage"].get(section, {}).get(field, {})
-        return field_def.get("options", [])
+        spec = self._fields.get(f"Mortgage.{section}.{field}")
+        return list(spec.options) if spec is not None else []
     
     def validate_field_value(self, section: str, field: str, value) -> bool:
         """Validate a single field value against schema."""
-        field_def = self.schema["Mortgage"].get(section, {}).get(field, {})
+        spec = self._fields.get(f"Mortgage.{section}.{field}")
         
-        if not field_def:
-            return False
+        if spec is None:
+            # Nested subsections (e.g. Revaluation.Revaluation1) have no type and accept any value
+            return bool(self.schema["Mortgage"].get(section, {}).get(field))
             
-        field_type = field_def.get("type")
+        field_type = spec.type
         
         if field_type == "menu":
-            options = field_def.get("options", [])
-            return value in options
+            return value in spec.options
         elif field_type == "boolean":
             return isinstance(value, bool)
         elif field_type == "integer":
@@ -0,0 +1,243 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Chunked loader for the mortgage portfolio CSV servicer feed.
+
+The feed columns (mortgage/mortgage-portfolio-csv.txt) are read with
+explicit dtypes, chunk by chunk, and renamed onto the flat mapping columns
+of MortgageCDM.create_mortgage_mapping; the collateral columns take the
+PropertyCDM mapping names, and feed columns without a CDM counterpart keep
+their feed names. Each chunk is validated with
+MortgageCDM.validate_mortgages_batch, so a file of any length loads in
+memory bounded by the chunk size.
+
+Dates become datetime64, Y/N style flags nullable booleans, counts
+nullable integers, and menu fields categoricals over the MortgageCDM menu
+options (after their membership has been checked, so invalid values are
+reported before they become null). Unparseable dates and flags become
+null and are reported as INVALID_<column> errors of their chunk. The feed
+carries no PropertyID, UPRN or OriginalLTV, so the batch error codes for
+them (FEED_UNSUPPORTED_CODES) are left out of the error frame by default.
+"""
+
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .mortgage_cdm import MortgageCDM
+
+# Feed column -> (output column, kind); kind is a dtype or one of
+# "date", "flag" and "menu:<MortgageCDM section>.<field>"
+FEED_COLUMNS = {
+    'snapshot_date': ('snapshot_date', 'date'),
+    'encrypted_loan_id': ('MortgageID', 'str'),
+    'encrypted_member_id': ('MemberID', 'str'),
+    'disbursal_date': ('DisbursalDate', 'date'),
+    'original_loan_amount': ('OriginalLoan', 'float64'),
+    'term': ('OriginalTerm', 'Int32'),
+    'lending_rate': ('CurrentLendingRate', 'float64'),
+    'spread': ('OriginalSpread', 'float64'),
+    'rate_type': ('OriginalRateType', 'menu:FinancialTerms.OriginalRateType'),
+    'maturity_date': ('MaturityDate', 'date'),
+    'principal_collected': ('PrincipalPayed', 'float64'),
+    'interest_collected': ('InterestPayed', 'float64'),
+    'total_number_of_payments': ('TotalPayments', 'Int32'),
+    'last_payment_date': ('LastPaymentDate', 'date'),
+    'outstanding_balance': ('OutstandingBalance', 'float64'),
+    'latest_status': ('LatestStatus', 'menu:CurrentStatus.LatestStatus'),
+    'date_of_default': ('DefaultDate', 'date'),
+    'is_in_arrears': ('InArrearsFlag', 'flag'),
+    'days_past_due': ('DaysInArrears', 'Int32'),
+    'default_flag': ('DefaultFlag', 'flag'),
+    'purchase_value': ('PurchaseValue', 'float64'),
+    'ltv_ratio': ('CurrentLTV', 'float64'),
+    'borrower_credit_score': ('BorrowerCreditScore', 'Int32'),
+    'borrower_income': ('BorrowerIncome', 'float64'),
+    'borrower_employment_status': ('BorrowerEmployment', 'menu:BorrowerDetails.BorrowerEmployment'),
+    'marital_status': ('MaritalStatus', 'menu:BorrowerDetails.MaritalStatus'),
+    'boe_base_rate': ('CurrentBoEBase', 'float64'),
+    'prepayment_risk': ('PrepaymentRisk', 'Int32'),
+    'refinance_incentive': ('RefinanceIncentive', 'Int32'),
+
+    # Collateral, under the PropertyCDM mapping names
+    'current_property_value': ('value', 'float64'),
+    'property_type': ('property_type', 'category'),
+    'flood_risk_zone': ('flood_zone', 'category'),
+    'property_address': ('street_name', 'str'),
+    'city': ('town_city', 'category'),
+    'state_province': ('county', 'category'),
+    'zip_postal_code': ('postcode', 'str'),
+    'country': ('country', 'category'),
+    'latitude': ('latitude', 'float64'),
+    'longitude': ('longitude', 'float64'),
+
+    # No CDM counterpart
+    'flood_risk_score': ('flood_risk_score', 'float64'),
+    'eps_score': ('eps_score', 'float64'),
+}
+
+# Default rows per chunk
+CHUNK_ROWS = 250_000
+
+# validate_mortgages_batch codes the feed cannot satisfy: it has no PropertyID,
+# UPRN or OriginalLTV column, so these would be set on every row
+FEED_UNSUPPORTED_CODES = ('MISSING_PropertyID', 'MISSING_UPRN', 'ORIGINAL_LTV_MISMATCH')
+
+_FLAG_VALUES = {
+    'y': True, 'yes': True, 'true': True, 't': True, '1': True,
+    'n': False, 'no': False, 'false': False, 'f': False, '0': False,
+}
+
+
+def feed_dtypes() -> Dict[str, str]:
+    """
+    Return the read_csv dtypes of the feed columns.
+
+    Dates and flags are read as strings and categoricals and converted
+    afterwards; menus are read as categoricals of the values present.
+
+    Returns:
+        Dictionary of feed column -> dtype
+    """
+    dtypes = {}
+    for feed_column, (_, kind) in FEED_COLUMNS.items():
+        if kind == 'date':
+            dtypes[feed_column] = 'str'
+        elif kind == 'flag' or kind.startswith('menu:'):
+            dtypes[feed_column] = 'category'
+        else:
+            dtypes[feed_column] = kind
+    return dtypes
+
+
+def _flags(values: pd.Series) -> Tuple[pd.Series, np.ndarray]:
+    """
+    Convert a categorical of Y/N style values into a nullable boolean column.
+
+    Returns:
+        (flags, invalid): the boolean column, null where the value is missing or
+        not a recognised flag, and the mask of unrecognised values
+    """
+    categories = values.cat.categories
+    lookup = [_FLAG_VALUES.get(str(category).strip().lower()) for category in categories]
+    codes = values.cat.codes.to_numpy()
+    known = np.asarray([flag is not None for flag in lookup] + [False], dtype=bool)[codes]
+    flags = np.asarray([bool(flag) for flag in lookup] + [False], dtype=bool)[codes]
+    flag_values = pd.Series(pd.arrays.BooleanArray(flags, ~known), index=values.index)
+    return flag_values, (codes >= 0) & ~known
+
+
+class MortgageFeedLoader:
+    """
+    Chunked loader of mortgage portfolio CSV feed files.
+
+    Example:
+        loader = MortgageFeedLoader(chunk_rows=500_000)
+        for frame, errors in loader.iter_chunks("portfolio.csv"):
+            valid = frame[~errors.any(axis=1)]
+    """
+
+    def __init__(self, chunk_rows: int = CHUNK_ROWS, drop_invalid: bool = False,
+                 ignore_codes: Optional[Sequence[str]] = FEED_UNSUPPORTED_CODES):
+        """
+        Initialize the loader.
+
+        Args:
+            chunk_rows: Rows read, converted and validated at a time
+            drop_invalid: Drop rows with validation errors from the yielded chunks
+            ignore_codes: Error codes left out of the error frame (and so never
+                cause a row to be dropped); None keeps every code
+        """
+        self.chunk_rows = chunk_rows
+        self.drop_invalid = drop_invalid
+        self.ignore_codes = frozenset(ignore_codes or ())
+        self.cdm = MortgageCDM()
+        self._dtypes = feed_dtypes()
+        self._rename = {feed_column: column for feed_column, (column, _) in FEED_COLUMNS.items()}
+
+        # Output column -> (error code, menu dtype) for every menu column
+        self._menus = {}
+        for column, kind in FEED_COLUMNS.values():
+            if kind.startswith('menu:'):
+                section, field = kind[len('menu:'):].rsplit('.', 1)
+                options = self.cdm.get_menu_options(section, field)
+                self._menus[column] = (f"INVALID_{section}.{field}", pd.CategoricalDtype(options))
+
+    def convert_chunk(self, chunk: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Convert and validate one chunk of feed rows read with feed_dtypes.
+
+        Args:
+            chunk: Feed columns as read by read_csv
+
+        Returns:
+            (frame, errors): frame under the CDM mapping column names and the
+            boolean error frame of validate_mortgages_batch, extended with the
+            menu, date and flag checks it does not cover, without ignore_codes
+        """
+        frame = chunk.rename(columns=self._rename)
+        invalid = {}
+        for feed_column, (column, kind) in FEED_COLUMNS.items():
+            if column not in frame.columns:
+                continue
+            if kind == 'date':
+                values = frame[column]
+                frame[column] = pd.to_datetime(values, format='ISO8601', errors='coerce')
+                invalid[f"INVALID_{column}"] = (values.notna() & frame[column].isna()).to_numpy()
+            elif kind == 'flag':
+                frame[column], invalid[f"INVALID_{column}"] = _flags(frame[column])
+
+        errors = self.cdm.validate_mortgages_batch(frame)
+        for code, mask in invalid.items():
+            errors[code] = mask
+        for column, (code, dtype) in self._menus.items():
+            if column not in frame.columns:
+                continue
+            values = frame[column]
+            if code not in errors.columns:
+                errors[code] = (values.notna() & ~values.isin(dtype.categories)).to_numpy()
+            # Fixed categories, so every chunk has the same dtype
+            frame[column] = values.cat.set_categories(dtype.categories)
+
+        if self.ignore_codes:
+            errors = errors.drop(columns=[code for code in errors.columns if code in self.ignore_codes])
+        if self.drop_invalid:
+            valid = ~errors.any(axis=1).to_numpy()
+            frame, errors = frame[valid], errors[valid]
+        return frame, errors
+
+    def iter_chunks(self, source: Union[str, object]) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame]]:
+        """
+        Stream a feed file as converted, validated chunks.
+
+        Only the known feed columns are read; the others are skipped.
+
+        Args:
+            source: Path or file object of the CSV feed
+
+        Returns:
+            Iterator of (frame, errors) pairs of at most chunk_rows rows,
+            indexed by row number in the file
+        """
+        try:
+            reader = pd.read_csv(source, dtype=self._dtypes, chunksize=self.chunk_rows,
+                                 usecols=lambda name: name in FEED_COLUMNS)
+            with reader:
+                for chunk in reader:
+                    yield self.convert_chunk(chunk)
+
+        except Exception as e:
+            raise ValueError(f"Error loading mortgage feed: {str(e)}")
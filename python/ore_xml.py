@@ -0,0 +1,584 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Streaming ORE portfolio XML importer and exporter for the Physical Risk Swap CDM.
+
+This module reads ORE-style <Portfolio><Trade> files (Envelope, a
+<...Data> block with LegData/ScheduleData and an optional BasketData)
+into raw PhysicalSwap records accepted by
+PhysicalRiskSwapCDM.create_swap_mapping. Trades are parsed with iterparse
+and cleared as soon as they are converted, so memory stays flat whatever
+the file size. A file can be split into byte-range shards, each starting
+at a <Trade> tag, and the shards parsed in a process pool.
+
+The exporter goes the other way: write_swap_portfolio streams mapped
+swaps into a <Portfolio> file trade by trade without building a document
+tree, and write_swap_portfolio_parallel renders shards of trades in a
+process pool and concatenates them in order.
+
+Basket names map onto gauges (GaugeIndex, IssuerId -> GaugeID, Notional ->
+PayoutSevereFlood) in the parallel-array GaugeSet.Gauges layout; names
+without a GaugeIndex are numbered by position. Files are
+assumed to be UTF-8 without namespaces, and shard boundaries assume no
+"<Trade" tags inside comments or CDATA sections.
+"""
+
+import os
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+from xml.sax.saxutils import escape, quoteattr
+
+from .physical_risk_swap_cdm import GaugeBasket, PhysicalRiskSwapCDM
+
+# Default size of a byte-range shard
+SHARD_BYTES = 32 * 1024 * 1024
+
+# Default number of trades per export shard
+SHARD_TRADES = 50_000
+
+# Trade id of exported mappings without a "trade_id" key, by position
+TRADE_ID_FORMAT = "PRS_{:08d}"
+
+_BLOCK_BYTES = 1024 * 1024
+_TRADE_TAG = b"<Trade"
+
+_TRUE = {"y", "yes", "true", "1"}
+_FALSE = {"n", "no", "false", "0"}
+
+
+def _children(element: Optional[ET.Element]) -> dict:
+    """Return the direct children of an element by tag (first occurrence wins)."""
+    if element is None:
+        return {}
+    children = {}
+    for child in element:
+        children.setdefault(child.tag, child)
+    return children
+
+
+def _text(children: dict, tag: str) -> Optional[str]:
+    element = children.get(tag)
+    text = element.text if element is not None else None
+    return (text.strip() or None) if text else None
+
+
+def _bool(text: Optional[str]) -> Optional[bool]:
+    if text is None:
+        return None
+    if text.lower() in _TRUE:
+        return True
+    if text.lower() in _FALSE:
+        return False
+    raise ValueError(f"Invalid boolean value: {text}")
+
+
+def _float(text: Optional[str]) -> Optional[float]:
+    return None if text is None else float(text)
+
+
+def _int(text: Optional[str]) -> Optional[int]:
+    return None if text is None else int(text)
+
+
+def _date(text: Optional[str]) -> Optional[str]:
+    """Return an ORE date (YYYYMMDD or ISO) as an ISO YYYY-MM-DD string."""
+    if text is not None and len(text) == 8 and text.isdigit():
+        return f"{text[:4]}-{text[4:6]}-{text[6:]}"
+    return text
+
+
+def _drop_none(section: dict) -> dict:
+    return {key: value for key, value in section.items() if value is not None}
+
+
+def trade_to_swap_record(trade: ET.Element) -> dict:
+    """
+    Convert an ORE <Trade> element into a raw PhysicalSwap record.
+
+    Args:
+        trade: Parsed <Trade> element
+
+    Returns:
+        Record for create_swap_mapping, with the trade id under "TradeId"
+
+    Raises:
+        ValueError: If a value cannot be converted
+    """
+    try:
+        # One dict of children per level instead of an ElementPath lookup per field
+        fields = _children(trade)
+        envelope = _children(fields.get("Envelope"))
+        additional = _children(envelope.get("AdditionalFields"))
+        data_element = next((child for child in trade if child.tag.endswith("Data")), None)
+        data = _children(data_element)
+        leg = _children(data.get("LegData"))
+        notionals = _children(leg.get("Notionals"))
+        rates = _children(_children(leg.get("FixedLegData")).get("Rates"))
+        rules = _children(_children(leg.get("ScheduleData")).get("Rules"))
+
+        header = _drop_none({
+            "TradeType": _text(fields, "TradeType"),
+            "CounterParty": _text(envelope, "CounterParty"),
+            "PartyId": _text(additional, "party_id"),
+            "ValuationDate": _date(_text(additional, "valuation_date")),
+            "GaugeSetID": _text(envelope, "NettingSetId"),
+            "ProtectionStart": _date(_text(data, "ProtectionStart")),
+            "SettlesAccrual": _bool(_text(data, "SettlesAccrual")),
+            "PaysAtDefaultTime": _bool(_text(data, "PaysAtDefaultTime")),
+        })
+        leg_data = _drop_none({
+            "LegType": _text(leg, "LegType"),
+            "Payer": _bool(_text(leg, "Payer")),
+            "Currency": _text(leg, "Currency"),
+            "Notional": _float(_text(notionals, "Notional")),
+            "DayCounter": _text(leg, "DayCounter"),
+            "PaymentConvention": _text(leg, "PaymentConvention"),
+            "FixedLegRate": _float(_text(rates, "Rate")),
+        })
+        schedule_data = _drop_none({
+            "StartDate": _date(_text(rules, "StartDate")),
+            "EndDate": _date(_text(rules, "EndDate")),
+            "Tenor": _text(rules, "Tenor"),
+            "Calendar": _text(rules, "Calendar"),
+            "Convention": _text(rules, "Convention"),
+            "TermConvention": _text(rules, "TermConvention"),
+            "Rule": _text(rules, "Rule"),
+            "EndOfMonth": _bool(_text(rules, "EndOfMonth")),
+            "FirstDate": _date(_text(rules, "FirstDate")),
+            "LastDate": _date(_text(rules, "LastDate")),
+        })
+
+        swap = {"Header": header, "LegData": leg_data, "ScheduleData": schedule_data}
+        basket = data.get("BasketData")
+        names = [_children(name) for name in basket if name.tag == "Name"] if basket is not None else []
+        if names:
+            basket_size = _int(_text(data, "GaugeBasketSize"))
+            swap["GaugeSet"] = _drop_none({
+                "GaugeSet": _text(data, "CreditCurveId"),
+                "GaugeBasketSize": len(names) if basket_size is None else basket_size,
+                "Gauges": {
+                    "GaugeIndex": [position if index is None else index
+                                   for position, index in enumerate((_int(_text(name, "GaugeIndex")) for name in names), 1)],
+                    "GaugeID": [_text(name, "IssuerId") for name in names],
+                    "PayoutSevereFlood": [_float(_text(name, "Notional")) for name in names],
+                },
+            })
+        return {"TradeId": trade.get("id"), "PhysicalSwap": swap}
+
+    except Exception as e:
+        raise ValueError(f"Error converting trade {trade.get('id')}: {str(e)}")
+
+
+class _ByteRangeReader:
+    """Read-only stream over a byte range of a file, wrapped in <Portfolio> tags."""
+
+    def __init__(self, path: str, start: int, stop: int):
+        self._file = open(path, "rb")
+        self._file.seek(start)
+        self._remaining = stop - start
+        self._prefix = b"<Portfolio>"
+        self._suffix = b"</Portfolio>"
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._remaining + len(self._prefix) + len(self._suffix)
+        out = self._prefix[:size]
+        self._prefix = self._prefix[len(out):]
+        if len(out) < size and self._remaining > 0:
+            chunk = self._file.read(min(size - len(out), self._remaining))
+            self._remaining -= len(chunk)
+            if not chunk:
+                self._remaining = 0
+            out += chunk
+        if len(out) < size and self._remaining <= 0:
+            tail = self._suffix[:size - len(out)]
+            self._suffix = self._suffix[len(tail):]
+            out += tail
+        return out
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def swap_record_to_mapping(cdm: PhysicalRiskSwapCDM, record: dict) -> dict:
+    """
+    Map a record from trade_to_swap_record, keeping its trade id.
+
+    The swap CDM has no column for the ORE trade id, so it is carried
+    through under "trade_id", the key write_swap_portfolio reads.
+
+    Args:
+        cdm: PhysicalRiskSwapCDM instance
+        record: Record with the trade id under "TradeId"
+
+    Returns:
+        create_swap_mapping output with "trade_id" added
+    """
+    mapping = cdm.create_swap_mapping(record)
+    if record.get("TradeId") is not None:
+        mapping["trade_id"] = record["TradeId"]
+    return mapping
+
+
+def iter_swap_records(source: Union[str, BinaryIO], byte_range: Optional[Tuple[int, int]] = None,
+                      mapped: bool = False) -> Iterator[dict]:
+    """
+    Stream the trades of an ORE portfolio file as raw PhysicalSwap records.
+
+    Every <Trade> element is converted and cleared as soon as it has been
+    parsed, and dropped from the document root, so memory use does not
+    grow with the number of trades.
+
+    Args:
+        source: Path or binary file object of the portfolio XML
+        byte_range: Optional (start, stop) shard from portfolio_shards (path sources only)
+        mapped: Yield create_swap_mapping outputs (with "trade_id") instead of raw records
+
+    Returns:
+        Iterator of records (or mappings) for create_swap_mapping, in file order
+    """
+    cdm = PhysicalRiskSwapCDM() if mapped else None
+    stream = _ByteRangeReader(source, *byte_range) if byte_range is not None else source
+    try:
+        root = None
+        for event, element in ET.iterparse(stream, events=("start", "end")):
+            if root is None:
+                root = element
+            elif event == "end" and element.tag == "Trade":
+                record = trade_to_swap_record(element)
+                yield swap_record_to_mapping(cdm, record) if mapped else record
+                element.clear()
+                root.clear()
+    finally:
+        if byte_range is not None:
+            stream.close()
+
+
+def _find_trade(f: BinaryIO, offset: int, size: int) -> int:
+    """Return the offset of the first <Trade> start tag at or after offset, or size."""
+    f.seek(offset)
+    position = offset
+    carry = b""
+    while position < size:
+        block = f.read(_BLOCK_BYTES)
+        if not block:
+            break
+        data = carry + block
+        base = position - len(carry)
+        start = 0
+        while True:
+            found = data.find(_TRADE_TAG, start)
+            if found < 0 or found + len(_TRADE_TAG) >= len(data):
+                break
+            if data[found + len(_TRADE_TAG):found + len(_TRADE_TAG) + 1] in (b" ", b">", b"\t", b"\n", b"\r", b"/"):
+                return base + found
+            start = found + 1
+        carry = data[-len(_TRADE_TAG):]
+        position += len(block)
+    return size
+
+
+def _find_portfolio_end(f: BinaryIO, size: int) -> int:
+    """Return the offset of the closing </Portfolio> tag."""
+    tail = min(size, _BLOCK_BYTES)
+    f.seek(size - tail)
+    data = f.read(tail)
+    found = data.rfind(b"</Portfolio")
+    if found < 0:
+        raise ValueError("Portfolio file has no closing </Portfolio> tag")
+    return size - tail + found
+
+
+def portfolio_shards(path: str, shard_bytes: int = SHARD_BYTES) -> List[Tuple[int, int]]:
+    """
+    Split a portfolio file into byte ranges of whole trades.
+
+    Each range starts at a <Trade> start tag and ends where the next
+    range starts (the last one at </Portfolio>), so every trade belongs
+    to exactly one shard.
+
+    Args:
+        path: Path of the portfolio XML
+        shard_bytes: Target shard size in bytes
+
+    Returns:
+        List of (start, stop) byte offsets for iter_swap_records
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        end = _find_portfolio_end(f, size)
+        starts = []
+        offset = 0
+        while offset < end:
+            start = _find_trade(f, offset, end)
+            if start >= end:
+                break
+            if not starts or start > starts[-1]:
+                starts.append(start)
+            offset = max(start + 1, offset + shard_bytes)
+    return list(zip(starts, starts[1:] + [end]))
+
+
+def _parse_shard(path: str, byte_range: Tuple[int, int], mapped: bool) -> List[dict]:
+    return list(iter_swap_records(path, byte_range, mapped))
+
+
+def iter_swap_records_parallel(path: str, max_workers: Optional[int] = None,
+                               shard_bytes: int = SHARD_BYTES, max_pending: Optional[int] = None,
+                               mapped: bool = False, mp_context=None) -> Iterator[dict]:
+    """
+    Parse a portfolio file over byte-range shards in a process pool.
+
+    At most max_pending shards are parsed or buffered at a time, so memory
+    is bounded by the shard size rather than the file size.
+
+    Args:
+        path: Path of the portfolio XML
+        max_workers: Number of worker processes (default: os.cpu_count())
+        shard_bytes: Target shard size in bytes
+        max_pending: Maximum number of shards in flight (default: 2 per worker)
+        mapped: Apply create_swap_mapping in the workers and yield mapped dicts,
+            with the trade id under "trade_id"
+        mp_context: Optional multiprocessing context (e.g. spawn)
+
+    Returns:
+        Iterator of records (or mappings) in file order
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * max_workers
+    shards = iter(portfolio_shards(path, shard_bytes))
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as pool:
+        pending = deque()
+        while True:
+            for byte_range in shards:
+                pending.append(pool.submit(_parse_shard, path, byte_range, mapped))
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
+def _xml(value) -> str:
+    return escape(str(value))
+
+
+def _ore_bool(value, true: str, false: str) -> Optional[str]:
+    if value is None:
+        return None
+    return true if value else false
+
+
+def _ore_date(value) -> Optional[str]:
+    """Return a date or ISO date string as an ORE YYYYMMDD date."""
+    if value is None:
+        return None
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y%m%d")
+    value = str(value)
+    return value.replace("-", "") if len(value) == 10 else value
+
+
+def _leaf(parts: List[str], indent: str, tag: str, value, empty: bool = False) -> None:
+    """Append <tag>value</tag>; None values are omitted, or written as <tag/> if empty."""
+    if value is not None:
+        parts.append(f"{indent}<{tag}>{_xml(value)}</{tag}>\n")
+    elif empty:
+        parts.append(f"{indent}<{tag}/>\n")
+
+
+def swap_mapping_to_xml(swap_mapping: dict, trade_id: str) -> str:
+    """
+    Render a mapped swap as an ORE <Trade> element.
+
+    The layout follows physicalriskswap/Index_Credit_Default_Swap.xml, with
+    the gauge basket written as BasketData names; iter_swap_records reads
+    the output back into the same mapping.
+
+    Args:
+        swap_mapping: PhysicalRiskSwapCDM.create_swap_mapping output
+        trade_id: Trade id attribute
+
+    Returns:
+        XML text of the trade, ending with a newline
+    """
+    try:
+        get = swap_mapping.get
+        trade_type = get("trade_type") or "PhysicalRiskSwap"
+        parts = [f"<Trade id={quoteattr(str(trade_id))}>\n"]
+        _leaf(parts, "    ", "TradeType", trade_type)
+        parts.append("    <Envelope>\n")
+        _leaf(parts, "        ", "CounterParty", get("counter_party"))
+        _leaf(parts, "        ", "NettingSetId", get("gauge_set_id"))
+        parts.append("        <AdditionalFields>\n")
+        _leaf(parts, "            ", "party_id", get("party_id"))
+        _leaf(parts, "            ", "valuation_date", get("valuation_date"))
+        parts.append("        </AdditionalFields>\n    </Envelope>\n")
+
+        parts.append(f"    <{trade_type}Data>\n")
+        _leaf(parts, "        ", "CreditCurveId", get("gauge_set"))
+        _leaf(parts, "        ", "GaugeBasketSize", get("gauge_basket_size"))
+        _leaf(parts, "        ", "SettlesAccrual", _ore_bool(get("settles_accrual"), "Y", "N"))
+        _leaf(parts, "        ", "PaysAtDefaultTime", _ore_bool(get("pays_at_default_time"), "Y", "N"))
+        _leaf(parts, "        ", "ProtectionStart", _ore_date(get("protection_start")))
+        parts.append("        <LegData>\n")
+        _leaf(parts, "            ", "LegType", get("leg_type"))
+        _leaf(parts, "            ", "Payer", _ore_bool(get("payer"), "true", "false"))
+        _leaf(parts, "            ", "Currency", get("currency"))
+        notional = get("notional")
+        if notional is not None:
+            parts.append(f"            <Notionals>\n                <Notional>{float(notional):.6f}</Notional>\n"
+                         f"            </Notionals>\n")
+        _leaf(parts, "            ", "DayCounter", get("day_counter"))
+        _leaf(parts, "            ", "PaymentConvention", get("payment_convention"))
+        rate = get("fixed_leg_rate")
+        if rate is not None:
+            parts.append(f"            <FixedLegData>\n                <Rates>\n"
+                         f"                    <Rate>{float(rate)!r}</Rate>\n"
+                         f"                </Rates>\n            </FixedLegData>\n")
+        parts.append("            <ScheduleData>\n                <Rules>\n")
+        indent = "                    "
+        _leaf(parts, indent, "StartDate", _ore_date(get("start_date")))
+        _leaf(parts, indent, "EndDate", _ore_date(get("end_date")))
+        _leaf(parts, indent, "Tenor", get("tenor"))
+        _leaf(parts, indent, "Calendar", get("calendar"))
+        _leaf(parts, indent, "Convention", get("convention"))
+        _leaf(parts, indent, "TermConvention", get("term_convention"))
+        _leaf(parts, indent, "Rule", get("rule"))
+        _leaf(parts, indent, "EndOfMonth", _ore_bool(get("end_of_month"), "true", "false"), empty=True)
+        _leaf(parts, indent, "FirstDate", _ore_date(get("first_date")), empty=True)
+        _leaf(parts, indent, "LastDate", _ore_date(get("last_date")), empty=True)
+        parts.append("                </Rules>\n            </ScheduleData>\n        </LegData>\n")
+
+        # Absent values are left out so the basket reads back unchanged
+        basket = GaugeBasket.from_mapping(swap_mapping).to_keyed()
+        if basket:
+            parts.append("        <BasketData>\n")
+            for gauge in basket.values():
+                parts.append("            <Name>\n")
+                _leaf(parts, "                ", "GaugeIndex", gauge.get("GaugeIndex"))
+                _leaf(parts, "                ", "IssuerId", gauge.get("GaugeID"))
+                if "PayoutSevereFlood" in gauge:
+                    parts.append(f"                <Notional>{gauge['PayoutSevereFlood']!r}</Notional>\n")
+                parts.append("            </Name>\n")
+            parts.append("        </BasketData>\n")
+        parts.append(f"    </{trade_type}Data>\n</Trade>\n")
+        return "".join(parts)
+
+    except Exception as e:
+        raise ValueError(f"Error writing trade {trade_id}: {str(e)}")
+
+
+def _write_trades(f: TextIO, swap_mappings: Iterable[dict], start: int) -> int:
+    count = 0
+    for count, swap_mapping in enumerate(swap_mappings, 1):
+        trade_id = swap_mapping.get("trade_id") or TRADE_ID_FORMAT.format(start + count - 1)
+        f.write(swap_mapping_to_xml(swap_mapping, trade_id))
+    return count
+
+
+def write_swap_portfolio(destination: Union[str, TextIO], swap_mappings: Iterable[dict]) -> int:
+    """
+    Stream mapped swaps into an ORE <Portfolio> file, one trade at a time.
+
+    No document tree is built, so memory does not depend on the number of
+    trades. A mapping's "trade_id" key, as set by the mapped importers,
+    gives its trade id, so an import -> map -> export round trip keeps the
+    ids; mappings without one are numbered by position with TRADE_ID_FORMAT.
+
+    Args:
+        destination: Path or text file object to write to
+        swap_mappings: Iterable of create_swap_mapping outputs
+
+    Returns:
+        Number of trades written
+    """
+    if not isinstance(destination, str):
+        destination.write("<Portfolio>\n")
+        count = _write_trades(destination, swap_mappings, 0)
+        destination.write("</Portfolio>\n")
+        return count
+    with open(destination, "w", encoding="utf-8", buffering=_BLOCK_BYTES) as f:
+        return write_swap_portfolio(f, swap_mappings)
+
+
+def _write_shard(directory: str, swap_mappings: List[dict], start: int) -> str:
+    """Write the trades of a shard to a temporary file in directory and return its path."""
+    fd, path = tempfile.mkstemp(suffix=".xml.part", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", buffering=_BLOCK_BYTES) as f:
+            _write_trades(f, swap_mappings, start)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+
+def write_swap_portfolio_parallel(path: str, swap_mappings: Iterable[dict], max_workers: Optional[int] = None,
+                                  shard_size: int = SHARD_TRADES, max_pending: Optional[int] = None,
+                                  mp_context=None) -> int:
+    """
+    Write mapped swaps into an ORE <Portfolio> file over shards in a process pool.
+
+    Trades are taken from swap_mappings shard_size at a time, rendered to
+    temporary shard files next to path by the workers, and the shards are
+    appended to path in order as they complete. At most max_pending shards
+    are in flight, so the input can be a generator of any length.
+
+    Args:
+        path: Path of the portfolio XML to write
+        swap_mappings: Iterable of create_swap_mapping outputs
+        max_workers: Number of worker processes (default: os.cpu_count())
+        shard_size: Trades per shard
+        max_pending: Maximum number of shards in flight (default: 2 per worker)
+        mp_context: Optional multiprocessing context (e.g. spawn)
+
+    Returns:
+        Number of trades written
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * max_workers
+    directory = os.path.dirname(os.path.abspath(path))
+    swap_mappings = iter(swap_mappings)
+    count = 0
+    pending = deque()
+    with open(path, "wb") as out, ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as pool:
+        out.write(b"<Portfolio>\n")
+        try:
+            while True:
+                while len(pending) < max_pending:
+                    shard = list(islice(swap_mappings, shard_size))
+                    if not shard:
+                        break
+                    pending.append(pool.submit(_write_shard, directory, shard, count))
+                    count += len(shard)
+                if not pending:
+                    break
+                shard_path = pending.popleft().result()
+                with open(shard_path, "rb") as f:
+                    shutil.copyfileobj(f, out, _BLOCK_BYTES)
+                os.remove(shard_path)
+        finally:
+            # Drop the shard files of an interrupted write
+            for future in pending:
+                if not future.cancel() and future.exception() is None:
+                    os.remove(future.result())
+        out.write(b"</Portfolio>\n")
+    return count
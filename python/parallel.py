@@ -0,0 +1,179 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Parallel CDM validation and mapping engine.
+
+This module shards iterables of records across a process pool in chunks and
+applies a CDM method (e.g. validate_mortgage or create_property_mapping) to
+every record. Each worker receives the compiled schema once, at start-up,
+and builds its CDM instance from it; results are returned in input order.
+"""
+
+import gc
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+
+from .flood_gauge_cdm import FloodGaugeCDM
+from .mortgage_cdm import MortgageCDM
+from .physical_risk_swap_cdm import PhysicalRiskSwapCDM
+from .property_cdm import PropertyCDM
+from .schema_registry import CompiledSchema, register_compiled_schema
+from .tc_event_cdm import TCEventCDM
+from .tc_event_ts_cdm import TCEventTSCDM
+
+# CDM name -> CDM class usable by the parallel executor
+CDM_CLASSES: Dict[str, type] = {
+    'flood_gauge': FloodGaugeCDM,
+    'mortgage': MortgageCDM,
+    'physical_risk_swap': PhysicalRiskSwapCDM,
+    'property': PropertyCDM,
+    'tc_event': TCEventCDM,
+    'tc_event_ts': TCEventTSCDM,
+}
+
+
+def register_cdm_class(name: str, cdm_class: type) -> None:
+    """
+    Register a CDM class for use with the parallel executor.
+
+    Args:
+        name: Registry name of the CDM
+        cdm_class: CDM class; its constructor must accept the cdm_kwargs passed to the executor
+    """
+    CDM_CLASSES[name] = cdm_class
+
+
+# Per-process CDM instance, built once by the pool initializer
+_worker_cdm = None
+
+
+def _init_worker(cdm_class: type, cdm_kwargs: Dict[str, Any], compiled: Optional[CompiledSchema]) -> None:
+    global _worker_cdm
+    if compiled is not None:
+        register_compiled_schema(compiled)
+    _worker_cdm = cdm_class(**cdm_kwargs)
+    # The schema lives for the whole process; keep it out of cyclic GC passes
+    gc.freeze()
+
+
+def _run_chunk(method: str, records: List[Any]) -> List[Any]:
+    apply = getattr(_worker_cdm, method)
+    return [apply(record) for record in records]
+
+
+class ParallelCDMExecutor:
+    """
+    Process-pool executor applying CDM methods to records in parallel chunks.
+
+    Example:
+        with ParallelCDMExecutor('mortgage', max_workers=8) as executor:
+            mapped = executor.map('create_mortgage_mapping', records)
+    """
+    def __init__(self, cdm: Union[str, Type], cdm_kwargs: Optional[Dict[str, Any]] = None,
+                 max_workers: Optional[int] = None, chunk_size: int = 1000,
+                 max_pending: Optional[int] = None, mp_context=None):
+        """
+        Initialize the executor and start its worker pool.
+
+        Args:
+            cdm: Registered CDM name (see CDM_CLASSES) or CDM class
+            cdm_kwargs: Keyword arguments for the CDM constructor (e.g. gauge_basket_size)
+            max_workers: Number of worker processes (default: os.cpu_count())
+            chunk_size: Number of records per task
+            max_pending: Maximum number of chunks in flight (default: 4 per worker)
+            mp_context: Optional multiprocessing context (e.g. spawn)
+
+        Raises:
+            ValueError: If the CDM name is not registered or chunk_size is not positive
+        """
+        if isinstance(cdm, str):
+            if cdm not in CDM_CLASSES:
+                raise ValueError(f"Unknown CDM: {cdm}. Registered: {sorted(CDM_CLASSES)}")
+            cdm = CDM_CLASSES[cdm]
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        self.cdm_class = cdm
+        self.cdm_kwargs = dict(cdm_kwargs or {})
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or 4 * self.max_workers
+
+        # Compile in the parent and ship the compiled schema to every worker once
+        compiled = getattr(self.cdm_class(**self.cdm_kwargs), "_compiled", None)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self.cdm_class, self.cdm_kwargs, compiled)
+        )
+
+    def imap(self, method: str, records: Iterable[Any]) -> Iterator[Any]:
+        """
+        Lazily apply a CDM method to every record, yielding results in input order.
+
+        At most max_pending chunks are in flight, so arbitrarily long
+        iterables are processed in bounded memory.
+
+        Args:
+            method: Name of the CDM method (e.g. "validate_mortgage")
+            records: Iterable of records
+
+        Returns:
+            Iterator of method results, one per record, in input order
+
+        Raises:
+            ValueError: If the CDM class has no such method
+        """
+        if not callable(getattr(self.cdm_class, method, None)):
+            raise ValueError(f"{self.cdm_class.__name__} has no method {method}")
+
+        iterator = iter(records)
+        pending = deque()
+        while True:
+            while len(pending) < self.max_pending:
+                chunk = list(islice(iterator, self.chunk_size))
+                if not chunk:
+                    break
+                pending.append(self._pool.submit(_run_chunk, method, chunk))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+    def map(self, method: str, records: Iterable[Any]) -> List[Any]:
+        """
+        Apply a CDM method to every record.
+
+        Args:
+            method: Name of the CDM method (e.g. "create_property_mapping")
+            records: Iterable of records
+
+        Returns:
+            List of method results, one per record, in input order
+        """
+        return list(self.imap(method, records))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool."""
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "ParallelCDMExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
@@ -18,10 +18,206 @@ Based on Physical_Risk_Swap_CDM v2 specification.
 
 This module provides a standardized data model for physical risk swap data,
 enabling consistent processing across different data sources.
+
+The gauge basket is held as parallel arrays (GaugeSet.Gauges with GaugeIndex,
+GaugeID and PayoutSevereFlood lists). The legacy keyed layout, one
+GaugeSet.Gauge{i} entry per basket slot, is still accepted on input and
+GaugeBasket converts between the two.
 """
 
+import numbers
+
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .schema_registry import get_compiled_schema
+
+# Basket entry field -> output column suffix of gauge_{i}_<suffix>
+_GAUGE_COLUMNS = (
+    ('GaugeIndex', 'index'),
+    ('GaugeID', 'id'),
+    ('PayoutSevereFlood', 'payout_severe_flood'),
+)
+
+
+def _gauge_slot(key) -> int:
+    """Return i for a legacy "Gauge{i}" key, or 0 if the key is not a basket slot."""
+    if isinstance(key, str) and key.startswith("Gauge") and key[5:].isdigit() and key[5] != "0":
+        return int(key[5:])
+    return 0
+
+
+def _keyed_gauges(gauge_set: dict, max_size: Optional[int] = None) -> List[Tuple[int, dict]]:
+    """Return the (slot, entry) pairs of the legacy Gauge{i} entries present, in slot order."""
+    slots = sorted((slot, key) for key in gauge_set
+                   if (slot := _gauge_slot(key)) and (max_size is None or slot <= max_size))
+    return [(slot, gauge_set[key]) for slot, key in slots]
+
+
+def _gauge_column(gauges: dict, field: str) -> list:
+    """Return a GaugeSet.Gauges column (list or NumPy array) as a list of Python values; absent is empty."""
+    values = gauges.get(field)
+    return [] if values is None else np.asarray(values, dtype=object).reshape(-1).tolist()
+
+
+def _is_integer(value) -> bool:
+    return isinstance(value, (numbers.Integral, np.integer))
+
+
+def _array_gauges(gauges: dict) -> List[Tuple[int, dict]]:
+    """Return (slot, entry) pairs for GaugeSet.Gauges arrays, numbering slots from 1."""
+    columns = [(field, _gauge_column(gauges, field)) for field, _ in _GAUGE_COLUMNS]
+    size = max(len(values) for _, values in columns)
+    return [(slot, {field: values[slot - 1] for field, values in columns if slot <= len(values)})
+            for slot in range(1, size + 1)]
+
+
+class GaugeBasket:
+    """
+    Gauge basket of a physical risk swap as parallel arrays.
+
+    Missing values are held as GaugeIndex 0, GaugeID None and a NaN payout,
+    and are dropped again by the conversions to the record layouts.
+
+    Example:
+        basket = GaugeBasket.from_record(swap["PhysicalSwap"]["GaugeSet"])
+        basket.payouts.sum()
+        legacy = basket.to_keyed()  # {"Gauge1": {...}, "Gauge2": {...}}
+    """
+    __slots__ = ("indices", "gauge_ids", "payouts")
+
+    def __init__(self, indices=(), gauge_ids=(), payouts=()):
+        """
+        Initialize the basket from parallel sequences.
+
+        Args:
+            indices: GaugeIndex of each gauge (portfolio position, 1-based)
+            gauge_ids: GaugeID of each gauge
+            payouts: PayoutSevereFlood of each gauge
+
+        Raises:
+            ValueError: If the sequences differ in length
+        """
+        self.indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        self.gauge_ids = np.empty(len(gauge_ids), dtype=object)
+        self.gauge_ids[:] = list(gauge_ids)
+        self.payouts = np.asarray(payouts, dtype=np.float64).reshape(-1)
+        if not len(self.indices) == len(self.gauge_ids) == len(self.payouts):
+            raise ValueError(f"Basket arrays differ in length: {len(self.indices)} indices, "
+                             f"{len(self.gauge_ids)} gauge IDs, {len(self.payouts)} payouts")
+
+    def __len__(self) -> int:
+        return len(self.gauge_ids)
+
+    def __repr__(self) -> str:
+        return f"GaugeBasket(n_gauges={len(self)})"
+
+    @staticmethod
+    def _numeric(values, fill) -> np.ndarray:
+        return pd.to_numeric(pd.Series(list(values), dtype=object), errors="coerce").fillna(fill).to_numpy()
+
+    @classmethod
+    def from_columns(cls, indices, gauge_ids, payouts) -> "GaugeBasket":
+        """
+        Build a basket from raw column values, coercing missing or invalid numbers.
+
+        Args:
+            indices: Raw GaugeIndex values
+            gauge_ids: Raw GaugeID values
+            payouts: Raw PayoutSevereFlood values
+
+        Returns:
+            GaugeBasket
+        """
+        return cls(cls._numeric(indices, 0).astype(np.int64), gauge_ids,
+                   cls._numeric(payouts, np.nan).astype(np.float64))
+
+    @classmethod
+    def from_record(cls, gauge_set: dict, max_size: Optional[int] = None) -> "GaugeBasket":
+        """
+        Build a basket from a GaugeSet section in either layout.
+
+        Args:
+            gauge_set: GaugeSet section with Gauges arrays or legacy Gauge{i} entries
+            max_size: Ignore legacy slots above this number (default: no limit)
+
+        Returns:
+            GaugeBasket
+        """
+        gauges = gauge_set.get("Gauges")
+        if gauges is not None:
+            return cls.from_columns(gauges.get("GaugeIndex", ()), gauges.get("GaugeID", ()),
+                                    gauges.get("PayoutSevereFlood", ()))
+        return cls.from_keyed(gauge_set, max_size)
+
+    @classmethod
+    def from_keyed(cls, gauge_set: dict, max_size: Optional[int] = None) -> "GaugeBasket":
+        """
+        Build a basket from legacy GaugeSet.Gauge{i} entries, in slot order.
+
+        Args:
+            gauge_set: GaugeSet section with Gauge{i} entries
+            max_size: Ignore slots above this number (default: no limit)
+
+        Returns:
+            GaugeBasket
+        """
+        entries = [gauge for _, gauge in _keyed_gauges(gauge_set, max_size)]
+        return cls.from_columns([gauge.get("GaugeIndex") for gauge in entries],
+                                [gauge.get("GaugeID") for gauge in entries],
+                                [gauge.get("PayoutSevereFlood") for gauge in entries])
+
+    @classmethod
+    def from_mapping(cls, mapping: dict) -> "GaugeBasket":
+        """
+        Build a basket from the gauge_{i}_* columns of a create_swap_mapping output.
+
+        Args:
+            mapping: Mapped swap
+
+        Returns:
+            GaugeBasket, in slot order
+        """
+        slots = sorted(int(column[6:-3]) for column in mapping
+                       if column.startswith("gauge_") and column.endswith("_id") and column[6:-3].isdigit())
+        return cls.from_columns([mapping.get(f"gauge_{i}_index") for i in slots],
+                                [mapping.get(f"gauge_{i}_id") for i in slots],
+                                [mapping.get(f"gauge_{i}_payout_severe_flood") for i in slots])
+
+    def _entries(self) -> Iterator[Tuple[int, dict]]:
+        for slot, (index, gauge_id, payout) in enumerate(
+                zip(self.indices.tolist(), self.gauge_ids, self.payouts.tolist()), 1):
+            entry = {}
+            if index:
+                entry["GaugeIndex"] = index
+            if gauge_id is not None:
+                entry["GaugeID"] = gauge_id
+            if payout == payout:
+                entry["PayoutSevereFlood"] = payout
+            yield slot, entry
+
+    def to_record(self) -> dict:
+        """Return the GaugeSet.Gauges arrays of the basket."""
+        return {
+            "GaugeIndex": self.indices.tolist(),
+            "GaugeID": self.gauge_ids.tolist(),
+            "PayoutSevereFlood": self.payouts.tolist(),
+        }
+
+    def to_keyed(self) -> Dict[str, dict]:
+        """Return the basket as legacy Gauge{i} entries, numbering slots from 1 in array order."""
+        return {f"Gauge{slot}": entry for slot, entry in self._entries()}
+
+    def to_mapping(self) -> dict:
+        """Return the basket as gauge_{i}_* mapping columns, numbering slots from 1 in array order."""
+        mapped = {}
+        for slot, entry in self._entries():
+            for field, suffix in _GAUGE_COLUMNS:
+                if field in entry:
+                    mapped[f"gauge_{slot}_{suffix}"] = entry[field]
+        return mapped
+
 
 class PhysicalRiskSwapCDM:
     """
@@ -29,15 +225,79 @@ class PhysicalRiskSwapCDM:
     Provides a standardized schema and data transformation methods
     for physical risk swap data.
     """
+    SCHEMA_VERSION = "v2"
+
+    # Output column name -> dotted schema path, in mapping order
+    _FIELD_COLUMNS = {
+        # Header section
+        'trade_type': 'PhysicalSwap.Header.TradeType',
+        'counter_party': 'PhysicalSwap.Header.CounterParty',
+        'party_id': 'PhysicalSwap.Header.PartyId',
+        'valuation_date': 'PhysicalSwap.Header.ValuationDate',
+        'gauge_set_id': 'PhysicalSwap.Header.GaugeSetID',
+        'protection_start': 'PhysicalSwap.Header.ProtectionStart',
+        'settles_accrual': 'PhysicalSwap.Header.SettlesAccrual',
+        'pays_at_default_time': 'PhysicalSwap.Header.PaysAtDefaultTime',
+
+        # LegData section
+        'leg_type': 'PhysicalSwap.LegData.LegType',
+        'payer': 'PhysicalSwap.LegData.Payer',
+        'currency': 'PhysicalSwap.LegData.Currency',
+        'notional': 'PhysicalSwap.LegData.Notional',
+        'day_counter': 'PhysicalSwap.LegData.DayCounter',
+        'payment_convention': 'PhysicalSwap.LegData.PaymentConvention',
+        'fixed_leg_rate': 'PhysicalSwap.LegData.FixedLegRate',
+
+        # ScheduleData section
+        'start_date': 'PhysicalSwap.ScheduleData.StartDate',
+        'end_date': 'PhysicalSwap.ScheduleData.EndDate',
+        'tenor': 'PhysicalSwap.ScheduleData.Tenor',
+        'calendar': 'PhysicalSwap.ScheduleData.Calendar',
+        'convention': 'PhysicalSwap.ScheduleData.Convention',
+        'term_convention': 'PhysicalSwap.ScheduleData.TermConvention',
+        'rule': 'PhysicalSwap.ScheduleData.Rule',
+        'end_of_month': 'PhysicalSwap.ScheduleData.EndOfMonth',
+        'first_date': 'PhysicalSwap.ScheduleData.FirstDate',
+        'last_date': 'PhysicalSwap.ScheduleData.LastDate',
+
+        # GaugeSet section
+        'gauge_set': 'PhysicalSwap.GaugeSet.GaugeSet',
+        'gauge_basket_size': 'PhysicalSwap.GaugeSet.GaugeBasketSize',
+    }
+
     def __init__(self, gauge_basket_size: int = 20):
         """
         Initialize the Physical Risk Swap CDM with schema definition.
         
         Args:
-            gauge_basket_size: Number of gauges in the basket (default: 20)
+            gauge_basket_size: Number of legacy Gauge{i} slots read from keyed baskets
+                (default: 20); array-layout baskets (GaugeSet.Gauges) are not capped
         """
         self.gauge_basket_size = gauge_basket_size
-        self.schema = {
+        self._compiled = get_compiled_schema(
+            "PhysicalSwap", self.SCHEMA_VERSION,
+            lambda: self._build_schema(gauge_basket_size),
+            variant=gauge_basket_size,
+            columns=self._FIELD_COLUMNS
+        )
+        self.schema = self._compiled.schema
+        self._fields = self._compiled.fields
+
+    @staticmethod
+    def _build_schema(gauge_basket_size: int) -> dict:
+        """
+        Build the Physical Risk Swap schema definition.
+
+        GaugeSet.Gauges describes one basket entry; in records its fields
+        hold parallel lists (or NumPy arrays) with one element per gauge.
+        
+        Args:
+            gauge_basket_size: Number of legacy Gauge{i} slots, quoted in the GaugeBasketSize description
+            
+        Returns:
+            Nested schema definition
+        """
+        return {
             "PhysicalSwap": {
                 "Header": {
                     "TradeType": {
@@ -153,22 +413,22 @@ class PhysicalRiskSwapCDM:
                     },
                     "GaugeBasketSize": {
                         "type": "integer",
-                        "description": f"number of gauges so 1 < n < {self.gauge_basket_size + 1}"
+                        "description": f"number of gauges so 1 < n < {gauge_basket_size + 1}"
                     },
-                    **{f"Gauge{i}": {
+                    "Gauges": {
                         "GaugeIndex": {
                             "type": "integer",
-                            "description": f"Index position of gauge {i} in portfolio"
+                            "description": "Index position of each gauge in portfolio"
                         },
                         "GaugeID": {
                             "type": "text",
-                            "description": f"Unique identifier for sensor {i}"
+                            "description": "Unique identifier for each sensor"
                         },
                         "PayoutSevereFlood": {
                             "type": "decimal",
-                            "description": f"Payout for reaching Severe Flood Warning for gauge {i}"
+                            "description": "Payout for reaching Severe Flood Warning for each gauge"
                         }
-                    } for i in range(1, self.gauge_basket_size + 1)}
+                    }
                 }
             }
         }
@@ -205,9 +465,10 @@ class PhysicalRiskSwapCDM:
             leg_data = swap_data.get("PhysicalSwap", {}).get("LegData", {})
             
             # Validate menu fields
-            leg_type = leg_data.get("LegType")
-            if leg_type and leg_type not in ["Fixed", "Float"]:
-                leg_errors.append("Invalid value for LegType")
+            for spec in self._fields.menu_fields("PhysicalSwap.LegData"):
+                value = leg_data.get(spec.name)
+                if value and value not in spec.options:
+                    leg_errors.append(f"Invalid value for {spec.name}")
                 
             if leg_errors:
                 errors["LegData"] = leg_errors
@@ -232,31 +493,38 @@ class PhysicalRiskSwapCDM:
             
             # Check that GaugeBasketSize is positive
             basket_size = gauge_set.get("GaugeBasketSize")
-            if basket_size is not None and (not isinstance(basket_size, int) or basket_size <= 0):
+            if basket_size is not None and (not _is_integer(basket_size) or basket_size <= 0):
                 gauge_errors.append("GaugeBasketSize must be a positive integer")
             
-            # Validate individual gauges (1 to gauge_basket_size)
-            for i in range(1, self.gauge_basket_size + 1):
-                gauge_key = f"Gauge{i}"
-                if gauge_key in gauge_set:
-                    gauge_data = gauge_set[gauge_key]
-                    if not gauge_data.get("GaugeID"):
-                        gauge_errors.append(f"Missing GaugeID for {gauge_key}")
-                    
-                    # Validate GaugeIndex
-                    gauge_index = gauge_data.get("GaugeIndex")
-                    if gauge_index is not None:
-                        if not isinstance(gauge_index, int) or gauge_index < 1:
-                            gauge_errors.append(f"Invalid GaugeIndex for {gauge_key} - must be positive integer")
-                    else:
-                        gauge_errors.append(f"Missing GaugeIndex for {gauge_key}")
-                    
-                    # Validate PayoutSevereFlood
-                    if gauge_data.get("PayoutSevereFlood") is not None:
-                        try:
-                            float(gauge_data["PayoutSevereFlood"])
-                        except (ValueError, TypeError):
-                            gauge_errors.append(f"Invalid PayoutSevereFlood value for {gauge_key}")
+            # Validate the gauges present, in either basket layout
+            gauges = gauge_set.get("Gauges")
+            if gauges is not None:
+                lengths = {len(_gauge_column(gauges, field)) for field, _ in _GAUGE_COLUMNS}
+                if len(lengths) > 1:
+                    gauge_errors.append("Gauges arrays must have the same length")
+                present = _array_gauges(gauges)
+            else:
+                present = _keyed_gauges(gauge_set, self.gauge_basket_size)
+
+            for slot, gauge_data in present:
+                gauge_key = f"Gauge{slot}"
+                if not gauge_data.get("GaugeID"):
+                    gauge_errors.append(f"Missing GaugeID for {gauge_key}")
+                
+                # Validate GaugeIndex
+                gauge_index = gauge_data.get("GaugeIndex")
+                if gauge_index is not None:
+                    if not _is_integer(gauge_index) or gauge_index < 1:
+                        gauge_errors.append(f"Invalid GaugeIndex for {gauge_key} - must be positive integer")
+                else:
+                    gauge_errors.append(f"Missing GaugeIndex for {gauge_key}")
+                
+                # Validate PayoutSevereFlood
+                if gauge_data.get("PayoutSevereFlood") is not None:
+                    try:
+                        float(gauge_data["PayoutSevereFlood"])
+                    except (ValueError, TypeError):
+                        gauge_errors.append(f"Invalid PayoutSevereFlood value for {gauge_key}")
                 
             if gauge_errors:
                 errors["GaugeSet"] = gauge_errors
@@ -277,55 +545,36 @@ class PhysicalRiskSwapCDM:
             Structured physical risk swap data according to CDM schema
         """
         try:
-            swap_data = {
-                # Header section
-                'trade_type': swap.get('PhysicalSwap', {}).get('Header', {}).get('TradeType'),
-                'counter_party': swap.get('PhysicalSwap', {}).get('Header', {}).get('CounterParty'),
-                'party_id': swap.get('PhysicalSwap', {}).get('Header', {}).get('PartyId'),
-                'valuation_date': swap.get('PhysicalSwap', {}).get('Header', {}).get('ValuationDate'),
-                'gauge_set_id': swap.get('PhysicalSwap', {}).get('Header', {}).get('GaugeSetID'),
-                'protection_start': swap.get('PhysicalSwap', {}).get('Header', {}).get('ProtectionStart'),
-                'settles_accrual': swap.get('PhysicalSwap', {}).get('Header', {}).get('SettlesAccrual'),
-                'pays_at_default_time': swap.get('PhysicalSwap', {}).get('Header', {}).get('PaysAtDefaultTime'),
-                
-                # LegData section
-                'leg_type': swap.get('PhysicalSwap', {}).get('LegData', {}).get('LegType'),
-                'payer': swap.get('PhysicalSwap', {}).get('LegData', {}).get('Payer'),
-                'currency': swap.get('PhysicalSwap', {}).get('LegData', {}).get('Currency'),
-                'notional': swap.get('PhysicalSwap', {}).get('LegData', {}).get('Notional'),
-                'day_counter': swap.get('PhysicalSwap', {}).get('LegData', {}).get('DayCounter'),
-                'payment_convention': swap.get('PhysicalSwap', {}).get('LegData', {}).get('PaymentConvention'),
-                'fixed_leg_rate': swap.get('PhysicalSwap', {}).get('LegData', {}).get('FixedLegRate'),
-                
-                # ScheduleData section
-                'start_date': swap.get('PhysicalSwap', {}).get('ScheduleData', {}).get('StartDate'),
-                'end_date': swap.get('PhysicalSwap', {}).get('ScheduleData', {}).get('EndDate'),
-                'tenor': swap.get('PhysicalSwap', {}).get('ScheduleData', {}).get('Tenor'),
-                'calendar': swap.get('PhysicalSwap', {}).get('ScheduleData', {}).get('Calendar'),
-                'convention': swap.get('PhysicalSwap', {}).get('ScheduleData', {}).get('Convention'),
-                'term_convention': swap.get('PhysicalSwap', {}).get('ScheduleData', {}).get('TermConvention'),
-                'rule': swap.get('PhysicalSwap', {}).get('ScheduleData', {}).get('Rule'),
-                'end_of_month': swap.get('PhysicalSwap', {}).get('ScheduleData', {}).get('EndOfMonth'),
-                'first_date': swap.get('PhysicalSwap', {}).get('ScheduleData', {}).get('FirstDate'),
-                'last_date': swap.get('PhysicalSwap', {}).get('ScheduleData', {}).get('LastDate'),
-                
-                # GaugeSet section
-                'gauge_set': swap.get('PhysicalSwap', {}).get('GaugeSet', {}).get('GaugeSet'),
-                'gauge_basket_size': swap.get('PhysicalSwap', {}).get('GaugeSet', {}).get('GaugeBasketSize')
-            }
+            # Single pass over the compiled columns, skipping None values
+            mapped = self._fields.mapper(swap)
+
+            # Append gauge_{i}_* columns for the gauges present only
+            gauge_set = swap.get("PhysicalSwap", {}).get("GaugeSet", {})
+            gauges = gauge_set.get("Gauges")
+            present = _array_gauges(gauges) if gauges is not None else _keyed_gauges(gauge_set, self.gauge_basket_size)
+            for slot, gauge_data in present:
+                for field, suffix in _GAUGE_COLUMNS:
+                    value = gauge_data.get(field)
+                    if value is not None:
+                        mapped[f'gauge_{slot}_{suffix}'] = value
+            return mapped
             
-            # Add individual gauges (1 to gauge_basket_size)
-            gauge_set_data = swap.get('PhysicalSwap', {}).get('GaugeSet', {})
-            for i in range(1, self.gauge_basket_size + 1):
-                gauge_key = f"Gauge{i}"
-                if gauge_key in gauge_set_data:
-                    gauge_data = gauge_set_data[gauge_key]
-                    swap_data[f'gauge_{i}_index'] = gauge_data.get('GaugeIndex')
-                    swap_data[f'gauge_{i}_id'] = gauge_data.get('GaugeID')
-                    swap_data[f'gauge_{i}_payout_severe_flood'] = gauge_data.get('PayoutSevereFlood')
+        except Exception as e:
+            raise ValueError(f"Error creating swap mapping: {str(e)}")
+
+    def create_gauge_basket(self, swap: dict) -> GaugeBasket:
+        """
+        Creates the parallel-array gauge basket of a physical risk swap.
+        
+        Args:
+            swap: Raw physical risk swap data dictionary, in either basket layout
             
-            # Remove None values from the dictionary
-            return {k: v for k, v in swap_data.items() if v is not None}
+        Returns:
+            GaugeBasket of the swap
+        """
+        try:
+            gauge_set = swap.get("PhysicalSwap", {}).get("GaugeSet", {})
+            return GaugeBasket.from_record(gauge_set, self.gauge_basket_size)
             
         except Exception as e:
-            raise ValueError(f"Error creating swap mapping: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Error creating gauge basket: {str(e)}")
@@ -26,13 +26,126 @@
 """
 
 import warnings
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+from .british_national_grid import fill_property_coordinates
+from .schema_registry import get_compiled_schema, thaw_schema
 
 class PropertyCDM:
 
+    SCHEMA_VERSION = "v10"
+
+    # Output column name -> dotted schema path, in mapping order
+    _FIELD_COLUMNS = {
+        # PropertyHeader.Header (4 fields) - CRITICAL FIELDS FOR FLOOD MODEL
+        'property_id': 'PropertyHeader.Header.PropertyID',
+        'uprn': 'PropertyHeader.Header.UPRN',
+        'property_type': 'PropertyHeader.Header.propertyType',
+        'property_status': 'PropertyHeader.Header.propertyStatus',
+
+        # PropertyHeader.Valuation (3 fields) - **CRITICAL: THIS WAS MISSING!**
+        'value': 'PropertyHeader.Valuation.PropertyValue',  # FLOOD MODEL NEEDS THIS!
+        'valuation_date': 'PropertyHeader.Valuation.ValuationDate',
+        'valuation_method': 'PropertyHeader.Valuation.ValuationMethod',
+
+        # PropertyHeader.Location (21 fields) - CRITICAL FOR FLOOD MODEL
+        'building_name': 'PropertyHeader.Location.BuildingName',
+        'building_number': 'PropertyHeader.Location.BuildingNumber',
+        'sub_building_number': 'PropertyHeader.Location.SubBuildingNumber',
+        'sub_building_name': 'PropertyHeader.Location.SubBuildingName',
+        'street_name': 'PropertyHeader.Location.StreetName',
+        'address_line2': 'PropertyHeader.Location.AddressLine2',
+        'town_city': 'PropertyHeader.Location.TownCity',
+        'county': 'PropertyHeader.Location.County',
+        'postcode': 'PropertyHeader.Location.Postcode',
+        'usrn': 'PropertyHeader.Location.USRN',
+        'local_authority': 'PropertyHeader.Location.LocalAuthority',
+        'electoral_ward': 'PropertyHeader.Location.ElectoralWard',
+        'parliamentary_constituency': 'PropertyHeader.Location.ParliamentaryConstituency',
+        'country': 'PropertyHeader.Location.Country',
+        'region': 'PropertyHeader.Location.Region',
+        'urban_rural': 'PropertyHeader.Location.UrbanRuralClassification',
+        'latitude': 'PropertyHeader.Location.LatitudeDegrees',  # FLOOD MODEL NEEDS THIS!
+        'longitude': 'PropertyHeader.Location.LongitudeDegrees',  # FLOOD MODEL NEEDS THIS!
+        'british_national_grid': 'PropertyHeader.Location.BritishNationalGrid',
+        'what3words': 'PropertyHeader.Location.What3Words',
+        'local_density': 'PropertyHeader.Location.LocalDensityHectare',
+
+        # PropertyHeader.Construction (7 fields) - CRITICAL FOR FLOOD MODEL
+        'construction_type': 'PropertyHeader.Construction.ConstructionType',
+        'foundation_type': 'PropertyHeader.Construction.FoundationType',
+        'floor_type': 'PropertyHeader.Construction.FloorType',
+        'site_height': 'PropertyHeader.Construction.SiteHeight',
+        'property_height': 'PropertyHeader.Construction.PropertyHeight',
+        'floor_level_metres': 'PropertyHeader.Construction.FloorLevelMeters',  # FLOOD MODEL NEEDS THIS!
+        'basement_present': 'PropertyHeader.Construction.BasementPresent',
+
+        # PropertyHeader.RiskAssessment (11 fields) - CRITICAL FOR FLOOD MODEL
+        'flood_zone': 'PropertyHeader.RiskAssessment.EAFloodZone',
+        'overall_flood_risk': 'PropertyHeader.RiskAssessment.OverallFloodRisk',
+        'flood_risk_type': 'PropertyHeader.RiskAssessment.FloodRiskType',
+        'last_flood_date': 'PropertyHeader.RiskAssessment.LastFloodDate',
+        'soil_type': 'PropertyHeader.RiskAssessment.SoilType',
+        # ELEVATION - Critical for flood model, defaults in _COLUMN_FALLBACKS
+        'ground_level_meters': 'PropertyHeader.RiskAssessment.GroundLevelMeters',
+        'elevation': 'PropertyHeader.RiskAssessment.GroundLevelMeters',  # Alias for flood model compatibility
+        'river_distance': 'PropertyHeader.RiskAssessment.RiverDistanceMeters',
+        'lake_distance': 'PropertyHeader.RiskAssessment.LakeDistanceMeters',
+        'coastal_distance': 'PropertyHeader.RiskAssessment.CoastalDistanceMeters',
+        'canal_distance': 'PropertyHeader.RiskAssessment.CanalDistanceMeters',
+        'government_defence_scheme': 'PropertyHeader.RiskAssessment.GovernmentDefenceScheme',
+
+        # PropertyHeader.PropertyAttributes (21 fields)
+        'occupancy_type': 'PropertyHeader.PropertyAttributes.OccupancyType',
+        'property_area_sqm': 'PropertyHeader.PropertyAttributes.PropertyAreaSqm',
+        'housing_association': 'PropertyHeader.PropertyAttributes.HousingAssociation',
+        'income_generating': 'PropertyHeader.PropertyAttributes.IncomeGenerating',
+        'paying_business_rates': 'PropertyHeader.PropertyAttributes.PayingBusinessRates',
+        'building_residency': 'PropertyHeader.PropertyAttributes.BuildingResidency',
+        'property_resi': 'PropertyHeader.PropertyAttributes.PropertyResi',
+        'occupancy_residency': 'PropertyHeader.PropertyAttributes.OccupancyResidency',
+        'height_meters': 'PropertyHeader.PropertyAttributes.HeightMeters',
+        'number_storeys': 'PropertyHeader.PropertyAttributes.NumberOfStoreys',
+        'construction_year': 'PropertyHeader.PropertyAttributes.ConstructionYear',
+        'property_period': 'PropertyHeader.PropertyAttributes.PropertyPeriod',
+        'council_tax_band': 'PropertyHeader.PropertyAttributes.CouncilTaxBand',
+        'number_bedrooms': 'PropertyHeader.PropertyAttributes.NumberBedrooms',
+        'number_bathrooms': 'PropertyHeader.PropertyAttributes.NumberBathrooms',
+        'total_rooms': 'PropertyHeader.PropertyAttributes.TotalRooms',
+        'garden_area_front': 'PropertyHeader.PropertyAttributes.GardenAreaFront',
+        'garden_area_back': 'PropertyHeader.PropertyAttributes.GardenAreaBack',
+        'parking_type': 'PropertyHeader.PropertyAttributes.ParkingType',
+        'access_type': 'PropertyHeader.PropertyAttributes.AccessType',
+        'last_major_works_date': 'PropertyHeader.PropertyAttributes.LastMajorWorksDate',
+        'renovation_required': 'PropertyHeader.PropertyAttributes.RenovationRequired',
+        'property_condition': 'PropertyHeader.PropertyAttributes.PropertyCondition',
+    }
+
+    # Defaults used when a field is absent from its section
+    _COLUMN_DEFAULTS = {
+        'property_type': 'residential',
+        'property_status': 'active',
+    }
+
+    # ELEVATION - defaults used when the value is None or zero
+    _COLUMN_FALLBACKS = {
+        'ground_level_meters': 12.0,  # Default 12m elevation
+        'elevation': 12.0,  # Alias for flood model compatibility
+    }
+
     def __init__(self):
-        """Initialize the Property CDM with schema definition from Excel specification."""
-        self.schema = {
+        """Initialize the Property CDM with the shared compiled schema definition."""
+        self._compiled = get_compiled_schema(
+            "Property", self.SCHEMA_VERSION, self._build_schema, columns=self._FIELD_COLUMNS,
+            defaults=self._COLUMN_DEFAULTS, fallbacks=self._COLUMN_FALLBACKS
+        )
+        self.schema = self._compiled.schema
+        self._fields = self._compiled.fields
+
+    @staticmethod
+    def _build_schema() -> dict:
+        """Build the Property schema definition from the Excel specification."""
+        return {
             "PropertyHeader": {
                 "Header": {
                     "UPRN": {
@@ -368,101 +481,41 @@ class PropertyCDM:
             Structured property data according to CDM schema with correct field names
         """
         try:
-            property_data = {
-                # PropertyHeader.Header (4 fields) - CRITICAL FIELDS FOR FLOOD MODEL
-                'property_id': prop.get('PropertyHeader', {}).get('Header', {}).get('PropertyID'),
-                'uprn': prop.get('PropertyHeader', {}).get('Header', {}).get('UPRN'),
-                'property_type': prop.get('PropertyHeader', {}).get('Header', {}).get('propertyType', 'residential'),
-                'property_status': prop.get('PropertyHeader', {}).get('Header', {}).get('propertyStatus', 'active'),
-
-                # PropertyHeader.Valuation (3 fields) - **CRITICAL: THIS WAS MISSING!**
-                'value': prop.get('PropertyHeader', {}).get('Valuation', {}).get('PropertyValue'),  # FLOOD MODEL NEEDS THIS!
-                'valuation_date': prop.get('PropertyHeader', {}).get('Valuation', {}).get('ValuationDate'),
-                'valuation_method': prop.get('PropertyHeader', {}).get('Valuation', {}).get('ValuationMethod'),
-
-                # PropertyHeader.Location (21 fields) - CRITICAL FOR FLOOD MODEL
-                'building_name': prop.get('PropertyHeader', {}).get('Location', {}).get('BuildingName'),
-                'building_number': prop.get('PropertyHeader', {}).get('Location', {}).get('BuildingNumber'),
-                'sub_building_number': prop.get('PropertyHeader', {}).get('Location', {}).get('SubBuildingNumber'),
-                'sub_building_name': prop.get('PropertyHeader', {}).get('Location', {}).get('SubBuildingName'),
-                'street_name': prop.get('PropertyHeader', {}).get('Location', {}).get('StreetName'),
-                'address_line2': prop.get('PropertyHeader', {}).get('Location', {}).get('AddressLine2'),
-                'town_city': prop.get('PropertyHeader', {}).get('Location', {}).get('TownCity'),
-                'county': prop.get('PropertyHeader', {}).get('Location', {}).get('County'),
-                'postcode': prop.get('PropertyHeader', {}).get('Location', {}).get('Postcode'),
-                'usrn': prop.get('PropertyHeader', {}).get('Location', {}).get('USRN'),
-                'local_authority': prop.get('PropertyHeader', {}).get('Location', {}).get('LocalAuthority'),
-                'electoral_ward': prop.get('PropertyHeader', {}).get('Location', {}).get('ElectoralWard'),
-                'parliamentary_constituency': prop.get('PropertyHeader', {}).get('Location', {}).get('ParliamentaryConstituency'),
-                'country': prop.get('PropertyHeader', {}).get('Location', {}).get('Country'),
-                'region': prop.get('PropertyHeader', {}).get('Location', {}).get('Region'),
-                'urban_rural': prop.get('PropertyHeader', {}).get('Location', {}).get('UrbanRuralClassification'),
-                'latitude': prop.get('PropertyHeader', {}).get('Location', {}).get('LatitudeDegrees'),      # FLOOD MODEL NEEDS THIS!
-                'longitude': prop.get('PropertyHeader', {}).get('Location', {}).get('LongitudeDegrees'),    # FLOOD MODEL NEEDS THIS!
-                'british_national_grid': prop.get('PropertyHeader', {}).get('Location', {}).get('BritishNationalGrid'),
-                'what3words': prop.get('PropertyHeader', {}).get('Location', {}).get('What3Words'),
-                'local_density': prop.get('PropertyHeader', {}).get('Location', {}).get('LocalDensityHectare'),
-                
-                # PropertyHeader.Construction (7 fields) - CRITICAL FOR FLOOD MODEL
-                'construction_type': prop.get('PropertyHeader', {}).get('Construction', {}).get('ConstructionType'),
-                'foundation_type': prop.get('PropertyHeader', {}).get('Construction', {}).get('FoundationType'),
-                'floor_type': prop.get('PropertyHeader', {}).get('Construction', {}).get('FloorType'),
-                'site_height': prop.get('PropertyHeader', {}).get('Construction', {}).get('SiteHeight'),
-                'property_height': prop.get('PropertyHeader', {}).get('Construction', {}).get('PropertyHeight'),
-                'floor_level_metres': prop.get('PropertyHeader', {}).get('Construction', {}).get('FloorLevelMeters'),  # FLOOD MODEL NEEDS THIS!
-                'basement_present': prop.get('PropertyHeader', {}).get('Construction', {}).get('BasementPresent'),
-
-                # PropertyHeader.RiskAssessment (11 fields) - CRITICAL FOR FLOOD MODEL
-                'flood_zone': prop.get('PropertyHeader', {}).get('RiskAssessment', {}).get('EAFloodZone'),
-                'overall_flood_risk': prop.get('PropertyHeader', {}).get('RiskAssessment', {}).get('OverallFloodRisk'),
-                'flood_risk_type': prop.get('PropertyHeader', {}).get('RiskAssessment', {}).get('FloodRiskType'),
-                'last_flood_date': prop.get('PropertyHeader', {}).get('RiskAssessment', {}).get('LastFloodDate'),
-                'soil_type': prop.get('PropertyHeader', {}).get('RiskAssessment', {}).get('SoilType'),
-                # ELEVATION - Critical for flood model with default value
-                'ground_level_meters': prop.get('PropertyHeader', {}).get('RiskAssessment', {}).get('GroundLevelMeters') or 12.0,  # Default 12m elevation
-                'elevation': prop.get('PropertyHeader', {}).get('RiskAssessment', {}).get('GroundLevelMeters') or 12.0,  # Alias for flood model compatibility
-                'river_distance': prop.get('PropertyHeader', {}).get('RiskAssessment', {}).get('RiverDistanceMeters'),
-                'lake_distance': prop.get('PropertyHeader', {}).get('RiskAssessment', {}).get('LakeDistanceMeters'),
-                'coastal_distance': prop.get('PropertyHeader', {}).get('RiskAssessment', {}).get('CoastalDistanceMeters'),
-                'canal_distance': prop.get('PropertyHeader', {}).get('RiskAssessment', {}).get('CanalDistanceMeters'),
-                'government_defence_scheme': prop.get('PropertyHeader', {}).get('RiskAssessment', {}).get('GovernmentDefenceScheme'),
-                
-                # PropertyHeader.PropertyAttributes (21 fields)
-                'occupancy_type': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('OccupancyType'),
-                'property_area_sqm': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('PropertyAreaSqm'),
-                'housing_association': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('HousingAssociation'),
-                'income_generating': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('IncomeGenerating'),
-                'paying_business_rates': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('PayingBusinessRates'),
-                'building_residency': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('BuildingResidency'),
-                'property_resi': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('PropertyResi'),
-                'occupancy_residency': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('OccupancyResidency'),
-                'height_meters': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('HeightMeters'),
-                'number_storeys': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('NumberOfStoreys'),
-                'construction_year': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('ConstructionYear'),
-                'property_period': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('PropertyPeriod'),
-                'council_tax_band': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('CouncilTaxBand'),
-                'number_bedrooms': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('NumberBedrooms'),
-                'number_bathrooms': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('NumberBathrooms'),
-                'total_rooms': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('TotalRooms'),
-                'garden_area_front': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('GardenAreaFront'),
-                'garden_area_back': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('GardenAreaBack'),
-                'parking_type': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('ParkingType'),
-                'access_type': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('AccessType'),
-                'last_major_works_date': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('LastMajorWorksDate'),
-                'renovation_required': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('RenovationRequired'),
-                'property_condition': prop.get('PropertyHeader', {}).get('PropertyAttributes', {}).get('PropertyCondition'),
-            }
-            
-            # Remove None values from the dictionary
+            # Single pass over the compiled columns, skipping None values
             # Note: elevation fields have defaults so won't be None
-            return {k: v for k, v in property_data.items() if v is not None}
-            return {k: v for k, v in property_data.items() if v is not None}
+            return self._fields.mapper(prop)
         
         except Exception as e:
             raise ValueError(f"Error creating property mapping: {str(e)}")
 
+    def create_property_mappings(self, props: List[dict], fill_coordinates: bool = True) -> List[dict]:
+        """
+        Creates property mappings for a batch of raw properties.
+        
+        Args:
+            props: Raw property data dictionaries
+            fill_coordinates: Derive whichever of latitude/longitude and
+                british_national_grid is missing, as one array conversion over the batch
+        
+        Returns:
+            List of structured property data dictionaries
+        """
+        try:
+            mapper = self._fields.mapper
+            mappings = [mapper(prop) for prop in props]
+            if fill_coordinates:
+                fill_property_coordinates(mappings)
+            return mappings
+        
+        except Exception as e:
+            raise ValueError(f"Error creating property mappings: {str(e)}")
+
     def get_field_info(self, field_path: str) -> dict:
-        """Get information about a specific field in the schema."""
+        """Get information about a specific field or section in the schema."""
+        spec = self._fields.get(field_path)
+        if spec is not None:
+            return thaw_schema(spec.definition)
+
         path_parts = field_path.split('.')
         current = self.schema
         
@@ -472,21 +525,8 @@ class PropertyCDM:
             else:
                 return {"error": f"Field path {field_path} not found in schema"}
         
-        return current if isinstance(current, dict) else {"type": "unknown", "value": current}
+        return thaw_schema(current) if isinstance(current, dict) else {"type": "unknown", "value": current}
 
     def list_all_fields(self) -> list:
         """Get a list of all field paths in the schema."""
-        def extract_paths(obj, prefix=""):
-            paths = []
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key in ['type', 'options', 'values', 'description', 'items']:
-                        continue
-                    current_path = f"{prefix}.{key}" if prefix else key
-                    if isinstance(value, dict) and 'type' in value:
-                        paths.append(current_path)
-                    else:
-                        paths.extend(extract_paths(value, current_path))
-            return paths
-        
-        return extract_paths(self.schema)
\ No newline at end of file
+        return self._fields.paths
@@ -0,0 +1,523 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Persistent grid index over property coordinates.
+
+This module buckets property latitude/longitude (the PropertyCDM
+latitude/longitude mapping columns) into a regular degree grid and keeps
+the points sorted by cell key, so the properties in one grid row of a
+query window are a contiguous slice found with a binary search. Radius,
+k-nearest and point-in-polygon queries are answered in bulk with NumPy,
+new properties go to a small sorted delta segment that is merged into the
+main segment once it grows, and an index is saved as a directory of .npy
+arrays (memory-mapped on open) with a JSON sidecar, like the TC cube store.
+"""
+
+import json
+import os
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .wind_field import EARTH_RADIUS_KM, property_coordinates
+
+INDEX_FORMAT_VERSION = 1
+INDEX_FILE = "index.json"
+SEGMENT_ARRAYS = ("keys", "x", "y", "z", "rows")
+IDS_FILE = "ids.npy"
+
+# Query points per vectorized batch; bounds the (query, candidate) pair arrays
+QUERY_BATCH = 16_384
+
+
+def _as_float_array(values) -> np.ndarray:
+    return np.atleast_1d(np.asarray(values, dtype=np.float64))
+
+
+def _unit_vectors(lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the (x, y, z) unit vectors of coordinates in degrees."""
+    phi, lam = np.radians(lat), np.radians(lon)
+    cos_phi = np.cos(phi)
+    return cos_phi * np.cos(lam), cos_phi * np.sin(lam), np.sin(phi)
+
+
+class SpatialQueryResult:
+    """
+    Neighbours of a batch of query points in CSR form: the matches of query i
+    are rows[offsets[i]:offsets[i + 1]] (insertion positions in the index),
+    with distances_km alongside when requested.
+    """
+    __slots__ = ("offsets", "rows", "distances_km")
+
+    def __init__(self, offsets: np.ndarray, rows: np.ndarray, distances_km: Optional[np.ndarray] = None):
+        self.offsets = offsets
+        self.rows = rows
+        self.distances_km = distances_km
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        return self.rows[self.offsets[i]:self.offsets[i + 1]]
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Return the number of matches per query."""
+        return np.diff(self.offsets)
+
+    def to_frame(self, ids: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Flatten the result to one row per (query, match).
+
+        Args:
+            ids: Optional property IDs by row (PropertySpatialIndex.ids) to add a property_id column
+
+        Returns:
+            DataFrame with query, row, [property_id] and [distance_km] columns
+        """
+        frame = pd.DataFrame({"query": np.repeat(np.arange(len(self)), self.counts), "row": self.rows})
+        if ids is not None:
+            frame["property_id"] = np.asarray(ids)[self.rows]
+        if self.distances_km is not None:
+            frame["distance_km"] = self.distances_km
+        return frame
+
+
+class _GridSegment:
+    """
+    Points sorted by grid cell key: keys, unit vectors (x, y, z) and
+    insertion rows. Unit vectors let radius tests compare squared chord
+    lengths without any trigonometry per candidate.
+    """
+    __slots__ = SEGMENT_ARRAYS
+
+    def __init__(self, keys: np.ndarray, x: np.ndarray, y: np.ndarray, z: np.ndarray, rows: np.ndarray):
+        self.keys = keys
+        self.x = x
+        self.y = y
+        self.z = z
+        self.rows = rows
+
+    @classmethod
+    def empty(cls) -> "_GridSegment":
+        return cls(np.empty(0, np.int64), np.empty(0), np.empty(0), np.empty(0), np.empty(0, np.int64))
+
+    @classmethod
+    def from_points(cls, keys: np.ndarray, x: np.ndarray, y: np.ndarray, z: np.ndarray, rows: np.ndarray
+                    ) -> "_GridSegment":
+        order = np.argsort(keys, kind="stable")
+        return cls(keys[order], x[order], y[order], z[order], rows[order])
+
+    def lat_lon(self, positions: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (latitude, longitude) in degrees of the points at positions (all by default)."""
+        x, y, z = (self.x, self.y, self.z) if positions is None else \
+            (self.x[positions], self.y[positions], self.z[positions])
+        return np.degrees(np.arcsin(np.clip(z, -1.0, 1.0))), np.degrees(np.arctan2(y, x))
+
+    def merge(self, other: "_GridSegment") -> "_GridSegment":
+        if not len(other):
+            return self
+        return _GridSegment.from_points(*(np.concatenate([getattr(self, name), getattr(other, name)])
+                                          for name in SEGMENT_ARRAYS))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def candidates(self, owner: np.ndarray, lo_keys: np.ndarray, hi_keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Expand inclusive cell key ranges into candidate points.
+
+        Args:
+            owner: Query (or polygon) index owning each key range
+            lo_keys: First cell key of each range
+            hi_keys: Last cell key of each range
+
+        Returns:
+            Tuple of (owner per candidate, position in this segment per candidate)
+        """
+        start = np.searchsorted(self.keys, lo_keys, side="left")
+        counts = np.searchsorted(self.keys, hi_keys, side="right") - start
+        total = int(counts.sum())
+        if not total:
+            return np.empty(0, np.int64), np.empty(0, np.int64)
+        # position = start of its range + rank within the range
+        first = np.cumsum(counts) - counts
+        positions = np.arange(total, dtype=np.int64) + np.repeat(start - first, counts)
+        return np.repeat(owner, counts), positions
+
+
+class PropertySpatialIndex:
+    """
+    Grid index over property coordinates with bulk radius, k-nearest and
+    point-in-polygon queries.
+
+    Points are identified by their insertion row (ids[row] is the property
+    ID); properties with missing coordinates keep their row but are never
+    matched. Query windows are not wrapped across the antimeridian.
+
+    Example:
+        index = PropertySpatialIndex.from_mappings(property_mappings)
+        hits = index.query_radius(gauge_lat, gauge_lon, radius_km=2.0)
+        nearest = index.ids[hits[0]]
+        index.save("indexes/properties")
+    """
+    def __init__(self, cell_deg: float = 0.005, merge_fraction: float = 0.1):
+        """
+        Initialize an empty index.
+
+        Args:
+            cell_deg: Grid cell size in degrees; about half the typical query
+                radius (0.005 deg is ~0.56 km of latitude) keeps candidate lists short
+            merge_fraction: Delta segment size, as a fraction of the main
+                segment, above which added points are merged into the main segment
+        """
+        if cell_deg <= 0.0:
+            raise ValueError(f"cell_deg must be positive, got {cell_deg}")
+        self.cell_deg = float(cell_deg)
+        self.merge_fraction = merge_fraction
+        self._n_lat = int(np.ceil(180.0 / self.cell_deg)) + 1
+        self._n_lon = int(np.ceil(360.0 / self.cell_deg)) + 1
+        self._main = _GridSegment.empty()
+        self._delta = _GridSegment.empty()
+        self._ids = np.empty(0, dtype=str)
+
+    @classmethod
+    def from_arrays(cls, ids: Sequence, lat, lon, **kwargs) -> "PropertySpatialIndex":
+        """
+        Build an index from coordinate arrays.
+
+        Args:
+            ids: Property IDs, one per point
+            lat: Latitudes in degrees (NaN for unknown)
+            lon: Longitudes in degrees (NaN for unknown)
+            **kwargs: PropertySpatialIndex options
+
+        Returns:
+            Populated index
+        """
+        index = cls(**kwargs)
+        index.add(ids, lat, lon)
+        return index
+
+    @classmethod
+    def from_mappings(cls, property_mappings: Union[pd.DataFrame, Sequence[dict]], **kwargs) -> "PropertySpatialIndex":
+        """
+        Build an index from mapped properties (create_property_mapping output or a frame of them).
+
+        Args:
+            property_mappings: Mapped properties with property_id, latitude and longitude
+            **kwargs: PropertySpatialIndex options
+
+        Returns:
+            Populated index
+        """
+        if isinstance(property_mappings, pd.DataFrame):
+            return cls.from_arrays(property_mappings["property_id"].to_numpy(dtype=str),
+                                   property_mappings["latitude"].to_numpy(dtype=np.float64, na_value=np.nan),
+                                   property_mappings["longitude"].to_numpy(dtype=np.float64, na_value=np.nan),
+                                   **kwargs)
+        lat, lon = property_coordinates(property_mappings)
+        return cls.from_arrays([p.get("property_id", "") for p in property_mappings], lat, lon, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Return the property IDs by insertion row."""
+        return self._ids
+
+    @property
+    def coordinates(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (latitude, longitude) by insertion row; NaN where unknown."""
+        lat = np.full(len(self), np.nan)
+        lon = np.full(len(self), np.nan)
+        for segment in (self._main, self._delta):
+            lat[segment.rows], lon[segment.rows] = segment.lat_lon()
+        return lat, lon
+
+    def _cell(self, lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        iy = np.clip(np.floor((lat + 90.0) / self.cell_deg), 0, self._n_lat - 1).astype(np.int64)
+        ix = np.clip(np.floor((lon + 180.0) / self.cell_deg), 0, self._n_lon - 1).astype(np.int64)
+        return iy, ix
+
+    def add(self, ids: Sequence, lat, lon) -> np.ndarray:
+        """
+        Add properties to the index.
+
+        Args:
+            ids: Property IDs, one per point
+            lat: Latitudes in degrees (NaN for unknown)
+            lon: Longitudes in degrees (NaN for unknown)
+
+        Returns:
+            Insertion rows assigned to the new properties
+
+        Raises:
+            ValueError: If the arrays differ in length or a coordinate is out of range
+        """
+        ids = np.asarray(ids, dtype=str).ravel()
+        lat, lon = _as_float_array(lat), _as_float_array(lon)
+        if not len(ids) == len(lat) == len(lon):
+            raise ValueError(f"Error adding properties: {len(ids)} ids, {len(lat)} latitudes, {len(lon)} longitudes")
+        known = ~(np.isnan(lat) | np.isnan(lon))
+        if np.any(np.abs(lat[known]) > 90.0) or np.any(np.abs(lon[known]) > 180.0):
+            raise ValueError("Error adding properties: latitude/longitude out of range")
+
+        rows = np.arange(len(self._ids), len(self._ids) + len(ids), dtype=np.int64)
+        self._ids = np.concatenate([self._ids, ids]) if len(self._ids) else ids
+        iy, ix = self._cell(lat[known], lon[known])
+        added = _GridSegment.from_points(iy * self._n_lon + ix, *_unit_vectors(lat[known], lon[known]), rows[known])
+        self._delta = self._delta.merge(added)
+        if len(self._delta) > self.merge_fraction * len(self._main):
+            self.compact()
+        return rows
+
+    def compact(self) -> None:
+        """Merge the delta segment into the main segment."""
+        self._main = self._main.merge(self._delta)
+        self._delta = _GridSegment.empty()
+
+    def _window_ranges(self, lat: np.ndarray, lon: np.ndarray, radius_km: np.ndarray
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (query, lo key, hi key) per grid row of each query's bounding box."""
+        angle = radius_km / EARTH_RADIUS_KM
+        dlat = np.degrees(angle)
+        # Longitude half-width of a spherical cap; the full circle if it reaches a pole
+        cos_lat = np.cos(np.radians(lat))
+        reaches_pole = angle >= np.radians(90.0 - np.abs(lat))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            dlon = np.where(reaches_pole, 360.0,
+                            np.degrees(np.arcsin(np.clip(np.sin(angle) / cos_lat, 0.0, 1.0))))
+        iy_lo, ix_lo = self._cell(lat - dlat, lon - dlon)
+        iy_hi, ix_hi = self._cell(lat + dlat, lon + dlon)
+
+        n_rows = iy_hi - iy_lo + 1
+        query = np.repeat(np.arange(len(lat)), n_rows)
+        iy = np.arange(len(query), dtype=np.int64) + np.repeat(iy_lo - (np.cumsum(n_rows) - n_rows), n_rows)
+        base = iy * self._n_lon
+        return query, base + ix_lo[query], base + ix_hi[query]
+
+    def _radius_batch(self, lat: np.ndarray, lon: np.ndarray, radius_km: np.ndarray, sort: bool
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (query, row, distance) of the points within radius_km of each query point, grouped by query."""
+        # Beyond half the circumference every point matches (and sin^2 would wrap)
+        radius_km = np.minimum(radius_km, np.pi * EARTH_RADIUS_KM)
+        query, lo_keys, hi_keys = self._window_ranges(lat, lon, radius_km)
+        # Compare squared chords against (2 sin(r / 2R))^2 so only matches pay for the arcsin
+        threshold = (2.0 * np.sin(radius_km / (2.0 * EARTH_RADIUS_KM))) ** 2
+        qx, qy, qz = _unit_vectors(lat, lon)
+        parts = []
+        for segment in (self._main, self._delta):
+            owner, positions = segment.candidates(query, lo_keys, hi_keys)
+            if not len(owner):
+                continue
+            chord2 = np.square(segment.x[positions] - qx[owner])
+            chord2 += np.square(segment.y[positions] - qy[owner])
+            chord2 += np.square(segment.z[positions] - qz[owner])
+            keep = chord2 <= threshold[owner]
+            owner, positions = owner[keep], positions[keep]
+            distance = 2.0 * EARTH_RADIUS_KM * np.arcsin(np.minimum(np.sqrt(chord2[keep]) * 0.5, 1.0))
+            parts.append((owner, segment.rows[positions], distance))
+        if not parts:
+            return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0)
+        owner, rows, distance = (np.concatenate(arrays) for arrays in zip(*parts))
+        if sort:
+            # One float key (query, then distance) sorts far faster than a lexsort
+            order = np.argsort(owner * (4.0 * np.pi * EARTH_RADIUS_KM) + distance)
+        elif len(parts) > 1:
+            # Each segment's matches are already grouped by query; merge the two runs
+            order = np.argsort(owner, kind="stable")
+        else:
+            return owner, rows, distance
+        return owner[order], rows[order], distance[order]
+
+    def query_radius(self, lat, lon, radius_km, sort: bool = False, return_distance: bool = True
+                     ) -> SpatialQueryResult:
+        """
+        Find the properties within a great-circle radius of each query point.
+
+        Args:
+            lat: Query latitudes in degrees
+            lon: Query longitudes in degrees
+            radius_km: Radius in km, scalar or one per query
+            sort: Whether to order each query's matches nearest first
+            return_distance: Whether to keep the distances in the result
+
+        Returns:
+            Matches per query
+        """
+        lat, lon = _as_float_array(lat), _as_float_array(lon)
+        radius_km = np.broadcast_to(_as_float_array(radius_km), lat.shape)
+        counts = np.zeros(len(lat), dtype=np.int64)
+        rows, distances = [], []
+        for start in range(0, len(lat), QUERY_BATCH):
+            stop = min(start + QUERY_BATCH, len(lat))
+            valid = np.flatnonzero(~(np.isnan(lat[start:stop]) | np.isnan(lon[start:stop])))
+            owner, batch_rows, batch_distance = self._radius_batch(
+                lat[start:stop][valid], lon[start:stop][valid], radius_km[start:stop][valid], sort)
+            counts[start + valid] = np.bincount(owner, minlength=len(valid))
+            rows.append(batch_rows)
+            distances.append(batch_distance)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        return SpatialQueryResult(offsets, np.concatenate(rows) if rows else np.empty(0, np.int64),
+                                  (np.concatenate(distances) if distances else np.empty(0)) if return_distance else None)
+
+    def query_knn(self, lat, lon, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest properties to each query point.
+
+        Radius queries are repeated with a doubling radius for the queries
+        that still have fewer than k matches, starting from a radius sized
+        to the point density of each query's grid cell.
+
+        Args:
+            lat: Query latitudes in degrees
+            lon: Query longitudes in degrees
+            k: Number of neighbours
+
+        Returns:
+            Tuple of (rows, distances_km), each of shape (queries, k), nearest
+            first; padded with -1 and inf where fewer than k points exist
+        """
+        lat, lon = _as_float_array(lat), _as_float_array(lon)
+        rows = np.full((len(lat), k), -1, dtype=np.int64)
+        distances = np.full((len(lat), k), np.inf)
+        n_points = len(self._main) + len(self._delta)
+        if not n_points or k < 1:
+            return rows, distances
+
+        pending = np.flatnonzero(~(np.isnan(lat) | np.isnan(lon)))
+        # Start from the radius expected to hold ~2k points at the density of
+        # the query's own cell, or of an average occupied cell if it is empty
+        sample = self._main if len(self._main) else self._delta
+        iy, ix = self._cell(lat[pending], lon[pending])
+        keys = iy * self._n_lon + ix
+        in_cell = np.searchsorted(sample.keys, keys, side="right") - np.searchsorted(sample.keys, keys, side="left")
+        occupied = int(np.count_nonzero(np.diff(sample.keys))) + 1
+        in_cell = np.where(in_cell > 0, in_cell, len(sample) / occupied)
+        cell_km = np.radians(self.cell_deg) * EARTH_RADIUS_KM
+        cell_area = cell_km ** 2 * np.maximum(np.cos(np.radians(lat[pending])), 0.01)
+        radius = np.sqrt(2.0 * k * cell_area / (np.pi * in_cell))
+
+        while len(pending):
+            result = self.query_radius(lat[pending], lon[pending], radius, sort=True)
+            counts = result.counts
+            enough = (counts >= min(k, n_points)) | (radius >= np.pi * EARTH_RADIUS_KM)
+            # Take the first k (nearest) matches of each completed query
+            owner = np.repeat(np.arange(len(pending)), counts)
+            rank = np.arange(len(owner)) - result.offsets[owner]
+            take = enough[owner] & (rank < k)
+            rows[pending[owner[take]], rank[take]] = result.rows[take]
+            distances[pending[owner[take]], rank[take]] = result.distances_km[take]
+            pending = pending[~enough]
+            radius = radius[~enough] * 2.0
+        return rows, distances
+
+    def query_polygon(self, polygon: Sequence) -> np.ndarray:
+        """
+        Find the properties inside a polygon (even-odd rule, planar in degrees).
+
+        Args:
+            polygon: One ring as a sequence of (lat, lon) vertices, or a sequence
+                of rings; holes and multi-part outlines are handled by the
+                even-odd rule across all rings
+
+        Returns:
+            Sorted insertion rows of the properties inside the polygon
+        """
+        rings = [np.asarray(polygon, dtype=np.float64)] if np.ndim(polygon[0]) == 1 else \
+            [np.asarray(ring, dtype=np.float64) for ring in polygon]
+        # Edges (y0, x0) -> (y1, x1) of every ring, closing each ring
+        edges = np.concatenate([np.hstack([ring, np.roll(ring, -1, axis=0)]) for ring in rings if len(ring) >= 3])
+        vertices = np.vstack(rings)
+        lat_min, lon_min = vertices.min(axis=0)
+        lat_max, lon_max = vertices.max(axis=0)
+
+        iy_lo, ix_lo = self._cell(np.array([lat_min]), np.array([lon_min]))
+        iy_hi, ix_hi = self._cell(np.array([lat_max]), np.array([lon_max]))
+        base = np.arange(iy_lo[0], iy_hi[0] + 1, dtype=np.int64) * self._n_lon
+        found = []
+        for segment in (self._main, self._delta):
+            _, positions = segment.candidates(np.zeros(len(base), np.int64), base + ix_lo[0], base + ix_hi[0])
+            y, x = segment.lat_lon(positions)
+            inside = np.zeros(len(positions), dtype=bool)
+            for y0, x0, y1, x1 in edges:
+                crosses = (y0 > y) != (y1 > y)
+                if not crosses.any():
+                    continue
+                idx = np.flatnonzero(crosses)
+                # x of the edge at the point's latitude; y1 != y0 wherever crosses holds
+                x_edge = x0 + (y[idx] - y0) * (x1 - x0) / (y1 - y0)
+                inside[idx[x[idx] < x_edge]] ^= True
+            found.append(segment.rows[positions[inside]])
+        return np.sort(np.concatenate(found))
+
+    def save(self, path: str) -> None:
+        """
+        Write the index to a directory (compacting it first).
+
+        Args:
+            path: Index directory (created if missing; an existing index is overwritten)
+        """
+        self.compact()
+        os.makedirs(path, exist_ok=True)
+        for name in SEGMENT_ARRAYS:
+            np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(getattr(self._main, name)))
+        np.save(os.path.join(path, IDS_FILE), self._ids)
+        index = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "cell_deg": self.cell_deg,
+            "merge_fraction": self.merge_fraction,
+            "n_properties": len(self._ids),
+            "n_indexed": len(self._main),
+        }
+        tmp_path = os.path.join(path, f"{INDEX_FILE}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, os.path.join(path, INDEX_FILE))
+
+    @classmethod
+    def open(cls, path: str, mode: str = "r") -> "PropertySpatialIndex":
+        """
+        Open a saved index with its arrays memory-mapped.
+
+        Properties added to an opened index are held in memory until the
+        next save; a compaction copies the main segment into memory.
+
+        Args:
+            path: Index directory
+            mode: Memory-map mode ("r" read-only, "c" copy-on-write)
+
+        Returns:
+            Opened index
+
+        Raises:
+            ValueError: If the format is unknown or the arrays do not match the index
+        """
+        with open(os.path.join(path, INDEX_FILE), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("format_version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported spatial index format: {index.get('format_version')}")
+
+        spatial_index = cls(cell_deg=index["cell_deg"], merge_fraction=index["merge_fraction"])
+        arrays = [np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode) for name in SEGMENT_ARRAYS]
+        spatial_index._main = _GridSegment(*arrays)
+        spatial_index._ids = np.load(os.path.join(path, IDS_FILE), mmap_mode=mode)
+        if len(spatial_index._ids) != index["n_properties"] or any(len(a) != index["n_indexed"] for a in arrays):
+            raise ValueError(f"Spatial index arrays do not match index ({index['n_properties']} properties, "
+                             f"{index['n_indexed']} indexed)")
+        return spatial_index
@@ -0,0 +1,201 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Compiled CDM schema registry.
+
+This module keeps a single compiled, read-only copy of every CDM schema
+per schema version, so that CDM instances share one schema instead of
+rebuilding the nested schema dictionaries on every instantiation.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .field_table import FieldTable
+
+
+class FrozenDict(dict):
+    """
+    Read-only dictionary used for the nodes of a compiled schema.
+    Behaves like a regular dict for lookups but rejects mutation.
+    """
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Compiled CDM schemas are read-only")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def freeze_schema(node):
+    """
+    Recursively convert a schema into read-only form.
+
+    Args:
+        node: Schema node (dict, list or scalar)
+
+    Returns:
+        FrozenDict for dicts, tuple for lists, the value itself otherwise
+    """
+    if isinstance(node, dict):
+        return FrozenDict((key, freeze_schema(value)) for key, value in node.items())
+    if isinstance(node, (list, tuple)):
+        return tuple(freeze_schema(value) for value in node)
+    return node
+
+
+def thaw_schema(node):
+    """
+    Return a mutable copy of a compiled schema node.
+
+    Args:
+        node: Schema node from freeze_schema
+
+    Returns:
+        dict for dicts, list for tuples, the value itself otherwise
+    """
+    if isinstance(node, dict):
+        return {key: thaw_schema(value) for key, value in node.items()}
+    if isinstance(node, tuple):
+        return [thaw_schema(value) for value in node]
+    return node
+
+
+class CompiledSchema:
+    """
+    Compiled form of a CDM schema, shared by all instances of a CDM class
+    for a given schema version: the frozen nested schema plus its flat
+    field-path table.
+    """
+    __slots__ = ("name", "version", "variant", "schema", "fields")
+
+    def __init__(self, name: str, version: str, schema: dict, variant: Hashable = None,
+                 columns: Optional[Dict[str, str]] = None,
+                 defaults: Optional[Dict[str, Any]] = None,
+                 fallbacks: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the compiled schema.
+
+        Args:
+            name: CDM name (e.g. "Mortgage")
+            version: Schema version (e.g. "v6")
+            schema: Nested schema definition
+            variant: Optional hashable key for parameterised schemas
+            columns: Ordered mapping of output column name to dotted field path
+            defaults: Output column defaults applied when a field is absent
+            fallbacks: Output column fallbacks applied when a value is falsy
+        """
+        self.name = name
+        self.version = version
+        self.variant = variant
+        self.schema = freeze_schema(schema)
+        self.fields = FieldTable(self.schema, columns, defaults, fallbacks)
+
+    @property
+    def key(self) -> Tuple[str, str, Hashable]:
+        """Return the registry key of this schema."""
+        return (self.name, self.version, self.variant)
+
+    def __repr__(self) -> str:
+        return f"CompiledSchema(name={self.name!r}, version={self.version!r}, variant={self.variant!r})"
+
+
+_registry: Dict[Tuple[str, str, Hashable], CompiledSchema] = {}
+_registry_lock = threading.Lock()
+
+
+def get_compiled_schema(name: str, version: str, builder: Callable[[], dict],
+                        variant: Hashable = None,
+                        columns: Optional[Dict[str, str]] = None,
+                        defaults: Optional[Dict[str, Any]] = None,
+                        fallbacks: Optional[Dict[str, Any]] = None) -> CompiledSchema:
+    """
+    Return the process-wide compiled schema, building it on first use.
+
+    Args:
+        name: CDM name
+        version: Schema version
+        builder: Zero-argument callable returning the nested schema definition
+        variant: Optional hashable key for parameterised schemas
+        columns: Ordered mapping of output column name to dotted field path
+        defaults: Output column defaults applied when a field is absent
+        fallbacks: Output column fallbacks applied when a value is falsy
+
+    Returns:
+        Shared CompiledSchema instance
+    """
+    key = (name, version, variant)
+    compiled = _registry.get(key)
+    if compiled is not None:
+        return compiled
+
+    with _registry_lock:
+        compiled = _registry.get(key)
+        if compiled is None:
+            compiled = CompiledSchema(name, version, builder(), variant,
+                                      columns, defaults, fallbacks)
+            _registry[key] = compiled
+    return compiled
+
+
+def register_compiled_schema(compiled: CompiledSchema) -> CompiledSchema:
+    """
+    Seed the registry with an already compiled schema (e.g. one received by
+    a worker process), unless a schema with the same key is registered.
+
+    Args:
+        compiled: Compiled schema to register
+
+    Returns:
+        The registered CompiledSchema instance for the key
+    """
+    with _registry_lock:
+        return _registry.setdefault(compiled.key, compiled)
+
+
+def registered_schemas() -> List[Tuple[str, str, Hashable]]:
+    """Return the keys of all compiled schemas held by the registry."""
+    return list(_registry.keys())
+
+
+def clear_schema_registry(name: Optional[str] = None) -> None:
+    """
+    Drop compiled schemas from the registry.
+
+    Args:
+        name: Only drop schemas of this CDM name (default: drop all)
+    """
+    with _registry_lock:
+        if name is None:
+            _registry.clear()
+        else:
+            for key in [key for key in _registry if key[0] == name]:
+                del _registry[key]
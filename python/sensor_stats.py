@@ -0,0 +1,374 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Incremental FloodGauge SensorStats aggregator.
+
+This module maintains the FloodGauge SensorStats fields (HistoricalHighLevel,
+HistoricalHighDate, LastDateLevelExceedLevel3 and FrequencyExceedLevel3 over
+a sliding 5-year window) from a stream of gauge readings, in amortized O(1)
+per reading. State can be saved and restored so a restart does not need a
+rescan of the reading history, and updated gauges are emitted in the
+FloodGaugeCDM.create_gauge_mapping output format.
+"""
+
+import json
+import os
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .flood_gauge_cdm import FloodGaugeCDM
+
+STATE_FORMAT_VERSION = 1
+
+# Length of the FrequencyExceedLevel3 window ("past 5 years")
+DEFAULT_WINDOW_DAYS = 5 * 365.25
+
+_NS_PER_DAY = 86_400 * 10**9
+_NO_TIME = np.iinfo(np.int64).min
+
+# The FloodGauge spec writes dates day first (15/02/2024); ISO dates are also accepted
+_DAY_FIRST = re.compile(r"\d{1,2}/\d{1,2}/\d{4}")
+_DAY_FIRST_FORMAT = "%d/%m/%Y"
+_ISO_FORMAT = "%Y-%m-%d"
+
+# Mapping columns whose format the written SensorStats dates follow
+_DATE_COLUMNS = ("historical_high_date", "last_date_level_exceed_level3", "installation_date", "last_inspection_date")
+
+
+def _to_ns(timestamp) -> int:
+    if isinstance(timestamp, (int, np.integer)):
+        return int(timestamp)
+    if isinstance(timestamp, str) and _DAY_FIRST.fullmatch(timestamp.strip()):
+        return pd.to_datetime(timestamp.strip(), format=_DAY_FIRST_FORMAT).value
+    return pd.Timestamp(timestamp).value
+
+
+def _date_format(record: dict) -> str:
+    """Return the date format of a gauge record: day first if its first date is, else ISO."""
+    for column in _DATE_COLUMNS:
+        value = record.get(column)
+        if isinstance(value, str) and value.strip():
+            return _DAY_FIRST_FORMAT if _DAY_FIRST.fullmatch(value.strip()) else _ISO_FORMAT
+    return _ISO_FORMAT
+
+
+def _to_date(ns: Optional[int], date_format: str = _ISO_FORMAT) -> Optional[str]:
+    return None if ns is None else pd.Timestamp(ns).strftime(date_format)
+
+
+class _GaugeStats:
+    """Running SensorStats of one gauge."""
+    __slots__ = ("level3", "release3", "high_level", "high_time", "above",
+                 "last_exceed_time", "exceedances", "last_time", "seed_count", "seed_time")
+
+    def __init__(self, level3: float, hysteresis: float):
+        self.level3 = level3
+        self.release3 = level3 - hysteresis
+        self.high_level = -np.inf
+        self.high_time: Optional[int] = None
+        self.above = False
+        self.last_exceed_time: Optional[int] = None
+        self.exceedances = deque()
+        self.last_time = _NO_TIME
+        # Exceedances counted before the aggregator existed, all at or before seed_time
+        self.seed_count = 0
+        self.seed_time: Optional[int] = None
+
+
+class SensorStatsAggregator:
+    """
+    Incremental aggregator of FloodGauge SensorStats per gauge.
+
+    Level 3 is the SevereFloodWarning trigger level. An exceedance is counted
+    when a reading rises above level 3 after the level has been at or below
+    level 3 - hysteresis.
+
+    Example:
+        aggregator = SensorStatsAggregator.from_gauge_mappings(gauges)
+        aggregator.update_many(ids, times, levels)
+        records = aggregator.updated_records()
+        aggregator.save("state/sensor_stats.json")
+    """
+    def __init__(self, window_days: float = DEFAULT_WINDOW_DAYS, hysteresis: float = 0.0):
+        """
+        Initialize an empty aggregator.
+
+        Args:
+            window_days: Length of the FrequencyExceedLevel3 window in days
+            hysteresis: Drop below level 3 (metres) needed before a new exceedance counts
+        """
+        self.window_days = window_days
+        self.hysteresis = hysteresis
+        self._window_ns = int(window_days * _NS_PER_DAY)
+        self._gauges: Dict[str, _GaugeStats] = {}
+        self._records: Dict[str, dict] = {}
+        self._dirty = set()
+        self.readings_skipped = 0
+
+    @classmethod
+    def from_gauge_mappings(cls, gauge_mappings: Iterable[dict], **kwargs) -> "SensorStatsAggregator":
+        """
+        Build an aggregator for mapped gauges (FloodGaugeCDM.create_gauge_mapping output).
+
+        Args:
+            gauge_mappings: Mapped gauges
+            **kwargs: Arguments for the constructor
+
+        Returns:
+            SensorStatsAggregator tracking the gauges
+        """
+        aggregator = cls(**kwargs)
+        for mapping in gauge_mappings:
+            aggregator.add_gauge(mapping)
+        return aggregator
+
+    def add_gauge(self, gauge_mapping: dict) -> None:
+        """
+        Track a gauge, seeding the historical high, last exceedance and 5-year
+        frequency from its mapping. The times of the seeded exceedances are not
+        known, only that none is later than the last exceedance date (or the
+        first reading, if the mapping has no date), so the seeded frequency is
+        carried in full until that date leaves the window and then dropped.
+
+        Args:
+            gauge_mapping: Mapped gauge with gauge_id and severe_flood_warning
+
+        Raises:
+            ValueError: If the mapping has no gauge_id
+        """
+        gauge_id = gauge_mapping.get("gauge_id")
+        if not gauge_id:
+            raise ValueError("Missing required field: gauge_id")
+        level3 = gauge_mapping.get("severe_flood_warning")
+        stats = _GaugeStats(np.inf if level3 is None else float(level3), self.hysteresis)
+        if gauge_mapping.get("historical_high_level") is not None:
+            stats.high_level = float(gauge_mapping["historical_high_level"])
+            if gauge_mapping.get("historical_high_date"):
+                stats.high_time = _to_ns(gauge_mapping["historical_high_date"])
+        if gauge_mapping.get("last_date_level_exceed_level3"):
+            stats.last_exceed_time = _to_ns(gauge_mapping["last_date_level_exceed_level3"])
+            stats.seed_time = stats.last_exceed_time
+        if gauge_mapping.get("frequency_exceed_level3"):
+            stats.seed_count = int(gauge_mapping["frequency_exceed_level3"])
+        self._gauges[gauge_id] = stats
+        self._records[gauge_id] = dict(gauge_mapping)
+
+    def update(self, gauge_id: str, timestamp, level: float) -> bool:
+        """
+        Apply one reading in amortized O(1).
+
+        Args:
+            gauge_id: Gauge ID
+            timestamp: Reading time (datetime-like, ISO or dd/mm/yyyy string, or int64 nanoseconds)
+            level: Water level in metres
+
+        Returns:
+            True if the reading was applied, False if it was skipped (unknown gauge,
+            NaN level or not newer than the gauge's last reading)
+        """
+        stats = self._gauges.get(gauge_id)
+        ns = _to_ns(timestamp)
+        if stats is None or level != level or ns <= stats.last_time:
+            self.readings_skipped += 1
+            return False
+        if stats.seed_time is None:
+            stats.seed_time = ns
+        stats.last_time = ns
+
+        if level > stats.high_level:
+            stats.high_level = level
+            stats.high_time = ns
+
+        if level > stats.level3:
+            if not stats.above:
+                stats.above = True
+                stats.exceedances.append(ns)
+            stats.last_exceed_time = ns
+        elif level <= stats.release3:
+            stats.above = False
+
+        # Slide the window; each exceedance is appended and evicted once
+        cutoff = ns - self._window_ns
+        exceedances = stats.exceedances
+        while exceedances and exceedances[0] <= cutoff:
+            exceedances.popleft()
+        if stats.seed_count and stats.seed_time <= cutoff:
+            stats.seed_count = 0
+
+        self._dirty.add(gauge_id)
+        return True
+
+    def update_many(self, gauge_ids: Sequence[str], timestamps: Sequence, levels: Sequence[float]) -> int:
+        """
+        Apply a batch of readings in time order.
+
+        Args:
+            gauge_ids: Gauge IDs
+            timestamps: Reading times (datetime-like, ISO or dd/mm/yyyy strings, or int64 nanoseconds)
+            levels: Water levels in metres
+
+        Returns:
+            Number of readings applied
+        """
+        times = np.asarray(timestamps)
+        if times.dtype.kind != "i":
+            day_first = len(times) and isinstance(times[0], str) and _DAY_FIRST.fullmatch(times[0].strip())
+            times = pd.to_datetime(times, format=_DAY_FIRST_FORMAT if day_first else "ISO8601")
+            times = times.to_numpy().astype("datetime64[ns]").view(np.int64)
+        order = np.argsort(times, kind="stable")
+        ids = np.asarray(gauge_ids, dtype=object)[order].tolist()
+        update = self.update
+        applied = 0
+        for gauge_id, ns, level in zip(ids, times[order].tolist(), np.asarray(levels, dtype=np.float64)[order].tolist()):
+            applied += update(gauge_id, ns, level)
+        return applied
+
+    def sensor_stats(self, gauge_id: str, as_of=None) -> dict:
+        """
+        Return the SensorStats of a gauge as create_gauge_mapping columns.
+
+        Args:
+            gauge_id: Gauge ID
+            as_of: End of the 5-year window (default: time of the gauge's last reading)
+
+        Returns:
+            Dictionary with historical_high_level, historical_high_date,
+            last_date_level_exceed_level3 and frequency_exceed_level3; dates
+            are written in the date format of the gauge's mapping
+        """
+        stats = self._gauges[gauge_id]
+        date_format = _date_format(self._records[gauge_id])
+        end = _to_ns(as_of) if as_of is not None else stats.last_time
+        cutoff = end - self._window_ns
+        if as_of is not None:
+            frequency = sum(1 for ns in stats.exceedances if cutoff < ns <= end)
+            seeded = stats.seed_time is not None and cutoff < stats.seed_time
+        else:
+            frequency = len(stats.exceedances)
+            seeded = True
+        if seeded:
+            frequency += stats.seed_count
+        return {
+            'historical_high_level': None if stats.high_level == -np.inf else stats.high_level,
+            'historical_high_date': _to_date(stats.high_time, date_format),
+            'last_date_level_exceed_level3': _to_date(stats.last_exceed_time, date_format),
+            'frequency_exceed_level3': frequency if stats.last_time != _NO_TIME else None,
+        }
+
+    def gauge_record(self, gauge_id: str, as_of=None) -> dict:
+        """
+        Return the gauge in create_gauge_mapping output format with updated SensorStats.
+
+        Args:
+            gauge_id: Gauge ID
+            as_of: End of the 5-year window (default: time of the gauge's last reading)
+
+        Returns:
+            Mapped gauge record, without None values, in mapping column order
+        """
+        record = dict(self._records[gauge_id])
+        record.update((column, value) for column, value in self.sensor_stats(gauge_id, as_of).items()
+                      if value is not None)
+        return {column: record[column] for column in FloodGaugeCDM._FIELD_COLUMNS
+                if record.get(column) is not None}
+
+    def updated_records(self, as_of=None) -> List[dict]:
+        """
+        Return the records of gauges updated since the previous call, and reset the update set.
+
+        Args:
+            as_of: End of the 5-year window (default: time of each gauge's last reading)
+
+        Returns:
+            List of mapped gauge records
+        """
+        records = [self.gauge_record(gauge_id, as_of) for gauge_id in sorted(self._dirty)]
+        self._dirty.clear()
+        return records
+
+    def save(self, path: str) -> None:
+        """
+        Persist the aggregator state as JSON (written atomically).
+
+        Args:
+            path: State file path
+        """
+        gauges = {}
+        for gauge_id, stats in self._gauges.items():
+            gauges[gauge_id] = {
+                'record': self._records[gauge_id],
+                'level3': None if stats.level3 == np.inf else stats.level3,
+                'high_level': None if stats.high_level == -np.inf else stats.high_level,
+                'high_time': stats.high_time,
+                'above': stats.above,
+                'last_exceed_time': stats.last_exceed_time,
+                'exceedances': list(stats.exceedances),
+                'last_time': None if stats.last_time == _NO_TIME else stats.last_time,
+                'seed_count': stats.seed_count,
+                'seed_time': stats.seed_time,
+            }
+        state = {
+            'format_version': STATE_FORMAT_VERSION,
+            'window_days': self.window_days,
+            'hysteresis': self.hysteresis,
+            'readings_skipped': self.readings_skipped,
+            'gauges': gauges,
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, default=str)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SensorStatsAggregator":
+        """
+        Restore an aggregator saved with save().
+
+        Args:
+            path: State file path
+
+        Returns:
+            Restored SensorStatsAggregator
+
+        Raises:
+            ValueError: If the state file format is not supported
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get('format_version') != STATE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported sensor stats state format: {state.get('format_version')}")
+
+        aggregator = cls(window_days=state['window_days'], hysteresis=state['hysteresis'])
+        aggregator.readings_skipped = state['readings_skipped']
+        for gauge_id, saved in state['gauges'].items():
+            level3 = np.inf if saved['level3'] is None else saved['level3']
+            stats = _GaugeStats(level3, aggregator.hysteresis)
+            stats.high_level = -np.inf if saved['high_level'] is None else saved['high_level']
+            stats.high_time = saved['high_time']
+            stats.above = saved['above']
+            stats.last_exceed_time = saved['last_exceed_time']
+            stats.exceedances = deque(saved['exceedances'])
+            stats.last_time = _NO_TIME if saved['last_time'] is None else saved['last_time']
+            stats.seed_count = saved.get('seed_count', 0)
+            stats.seed_time = saved.get('seed_time')
+            aggregator._gauges[gauge_id] = stats
+            aggregator._records[gauge_id] = saved['record']
+        return aggregator
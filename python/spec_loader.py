@@ -0,0 +1,208 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+CDM specification CSV loader.
+
+This module parses the machine-readable CDM specification files kept in the
+repository (Level 0/Level 1/Level 2/Field/Data Type/Menu Options layout) into
+the nested CDM schema structure, and caches the parsed result on disk keyed
+by the content hash of the specification file.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .schema_registry import CompiledSchema, get_compiled_schema
+
+# Bump when the parsed output format changes so stale cache entries are ignored
+LOADER_VERSION = 1
+
+CACHE_DIR_ENV = "PHYSRISK_CDM_CACHE_DIR"
+
+
+def default_cache_dir() -> str:
+    """Return the spec cache directory ($PHYSRISK_CDM_CACHE_DIR or ~/.cache/physrisk_cdm)."""
+    return os.environ.get(CACHE_DIR_ENV) or os.path.join(os.path.expanduser("~"), ".cache", "physrisk_cdm")
+
+
+def parse_menu_options(text: str) -> List[str]:
+    """
+    Parse a "{Option A, Option B}" menu options cell.
+
+    Args:
+        text: Raw cell text
+
+    Returns:
+        List of menu options
+    """
+    text = text.strip()
+    if text.startswith("{"):
+        text = text[1:]
+    if "}" in text:
+        text = text[:text.index("}")]
+    return [option.strip() for option in text.split(",") if option.strip()]
+
+
+def parse_spec_text(text: str) -> dict:
+    """
+    Parse the text of a CDM specification CSV into the nested schema structure.
+
+    Section rows set the current Level 0/1/2 path; any level left blank is
+    inherited from the previous row when it precedes the first given level
+    and cleared when it follows it. Field rows add a field to the current path.
+
+    Args:
+        text: CSV text of the specification
+
+    Returns:
+        Nested schema definition
+
+    Raises:
+        ValueError: If the file does not use the Level/Field specification layout
+    """
+    rows = csv.reader(io.StringIO(text))
+    header = [cell.strip() for cell in next(rows, [])]
+    level_cols = [i for i, name in enumerate(header) if re.fullmatch(r"Level \d+", name)]
+    if not level_cols or "Field" not in header:
+        raise ValueError("Specification must have 'Level N' and 'Field' columns")
+
+    def column(name: str) -> Optional[int]:
+        return header.index(name) if name in header else None
+
+    field_col = header.index("Field")
+    type_col = column("Data Type")
+    desc_col = column("Data Description")
+    options_col = column("Menu Options")
+
+    def cell(row: List[str], col: Optional[int]) -> str:
+        return row[col].strip() if col is not None and col < len(row) else ""
+
+    schema: Dict[str, dict] = {}
+    path: List[str] = [""] * len(level_cols)
+    for row in rows:
+        levels = [cell(row, col) for col in level_cols]
+        given = [i for i, level in enumerate(levels) if level]
+        if given:
+            first = given[0]
+            path = path[:first] + levels[first:]
+
+        field = cell(row, field_col)
+        if not field or field == "section":
+            continue
+
+        node = schema
+        for level in path:
+            if level:
+                node = node.setdefault(level, {})
+
+        definition = {
+            "type": cell(row, type_col) or "text",
+            "description": cell(row, desc_col)
+        }
+        options = cell(row, options_col)
+        if options:
+            definition["options"] = parse_menu_options(options)
+        node[field] = definition
+    return schema
+
+
+def load_spec_schema(path: str, cache_dir: Optional[str] = None, use_cache: bool = True) -> dict:
+    """
+    Load a CDM specification CSV into the nested schema structure.
+
+    The parsed schema is cached as JSON under the SHA-256 of the file
+    content, so a warm start only hashes the file and skips CSV parsing.
+
+    Args:
+        path: Path to the specification CSV
+        cache_dir: Cache directory (default: default_cache_dir())
+        use_cache: Read and write the on-disk cache
+
+    Returns:
+        Nested schema definition
+    """
+    return _load_spec(path, cache_dir, use_cache)[1]
+
+
+def _load_spec(path: str, cache_dir: Optional[str], use_cache: bool) -> Tuple[str, dict]:
+    with open(path, "rb") as f:
+        content = f.read()
+    digest = spec_digest(content)
+
+    if not use_cache:
+        return digest, parse_spec_text(content.decode("utf-8-sig"))
+
+    cache_dir = cache_dir or default_cache_dir()
+    cache_path = os.path.join(cache_dir, f"{digest}.json")
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return digest, json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    schema = parse_spec_text(content.decode("utf-8-sig"))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(schema, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # A read-only cache directory only costs a re-parse on the next start
+        pass
+    return digest, schema
+
+
+def spec_digest(content: bytes) -> str:
+    """Return the cache key for the raw content of a specification file."""
+    return hashlib.sha256(b"cdm-spec-v%d\0" % LOADER_VERSION + content).hexdigest()
+
+
+def spec_version(path: str) -> str:
+    """Return the schema version encoded in a spec file name (e.g. "v5"), or "v1"."""
+    match = re.search(r"v(\d+)", os.path.splitext(os.path.basename(path))[0])
+    return f"v{match.group(1)}" if match else "v1"
+
+
+def compile_spec(path: str, cache_dir: Optional[str] = None,
+                 columns: Optional[Dict[str, str]] = None) -> CompiledSchema:
+    """
+    Load a specification CSV and register it in the compiled schema registry.
+
+    The schema is registered under its Level 0 name and the version in the
+    file name, with the content hash as variant so edited files never
+    collide with stale entries.
+
+    Args:
+        path: Path to the specification CSV
+        cache_dir: Cache directory (default: default_cache_dir())
+        columns: Optional output columns for the field table
+
+    Returns:
+        Shared CompiledSchema instance
+
+    Raises:
+        ValueError: If the specification does not have exactly one Level 0 root
+    """
+    digest, schema = _load_spec(path, cache_dir, use_cache=True)
+    if len(schema) != 1:
+        raise ValueError(f"Specification {path} must have exactly one Level 0 root, found {list(schema)}")
+    name = next(iter(schema))
+    return get_compiled_schema(name, spec_version(path), lambda: schema, variant=digest, columns=columns)
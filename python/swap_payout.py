@@ -0,0 +1,245 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Vectorized basket payout engine for physical risk swaps.
+
+This module computes, for a (scenarios x gauges) matrix of peak river
+levels, the basket payout of many PhysicalRiskSwapCDM swaps at once: each
+swap pays the PayoutSevereFlood of every basket gauge whose peak level
+reaches that gauge's FloodGauge SevereFloodWarning level.
+
+Swaps are grouped by GaugeSetID. Each group holds a dense
+(group swaps x group gauges) payout matrix, so the exceedance of a shared
+gauge is evaluated once per scenario and a group's payouts are one matrix
+product. Scenarios are processed in chunks to bound memory, with the
+exceedance matrix held gauge-major so that gathering a group's gauges reads
+contiguous rows.
+
+Levels and trigger levels are compared in float64, and payouts are
+float64 unless float32 is requested to halve the memory of large books.
+"""
+
+import re
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Group key of swaps without a GaugeSetID: their own basket
+_NO_GAUGE_SET = "__basket__"
+
+_GAUGE_ID_COLUMN = re.compile(r"gauge_(\d+)_id")
+
+
+def swap_basket(swap_mapping: dict) -> List[Tuple[str, float]]:
+    """
+    Extract the gauge basket of a mapped swap.
+
+    Args:
+        swap_mapping: PhysicalRiskSwapCDM.create_swap_mapping output
+
+    Returns:
+        List of (gauge ID, PayoutSevereFlood) in gauge slot order; slots
+        without a GaugeID are skipped and missing payouts are 0.0
+    """
+    slots = sorted(int(match.group(1)) for match in map(_GAUGE_ID_COLUMN.fullmatch, swap_mapping) if match)
+    return [(swap_mapping[f"gauge_{i}_id"], float(swap_mapping.get(f"gauge_{i}_payout_severe_flood") or 0.0))
+            for i in slots if swap_mapping[f"gauge_{i}_id"] is not None]
+
+
+class _GaugeSetGroup:
+    """Swaps sharing a gauge set, with their dense payout matrix."""
+    __slots__ = ("key", "gauges", "swaps", "payouts")
+
+    def __init__(self, key: str, gauges: np.ndarray, swaps: np.ndarray, payouts: np.ndarray):
+        self.key = key
+        self.gauges = gauges    # (group gauges,) columns of the level matrix
+        self.swaps = swaps      # (group swaps,) output columns
+        self.payouts = payouts  # (group swaps, group gauges) in the engine dtype
+
+
+class BasketPayoutEngine:
+    """
+    Basket payout engine over a fixed gauge universe and swap book.
+
+    Example:
+        engine = BasketPayoutEngine.from_mappings(gauge_mappings, swap_mappings)
+        payouts = engine.payouts(peak_levels)          # (scenarios, swaps)
+        stats = engine.payout_statistics(peak_levels)  # per swap, no full matrix
+    """
+    def __init__(self, gauge_ids: Sequence[str], severe_levels: np.ndarray,
+                 basket_gauges: np.ndarray, basket_payouts: np.ndarray,
+                 gauge_set_ids: Optional[Sequence[Optional[str]]] = None,
+                 chunk_size: int = 8192, dtype=np.float64):
+        """
+        Initialize the engine from columnar swap baskets.
+
+        Args:
+            gauge_ids: Gauge IDs, in the column order of the level matrices
+            severe_levels: SevereFloodWarning level of every gauge (NaN never pays)
+            basket_gauges: (swaps, max basket size) gauge column indices, -1 for empty slots
+            basket_payouts: (swaps, max basket size) PayoutSevereFlood amounts
+            gauge_set_ids: Optional GaugeSetID per swap; swaps without one form their own group
+            chunk_size: Scenarios evaluated per chunk
+            dtype: Floating dtype of the payout matrices and results; float32
+                halves their memory at the cost of precision on large baskets
+
+        Raises:
+            ValueError: If the arrays are inconsistent
+        """
+        self.gauge_ids = pd.Index([str(gauge_id) for gauge_id in gauge_ids])
+        severe_levels = np.asarray(severe_levels, dtype=np.float64)
+        if severe_levels.shape != (len(self.gauge_ids),):
+            raise ValueError(f"severe_levels must have shape ({len(self.gauge_ids)},), got {severe_levels.shape}")
+        self.severe_levels = np.where(np.isnan(severe_levels), np.inf, severe_levels)
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"dtype must be float32 or float64, got {self.dtype}")
+
+        basket_gauges = np.atleast_2d(np.asarray(basket_gauges, dtype=np.int64))
+        basket_payouts = np.nan_to_num(np.atleast_2d(np.asarray(basket_payouts, dtype=np.float64)))
+        if basket_gauges.shape != basket_payouts.shape:
+            raise ValueError("basket_gauges and basket_payouts must have the same shape")
+        if (basket_gauges >= len(self.gauge_ids)).any():
+            raise ValueError("basket_gauges refers to a gauge outside the gauge universe")
+        self.n_swaps = basket_gauges.shape[0]
+        self.chunk_size = chunk_size
+
+        if gauge_set_ids is None:
+            gauge_set_ids = [None] * self.n_swaps
+        keys = pd.Series([_NO_GAUGE_SET + str(i) if gauge_set is None or gauge_set != gauge_set else str(gauge_set)
+                          for i, gauge_set in enumerate(gauge_set_ids)])
+
+        self.groups: List[_GaugeSetGroup] = []
+        for key, swaps in keys.groupby(keys, sort=False).indices.items():
+            gauges = basket_gauges[swaps]
+            used = gauges >= 0
+            group_gauges, position = np.unique(gauges[used], return_inverse=True)
+            payouts = np.zeros((len(swaps), len(group_gauges)), dtype=self.dtype)
+            row = np.broadcast_to(np.arange(len(swaps))[:, None], gauges.shape)[used]
+            np.add.at(payouts, (row, position), basket_payouts[swaps][used])
+            self.groups.append(_GaugeSetGroup(key, group_gauges, np.asarray(swaps), payouts))
+
+        # Groups fill contiguous output rows; _order maps them back to swap order
+        self._order = np.argsort(np.concatenate([group.swaps for group in self.groups]
+                                                or [np.empty(0, dtype=np.int64)]), kind="stable")
+
+    @classmethod
+    def from_mappings(cls, gauge_mappings: Sequence[dict], swap_mappings: Sequence[dict],
+                      **kwargs) -> "BasketPayoutEngine":
+        """
+        Build an engine from mapped gauges and swaps.
+
+        Args:
+            gauge_mappings: FloodGaugeCDM.create_gauge_mapping outputs (gauge_id, severe_flood_warning)
+            swap_mappings: PhysicalRiskSwapCDM.create_swap_mapping outputs (gauge_set_id,
+                gauge_{i}_id, gauge_{i}_payout_severe_flood)
+            **kwargs: Arguments for the constructor
+
+        Returns:
+            BasketPayoutEngine over the gauges of gauge_mappings
+
+        Raises:
+            ValueError: If a swap refers to a gauge that is not in gauge_mappings
+        """
+        gauge_ids = [mapping["gauge_id"] for mapping in gauge_mappings]
+        severe_levels = np.array([mapping.get("severe_flood_warning", np.nan) for mapping in gauge_mappings],
+                                 dtype=np.float64)
+        column_of = {gauge_id: i for i, gauge_id in enumerate(gauge_ids)}
+
+        baskets = []
+        for n, swap in enumerate(swap_mappings):
+            basket = []
+            for gauge_id, payout in swap_basket(swap):
+                if gauge_id not in column_of:
+                    raise ValueError(f"Swap {n} refers to unknown gauge {gauge_id}")
+                basket.append((column_of[gauge_id], payout))
+            baskets.append(basket)
+
+        width = max((len(basket) for basket in baskets), default=0)
+        basket_gauges = np.full((len(baskets), width), -1, dtype=np.int64)
+        basket_payouts = np.zeros((len(baskets), width), dtype=np.float64)
+        for n, basket in enumerate(baskets):
+            if basket:
+                basket_gauges[n, :len(basket)], basket_payouts[n, :len(basket)] = zip(*basket)
+        gauge_set_ids = [swap.get("gauge_set_id") for swap in swap_mappings]
+        return cls(gauge_ids, severe_levels, basket_gauges, basket_payouts, gauge_set_ids, **kwargs)
+
+    def _chunks(self, levels: np.ndarray) -> Iterator[Tuple[int, int, np.ndarray]]:
+        if levels.ndim != 2 or levels.shape[1] != len(self.gauge_ids):
+            raise ValueError(f"levels must have shape (scenarios, {len(self.gauge_ids)}), got {levels.shape}")
+        for start in range(0, levels.shape[0], self.chunk_size):
+            stop = min(start + self.chunk_size, levels.shape[0])
+            # Every gauge is tested once per scenario, whatever the number of swaps on it
+            exceed = np.ascontiguousarray(levels[start:stop].T >= self.severe_levels[:, None]).astype(self.dtype)
+            yield start, stop, exceed
+
+    def _chunk_payouts(self, exceed: np.ndarray) -> np.ndarray:
+        """Return the (swaps, chunk scenarios) payouts for a gauge-major exceedance matrix."""
+        out = np.empty((self.n_swaps, exceed.shape[1]), dtype=self.dtype)
+        row = 0
+        for group in self.groups:
+            n = len(group.swaps)
+            np.matmul(group.payouts, exceed[group.gauges], out=out[row:row + n])
+            row += n
+        return out[self._order]
+
+    def payouts(self, levels: np.ndarray) -> np.ndarray:
+        """
+        Compute the basket payout of every swap in every scenario.
+
+        Args:
+            levels: (scenarios, gauges) peak levels in the gauge column order
+
+        Returns:
+            (scenarios, swaps) payouts in the engine dtype
+        """
+        levels = np.asarray(levels)
+        out = np.empty((levels.shape[0], self.n_swaps), dtype=self.dtype)
+        for start, stop, exceed in self._chunks(levels):
+            out[start:stop] = self._chunk_payouts(exceed).T
+        return out
+
+    def payout_statistics(self, levels: np.ndarray) -> pd.DataFrame:
+        """
+        Compute per-swap payout statistics without materialising the full payout matrix.
+
+        Args:
+            levels: (scenarios, gauges) peak levels in the gauge column order
+
+        Returns:
+            DataFrame with one row per swap: expected_payout, payout_std,
+            payout_probability and max_payout
+        """
+        levels = np.asarray(levels)
+        total = np.zeros(self.n_swaps)
+        total_sq = np.zeros(self.n_swaps)
+        hits = np.zeros(self.n_swaps, dtype=np.int64)
+        maximum = np.zeros(self.n_swaps)
+        for _, _, exceed in self._chunks(levels):
+            chunk = self._chunk_payouts(exceed)
+            total += chunk.sum(axis=1, dtype=np.float64)
+            total_sq += np.square(chunk, dtype=np.float64).sum(axis=1)
+            hits += (chunk > 0).sum(axis=1)
+            np.maximum(maximum, chunk.max(axis=1, initial=0.0), out=maximum)
+
+        n = max(levels.shape[0], 1)
+        mean = total / n
+        return pd.DataFrame({
+            'expected_payout': mean,
+            'payout_std': np.sqrt(np.maximum(total_sq / n - mean ** 2, 0.0)),
+            'payout_probability': hits / n,
+            'max_payout': maximum,
+        })
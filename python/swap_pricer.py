@@ -0,0 +1,276 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Monte Carlo pricer for physical risk swaps.
+
+This module values a PhysicalRiskSwapCDM trade: a fixed leg paying
+FixedLegRate on the outstanding notional against contingent payouts of
+PayoutSevereFlood for every basket gauge on its first exceedance of the
+SevereFloodWarning level during the protection period. Gauge exceedances
+in each schedule period are drawn from a Gaussian copula whose correlation
+decays with the great-circle distance between the FloodGaugeCDM gauge
+coordinates, rho_ij = exp(-d_ij / L), with Poisson marginals calibrated on
+FrequencyExceedLevel3 (exceedances in the past 5 years).
+
+Paths are simulated in fixed-size batches, each with its own child of one
+numpy SeedSequence, so results only depend on the seed and the batch size,
+not on the number of worker processes.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .swap_payout import swap_basket
+from .swap_schedule import ScheduleEngine, parse_flag
+from .wind_field import haversine_km
+
+# FrequencyExceedLevel3 counts exceedances over this many years
+FREQUENCY_WINDOW_YEARS = 5.0
+
+
+def gauge_loading_matrix(lat: np.ndarray, lon: np.ndarray, correlation_length_km: float) -> np.ndarray:
+    """
+    Return A with A @ A.T = exp(-d / L), the spatial correlation of the gauges.
+
+    Gauges without coordinates are uncorrelated with all others. The factor is
+    taken from an eigendecomposition so co-located gauges (rho = 1) are allowed.
+
+    Args:
+        lat: Gauge latitudes (degrees, NaN if unknown)
+        lon: Gauge longitudes (degrees, NaN if unknown)
+        correlation_length_km: Correlation length L in km
+
+    Returns:
+        (gauges, gauges) loading matrix
+    """
+    distance = haversine_km(lat[:, None], lon[:, None], lat[None, :], lon[None, :])
+    correlation = np.exp(-np.where(np.isnan(distance), np.inf, distance) / correlation_length_km)
+    np.fill_diagonal(correlation, 1.0)
+    eigenvalues, eigenvectors = np.linalg.eigh(correlation)
+    return eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+
+
+class SwapMonteCarloPricer:
+    """
+    Monte Carlo pricer of one physical risk swap.
+
+    Example:
+        pricer = SwapMonteCarloPricer(swap_mapping, gauge_mappings, discount_rate=0.04)
+        result = pricer.price(1_000_000, seed=7, max_workers=8)
+        print(result['pv'], result['std_error'], result['paths_per_second'])
+    """
+    def __init__(self, swap_mapping: dict, gauge_mappings: Sequence[dict],
+                 discount_rate: float = 0.0, correlation_length_km: float = 50.0,
+                 annual_rates: Optional[Dict[str, float]] = None,
+                 valuation_date=None, schedule_engine: Optional[ScheduleEngine] = None):
+        """
+        Initialize the pricer and precompute the schedule, copula and thresholds.
+
+        Args:
+            swap_mapping: PhysicalRiskSwapCDM.create_swap_mapping output
+            gauge_mappings: FloodGaugeCDM.create_gauge_mapping outputs covering the basket gauges
+            discount_rate: Flat continuously compounded discount rate
+            correlation_length_km: Copula correlation length L in km
+            annual_rates: Optional annual exceedance rate per gauge ID, overriding
+                frequency_exceed_level3 / 5
+            valuation_date: Valuation date (default: the swap valuation_date, else start_date)
+            schedule_engine: Schedule engine to share its memo (default: a new engine)
+
+        Raises:
+            ValueError: If the swap lacks schedule or notional data, a flag is not a
+                boolean value, or a basket gauge is unknown
+        """
+        if swap_mapping.get("notional") is None:
+            raise ValueError("Swap must have a notional")
+
+        self.notional = float(swap_mapping["notional"])
+        self.fixed_rate = float(swap_mapping.get("fixed_leg_rate") or 0.0)
+        self.settles_accrual = parse_flag(swap_mapping.get("settles_accrual"))
+        self.pays_at_default_time = parse_flag(swap_mapping.get("pays_at_default_time"))
+        # The party pays the fixed leg (buys protection) when Payer is set
+        self.sign = 1.0 if parse_flag(swap_mapping.get("payer")) else -1.0
+        self.discount_rate = discount_rate
+        self.correlation_length_km = correlation_length_km
+
+        # Adjusted accrual periods paid after the valuation date
+        schedule = (schedule_engine or ScheduleEngine()).schedule(swap_mapping)
+        start = schedule["accrual_start"].iloc[0]
+        valuation = pd.Timestamp(valuation_date or swap_mapping.get("valuation_date") or start)
+        protection_start = pd.Timestamp(swap_mapping.get("protection_start") or start)
+        schedule = schedule[schedule["payment_date"] > valuation]
+        self.valuation_date = valuation
+        self.payment_dates = schedule["payment_date"].tolist()
+        self.accrual = schedule["accrual_fraction"].to_numpy()
+
+        def years(dates: pd.Series) -> np.ndarray:
+            return (dates - valuation).dt.days.to_numpy(dtype=np.float64) / 365.0
+
+        protected_from = schedule["accrual_start"].clip(lower=max(protection_start, valuation))
+        exposure = np.maximum(years(schedule["accrual_end"]) - years(protected_from), 0.0)
+        payment_t = years(schedule["payment_date"])
+        payout_t = years(schedule["accrual_end"]) - exposure / 2.0 if self.pays_at_default_time else payment_t
+        self.fixed_discount = np.exp(-discount_rate * payment_t)
+        self.payout_discount = np.exp(-discount_rate * np.maximum(payout_t, 0.0))
+
+        # Basket gauges, their payouts, coordinates and exceedance rates
+        gauges = {mapping.get("gauge_id"): mapping for mapping in gauge_mappings}
+        basket = swap_basket(swap_mapping)
+        unknown = [gauge_id for gauge_id, _ in basket if gauge_id not in gauges]
+        if unknown:
+            raise ValueError(f"Swap basket refers to unknown gauges: {unknown}")
+        self.gauge_ids = [gauge_id for gauge_id, _ in basket]
+        self.payouts = np.array([payout for _, payout in basket], dtype=np.float64)
+
+        def coordinate(gauge_id: str, key: str) -> float:
+            value = gauges[gauge_id].get(key)
+            return np.nan if value is None else float(value)
+
+        lat = np.array([coordinate(gauge_id, "gauge_latitude") for gauge_id in self.gauge_ids])
+        lon = np.array([coordinate(gauge_id, "gauge_longitude") for gauge_id in self.gauge_ids])
+        self.annual_rates = np.array([
+            (annual_rates or {}).get(gauge_id,
+                                     float(gauges[gauge_id].get("frequency_exceed_level3") or 0.0)
+                                     / FREQUENCY_WINDOW_YEARS)
+            for gauge_id in self.gauge_ids
+        ], dtype=np.float64)
+        self.loading = gauge_loading_matrix(lat, lon, correlation_length_km)
+
+        # Gauge k exceeds in period t when its latent normal falls below Phi^-1(p_tk)
+        probability = 1.0 - np.exp(-np.outer(exposure, self.annual_rates))
+        self.thresholds = np.vectorize(self._normal_quantile, otypes=[np.float64])(probability)
+
+    @staticmethod
+    def _normal_quantile(p: float) -> float:
+        if p <= 0.0:
+            return -math.inf
+        if p >= 1.0:
+            return math.inf
+        return NormalDist().inv_cdf(p)
+
+    @property
+    def n_periods(self) -> int:
+        """Return the number of schedule periods after the valuation date."""
+        return len(self.accrual)
+
+    def max_payout(self) -> float:
+        """Return the maximum contingent payout, the basket total capped at the notional."""
+        return min(float(self.payouts.sum()), self.notional)
+
+    def simulate(self, n_paths: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate the discounted legs of the swap on independent paths.
+
+        Args:
+            n_paths: Number of paths
+            rng: Random generator
+
+        Returns:
+            Tuple of (contingent leg PV, fixed leg PV) arrays, one value per path
+        """
+        n_periods, n_gauges = self.thresholds.shape
+        # Single precision halves the cost of the correlated draws
+        latent = (rng.standard_normal((n_paths, n_periods, n_gauges), dtype=np.float32)
+                  @ self.loading.T.astype(np.float32))
+        hit = latent < self.thresholds.astype(np.float32)
+
+        # Each gauge pays once, in the period of its first exceedance
+        first = hit.argmax(axis=1)
+        paid = hit.any(axis=1)
+        path = np.broadcast_to(np.arange(n_paths)[:, None], first.shape)
+        loss = np.bincount((path * n_periods + first)[paid],
+                           weights=np.broadcast_to(self.payouts, first.shape)[paid],
+                           minlength=n_paths * n_periods).reshape(n_paths, n_periods)
+        loss = np.cumsum(loss, axis=1)
+        outstanding_end = self.notional - np.minimum(loss, self.notional)
+        outstanding_start = np.concatenate(
+            [np.full((n_paths, 1), self.notional), outstanding_end[:, :-1]], axis=1)
+
+        contingent = (outstanding_start - outstanding_end) @ self.payout_discount
+        # Accrual on the notional lost during a period is settled up to mid-period
+        accruing = 0.5 * (outstanding_start + outstanding_end) if self.settles_accrual else outstanding_end
+        fixed = self.fixed_rate * (accruing @ (self.accrual * self.fixed_discount))
+        return contingent, fixed
+
+    def price(self, n_paths: int, seed: Optional[int] = None, max_workers: Optional[int] = None,
+              batch_size: int = 10_000, mp_context=None) -> Dict[str, float]:
+        """
+        Price the swap by Monte Carlo, spreading path batches over a process pool.
+
+        Args:
+            n_paths: Number of paths (rounded up to whole batches)
+            seed: Seed of the root SeedSequence (default: fresh entropy)
+            max_workers: Number of worker processes (default: os.cpu_count(); 1 runs in-process)
+            batch_size: Paths per batch; each batch draws from its own spawned stream
+            mp_context: Optional multiprocessing context (e.g. spawn)
+
+        Returns:
+            Dictionary with pv, std_error, contingent_leg, fixed_leg, n_paths,
+            elapsed_seconds and paths_per_second; pv is from the party's side
+
+        Raises:
+            ValueError: If n_paths or batch_size is not positive
+        """
+        if n_paths < 1 or batch_size < 1:
+            raise ValueError(f"n_paths and batch_size must be positive, got {n_paths} and {batch_size}")
+
+        n_batches = -(-n_paths // batch_size)
+        streams = np.random.SeedSequence(seed).spawn(n_batches)
+        max_workers = min(max_workers or os.cpu_count() or 1, n_batches)
+
+        start = time.perf_counter()
+        if max_workers == 1:
+            _init_worker(self)
+            totals = [_run_batch(batch_size, stream) for stream in streams]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                                     initializer=_init_worker, initargs=(self,)) as pool:
+                totals = list(pool.map(_run_batch, [batch_size] * n_batches, streams))
+        elapsed = time.perf_counter() - start
+
+        total = np.sum(totals, axis=0)
+        n = n_batches * batch_size
+        mean = float(total[0]) / n
+        variance = max(total[1] / n - mean ** 2, 0.0) * n / max(n - 1, 1)
+        return {
+            'pv': mean,
+            'std_error': math.sqrt(variance / n),
+            'contingent_leg': float(total[2]) / n,
+            'fixed_leg': float(total[3]) / n,
+            'n_paths': n,
+            'elapsed_seconds': elapsed,
+            'paths_per_second': n / elapsed if elapsed > 0 else math.inf,
+        }
+
+
+# Per-process pricer, set by the pool initializer
+_worker_pricer: Optional[SwapMonteCarloPricer] = None
+
+
+def _init_worker(pricer: SwapMonteCarloPricer) -> None:
+    global _worker_pricer
+    _worker_pricer = pricer
+
+
+def _run_batch(n_paths: int, stream: np.random.SeedSequence) -> np.ndarray:
+    contingent, fixed = _worker_pricer.simulate(n_paths, np.random.default_rng(stream))
+    pv = _worker_pricer.sign * (contingent - fixed)
+    return np.array([pv.sum(), np.square(pv).sum(), contingent.sum(), fixed.sum()])
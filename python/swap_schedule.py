@@ -0,0 +1,501 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Business-day schedule engine for swap ScheduleData.
+
+This module turns PhysicalRiskSwapCDM ScheduleData (StartDate, EndDate,
+Tenor, Calendar, Convention, TermConvention, Rule, EndOfMonth, FirstDate,
+LastDate) together with the leg DayCounter and PaymentConvention into
+adjusted accrual periods, payment dates and accrual fractions.
+
+Holiday calendars (UK, TARGET, US and weekends-only, joinable as "UK,US")
+are generated once per name with the Easter computus and held as numpy
+business-day calendars. ScheduleEngine generates the schedules of many
+trades at once, vectorized over the trades that share the same
+(calendar, tenor, rule, conventions) terms, and memoises every distinct
+schedule so trades with identical terms are only generated once.
+"""
+
+import datetime
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Years covered by the generated holiday calendars
+CALENDAR_YEARS = (1950, 2150)
+
+_CALENDAR_ALIASES = {
+    'UK': 'UK', 'GB': 'UK', 'GBP': 'UK', 'GBLO': 'UK', 'LONDON': 'UK', 'UNITEDKINGDOM': 'UK',
+    'TARGET': 'TARGET', 'TGT': 'TARGET', 'EUR': 'TARGET',
+    'US': 'US', 'USD': 'US', 'USNY': 'US', 'UNITEDSTATES': 'US',
+    'WEEKENDSONLY': 'WEEKENDSONLY', 'NULL': 'WEEKENDSONLY', '': 'WEEKENDSONLY',
+}
+
+_ROLLS = {
+    'F': 'following', 'FOLLOWING': 'following',
+    'MF': 'modifiedfollowing', 'MODIFIEDFOLLOWING': 'modifiedfollowing',
+    'P': 'preceding', 'PRECEDING': 'preceding',
+    'MP': 'modifiedpreceding', 'MODIFIEDPRECEDING': 'modifiedpreceding',
+    'U': None, 'UNADJUSTED': None, 'NONE': None,
+}
+
+_RULES = {
+    'FORWARD': 'Forward', 'BACKWARD': 'Backward', 'ZERO': 'Zero',
+    'CDS': 'CDS', 'CDS2015': 'CDS', 'TWENTIETHIMM': 'CDS',
+}
+
+_DAY_COUNTERS = {
+    'A360': 'A360', 'ACT/360': 'A360', 'ACTUAL/360': 'A360',
+    'A365': 'A365F', 'A365F': 'A365F', 'ACT/365': 'A365F', 'ACT/365F': 'A365F',
+    'ACT/365(FIXED)': 'A365F', 'ACTUAL/365(FIXED)': 'A365F',
+    '30/360': '30/360', '30U/360': '30/360', '30/360US': '30/360', 'BOND': '30/360',
+    '30/360(BONDBASIS)': '30/360',
+    '30E/360': '30E/360', 'EUROBOND': '30E/360', '30/360(EUROBONDBASIS)': '30E/360',
+    'ACTACT': 'ActAct', 'ACT/ACT': 'ActAct', 'ACTUAL/ACTUAL': 'ActAct',
+    'ACT/ACT(ISDA)': 'ActAct', 'ACTUAL/ACTUAL(ISDA)': 'ActAct',
+}
+
+# ScheduleData and leg fields of a create_swap_mapping output that define a schedule
+SCHEDULE_COLUMNS = ('start_date', 'end_date', 'tenor', 'calendar', 'convention', 'term_convention',
+                    'rule', 'end_of_month', 'first_date', 'last_date', 'day_counter', 'payment_convention')
+
+# Terms shared by a vectorized generation batch
+_CONVENTION_COLUMNS = ('tenor', 'calendar', 'rule', 'convention', 'term_convention', 'end_of_month',
+                       'day_counter', 'payment_convention')
+_CONVENTION_INDEX = tuple(SCHEDULE_COLUMNS.index(column) for column in _CONVENTION_COLUMNS)
+
+_TRUE = {"y", "yes", "true", "1"}
+_FALSE = {"n", "no", "false", "0", ""}
+
+
+def _key(value: Optional[str]) -> str:
+    if value is None or value != value:
+        return ''
+    return str(value).upper().replace(' ', '').replace('_', '')
+
+
+def parse_flag(value) -> bool:
+    """Parse a boolean schedule or leg flag (bool, 0/1 or Y/N/true/false text); missing is False."""
+    if value is None or value != value:
+        return False
+    if isinstance(value, (bool, np.bool_, int, np.integer, float, np.floating)):
+        return bool(value)
+    text = str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise ValueError(f"Invalid boolean value: {value}")
+
+
+def easter_sunday(year: int) -> datetime.date:
+    """Return the date of Easter Sunday in the Gregorian calendar (anonymous computus)."""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return datetime.date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> datetime.date:
+    """Return the n-th (n < 0: counted from the end) weekday (Mon=0) of a month."""
+    if n > 0:
+        first = datetime.date(year, month, 1)
+        return first + datetime.timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = datetime.date(year + month // 12, month % 12 + 1, 1) - datetime.timedelta(days=1)
+    return last - datetime.timedelta(days=(last.weekday() - weekday) % 7 + 7 * (-n - 1))
+
+
+def _substitute(days: List[datetime.date]) -> List[datetime.date]:
+    """Move weekend holidays to the next weekday that is not already a holiday (UK rule)."""
+    result = []
+    for day in sorted(days):
+        while day.weekday() >= 5 or day in result:
+            day += datetime.timedelta(days=1)
+        result.append(day)
+    return result
+
+
+def _observed(day: datetime.date) -> datetime.date:
+    """Return the US observed date: Saturday holidays move to Friday, Sunday ones to Monday."""
+    if day.weekday() == 5:
+        return day - datetime.timedelta(days=1)
+    if day.weekday() == 6:
+        return day + datetime.timedelta(days=1)
+    return day
+
+
+_UK_SPECIAL = [datetime.date(1999, 12, 31), datetime.date(2002, 6, 3), datetime.date(2011, 4, 29),
+               datetime.date(2012, 6, 5), datetime.date(2022, 6, 3), datetime.date(2022, 9, 19),
+               datetime.date(2023, 5, 8)]
+_UK_MOVED = {(1995, 'early_may'): datetime.date(1995, 5, 8), (2020, 'early_may'): datetime.date(2020, 5, 8),
+             (2002, 'spring'): datetime.date(2002, 6, 4), (2012, 'spring'): datetime.date(2012, 6, 4),
+             (2022, 'spring'): datetime.date(2022, 6, 2)}
+
+
+def _uk_holidays(year: int) -> List[datetime.date]:
+    easter = easter_sunday(year)
+    days = [
+        easter - datetime.timedelta(days=2),
+        easter + datetime.timedelta(days=1),
+        _UK_MOVED.get((year, 'early_may'), _nth_weekday(year, 5, 0, 1)),
+        _UK_MOVED.get((year, 'spring'), _nth_weekday(year, 5, 0, -1)),
+        _nth_weekday(year, 8, 0, -1),
+    ]
+    days += _substitute([datetime.date(year, 1, 1)])
+    days += _substitute([datetime.date(year, 12, 25), datetime.date(year, 12, 26)])
+    return days + [day for day in _UK_SPECIAL if day.year == year]
+
+
+def _target_holidays(year: int) -> List[datetime.date]:
+    days = [datetime.date(year, 1, 1), datetime.date(year, 12, 25), datetime.date(year, 12, 26)]
+    if year >= 2000:
+        easter = easter_sunday(year)
+        days += [easter - datetime.timedelta(days=2), easter + datetime.timedelta(days=1),
+                 datetime.date(year, 5, 1)]
+    if year in (1999, 2001):
+        days.append(datetime.date(year, 12, 31))
+    return days
+
+
+def _us_holidays(year: int) -> List[datetime.date]:
+    # US settlement calendar; a Saturday New Year's Day is observed on the Friday before
+    days = [_observed(datetime.date(year, 1, 1)), _observed(datetime.date(year, 7, 4)),
+            _observed(datetime.date(year, 11, 11)), _observed(datetime.date(year, 12, 25)),
+            _nth_weekday(year, 2, 0, 3), _nth_weekday(year, 5, 0, -1), _nth_weekday(year, 9, 0, 1),
+            _nth_weekday(year, 10, 0, 2), _nth_weekday(year, 11, 3, 4)]
+    if year >= 1983:
+        days.append(_nth_weekday(year, 1, 0, 3))
+    if year >= 2022:
+        days.append(_observed(datetime.date(year, 6, 19)))
+    return days
+
+
+_HOLIDAY_RULES = {'UK': _uk_holidays, 'TARGET': _target_holidays, 'US': _us_holidays,
+                  'WEEKENDSONLY': lambda year: []}
+
+
+def holidays(calendar: Optional[str], years: Tuple[int, int] = CALENDAR_YEARS) -> np.ndarray:
+    """
+    Return the weekday holidays of a calendar.
+
+    Args:
+        calendar: Calendar name (UK, TARGET, US, WeekendsOnly or aliases such as GBP,
+            EUR, USD); comma-separated names join calendars
+        years: First and last year to generate
+
+    Returns:
+        Sorted unique datetime64[D] array of holidays falling on weekdays
+
+    Raises:
+        ValueError: If a calendar name is not supported
+    """
+    days = []
+    for name in str(calendar or '').split(','):
+        rule = _CALENDAR_ALIASES.get(_key(name))
+        if rule is None:
+            raise ValueError(f"Unsupported calendar: {name}")
+        for year in range(years[0], years[1] + 1):
+            days.extend(_HOLIDAY_RULES[rule](year))
+    dates = np.array(sorted(set(days)), dtype='datetime64[D]')
+    return dates[np.is_busday(dates)]
+
+
+@lru_cache(maxsize=None)
+def business_calendar(calendar: Optional[str]) -> np.busdaycalendar:
+    """Return the (memoised) numpy business-day calendar of a calendar name."""
+    return np.busdaycalendar(holidays=holidays(calendar))
+
+
+def business_day_roll(convention: Optional[str]) -> Optional[str]:
+    """
+    Return the numpy busday_offset roll of a business day convention.
+
+    Args:
+        convention: F, MF, P, MP or U (or their long names; default F)
+
+    Returns:
+        Roll name, or None for unadjusted dates
+
+    Raises:
+        ValueError: If the convention is not supported
+    """
+    key = _key(convention) or 'F'
+    if key not in _ROLLS:
+        raise ValueError(f"Unsupported business day convention: {convention}")
+    return _ROLLS[key]
+
+
+def adjust_dates(dates: np.ndarray, convention: Optional[str], calendar: Optional[str]) -> np.ndarray:
+    """Adjust datetime64[D] dates to business days of a calendar under a business day convention."""
+    roll = business_day_roll(convention)
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    if roll is None or not len(dates):
+        return dates
+    return np.busday_offset(dates, 0, roll=roll, busdaycal=business_calendar(calendar))
+
+
+def year_fractions(day_counter: Optional[str], start, end) -> np.ndarray:
+    """
+    Return accrual fractions between arrays of dates.
+
+    Args:
+        day_counter: A360, A365F, 30/360 (US bond basis), 30E/360 or ActAct (ISDA); default A360
+        start: Accrual start dates
+        end: Accrual end dates
+
+    Returns:
+        float64 array of year fractions
+
+    Raises:
+        ValueError: If the day count convention is not supported
+    """
+    basis = _DAY_COUNTERS.get(_key(day_counter) or 'A360')
+    if basis is None:
+        raise ValueError(f"Unsupported day counter: {day_counter}")
+    start = np.asarray(start, dtype='datetime64[D]')
+    end = np.asarray(end, dtype='datetime64[D]')
+    days = (end - start).astype(np.float64)
+    if basis == 'A360':
+        return days / 360.0
+    if basis == 'A365F':
+        return days / 365.0
+
+    y1, y2 = start.astype('datetime64[Y]'), end.astype('datetime64[Y]')
+    if basis == 'ActAct':
+        def year_length(year):
+            return ((year + 1).astype('datetime64[D]') - year.astype('datetime64[D]')).astype(np.float64)
+        head = ((y1 + 1).astype('datetime64[D]') - start).astype(np.float64) / year_length(y1)
+        tail = (end - y2.astype('datetime64[D]')).astype(np.float64) / year_length(y2)
+        return (y2 - y1).astype(np.float64) - 1.0 + head + tail
+
+    m1, m2 = start.astype('datetime64[M]'), end.astype('datetime64[M]')
+    d1 = (start - m1.astype('datetime64[D]')).astype(np.int64) + 1
+    d2 = (end - m2.astype('datetime64[D]')).astype(np.int64) + 1
+    d1 = np.minimum(d1, 30)
+    d2 = np.where(d1 == 30, np.minimum(d2, 30), d2) if basis == '30/360' else np.minimum(d2, 30)
+    months = (m2 - m1).astype(np.int64)
+    return (30 * months + d2 - d1) / 360.0
+
+
+def _parse_tenor(tenor: Optional[str]) -> Tuple[int, str]:
+    """Return (count, unit) of a tenor such as 3M, 6M, 1Y, 2W or 7D (default 3M)."""
+    text = _key(tenor) or '3M'
+    if len(text) < 2 or text[-1] not in 'DWMY' or not text[:-1].isdigit() or int(text[:-1]) <= 0:
+        raise ValueError(f"Invalid tenor: {tenor}")
+    count, unit = int(text[:-1]), text[-1]
+    if unit == 'Y':
+        return 12 * count, 'M'
+    if unit == 'W':
+        return 7 * count, 'D'
+    return count, unit
+
+
+def _add_months(dates: np.ndarray, months: np.ndarray, end_of_month: np.ndarray) -> np.ndarray:
+    """Add months to dates, clipping to month end, or rolling to month end where end_of_month."""
+    month = dates.astype('datetime64[M]')
+    day = (dates - month.astype('datetime64[D]')).astype(np.int64)
+    target = month + months.astype('timedelta64[M]')
+    first = target.astype('datetime64[D]')
+    length = ((target + 1).astype('datetime64[D]') - first).astype(np.int64)
+    return first + np.where(end_of_month, length - 1, np.minimum(day, length - 1)).astype('timedelta64[D]')
+
+
+def _next_imm_twentieth(dates: np.ndarray) -> np.ndarray:
+    """Return the first 20 March/June/September/December strictly after each date."""
+    month = dates.astype('datetime64[M]')
+    quarter = month + ((2 - month.astype(np.int64) % 12) % 3).astype('timedelta64[M]')
+    twentieth = quarter.astype('datetime64[D]') + np.timedelta64(19, 'D')
+    return np.where(twentieth > dates, twentieth,
+                    (quarter + 3).astype('datetime64[D]') + np.timedelta64(19, 'D'))
+
+
+def _generate(terms: dict, start: np.ndarray, end: np.ndarray, first: np.ndarray,
+              last: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate the unadjusted schedule dates of schedules sharing conventions.
+
+    Returns:
+        Tuple of (schedule number, date) arrays sorted by schedule and date
+    """
+    step, unit = _parse_tenor(terms['tenor'])
+    rule = _RULES.get(_key(terms['rule']) or 'FORWARD')
+    if rule is None:
+        raise ValueError(f"Unsupported schedule rule: {terms['rule']}")
+
+    lo = np.where(np.isnat(first), _next_imm_twentieth(start) if rule == 'CDS' else start, first)
+    hi = np.where(np.isnat(last), end, last)
+    n = len(start)
+
+    points = [(np.arange(n), start), (np.arange(n), lo), (np.arange(n), hi), (np.arange(n), end)]
+    if rule != 'Zero':
+        backward = rule == 'Backward'
+        anchor = hi if backward else lo
+        if unit == 'M':
+            span = (hi.astype('datetime64[M]') - lo.astype('datetime64[M]')).astype(np.int64)
+        else:
+            span = (hi - lo).astype(np.int64)
+        counts = np.maximum(span // step + 2, 0)
+        schedule = np.repeat(np.arange(n), counts)
+        k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        if backward:
+            k = -k
+        if unit == 'M':
+            anchor_month = anchor.astype('datetime64[M]')
+            at_month_end = (anchor + 1).astype('datetime64[M]') != anchor_month
+            eom = bool(terms['end_of_month']) & at_month_end
+            dates = _add_months(anchor[schedule], k * step, eom[schedule])
+        else:
+            dates = anchor[schedule] + (k * step).astype('timedelta64[D]')
+        inside = (dates > lo[schedule]) & (dates < hi[schedule])
+        points.append((schedule[inside], dates[inside]))
+
+    schedule = np.concatenate([p[0] for p in points])
+    dates = np.concatenate([p[1] for p in points])
+    order = np.lexsort((dates, schedule))
+    schedule, dates = schedule[order], dates[order]
+    keep = np.ones(len(dates), dtype=bool)
+    keep[1:] = (schedule[1:] != schedule[:-1]) | (dates[1:] != dates[:-1])
+    return schedule[keep], dates[keep]
+
+
+def _to_dates(values) -> np.ndarray:
+    return pd.to_datetime(pd.Series(list(values), dtype=object), format="mixed").to_numpy().astype('datetime64[D]')
+
+
+class ScheduleEngine:
+    """
+    Vectorized, memoising schedule generator for swap ScheduleData.
+
+    Example:
+        engine = ScheduleEngine()
+        periods = engine.schedules(swap_mappings)   # one row per trade and period
+        single = engine.schedule(swap_mappings[0])
+    """
+    def __init__(self, max_cached: int = 100_000):
+        """
+        Initialize the engine.
+
+        Args:
+            max_cached: Maximum number of distinct schedules kept in the memo
+        """
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[tuple, Tuple[np.ndarray, ...]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def clear_cache(self) -> None:
+        """Drop all memoised schedules."""
+        self._cache.clear()
+
+    def _build(self, terms: dict, rows: pd.DataFrame) -> List[Tuple[np.ndarray, ...]]:
+        """Generate the schedules of distinct date rows sharing the same conventions."""
+        start, end = _to_dates(rows['start_date']), _to_dates(rows['end_date'])
+        first, last = _to_dates(rows['first_date']), _to_dates(rows['last_date'])
+        bad = np.isnat(start) | np.isnat(end) | (end <= start)
+        if bad.any():
+            raise ValueError(f"{int(bad.sum())} schedule(s) without a valid start_date before end_date")
+
+        schedule, dates = _generate(terms, start, end, first, last)
+        is_last = np.ones(len(schedule), dtype=bool)
+        is_last[:-1] = schedule[1:] != schedule[:-1]
+        adjusted = np.where(is_last,
+                            adjust_dates(dates, terms['term_convention'] or terms['convention'], terms['calendar']),
+                            adjust_dates(dates, terms['convention'], terms['calendar']))
+
+        # Periods join consecutive dates of a schedule; stubs collapsed by the adjustment are dropped
+        same = schedule[1:] == schedule[:-1]
+        period_of = schedule[:-1][same]
+        accrual_start, accrual_end = adjusted[:-1][same], adjusted[1:][same]
+        keep = accrual_end > accrual_start
+        period_of, accrual_start, accrual_end = period_of[keep], accrual_start[keep], accrual_end[keep]
+        payment = adjust_dates(accrual_end, terms['payment_convention'] or terms['convention'], terms['calendar'])
+        fraction = year_fractions(terms['day_counter'], accrual_start, accrual_end)
+
+        bounds = np.searchsorted(period_of, np.arange(len(rows) + 1))
+        return [(accrual_start[a:b], accrual_end[a:b], payment[a:b], fraction[a:b])
+                for a, b in zip(bounds[:-1], bounds[1:])]
+
+    def schedules(self, swaps: Union[pd.DataFrame, Sequence[dict]]) -> pd.DataFrame:
+        """
+        Generate the accrual periods of many trades.
+
+        Args:
+            swaps: DataFrame or sequence of create_swap_mapping outputs; see SCHEDULE_COLUMNS
+
+        Returns:
+            DataFrame with one row per trade and period: trade (input position), period,
+            accrual_start, accrual_end, payment_date and accrual_fraction
+
+        Raises:
+            ValueError: If a trade has invalid dates or unsupported conventions
+        """
+        frame = swaps if isinstance(swaps, pd.DataFrame) else pd.DataFrame(list(swaps))
+        terms = pd.DataFrame({column: frame[column] if column in frame.columns else None
+                              for column in SCHEDULE_COLUMNS}, index=range(len(frame)))
+        terms = terms.astype(object).where(terms.notna(), None)
+        terms['end_of_month'] = terms['end_of_month'].map(parse_flag)
+        keys = list(terms.itertuples(index=False, name=None))
+
+        # Generate the distinct schedules missing from the memo, batched by conventions
+        distinct = list(dict.fromkeys(keys))
+        missing = [key for key in distinct if key not in self._cache]
+        self.hits += len(distinct) - len(missing)
+        self.misses += len(missing)
+        batches: Dict[tuple, List[tuple]] = {}
+        for key in missing:
+            batches.setdefault(tuple(key[i] for i in _CONVENTION_INDEX), []).append(key)
+        for conventions, batch in batches.items():
+            built = self._build(dict(zip(_CONVENTION_COLUMNS, conventions)),
+                                pd.DataFrame(batch, columns=SCHEDULE_COLUMNS))
+            for key, periods in zip(batch, built):
+                self._cache[key] = periods
+        schedules = [self._cache[key] for key in keys]
+        for key in distinct:
+            self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+
+        counts = np.array([len(periods[0]) for periods in schedules], dtype=np.int64)
+        columns = [np.concatenate([periods[i] for periods in schedules]) if schedules
+                   else np.empty(0, dtype='datetime64[D]' if i < 3 else np.float64) for i in range(4)]
+        return pd.DataFrame({
+            'trade': np.repeat(np.arange(len(schedules)), counts),
+            'period': np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts),
+            'accrual_start': columns[0].astype('datetime64[ns]'),
+            'accrual_end': columns[1].astype('datetime64[ns]'),
+            'payment_date': columns[2].astype('datetime64[ns]'),
+            'accrual_fraction': columns[3].astype(np.float64),
+        })
+
+    def schedule(self, swap: dict) -> pd.DataFrame:
+        """
+        Generate the accrual periods of one trade.
+
+        Args:
+            swap: create_swap_mapping output
+
+        Returns:
+            DataFrame with period, accrual_start, accrual_end, payment_date and accrual_fraction
+        """
+        return self.schedules([swap]).drop(columns='trade')
@@ -22,15 +22,69 @@ enabling consistent processing across different data sources and applications.
 
 from typing import Dict, List
 
+from .schema_registry import get_compiled_schema
+
 class TCEventCDM:
     """
     Tropical Cyclone Event Common Data Model (CDM) implementation.
     Provides a standardized schema and data transformation methods
     for tropical cyclone event data.
     """
+    SCHEMA_VERSION = "v1"
+
+    # Output column name -> dotted schema path, in mapping order
+    _FIELD_COLUMNS = {
+        'tc_event_id': 'TropicalCycloneEvent.Header.TCEventID',
+
+        # Attributes section
+        'tc_name': 'TropicalCycloneEvent.Attributes.TCName',
+        'tc_size': 'TropicalCycloneEvent.Attributes.TCSize',
+        'tc_wind_speed': 'TropicalCycloneEvent.Attributes.TCWindSpeed',
+        'tc_duration': 'TropicalCycloneEvent.Attributes.TCDuration',
+        'tc_pressure': 'TropicalCycloneEvent.Attributes.TCPressure',
+        'tc_surge': 'TropicalCycloneEvent.Attributes.TCSurge',
+        'distance_eye': 'TropicalCycloneEvent.Attributes.DistanceEye',
+        'distance_path': 'TropicalCycloneEvent.Attributes.DistancePath',
+        'start_date': 'TropicalCycloneEvent.Attributes.StartDate',
+        'end_date': 'TropicalCycloneEvent.Attributes.EndDate',
+
+        # Alert section
+        'warning_centre': 'TropicalCycloneEvent.Alert.WarningCentre',
+        'cyclone_alert': 'TropicalCycloneEvent.Alert.CycloneAlert',
+
+        # Warning section
+        'warning_date': 'TropicalCycloneEvent.Warning.Date',
+        'warning_time': 'TropicalCycloneEvent.Warning.Time',
+        'position': 'TropicalCycloneEvent.Warning.Position',
+        'intensity': 'TropicalCycloneEvent.Warning.Intensity',
+        'wind_speeds': 'TropicalCycloneEvent.Warning.WindSpeeds',
+        'expected_time': 'TropicalCycloneEvent.Warning.ExpectedTime',
+        'expected_date': 'TropicalCycloneEvent.Warning.ExpectedDate',
+        'expected_location': 'TropicalCycloneEvent.Warning.ExpectedLocation',
+        'anticipated_surge_height': 'TropicalCycloneEvent.Warning.AnticipatedStormSurgeHeight',
+        'potential_damage': 'TropicalCycloneEvent.Warning.PotentialDamage',
+        'suggested_actions': 'TropicalCycloneEvent.Warning.SuggestedActions',
+
+        # Triggers section
+        'currency': 'TropicalCycloneEvent.Triggers.currency',
+        'evacuation_trigger': 'TropicalCycloneEvent.Triggers.EvacuationTrigger',
+        'property_damage_trigger': 'TropicalCycloneEvent.Triggers.PropertyDamageTrigger',
+        'business_interruption_trigger': 'TropicalCycloneEvent.Triggers.BusinessInteruptionTrigger',
+        'additional_expenses_trigger': 'TropicalCycloneEvent.Triggers.AdditionalExpensesTrigger',
+    }
+
     def __init__(self):
-        """Initialize the TC Event CDM with schema definition."""
-        self.schema = {
+        """Initialize the TC Event CDM with the shared compiled schema definition."""
+        self._compiled = get_compiled_schema(
+            "TropicalCycloneEvent", self.SCHEMA_VERSION, self._build_schema, columns=self._FIELD_COLUMNS
+        )
+        self.schema = self._compiled.schema
+        self._fields = self._compiled.fields
+
+    @staticmethod
+    def _build_schema() -> dict:
+        """Build the TC Event schema definition."""
+        return {
             "TropicalCycloneEvent": {
                 "Header": {
                     "TCEventID": {
@@ -195,46 +249,8 @@ class TCEventCDM:
             Structured tropical cyclone event data according to CDM schema
         """
         try:
-            tcevent_data = {
-                'tc_event_id': tcevent.get('TropicalCycloneEvent', {}).get('Header', {}).get('TCEventID'),
-                
-                # Attributes section
-                'tc_name': tcevent.get('TropicalCycloneEvent', {}).get('Attributes', {}).get('TCName'),
-                'tc_size': tcevent.get('TropicalCycloneEvent', {}).get('Attributes', {}).get('TCSize'),
-                'tc_wind_speed': tcevent.get('TropicalCycloneEvent', {}).get('Attributes', {}).get('TCWindSpeed'),
-                'tc_duration': tcevent.get('TropicalCycloneEvent', {}).get('Attributes', {}).get('TCDuration'),
-                'tc_pressure': tcevent.get('TropicalCycloneEvent', {}).get('Attributes', {}).get('TCPressure'),
-                'tc_surge': tcevent.get('TropicalCycloneEvent', {}).get('Attributes', {}).get('TCSurge'),
-                'distance_eye': tcevent.get('TropicalCycloneEvent', {}).get('Attributes', {}).get('DistanceEye'),
-                'distance_path': tcevent.get('TropicalCycloneEvent', {}).get('Attributes', {}).get('DistancePath'),
-                'start_date': tcevent.get('TropicalCycloneEvent', {}).get('Attributes', {}).get('StartDate'),
-                'end_date': tcevent.get('TropicalCycloneEvent', {}).get('Attributes', {}).get('EndDate'),
-                
-                # Alert section
-                'warning_centre': tcevent.get('TropicalCycloneEvent', {}).get('Alert', {}).get('WarningCentre'),
-                'cyclone_alert': tcevent.get('TropicalCycloneEvent', {}).get('Alert', {}).get('CycloneAlert'),
-                
-                # Warning section
-                'warning_date': tcevent.get('TropicalCycloneEvent', {}).get('Warning', {}).get('Date'),
-                'warning_time': tcevent.get('TropicalCycloneEvent', {}).get('Warning', {}).get('Time'),
-                'position': tcevent.get('TropicalCycloneEvent', {}).get('Warning', {}).get('Position'),
-                'intensity': tcevent.get('TropicalCycloneEvent', {}).get('Warning', {}).get('Intensity'),
-                'wind_speeds': tcevent.get('TropicalCycloneEvent', {}).get('Warning', {}).get('WindSpeeds'),
-                'expected_time': tcevent.get('TropicalCycloneEvent', {}).get('Warning', {}).get('ExpectedTime'),
-                'expected_date': tcevent.get('TropicalCycloneEvent', {}).get('Warning', {}).get('ExpectedDate'),
-                'expected_location': tcevent.get('TropicalCycloneEvent', {}).get('Warning', {}).get('ExpectedLocation'),
-                'anticipated_surge_height': tcevent.get('TropicalCycloneEvent', {}).get('Warning', {}).get('AnticipatedStormSurgeHeight'),
-                'potential_damage': tcevent.get('TropicalCycloneEvent', {}).get('Warning', {}).get('PotentialDamage'),
-                'suggested_actions': tcevent.get('TropicalCycloneEvent', {}).get('Warning', {}).get('SuggestedActions'),
-                
-                # Triggers section
-                'currency': tcevent.get('TropicalCycloneEvent', {}).get('Triggers', {}).get('currency'),
-                'evacuation_trigger': tcevent.get('TropicalCycloneEvent', {}).get('Triggers', {}).get('EvacuationTrigger'),
-                'property_damage_trigger': tcevent.get('TropicalCycloneEvent', {}).get('Triggers', {}).get('PropertyDamageTrigger'),
-                'business_interruption_trigger': tcevent.get('TropicalCycloneEvent', {}).get('Triggers', {}).get('BusinessInteruptionTrigger'),
-                'additional_expenses_trigger': tcevent.get('TropicalCycloneEvent', {}).get('Triggers', {}).get('AdditionalExpensesTrigger')
-            }
-            return {k: v for k, v in tcevent_data.items() if v is not None}
+            # Single pass over the compiled columns, skipping None values
+            return self._fields.mapper(tcevent)
         except Exception as e:
             raise ValueError(f"Error creating event mapping: {str(e)}")
             
@@ -249,49 +265,7 @@ class TCEventCDM:
             Structured TC event data according to CDM schema (nested structure)
         """
         try:
-            tcevent_data = {
-                "TropicalCycloneEvent": {
-                    "Header": {
-                        "TCEventID": event_data.get('tc_event_id')
-                    },
-                    "Attributes": {
-                        "TCName": event_data.get('tc_name'),
-                        "TCSize": event_data.get('tc_size'),
-                        "TCWindSpeed": event_data.get('tc_wind_speed'),
-                        "TCDuration": event_data.get('tc_duration'),
-                        "TCPressure": event_data.get('tc_pressure'),
-                        "TCSurge": event_data.get('tc_surge'),
-                        "DistanceEye": event_data.get('distance_eye'),
-                        "DistancePath": event_data.get('distance_path'),
-                        "StartDate": event_data.get('start_date'),
-                        "EndDate": event_data.get('end_date')
-                    },
-                    "Alert": {
-                        "WarningCentre": event_data.get('warning_centre'),
-                        "CycloneAlert": event_data.get('cyclone_alert')
-                    },
-                    "Warning": {
-                        "Date": event_data.get('warning_date'),
-                        "Time": event_data.get('warning_time'),
-                        "Position": event_data.get('position'),
-                        "Intensity": event_data.get('intensity'),
-                        "WindSpeeds": event_data.get('wind_speeds'),
-                        "ExpectedTime": event_data.get('expected_time'),
-                        "ExpectedDate": event_data.get('expected_date'),
-                        "ExpectedLocation": event_data.get('expected_location'),
-                        "AnticipatedStormSurgeHeight": event_data.get('anticipated_surge_height'),
-                        "PotentialDamage": event_data.get('potential_damage'),
-                        "SuggestedActions": event_data.get('suggested_actions')
-                    },
-                    "Triggers": {
-                        "currency": event_data.get('currency'),
-                        "EvacuationTrigger": event_data.get('evacuation_trigger'),
-                        "PropertyDamageTrigger": event_data.get('property_damage_trigger'),
-                        "BusinessInteruptionTrigger": event_data.get('business_interruption_trigger'),
-                        "AdditionalExpensesTrigger": event_data.get('additional_expenses_trigger')
-                    }
-                }
-            }
+            tcevent_data = self._fields.unmap_record(event_data)
             
             # Remove None values recursively
             def remove_nones(d):
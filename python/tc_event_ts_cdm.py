@@ -20,15 +20,100 @@ This module provides a standardized data model for tropical cyclone event time s
 enabling consistent processing across different data sources and applications.
 """
 
+import json
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Any
 
+from .schema_registry import get_compiled_schema
+
+
+def _config_variant(yaml_config: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Return a hashable registry key for a GEFS-HRRR configuration."""
+    if yaml_config is None:
+        return None
+    return json.dumps(yaml_config, sort_keys=True, default=str)
+
+
 class TCEventTSCDM:
     """
     Tropical Cyclone Event Time Series Common Data Model (CDM) implementation.
     Provides a standardized schema and data transformation methods
     for tropical cyclone event time series data.
     """
+    SCHEMA_VERSION = "v2"
+
+    # Output column name -> dotted schema path, in mapping order
+    _FIELD_COLUMNS = {
+        'event_id': 'EventTimeseries.Header.event_id',
+        'time': 'EventTimeseries.Header.time',
+        'lead_time': 'EventTimeseries.Header.lead_time',
+
+        # Dimensions
+        'lat': 'EventTimeseries.Dimensions.lat',
+        'lon': 'EventTimeseries.Dimensions.lon',
+        'mrr': 'EventTimeseries.Dimensions.mrr',
+
+        # CycloneParameters
+        'direction': 'EventTimeseries.CycloneParameters.direction',
+        'storm_size': 'EventTimeseries.CycloneParameters.storm_size',
+        'intensity_change': 'EventTimeseries.CycloneParameters.intensity_change',
+        'pressure_change': 'EventTimeseries.CycloneParameters.pressure_change',
+
+        # SurfaceNearSurface
+        't2m': 'EventTimeseries.SurfaceNearSurface.t2m',
+        'sp': 'EventTimeseries.SurfaceNearSurface.sp',
+        'msl': 'EventTimeseries.SurfaceNearSurface.msl',
+        'tcwv': 'EventTimeseries.SurfaceNearSurface.tcwv',
+        'u10m': 'EventTimeseries.SurfaceNearSurface.u10m',
+        'v10m': 'EventTimeseries.SurfaceNearSurface.v10m',
+        'u100m': 'EventTimeseries.SurfaceNearSurface.u100m',
+        'v100m': 'EventTimeseries.SurfaceNearSurface.v100m',
+        'tp': 'EventTimeseries.SurfaceNearSurface.tp',
+        'csnow': 'EventTimeseries.SurfaceNearSurface.csnow',
+        'cicep': 'EventTimeseries.SurfaceNearSurface.cicep',
+        'cfrzr': 'EventTimeseries.SurfaceNearSurface.cfrzr',
+        'crain': 'EventTimeseries.SurfaceNearSurface.crain',
+
+        # PressureLevels - flattening the nested structure for easier access
+        'u1000': 'EventTimeseries.PressureLevels.1000hPa.u1000',
+        'v1000': 'EventTimeseries.PressureLevels.1000hPa.v1000',
+        'z1000': 'EventTimeseries.PressureLevels.1000hPa.z1000',
+        't850': 'EventTimeseries.PressureLevels.850hPa.t850',
+        'u850': 'EventTimeseries.PressureLevels.850hPa.u850',
+        'v850': 'EventTimeseries.PressureLevels.850hPa.v850',
+        'z850': 'EventTimeseries.PressureLevels.850hPa.z850',
+        'r850': 'EventTimeseries.PressureLevels.850hPa.r850',
+        't500': 'EventTimeseries.PressureLevels.500hPa.t500',
+        'u500': 'EventTimeseries.PressureLevels.500hPa.u500',
+        'v500': 'EventTimeseries.PressureLevels.500hPa.v500',
+        'z500': 'EventTimeseries.PressureLevels.500hPa.z500',
+        'r500': 'EventTimeseries.PressureLevels.500hPa.r500',
+        't250': 'EventTimeseries.PressureLevels.250hPa.t250',
+        'u250': 'EventTimeseries.PressureLevels.250hPa.u250',
+        'v250': 'EventTimeseries.PressureLevels.250hPa.v250',
+        'z250': 'EventTimeseries.PressureLevels.250hPa.z250',
+        'z50': 'EventTimeseries.PressureLevels.50hPa.z50',
+    }
+
+    # Column dtypes of to_typed_dataframe by schema field type; text columns
+    # become categoricals and integers nullable
+    _FRAME_TYPE_DTYPES = {
+        'decimal': np.float32,
+        'integer': np.int16,
+        'datetime': 'datetime64[ns]',
+        'text': 'category',
+    }
+
+    # Per-column overrides: coordinates keep full precision
+    _FRAME_COLUMN_DTYPES = {
+        'lat': np.float64,
+        'lon': np.float64,
+    }
+
+    # Rows staged per block assignment in to_typed_dataframe
+    _FRAME_BLOCK_ROWS = 4096
+
     def __init__(self, yaml_config: Optional[Dict[str, Any]] = None):
         """
         Initialize the TC Event Time Series CDM with schema definition.
@@ -47,7 +132,27 @@ class TCEventTSCDM:
                                "cat_freez", "cat_rain", "cat_none"]
         }
         
-        self.schema = {
+        self._compiled = get_compiled_schema(
+            "EventTimeseries", self.SCHEMA_VERSION,
+            lambda: self._build_schema(yaml_config),
+            variant=_config_variant(yaml_config),
+            columns=self._FIELD_COLUMNS
+        )
+        self.schema = self._compiled.schema
+        self._fields = self._compiled.fields
+
+    @staticmethod
+    def _build_schema(yaml_config: Optional[Dict[str, Any]] = None) -> dict:
+        """
+        Build the TC Event Time Series schema definition.
+        
+        Args:
+            yaml_config: Optional configuration for GEFS-HRRR integration
+            
+        Returns:
+            Nested schema definition
+        """
+        return {
             "EventTimeseries": {
                 "Header": {
                     "event_id": {"type": "text", "description": "Unique identifier for TC event"},
@@ -183,59 +288,8 @@ class TCEventTSCDM:
             Structured tropical cyclone event timeseries data according to CDM schema
         """
         try:
-            tceventts_data = {
-                'event_id': tceventts.get('EventTimeseries', {}).get('Header', {}).get('event_id'),
-                'time': tceventts.get('EventTimeseries', {}).get('Header', {}).get('time'),
-                'lead_time': tceventts.get('EventTimeseries', {}).get('Header', {}).get('lead_time'),
-                
-                # Dimensions
-                'lat': tceventts.get('EventTimeseries', {}).get('Dimensions', {}).get('lat'),
-                'lon': tceventts.get('EventTimeseries', {}).get('Dimensions', {}).get('lon'),
-                'mrr': tceventts.get('EventTimeseries', {}).get('Dimensions', {}).get('mrr'),
-                
-                # CycloneParameters
-                'direction': tceventts.get('EventTimeseries', {}).get('CycloneParameters', {}).get('direction'),
-                'storm_size': tceventts.get('EventTimeseries', {}).get('CycloneParameters', {}).get('storm_size'),
-                'intensity_change': tceventts.get('EventTimeseries', {}).get('CycloneParameters', {}).get('intensity_change'),
-                'pressure_change': tceventts.get('EventTimeseries', {}).get('CycloneParameters', {}).get('pressure_change'),
-                
-                # SurfaceNearSurface
-                't2m': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('t2m'),
-                'sp': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('sp'),
-                'msl': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('msl'),
-                'tcwv': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('tcwv'),
-                'u10m': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('u10m'),
-                'v10m': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('v10m'),
-                'u100m': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('u100m'),
-                'v100m': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('v100m'),
-                'tp': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('tp'),
-                'csnow': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('csnow'),
-                'cicep': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('cicep'),
-                'cfrzr': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('cfrzr'),
-                'crain': tceventts.get('EventTimeseries', {}).get('SurfaceNearSurface', {}).get('crain'),
-                
-                # PressureLevels - flattening the nested structure for easier access
-                'u1000': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('1000hPa', {}).get('u1000'),
-                'v1000': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('1000hPa', {}).get('v1000'),
-                'z1000': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('1000hPa', {}).get('z1000'),
-                't850': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('850hPa', {}).get('t850'),
-                'u850': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('850hPa', {}).get('u850'),
-                'v850': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('850hPa', {}).get('v850'),
-                'z850': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('850hPa', {}).get('z850'),
-                'r850': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('850hPa', {}).get('r850'),
-                't500': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('500hPa', {}).get('t500'),
-                'u500': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('500hPa', {}).get('u500'),
-                'v500': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('500hPa', {}).get('v500'),
-                'z500': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('500hPa', {}).get('z500'),
-                'r500': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('500hPa', {}).get('r500'),
-                't250': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('250hPa', {}).get('t250'),
-                'u250': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('250hPa', {}).get('u250'),
-                'v250': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('250hPa', {}).get('v250'),
-                'z250': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('250hPa', {}).get('z250'),
-                'z50': tceventts.get('EventTimeseries', {}).get('PressureLevels', {}).get('50hPa', {}).get('z50')
-            }
-            
-            return {k: v for k, v in tceventts_data.items() if v is not None}
+            # Single pass over the compiled columns, skipping None values
+            return self._fields.mapper(tceventts)
         except Exception as e:
             raise ValueError(f"Error creating TC event timeseries mapping: {str(e)}")
 
@@ -265,3 +319,106 @@ class TCEventTSCDM:
             return pd.DataFrame(flattened_data)
         except Exception as e:
             raise ValueError(f"Error converting to DataFrame: {str(e)}")
+
+    def to_typed_dataframe(self, tceventts_data: List[dict]) -> pd.DataFrame:
+        """
+        Convert TC event timeseries data to a DataFrame with compact column dtypes.
+        Columns follow the CDM mapping and are pre-allocated from the schema:
+        float32 for met variables, float64 for lat/lon, datetime64 for time,
+        nullable int16 for lead_time and categorical for event_id. Entries
+        are read in a single pass; keys outside the mapping are ignored.
+        
+        Args:
+            tceventts_data: List of mapped entries (as returned by create_tceventts_mapping)
+                or nested EventTimeseries records
+            
+        Returns:
+            DataFrame with one row per entry and one column per mapping column
+
+        Raises:
+            ValueError: If an entry cannot be converted, e.g. a lead_time outside the int16 range
+        """
+        try:
+            entries = tceventts_data if isinstance(tceventts_data, list) else list(tceventts_data)
+            n_rows = len(entries)
+            mapper = self._fields.mapper
+
+            # Slot per column: (kind, index within its kind)
+            slots = {}
+            block_columns = {np.float32: [], np.float64: []}
+            text_columns, time_columns, int_columns = [], [], []
+            for col in self._fields.columns:
+                dtype = self._FRAME_COLUMN_DTYPES.get(col.column, self._FRAME_TYPE_DTYPES.get(col.field.type, np.float32))
+                if dtype == 'category':
+                    slots[col.column] = (2, len(text_columns))
+                    text_columns.append(col.column)
+                elif dtype == 'datetime64[ns]':
+                    slots[col.column] = (3, len(time_columns))
+                    time_columns.append(col.column)
+                else:
+                    if dtype == np.int16:
+                        # Staged as float64 (exact for int16) so missing values stay NaN
+                        int_columns.append(col.column)
+                        dtype = np.float64
+                    slots[col.column] = (0 if dtype == np.float32 else 1, len(block_columns[dtype]))
+                    block_columns[dtype].append(col.column)
+
+            # Column-major blocks, so every column is a contiguous view
+            block32 = np.full((n_rows, len(block_columns[np.float32])), np.nan, dtype=np.float32, order="F")
+            block64 = np.full((n_rows, len(block_columns[np.float64])), np.nan, dtype=np.float64, order="F")
+            codes = np.full((len(text_columns), n_rows), -1, dtype=np.int32)
+            categories = [{} for _ in text_columns]
+            times = np.full((len(time_columns), n_rows), None, dtype=object)
+
+            empty32 = [np.nan] * block32.shape[1]
+            empty64 = [np.nan] * block64.shape[1]
+            rows32, rows64 = [], []
+            start = 0
+            for i, entry in enumerate(entries):
+                if "EventTimeseries" in entry:
+                    entry = mapper(entry)
+                row32 = empty32.copy()
+                row64 = empty64.copy()
+                for key, value in entry.items():
+                    slot = slots.get(key)
+                    if slot is None or value is None:
+                        continue
+                    kind, j = slot
+                    if kind == 0:
+                        row32[j] = value
+                    elif kind == 1:
+                        row64[j] = value
+                    elif kind == 2:
+                        codes[j, i] = categories[j].setdefault(value, len(categories[j]))
+                    else:
+                        times[j, i] = value
+                rows32.append(row32)
+                rows64.append(row64)
+                if len(rows32) == self._FRAME_BLOCK_ROWS or i == n_rows - 1:
+                    block32[start:i + 1] = rows32
+                    block64[start:i + 1] = rows64
+                    rows32, rows64 = [], []
+                    start = i + 1
+
+            arrays = {}
+            for j, column in enumerate(block_columns[np.float32]):
+                arrays[column] = block32[:, j]
+            for j, column in enumerate(block_columns[np.float64]):
+                values = block64[:, j]
+                if column in int_columns:
+                    missing = np.isnan(values)
+                    limits = np.iinfo(np.int16)
+                    out_of_range = ~missing & ((values < limits.min) | (values > limits.max))
+                    if out_of_range.any():
+                        raise ValueError(f"{column} value {values[out_of_range][0]:g} is outside "
+                                         f"the int16 range [{limits.min}, {limits.max}]")
+                    values = pd.arrays.IntegerArray(np.where(missing, 0, values).astype(np.int16), missing)
+                arrays[column] = values
+            for j, column in enumerate(text_columns):
+                arrays[column] = pd.Categorical.from_codes(codes[j], categories=list(categories[j]))
+            for j, column in enumerate(time_columns):
+                arrays[column] = pd.to_datetime(times[j], format="ISO8601").as_unit("ns")
+
+            return pd.DataFrame({col.column: arrays[col.column] for col in self._fields.columns}, copy=False)
+        except Exception as e:
+            raise ValueError(f"Error converting to typed DataFrame: {str(e)}")
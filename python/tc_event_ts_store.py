@@ -0,0 +1,311 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Memory-mapped cube store for TC event time series.
+
+This module stores TC event timeseries variables as one on-disk NumPy
+cube of shape (variable, event, time), memory-mapped on open, with a JSON
+sidecar index of the variable names, event IDs and time steps. Opening a
+store only reads the index and the .npy header, and the cube is laid out
+variable-major so one variable across all events is a contiguous slice.
+
+Creating a store does not touch the cube's pages: a variable is NaN-filled
+on its first write and listed under "filled_variables" in the index, and
+variables never written read as NaN without being stored.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .tc_event_ts_cdm import TCEventTSCDM
+
+STORE_FORMAT_VERSION = 2
+# Version 1 stores were NaN-filled on creation, so every variable counts as filled
+_READABLE_FORMAT_VERSIONS = (1, STORE_FORMAT_VERSION)
+CUBE_FILE = "cube.npy"
+INDEX_FILE = "index.json"
+
+
+def default_cube_variables() -> List[str]:
+    """Return the decimal mapping columns of TCEventTSCDM (every numeric variable per step)."""
+    return [col.column for col in TCEventTSCDM()._fields.columns if col.field.type == "decimal"]
+
+
+def _write_index(path: str, index: dict) -> None:
+    """Write the sidecar index atomically."""
+    tmp_path = os.path.join(path, f"{INDEX_FILE}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(tmp_path, os.path.join(path, INDEX_FILE))
+
+
+class TCEventTSCubeStore:
+    """
+    On-disk (variable x event x time) cube of TC event timeseries,
+    memory-mapped with a sidecar index.
+
+    Example:
+        store = TCEventTSCubeStore.open("archive/gefs_2024")
+        t2m = store.variable("t2m")             # (event, time) memmap view
+        track = store.sel("msl", event_id="AL052024")
+    """
+    def __init__(self, path: str, cube: np.ndarray, index: dict):
+        """
+        Initialize the store from an opened cube and its index.
+        Use TCEventTSCubeStore.create or TCEventTSCubeStore.open instead.
+
+        Args:
+            path: Store directory
+            cube: Memory-mapped cube of shape (variable, event, time)
+            index: Sidecar index
+        """
+        self.path = path
+        self.cube = cube
+        self.variables: List[str] = list(index["variables"])
+        self.event_ids: List[str] = list(index["event_ids"])
+        self.times = np.array(index["times"], dtype="datetime64[s]")
+        self._index = index
+        self._filled = set(index.get("filled_variables", self.variables))
+        self._variable_index = {name: i for i, name in enumerate(self.variables)}
+        self._event_index = {event_id: i for i, event_id in enumerate(self.event_ids)}
+        self._time_index = {time: i for i, time in enumerate(self.times.tolist())}
+
+    @classmethod
+    def create(cls, path: str, event_ids: Sequence[str], times: Iterable,
+               variables: Optional[Sequence[str]] = None, dtype=np.float32) -> "TCEventTSCubeStore":
+        """
+        Create an empty store, in which every value reads as NaN.
+        The cube file is created sparse; no page is written until a variable is.
+
+        Args:
+            path: Store directory (created if missing; an existing store is overwritten)
+            event_ids: Event IDs along the event axis
+            times: Time steps along the time axis (datetime-like)
+            variables: Variables along the variable axis (default: default_cube_variables())
+            dtype: Floating-point dtype of the cube
+
+        Returns:
+            Store opened for reading and writing
+
+        Raises:
+            ValueError: If an axis has duplicate labels
+        """
+        variables = list(variables) if variables is not None else default_cube_variables()
+        event_ids = [str(event_id) for event_id in event_ids]
+        times = pd.to_datetime(list(times), format="ISO8601").to_numpy().astype("datetime64[s]")
+        for axis, labels in (("variables", variables), ("event_ids", event_ids), ("times", times.tolist())):
+            if len(set(labels)) != len(labels):
+                raise ValueError(f"Duplicate labels in {axis}")
+
+        os.makedirs(path, exist_ok=True)
+        shape = (len(variables), len(event_ids), len(times))
+        cube = np.lib.format.open_memmap(os.path.join(path, CUBE_FILE), mode="w+", dtype=dtype, shape=shape)
+
+        index = {
+            "format_version": STORE_FORMAT_VERSION,
+            "dtype": np.dtype(dtype).str,
+            "shape": list(shape),
+            "variables": variables,
+            "event_ids": event_ids,
+            "times": [str(time) for time in times],
+            "filled_variables": [],
+        }
+        _write_index(path, index)
+        return cls(path, cube, index)
+
+    @classmethod
+    def open(cls, path: str, mode: str = "r") -> "TCEventTSCubeStore":
+        """
+        Open an existing store without reading the cube data.
+
+        Args:
+            path: Store directory
+            mode: Memory-map mode ("r" read-only, "r+" read-write, "c" copy-on-write)
+
+        Returns:
+            Opened store
+
+        Raises:
+            ValueError: If the index and cube do not match or the format is unknown
+        """
+        with open(os.path.join(path, INDEX_FILE), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("format_version") not in _READABLE_FORMAT_VERSIONS:
+            raise ValueError(f"Unsupported cube store format: {index.get('format_version')}")
+
+        cube = np.load(os.path.join(path, CUBE_FILE), mmap_mode=mode)
+        if list(cube.shape) != index["shape"] or cube.dtype.str != index["dtype"]:
+            raise ValueError(f"Cube {cube.shape}/{cube.dtype} does not match index {index['shape']}/{index['dtype']}")
+        return cls(path, cube, index)
+
+    @property
+    def shape(self) -> tuple:
+        """Return the cube shape (variables, events, times)."""
+        return self.cube.shape
+
+    def variable_index(self, name: str) -> int:
+        """Return the position of a variable on the variable axis."""
+        try:
+            return self._variable_index[name]
+        except KeyError:
+            raise KeyError(f"Unknown variable: {name}")
+
+    def event_index(self, event_id: str) -> int:
+        """Return the position of an event on the event axis."""
+        try:
+            return self._event_index[event_id]
+        except KeyError:
+            raise KeyError(f"Unknown event_id: {event_id}")
+
+    def time_index(self, time) -> int:
+        """Return the position of a time step on the time axis."""
+        key = pd.Timestamp(time).to_datetime64().astype("datetime64[s]").tolist()
+        try:
+            return self._time_index[key]
+        except KeyError:
+            raise KeyError(f"Unknown time: {time}")
+
+    def variable(self, name: str) -> np.ndarray:
+        """
+        Return one variable across all events and times, without loading it.
+
+        Args:
+            name: Variable name
+
+        Returns:
+            Memory-mapped (event, time) view, or a read-only all-NaN view
+            if the variable has never been written
+        """
+        i = self.variable_index(name)
+        if name not in self._filled:
+            return np.broadcast_to(np.array(np.nan, dtype=self.cube.dtype), self.cube.shape[1:])
+        return self.cube[i]
+
+    def writable_variable(self, name: str) -> np.ndarray:
+        """
+        Return one variable for writing in place, NaN-filling it on first use.
+
+        Write through this view (or write_frame) rather than through cube:
+        a variable written only through cube still reads as NaN.
+
+        Args:
+            name: Variable name
+
+        Returns:
+            Memory-mapped (event, time) view
+        """
+        i = self.variable_index(name)
+        if name not in self._filled:
+            self.cube[i] = np.nan
+            self.flush()
+            self._filled.add(name)
+            self._index["filled_variables"] = [v for v in self.variables if v in self._filled]
+            self._index["format_version"] = STORE_FORMAT_VERSION
+            _write_index(self.path, self._index)
+        return self.cube[i]
+
+    def sel(self, variable: str, event_id: Optional[str] = None, time=None) -> Union[np.ndarray, float]:
+        """
+        Select values of one variable by label.
+
+        Args:
+            variable: Variable name
+            event_id: Optional event ID (default: all events)
+            time: Optional time step (default: all times)
+
+        Returns:
+            (event, time), (time,) or (event,) memory-mapped view, or a scalar
+        """
+        view = self.variable(variable)
+        if event_id is not None:
+            view = view[self.event_index(event_id)]
+        if time is not None:
+            view = view[..., self.time_index(time)]
+        return view
+
+    def write_frame(self, frame: pd.DataFrame) -> int:
+        """
+        Write timeseries rows into the cube.
+        Rows are located by their event_id and time columns (e.g. the output
+        of TCEventTSCDM.to_typed_dataframe); every frame column that is a
+        store variable is written in one vectorized assignment. Null cells
+        are not written, so partial rows keep the values already stored and
+        all-null columns leave their variable unfilled.
+
+        Args:
+            frame: DataFrame with event_id, time and variable columns
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            ValueError: If an event_id or time is not on the store axes
+        """
+        event_ids = frame["event_id"].astype(str).to_numpy()
+        times = pd.to_datetime(frame["time"], format="ISO8601").to_numpy().astype("datetime64[s]")
+
+        events = pd.Index(self.event_ids).get_indexer(event_ids)
+        steps = pd.Index(self.times).get_indexer(times)
+        if (events < 0).any():
+            raise ValueError(f"Unknown event_id: {event_ids[np.argmax(events < 0)]}")
+        if (steps < 0).any():
+            raise ValueError(f"Unknown time: {times[np.argmax(steps < 0)]}")
+
+        for name in frame.columns:
+            if name in self._variable_index:
+                values = pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=self.cube.dtype, na_value=np.nan)
+                present = ~np.isnan(values)
+                if present.all():
+                    self.writable_variable(name)[events, steps] = values
+                elif present.any():
+                    self.writable_variable(name)[events[present], steps[present]] = values[present]
+        return len(frame)
+
+    def write_entries(self, entries: List[dict]) -> int:
+        """
+        Write mapped timeseries entries (as returned by create_tceventts_mapping) into the cube.
+
+        Args:
+            entries: List of mapped entries
+
+        Returns:
+            Number of entries written
+        """
+        return self.write_frame(TCEventTSCDM().to_typed_dataframe(entries))
+
+    def to_frame(self, event_id: str, variables: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Load the timeseries of one event as a DataFrame indexed by time.
+
+        Args:
+            event_id: Event ID
+            variables: Variables to load (default: all)
+
+        Returns:
+            DataFrame of shape (times, variables)
+        """
+        event = self.event_index(event_id)
+        variables = list(variables) if variables is not None else self.variables
+        data: Dict[str, np.ndarray] = {name: np.array(self.variable(name)[event]) for name in variables}
+        return pd.DataFrame(data, index=pd.DatetimeIndex(self.times, name="time"))
+
+    def flush(self) -> None:
+        """Flush pending writes to disk."""
+        if isinstance(self.cube, np.memmap):
+            self.cube.flush()
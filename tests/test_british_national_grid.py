@@ -0,0 +1,69 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the British National Grid <-> WGS84 conversion."""
+
+import numpy as np
+import pandas as pd
+
+from python.british_national_grid import (
+    HELMERT_ACCURACY_M,
+    OSTN15_TEST_POINTS,
+    check_control_points,
+    fill_property_coordinates,
+    format_grid_references,
+    parse_grid_references,
+    wgs84_to_grid,
+)
+
+
+def test_control_points_within_bounds():
+    errors = check_control_points()
+    assert errors["projection"] < 0.001
+    assert errors["round_trip"] < 0.01
+    assert errors["wgs84_to_grid"] < HELMERT_ACCURACY_M
+    assert errors["grid_to_wgs84"] < HELMERT_ACCURACY_M
+
+
+def test_ostn15_points_format_to_their_grid_squares():
+    _, lat, lon, easting, northing = map(np.array, zip(*OSTN15_TEST_POINTS))
+    # 1 km references are stable under the ~5 m Helmert error except right at a square edge
+    expected = format_grid_references(easting, northing, digits=4)
+    actual = format_grid_references(*wgs84_to_grid(lat, lon), digits=4)
+    near_edge = (np.minimum(easting % 1000, 1000 - easting % 1000) < 10) | \
+        (np.minimum(northing % 1000, 1000 - northing % 1000) < 10)
+    assert (actual == expected)[~near_edge].all()
+
+
+def test_grid_references_parse_and_format():
+    assert format_grid_references([651409.903], [313177.270]).tolist() == ["TG 51409 13177"]
+    assert format_grid_references([651409.903], [313177.270], digits=6).tolist() == ["TG 514 131"]
+    assert format_grid_references([-1.0, 700000.0], [0.0, 0.0]).tolist() == [None, None]
+    easting, northing = parse_grid_references(["TG 51409 13177", "tg514131", "TG", "XX 1 2", None,
+                                               "651409,313177", "HP 1 2"])
+    np.testing.assert_array_equal(easting, [651409, 651400, 600000, np.nan, np.nan, 651409, 410000])
+    np.testing.assert_array_equal(northing, [313177, 313100, 300000, np.nan, np.nan, 313177, 1220000])
+
+
+def test_fill_property_coordinates_fills_missing_side():
+    frame = pd.DataFrame({
+        "latitude": [51.4779, np.nan, np.nan],
+        "longitude": [-0.0015, np.nan, np.nan],
+        "british_national_grid": [None, "TG 51409 13177", "junk"],
+    })
+    assert fill_property_coordinates(frame) == {"latitude_longitude": 1, "british_national_grid": 1}
+    assert frame.loc[0, "british_national_grid"].startswith("TQ 388")
+    np.testing.assert_allclose(frame.loc[1, ["latitude", "longitude"]].astype(float), [52.658, 1.716], atol=1e-3)
+    assert np.isnan(frame.loc[2, "latitude"])
@@ -0,0 +1,102 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+"""Tests for the climate-adjusted LTV and expected-loss engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from python.climate_credit import UNMATCHED, ClimateLossEngine, HazardScenario
+
+PROPERTIES = pd.DataFrame({
+    "property_id": ["P1", "P2", "P2", None, "P4"],
+    "uprn": ["U1", "U2", "U3", "U9", "U4"],
+    "value": [300_000.0, 200_000.0, 999_999.0, 150_000.0, 400_000.0],
+    "region": ["North", "South", "South", "East", "North"],
+    "flood_zone": ["Zone 1", "Zone 3a", "Zone 3a", "Zone 2", "Zone 3b"],
+    "overall_flood_risk": ["Low", "High", "High", "Medium", "Very high"],
+    "floor_level_metres": [0.0, 0.5, 0.5, 0.0, 2.5],
+    "elevation": [10.0, 1.0, 1.0, 3.0, 0.5],
+})
+
+
+def test_join_falls_back_from_property_id_to_uprn():
+    mortgages = pd.DataFrame({
+        "PropertyID": ["P2", "P404", None, "P1", "P404"],
+        "UPRN": ["U1", "U9", "U4", None, "U0"],
+    })
+    # PropertyID wins over UPRN; duplicated keys use the first property; null keys never match
+    assert ClimateLossEngine.join(mortgages, PROPERTIES).tolist() == [1, 3, 4, 0, -1]
+    assert ClimateLossEngine.join(mortgages[["UPRN"]], PROPERTIES).tolist() == [0, 3, 4, -1, -1]
+
+
+def test_haircuts_combine_flood_floor_and_elevation():
+    scenario = HazardScenario("test", zone_haircuts={"Zone 3a": 0.1, "Zone 3b": 0.3},
+                              risk_haircuts={"High": 0.2, "Very high": 0.25}, floor_protection_m=1.0,
+                              low_elevation_m=2.0, low_elevation_haircut=0.05)
+    haircuts = ClimateLossEngine(scenarios=[HazardScenario("baseline"), scenario]).property_haircuts(PROPERTIES)
+    assert np.all(haircuts[:, 0] == 0.0)
+    # Larger of zone and risk haircut, scaled down by the floor level, then the low-elevation haircut
+    flood = max(0.1, 0.2) * (1.0 - 0.5 / 1.0)
+    assert haircuts[1, 1] == pytest.approx(1.0 - (1.0 - flood) * (1.0 - 0.05))
+    assert haircuts[0, 1] == 0.0
+    # Floor above the protection level removes the flood haircut, not the elevation one
+    assert haircuts[4, 1] == pytest.approx(0.05)
+
+
+def test_defaulted_loans_have_certain_default():
+    mortgages = pd.DataFrame({
+        "MortgageID": ["M1", "M2", "M3"],
+        "PropertyID": ["P2", "P2", "P2"],
+        "OutstandingBalance": [150_000.0, 150_000.0, 150_000.0],
+        "InArrearsFlag": [False, True, None],
+        "DefaultFlag": [False, None, True],
+    })
+    result = ClimateLossEngine().run(mortgages, PROPERTIES)
+    pd_ = result.probability_of_default
+    assert np.all(pd_[2] == 1.0)
+    assert np.all((pd_[0] > 0.0) & (pd_[0] < pd_[1]) & (pd_[1] < 1.0))
+    # Stressed scenarios raise the PD through the haircut and the multiplier
+    assert np.all(np.diff(pd_[0]) > 0)
+    assert result.expected_loss[2] == pytest.approx(result.loss_given_default[2] * 150_000.0)
+
+
+def test_aggregate_matches_groupby_of_long_frame():
+    rng = np.random.default_rng(20)
+    n = 300
+    mortgages = pd.DataFrame({
+        "MortgageID": [f"M{i}" for i in range(n)],
+        "PropertyID": rng.choice(["P1", "P2", "P4", "P404", None], n),
+        "UPRN": rng.choice(["U1", "U9", "U0"], n),
+        "OutstandingBalance": rng.uniform(50_000, 350_000, n),
+        "PurchaseValue": rng.uniform(100_000, 500_000, n),
+        "InArrearsFlag": rng.random(n) < 0.1,
+        "DefaultFlag": rng.random(n) < 0.05,
+    })
+    result = ClimateLossEngine().run(mortgages, PROPERTIES)
+    aggregate = result.aggregate(("region", "flood_zone"))
+
+    frame = result.to_frame()
+    frame[["region", "flood_zone"]] = frame[["region", "flood_zone"]].astype(object).fillna(UNMATCHED)
+    grouped = frame.groupby(["region", "flood_zone", "scenario"]).agg(
+        n_loans=("MortgageID", "size"), exposure=("exposure", "sum"), expected_loss=("expected_loss", "sum"))
+    assert UNMATCHED in grouped.index.get_level_values("region")
+    joined = aggregate.join(grouped, rsuffix="_groupby", how="outer")
+    assert len(joined) == len(aggregate) == len(grouped)
+    for name in ("n_loans", "exposure", "expected_loss"):
+        assert np.allclose(joined[name], joined[f"{name}_groupby"])
+    assert np.allclose(aggregate["loss_rate"], aggregate["expected_loss"] / aggregate["exposure"])
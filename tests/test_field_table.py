@@ -0,0 +1,74 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+"""Tests for the compiled CDM field table."""
+
+import numpy as np
+import pytest
+
+from python.flood_gauge_cdm import FloodGaugeCDM
+from python.mortgage_cdm import MortgageCDM
+from python.physical_risk_swap_cdm import PhysicalRiskSwapCDM
+from python.property_cdm import PropertyCDM
+from python.tc_event_cdm import TCEventCDM
+from python.tc_event_ts_cdm import TCEventTSCDM
+
+CDMS = [
+    (PropertyCDM, "create_property_mapping"),
+    (MortgageCDM, "create_mortgage_mapping"),
+    (FloodGaugeCDM, "create_gauge_mapping"),
+    (TCEventCDM, "create_event_mapping"),
+    (TCEventTSCDM, "create_tceventts_mapping"),
+    (PhysicalRiskSwapCDM, "create_swap_mapping"),
+]
+
+
+def random_record(fields, rng):
+    """Nested record over every schema field, with absent, None, falsy and set values and absent sections."""
+    record = {}
+    for spec in fields.fields:
+        draw = rng.random()
+        # Swap gauge baskets hold arrays and are covered by the GaugeBasket tests
+        if draw < 0.2 or "GaugeSet" in spec.section:
+            continue
+        node = record
+        for key in spec.section:
+            node = node.setdefault(key, {})
+        node[spec.name] = [None, 0, "", False, 1.5][int(rng.integers(5))] if draw < 0.5 else f"{spec.name}-value"
+    for key in list(record):
+        for section in list(record[key]):
+            if rng.random() < 0.1:
+                del record[key][section]
+    return record
+
+
+@pytest.mark.parametrize("cdm_class, method", CDMS)
+def test_compiled_mapper_matches_interpreted_map_record(cdm_class, method):
+    cdm = cdm_class()
+    fields = cdm._fields
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        record = random_record(fields, rng)
+        expected = {column: value for column, value in fields.map_record(record).items() if value is not None}
+        mapped = getattr(cdm, method)(record)
+        assert mapped == expected
+        assert list(mapped) == list(expected)
+
+
+def test_unmap_record_inverts_map_record():
+    fields = MortgageCDM()._fields
+    flat = {col.column: f"{col.column}-value" for col in fields.columns}
+    assert fields.map_record(fields.unmap_record(flat)) == flat
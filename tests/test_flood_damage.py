@@ -0,0 +1,89 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+"""Tests for the flood depth-damage engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from python.flood_damage import DEFAULT_CURVES, DEFAULT_FLOOR_FACTORS, DepthDamageCurve, FloodDamageEngine
+
+PROPERTIES = pd.DataFrame({
+    "property_id": ["P1", "P2", "P3", "P4", "P5"],
+    "value": [300_000.0, 250_000.0, 400_000.0, 200_000.0, None],
+    "ground_level_meters": [5.0, None, None, 4.0, 5.0],
+    "elevation": [99.0, 6.0, None, None, None],
+    "floor_level_metres": [0.3, 0.0, 0.5, None, 0.0],
+    "construction_type": ["Timber frame", "Stone", "Straw bale", None, "Brick and block"],
+    "floor_type": ["Suspended timber", None, "Solid concrete", "Unknown", "Mixed"],
+    "basement_present": [False, True, None, True, False],
+})
+
+
+def test_depth_is_water_level_above_floor_elevation():
+    engine = FloodDamageEngine()
+    ground, floor = engine.ground_and_floor_levels(PROPERTIES)
+    # ground_level_meters, then elevation, then the default ground level
+    assert ground.tolist() == [5.0, 6.0, 12.0, 4.0, 5.0]
+    assert floor.tolist() == pytest.approx([5.3, 6.0, 12.5, 4.0, 5.0])
+    result = engine.run(PROPERTIES, [6.0, 6.5, 12.0, np.nan, 5.2])
+    assert result.depth_m[:, 0] == pytest.approx([0.7, 0.5, -0.5, np.nan, 0.2], nan_ok=True)
+
+
+def test_curve_and_floor_factor_selection():
+    water = np.array([[6.0, 7.0], [6.5, 8.0], [13.5, 14.0], [5.0, 4.5], [5.6, 6.0]])
+    result = FloodDamageEngine(basement_ratio=0.0).run(PROPERTIES, water, scenarios=["RP100", "RP1000"])
+    depth = water - np.array([5.3, 6.0, 12.5, 4.0, 5.0])[:, None]
+    # Unknown and missing construction types use the default curve; unknown floor types a factor of 1
+    curves = ["Timber frame", "Stone", "Brick and block", "Brick and block", "Brick and block"]
+    factors = [DEFAULT_FLOOR_FACTORS["Suspended timber"], 1.0, DEFAULT_FLOOR_FACTORS["Solid concrete"], 1.0,
+               DEFAULT_FLOOR_FACTORS["Mixed"]]
+    expected = np.array([DEFAULT_CURVES[c](d) * f for c, d, f in zip(curves, depth, factors)])
+    assert result.damage_ratio == pytest.approx(expected)
+    assert result.scenarios == ["RP100", "RP1000"]
+
+
+def test_basement_uplift_applies_once_water_is_above_ground():
+    engine = FloodDamageEngine(basement_ratio=0.1)
+    without = FloodDamageEngine(basement_ratio=0.0)
+    # P2 (basement, ground 6.0) dry, at ground level and flooded; P4 (basement, ground 4.0) flooded
+    water = np.array([[np.nan] * 3, [5.9, 6.0, 6.4], [np.nan] * 3, [4.2, 4.2, 4.2], [np.nan] * 3])
+    uplift = engine.run(PROPERTIES, water).damage_ratio - without.run(PROPERTIES, water).damage_ratio
+    assert uplift == pytest.approx(np.array([[0, 0, 0], [0, 0, 0.1], [0, 0, 0], [0.1, 0.1, 0.1], [0, 0, 0]]))
+
+
+def test_loss_is_value_times_damage_ratio():
+    water = np.array([7.0, 7.5, 14.0, 6.0, 8.0])
+    result = FloodDamageEngine().run(PROPERTIES.to_dict("records"), water)
+    value = np.nan_to_num(PROPERTIES["value"].to_numpy(dtype=np.float64))
+    assert result.loss[:, 0] == pytest.approx(result.damage_ratio[:, 0] * value)
+    assert result.loss[4, 0] == 0.0
+    assert result.total_loss()["0"] == pytest.approx(result.loss.sum())
+    frame = result.to_frame()
+    assert frame["property_id"].tolist() == PROPERTIES["property_id"].tolist()
+    assert np.all((result.damage_ratio >= 0.0) & (result.damage_ratio <= 1.0))
+
+
+def test_curve_interpolates_and_rejects_bad_points():
+    curve = DepthDamageCurve("test", [0.0, 1.0, 2.0], [0.0, 0.4, 0.5])
+    assert curve(np.array([-0.5, 0.5, 1.5, 3.0, np.nan])).tolist() == pytest.approx([0.0, 0.2, 0.45, 0.5, 0.0])
+    with pytest.raises(ValueError):
+        DepthDamageCurve("bad", [0.0, 0.0], [0.0, 0.1])
+    with pytest.raises(ValueError):
+        DepthDamageCurve("bad", [0.0, 1.0], [0.0, 1.1])
+    with pytest.raises(ValueError):
+        FloodDamageEngine(default_curve="Straw bale")
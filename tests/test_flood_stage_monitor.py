@@ -0,0 +1,76 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+"""Tests for the streaming flood stage monitor."""
+
+import numpy as np
+import pandas as pd
+
+from python.flood_stage_monitor import FloodStageMonitor
+
+
+def naive_crossings(levels, triggers, hysteresis):
+    """Step one gauge's stage reading by reading: up through reached triggers, down through release levels."""
+    stage, crossings = 0, []
+    for n, level in enumerate(levels):
+        previous = stage
+        while stage < len(triggers) and level >= triggers[stage]:
+            stage += 1
+        while stage > 0 and level < triggers[stage - 1] - hysteresis:
+            stage -= 1
+        if stage != previous:
+            crossings.append((n, previous, stage))
+    return crossings
+
+
+def test_crossings_match_naive_loop_across_batches():
+    rng = np.random.default_rng(11)
+    n_gauges, n_readings, hysteresis = 12, 400, 0.1
+    triggers = np.sort(rng.uniform(1.0, 3.0, (n_gauges, 3)), axis=1)
+    levels = np.cumsum(rng.normal(0.0, 0.15, (n_gauges, n_readings)), axis=1) + 2.0
+    times = np.datetime64("2024-01-01T00:00", "ns") + np.arange(n_readings) * np.timedelta64(15, "m")
+    readings = pd.DataFrame({
+        'gauge_id': np.repeat([f"G{i}" for i in range(n_gauges)], n_readings),
+        'time': np.tile(times, n_gauges),
+        'level': levels.ravel(),
+    })
+
+    monitor = FloodStageMonitor([f"G{i}" for i in range(n_gauges)], triggers, hysteresis)
+    events = []
+    # Time slices arrive in order, their readings shuffled across gauges and times
+    for start in range(0, n_readings, 70):
+        batch = readings[readings['time'].isin(times[start:start + 70])].sample(frac=1.0, random_state=start)
+        events.append(monitor.process(batch['gauge_id'], batch['time'], batch['level']))
+    events = pd.concat(events, ignore_index=True)
+
+    expected = pd.DataFrame([(f"G{i}", times[n], levels[i, n], previous, stage)
+                             for i in range(n_gauges)
+                             for n, previous, stage in naive_crossings(levels[i], triggers[i], hysteresis)],
+                            columns=events.columns).astype(events.dtypes)
+    assert len(expected) > n_gauges
+    pd.testing.assert_frame_equal(events.sort_values(['gauge_id', 'time'], ignore_index=True),
+                                  expected.sort_values(['gauge_id', 'time'], ignore_index=True))
+
+
+def test_repeated_timestamps_and_unknown_indices_are_skipped():
+    monitor = FloodStageMonitor(["G0", "G1"], [[1.0, 2.0, 3.0], [1.0, 2.0, 3.0]], hysteresis=0.1)
+    time = np.datetime64("2024-01-01T00:00", "ns")
+    events = monitor.process([0, 0, 1, 2, -1], [time, time, time, time, time], [2.5, 0.5, 1.5, 3.5, 3.5])
+    assert events[['gauge_id', 'level', 'to_stage']].values.tolist() == [["G0", 2.5, 2], ["G1", 1.5, 1]]
+    assert monitor.readings_processed == 2 and monitor.readings_skipped == 3
+
+    events = monitor.process(["G0"], [time], [3.5])
+    assert events.empty and monitor.stage.tolist() == [2, 1]
@@ -0,0 +1,84 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+"""Tests for the cached nearest-gauge assignment."""
+
+import numpy as np
+import pandas as pd
+
+from python.gauge_assignment import GaugeAssigner
+from python.wind_field import haversine_km
+
+STATUSES = ["Fully operational", "Partially operational", "Closed"]
+
+
+def brute_force(properties, gauges, operational_statuses):
+    """Nearest eligible gauge of every property by a full distance matrix."""
+    eligible = gauges[gauges['operational_status'].isin(operational_statuses)
+                      & gauges['gauge_latitude'].notna()].reset_index(drop=True)
+    distance = haversine_km(properties['latitude'].to_numpy()[:, None], properties['longitude'].to_numpy()[:, None],
+                            eligible['gauge_latitude'].to_numpy()[None, :],
+                            eligible['gauge_longitude'].to_numpy()[None, :])
+    nearest = distance.argmin(axis=1)
+    return pd.DataFrame({'gauge_id': eligible['gauge_id'].to_numpy()[nearest],
+                         'distance_km': distance[np.arange(len(properties)), nearest]},
+                        index=pd.Index(properties['property_id'], name="property_id"))
+
+
+def test_assignments_match_brute_force_through_updates():
+    rng = np.random.default_rng(31)
+    n_gauges, n_properties = 150, 2000
+    gauges = pd.DataFrame({
+        'gauge_id': [f"G{i}" for i in range(n_gauges)],
+        'gauge_latitude': rng.uniform(50.5, 53.0, n_gauges),
+        'gauge_longitude': rng.uniform(-3.0, 1.0, n_gauges),
+        'operational_status': rng.choice(STATUSES, n_gauges, p=[0.7, 0.2, 0.1]),
+        'certification_status': "Fully certified",
+    })
+    properties = pd.DataFrame({
+        'property_id': [f"P{i}" for i in range(n_properties)],
+        'latitude': rng.uniform(50.5, 53.0, n_properties),
+        'longitude': rng.uniform(-3.0, 1.0, n_properties),
+    })
+    operational = STATUSES[:2]
+    assigner = GaugeAssigner(operational_statuses=operational)
+
+    def check():
+        actual = assigner.assign(properties)
+        expected = brute_force(properties, gauges, operational)
+        pd.testing.assert_series_equal(actual['gauge_id'], expected['gauge_id'], check_dtype=False)
+        np.testing.assert_allclose(actual['distance_km'], expected['distance_km'], rtol=1e-9)
+
+    assigner.update_gauges(gauges)
+    check()
+
+    # Move, close, reopen, drop and add gauges, and move some properties
+    gauges.loc[:9, ['gauge_latitude', 'gauge_longitude']] += rng.normal(0.0, 0.2, (10, 2))
+    reopened = gauges.index[gauges['operational_status'] == "Closed"][:5]
+    gauges.loc[10:19, 'operational_status'] = "Closed"
+    gauges.loc[reopened, 'operational_status'] = "Fully operational"
+    gauges = gauges.drop(index=range(20, 25))
+    gauges = pd.concat([gauges, pd.DataFrame({
+        'gauge_id': [f"N{i}" for i in range(20)],
+        'gauge_latitude': rng.uniform(50.5, 53.0, 20),
+        'gauge_longitude': rng.uniform(-3.0, 1.0, 20),
+        'operational_status': "Fully operational",
+        'certification_status': "Fully certified",
+    })], ignore_index=True)
+    assigner.update_gauges(gauges)
+    properties.loc[:99, ['latitude', 'longitude']] += rng.normal(0.0, 0.1, (100, 2))
+    check()
+    assert assigner.last_recomputed == 100
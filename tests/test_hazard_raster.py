@@ -0,0 +1,47 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the memory-mapped hazard raster sampler."""
+
+import numpy as np
+
+from python.hazard_raster import HazardRaster
+
+
+def make_raster(tmp_path, data):
+    return HazardRaster.create(str(tmp_path / "raster"), np.asarray(data, dtype=np.float32),
+                               origin_lat=2.0, origin_lon=0.0, pixel_deg=1.0, tile_size=2)
+
+
+def test_bilinear_and_nearest_agree_on_ties(tmp_path):
+    raster = make_raster(tmp_path, [[np.nan, np.nan], [np.nan, 500.0]])
+    # Midpoint of the four pixel centres, and midpoints of two pairs
+    lat, lon = np.array([1.0, 1.0, 0.5]), np.array([1.0, 0.5, 1.0])
+    nearest = raster.sample(lat, lon, method="nearest")
+    bilinear = raster.sample(lat, lon, method="bilinear")
+    np.testing.assert_array_equal(nearest, [500.0, np.nan, 500.0])
+    np.testing.assert_array_equal(np.isnan(bilinear), np.isnan(nearest))
+    assert bilinear[0] == 500.0
+
+
+def test_bilinear_matches_interpolation(tmp_path):
+    data = np.arange(16, dtype=np.float32).reshape(4, 4) * 10
+    raster = HazardRaster.create(str(tmp_path / "raster"), data, origin_lat=4.0, origin_lon=0.0,
+                                 pixel_deg=1.0, tile_size=2)
+    rng = np.random.default_rng(1)
+    row, col = rng.uniform(0, 3, 50), rng.uniform(0, 3, 50)
+    values = raster.sample(4.0 - (row + 0.5), col + 0.5)
+    # The raster is linear in row and column, so bilinear interpolation is exact
+    np.testing.assert_allclose(values, 40 * row + 10 * col, rtol=1e-6)
@@ -0,0 +1,130 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+"""Tests for the mortgage amortisation engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from python.mortgage_amortisation import SCHEDULE_ARRAYS, AmortisationEngine
+
+
+def annuity(balance, rate, periods, balloon=0.0):
+    """Closed-form level payment repaying balance down to balloon."""
+    discount = (1.0 + rate) ** -periods
+    return (balance - balloon * discount) * rate / (1.0 - discount)
+
+
+def loan(**columns):
+    base = {"OriginalLoan": [200_000.0], "OriginalTerm": [300], "OriginalLendingRate": [0.06]}
+    return pd.DataFrame(dict(base, **{name: [value] for name, value in columns.items()}))
+
+
+def test_repayment_loan_matches_closed_form_annuity():
+    schedule = AmortisationEngine(n_periods=360).project(loan())
+    r = 0.06 / 12
+    payment = annuity(200_000.0, r, 300)
+    assert schedule.payment[0, :300] == pytest.approx(np.full(300, payment))
+    assert schedule.interest[0].sum() == pytest.approx(300 * payment - 200_000.0)
+    assert schedule.principal[0].sum() == pytest.approx(200_000.0)
+    k = 120
+    expected = 200_000.0 * (1 + r) ** k - payment * ((1 + r) ** k - 1) / r
+    assert schedule.balance[0, k - 1] == pytest.approx(expected)
+    assert schedule.balance[0, 299] == pytest.approx(0.0, abs=1e-6)
+    assert np.all(schedule.payment[0, 300:] == 0.0)
+
+
+def test_interest_only_loan_repays_at_maturity():
+    schedule = AmortisationEngine(n_periods=360).project(loan(InterestOnlyPayment=True))
+    r = 0.06 / 12
+    assert schedule.interest[0, :300] == pytest.approx(np.full(300, 200_000.0 * r))
+    assert np.all(schedule.principal[0, :299] == 0.0)
+    assert schedule.principal[0, 299] == 200_000.0
+    assert schedule.balance[0, 299] == 0.0
+
+
+def test_balloon_loan_amortises_down_to_balloon():
+    schedule = AmortisationEngine(n_periods=300, balloon_fraction=0.3).project(loan(BalloonPayment=True))
+    r = 0.06 / 12
+    payment = annuity(200_000.0, r, 300, balloon=60_000.0)
+    assert schedule.payment[0, :299] == pytest.approx(np.full(299, payment))
+    assert schedule.payment[0, 299] == pytest.approx(payment + 60_000.0)
+    assert schedule.balance[0, 298] * (1 + r) - payment == pytest.approx(60_000.0)
+
+
+def test_rate_reset_recomputes_payment_on_remaining_balance():
+    engine = AmortisationEngine(n_periods=300)
+    schedule = engine.project(loan(OriginalLendingRate=0.03, InitialFixedTerm=24,
+                                   OriginalBoEBase=0.01, CurrentBoEBase=0.04))
+    fixed_payment = annuity(200_000.0, 0.03 / 12, 300)
+    assert schedule.payment[0, :24] == pytest.approx(np.full(24, fixed_payment))
+    # Reversion keeps the origination margin (3% - 1%) over the current base rate
+    reverted = annuity(schedule.balance[0, 23], 0.06 / 12, 276)
+    assert schedule.interest[0, 24] == pytest.approx(schedule.balance[0, 23] * 0.06 / 12)
+    assert schedule.payment[0, 24:] == pytest.approx(np.full(276, reverted))
+    assert schedule.balance[0, -1] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_overpayments_keep_payment_and_shorten_loan():
+    base = AmortisationEngine(n_periods=300).summary(loan(OverpaymentAllowance=0.1))
+    engine = AmortisationEngine(n_periods=300, overpayment_utilisation=1.0)
+    schedule = engine.project(loan(OverpaymentAllowance=0.1))
+    summary = engine.summary(loan(OverpaymentAllowance=0.1))
+    r = 0.06 / 12
+    payment = annuity(200_000.0, r, 300)
+    assert schedule.principal[0, 0] == pytest.approx(payment - 200_000.0 * r + 200_000.0 * 0.1 / 12)
+    assert base.loc[0, "repaid_period"] == 299
+    assert 0 < summary.loc[0, "repaid_period"] < 299
+    assert summary.loc[0, "total_interest"] < base.loc[0, "total_interest"]
+    assert summary.loc[0, "total_principal"] == pytest.approx(200_000.0)
+
+
+def test_weekly_loans_accrue_at_equivalent_monthly_rate():
+    terms = AmortisationEngine().loan_terms(loan(PaymentFrequency="Weekly"))
+    assert terms["fixed_rate"][0] == pytest.approx((1 + 0.06 / 52) ** (52 / 12) - 1)
+
+
+def test_chunked_summary_matches_full_projection():
+    rng = np.random.default_rng(19)
+    n = 400
+    loans = pd.DataFrame({
+        "OriginalLoan": rng.uniform(50_000, 500_000, n),
+        "OriginalTerm": rng.choice([120, 240, 300, 420], n),
+        "OriginalLendingRate": rng.uniform(0.0, 0.07, n),
+        "InitialFixedTerm": rng.choice([0, 24, 60], n),
+        "OriginalBoEBase": rng.uniform(0.0, 0.02, n),
+        "CurrentBoEBase": rng.uniform(0.0, 0.05, n),
+        "InterestOnlyPayment": rng.random(n) < 0.2,
+        "BalloonPayment": rng.random(n) < 0.1,
+        "OverpaymentAllowance": rng.choice([0.0, 0.1], n),
+        "PaymentFrequency": rng.choice(["Monthly", "Biweekly", "Weekly"], n),
+    })
+    loans.loc[::37, "OriginalLoan"] = np.nan
+    engine = AmortisationEngine(n_periods=360, memory_budget_mb=0.5, overpayment_utilisation=0.5)
+    assert engine.chunk_rows < n
+
+    full = engine.project(loans)
+    summary = engine.summary(loans)
+    assert np.allclose(summary["total_interest"], full.interest.sum(axis=1), equal_nan=True)
+    assert np.allclose(summary["total_principal"], full.principal.sum(axis=1), equal_nan=True)
+    assert np.allclose(summary["final_balance"], full.balance[:, -1], equal_nan=True)
+    repaid = full.balance <= 0.0
+    assert np.array_equal(summary["repaid_period"], np.where(repaid.any(axis=1), repaid.argmax(axis=1), -1))
+
+    for rows, schedule in engine.iter_schedules(loans):
+        for name in SCHEDULE_ARRAYS:
+            assert np.array_equal(getattr(schedule, name), getattr(full, name)[rows], equal_nan=True)
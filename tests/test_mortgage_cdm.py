@@ -0,0 +1,113 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the Mortgage CDM."""
+
+import numpy as np
+import pandas as pd
+
+from python.mortgage_cdm import MortgageCDM
+
+# validate_mortgage message fragments and the batch error code they correspond to
+RULE_MESSAGES = {
+    'Original LTV mismatch': 'ORIGINAL_LTV_MISMATCH',
+    'Current LTV mismatch': 'CURRENT_LTV_MISMATCH',
+    'Buy-to-Let mortgage': 'BTL_PRIMARY_RESIDENCE',
+    'Shared Ownership mortgages': 'SHARED_OWNERSHIP_SHARE',
+    'seems young for retirement': 'RETIRED_UNDER_55',
+    'exceeds reasonable working years': 'EMPLOYMENT_YEARS_EXCEED_AGE',
+    'DefaultFlag is True': 'DEFAULT_FLAG_NOT_DEFAULTED',
+    "LatestStatus is 'Defaulted'": 'DEFAULTED_WITHOUT_FLAG',
+}
+
+
+def record_codes(errors):
+    """Translate validate_mortgage errors into batch error codes."""
+    codes = set()
+    for section, messages in errors.items():
+        for message in messages:
+            if message.startswith("Missing required field: "):
+                codes.add(f"MISSING_{message.split(': ')[1]}")
+            elif message.startswith("Invalid value for "):
+                name = message[len("Invalid value for "):].split(':')[0]
+                codes.add(f"INVALID_{name}" if '.' in name else f"INVALID_Application.{name}")
+            else:
+                codes.update(code for fragment, code in RULE_MESSAGES.items() if fragment in message)
+    return codes
+
+
+def strip_none(node):
+    return {key: strip_none(value) if isinstance(value, dict) else value
+            for key, value in node.items() if value is not None}
+
+
+def random_portfolio(cdm, rng, n_rows):
+    """Flat mapping columns mixing valid, invalid and missing values for every batch check."""
+    def pick(values, n=n_rows):
+        values = list(values)
+        return [values[i] for i in rng.integers(0, len(values), n)]
+
+    purchase_value = pick([None, 0, 250_000.0, 400_000.0])
+    original_loan = pick([None, 0, 200_000.0, 300_000.0])
+    balance = pick([None, 150_000.0, 180_000.0])
+    columns = {
+        'MortgageID': pick(["M1", "", None]),
+        'PropertyID': pick(["P1", "", None]),
+        'UPRN': pick(["100023336956", None]),
+        'OriginalLTV': [None if loan is None or not value or i % 7 == 0 else loan / value + (0.05 if i % 5 == 0 else 0.0)
+                        for i, (loan, value) in enumerate(zip(original_loan, purchase_value))],
+        'CurrentLTV': pick([None, 0.45, 0.6, 0.72]),
+        'SharedOwnershipShare': pick([None, 0, 0.5, 1.0, 1.5]),
+        'BorrowerAge': pick([None, 0, 30, 50, 70]),
+        'BorrowerEmployment': pick([None, "Employed", "Retired"]),
+        'YearsInCurrentEmployment': pick([None, 0, 10, 40]),
+        'DefaultFlag': pick([None, True, False]),
+        'PurchaseValue': purchase_value,
+        'OriginalLoan': original_loan,
+        'OutstandingBalance': balance,
+    }
+    for section in cdm._BATCH_MENU_SECTIONS:
+        for spec in cdm._fields.menu_fields(f"Mortgage.{section}"):
+            columns[spec.name] = pick(list(spec.options) * 2 + ["Bogus", None])
+    return columns
+
+
+def test_batch_validation_matches_per_record_validation():
+    cdm = MortgageCDM()
+    columns = random_portfolio(cdm, np.random.default_rng(41), 3000)
+    batch = cdm.validate_mortgages_batch(pd.DataFrame(columns))
+    assert list(batch.columns) == cdm.batch_error_codes()
+    # Every check fires on some rows and passes on others
+    assert batch.any().all() and not batch.all().any()
+
+    for i, values in enumerate(zip(*columns.values())):
+        row = dict(zip(columns, values))
+        errors = cdm.validate_mortgage(strip_none(cdm._fields.unmap_record(row)))
+        assert record_codes(errors) == set(batch.columns[batch.iloc[i].to_numpy()]), (i, errors)
+
+
+def test_validate_field_value_accepts_nested_subsections():
+    cdm = MortgageCDM()
+    assert cdm.validate_field_value('Revaluation', 'Revaluation1', {})
+    assert cdm.validate_field_value('Regulatory', 'HMDA', {})
+    assert not cdm.validate_field_value('Revaluation', 'NotAField', {})
+
+
+def test_section_fields_and_menu_options_are_mutable_copies():
+    cdm = MortgageCDM()
+    fields = cdm.get_section_fields('CurrentStatus')
+    assert type(fields) is dict
+    assert isinstance(fields['LatestStatus']['options'], list)
+    assert cdm.get_menu_options('CurrentStatus', 'LatestStatus') == fields['LatestStatus']['options']
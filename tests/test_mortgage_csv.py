@@ -0,0 +1,82 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the chunked mortgage portfolio CSV feed loader."""
+
+import io
+import os
+
+from python.mortgage_csv import FEED_UNSUPPORTED_CODES, MortgageFeedLoader
+
+FEED_HEADER = os.path.join(os.path.dirname(__file__), "..", "mortgage", "mortgage-portfolio-csv.txt")
+
+ROW = {
+    'snapshot_date': "2024-12-31", 'encrypted_loan_id': "L0000000001", 'encrypted_member_id': "M0000000001",
+    'disbursal_date': "2018-03-15", 'original_loan_amount': "200000", 'term': "300",
+    'lending_rate': "0.045", 'spread': "0.012", 'rate_type': "Fixed", 'maturity_date': "2043-03-15",
+    'principal_collected': "40000", 'interest_collected': "30000", 'total_number_of_payments': "81",
+    'last_payment_date': "2024-12-01", 'outstanding_balance': "160000", 'latest_status': "Current",
+    'date_of_default': "", 'is_in_arrears': "N", 'days_past_due': "0", 'default_flag': "N",
+    'purchase_value': "250000", 'current_property_value': "290000", 'ltv_ratio': "0.64",
+    'property_type': "Detached", 'flood_risk_zone': "2", 'flood_risk_score': "3.5", 'eps_score': "60",
+    'property_address': "1 High Street", 'city': "York", 'state_province': "England",
+    'zip_postal_code': "YO1 7HH", 'country': "GB", 'latitude': "53.96", 'longitude': "-1.08",
+    'borrower_credit_score': "720", 'borrower_income': "55000", 'borrower_employment_status': "Employed",
+    'marital_status': "Married", 'boe_base_rate': "0.0475", 'prepayment_risk': "3", 'refinance_incentive': "2",
+}
+
+
+def feed(*rows: dict) -> io.StringIO:
+    """Return a feed file in the mortgage-portfolio-csv.txt layout with the given rows."""
+    with open(FEED_HEADER, encoding="utf-8") as f:
+        header = f.readline().strip().split(",")
+    lines = [",".join(header)] + [",".join(f'"{row[column]}"' for column in header) for row in rows]
+    return io.StringIO("\n".join(lines) + "\n")
+
+
+def load(loader: MortgageFeedLoader, source: io.StringIO):
+    frames, errors = zip(*loader.iter_chunks(source))
+    return frames[0], errors[0]
+
+
+def test_valid_feed_row_survives_drop_invalid():
+    frame, errors = load(MortgageFeedLoader(drop_invalid=True), feed(ROW))
+    assert len(frame) == 1
+    assert frame['MortgageID'].iloc[0] == "L0000000001"
+    assert not set(FEED_UNSUPPORTED_CODES) & set(errors.columns)
+
+
+def test_ignore_codes_none_keeps_every_code():
+    frame, errors = load(MortgageFeedLoader(ignore_codes=None), feed(ROW))
+    assert errors.loc[0, list(FEED_UNSUPPORTED_CODES)].all()
+
+
+def test_malformed_date_and_flag_are_reported_per_row():
+    bad_date = dict(ROW, encrypted_loan_id="L0000000002", disbursal_date="2020-13-45")
+    bad_flag = dict(ROW, encrypted_loan_id="L0000000003", is_in_arrears="maybe")
+    frame, errors = load(MortgageFeedLoader(), feed(ROW, bad_date, bad_flag))
+    assert len(frame) == 3
+    assert errors['INVALID_DisbursalDate'].tolist() == [False, True, False]
+    assert errors['INVALID_InArrearsFlag'].tolist() == [False, False, True]
+    assert frame['DisbursalDate'].isna().tolist() == [False, True, False]
+
+    frame, _ = load(MortgageFeedLoader(drop_invalid=True), feed(ROW, bad_date, bad_flag))
+    assert frame['MortgageID'].tolist() == ["L0000000001"]
+
+
+def test_invalid_menu_value_is_reported():
+    bad_status = dict(ROW, latest_status="Lost")
+    _, errors = load(MortgageFeedLoader(), feed(ROW, bad_status))
+    assert errors['INVALID_CurrentStatus.LatestStatus'].tolist() == [False, True]
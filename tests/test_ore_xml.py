@@ -0,0 +1,104 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the streaming ORE portfolio XML importer and exporter."""
+
+import os
+
+from python.ore_xml import (
+    TRADE_ID_FORMAT,
+    iter_swap_records,
+    iter_swap_records_parallel,
+    swap_mapping_to_xml,
+    write_swap_portfolio,
+    write_swap_portfolio_parallel,
+)
+from python.physical_risk_swap_cdm import PhysicalRiskSwapCDM
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "..", "physicalriskswap",
+                      "Index_Credit_Default_Swap_Bespoke_Basket.xml")
+
+
+def test_mapped_records_keep_trade_id():
+    records = list(iter_swap_records(SAMPLE))
+    mappings = list(iter_swap_records(SAMPLE, mapped=True))
+    assert [m["trade_id"] for m in mappings] == [r["TradeId"] for r in records]
+    assert all(m["trade_id"] for m in mappings)
+
+
+def test_parallel_mapped_records_keep_trade_id():
+    expected = [r["TradeId"] for r in iter_swap_records(SAMPLE)]
+    mappings = list(iter_swap_records_parallel(SAMPLE, max_workers=1, shard_bytes=256, mapped=True))
+    assert [m["trade_id"] for m in mappings] == expected
+
+
+def _renamed(mappings, prefix):
+    return [dict(mapping, trade_id=f"{prefix}{i}") for i, mapping in enumerate(mappings)]
+
+
+def test_export_round_trip_keeps_trade_ids(tmp_path):
+    mappings = _renamed(list(iter_swap_records(SAMPLE, mapped=True)) * 3, "TRADE_")
+    path = str(tmp_path / "portfolio.xml")
+    assert write_swap_portfolio(path, mappings) == len(mappings)
+    assert list(iter_swap_records(path, mapped=True)) == mappings
+
+
+def test_parallel_export_round_trip_keeps_trade_ids(tmp_path):
+    mappings = _renamed(list(iter_swap_records(SAMPLE, mapped=True)) * 5, "TRADE_")
+    path = str(tmp_path / "portfolio.xml")
+    write_swap_portfolio_parallel(path, mappings, max_workers=1, shard_size=2)
+    assert list(iter_swap_records(path, mapped=True)) == mappings
+
+
+def test_export_numbers_trades_without_id(tmp_path):
+    mapping, = iter_swap_records(SAMPLE, mapped=True)
+    del mapping["trade_id"]
+    path = str(tmp_path / "portfolio.xml")
+    write_swap_portfolio(path, [mapping, mapping])
+    assert [r["TradeId"] for r in iter_swap_records(path)] == [TRADE_ID_FORMAT.format(0), TRADE_ID_FORMAT.format(1)]
+
+
+def test_export_writes_gauge_index_and_skips_absent_payouts():
+    mapping = {"trade_type": "PhysicalRiskSwap", "gauge_basket_size": 40,
+               "gauge_1_index": 7, "gauge_1_id": "G7", "gauge_1_payout_severe_flood": 2.5e5,
+               "gauge_2_index": 3, "gauge_2_id": "G3"}
+    xml = swap_mapping_to_xml(mapping, "TRADE_0")
+    assert "<GaugeBasketSize>40</GaugeBasketSize>" in xml
+    assert xml.count("<GaugeIndex>") == 2 and "<GaugeIndex>7</GaugeIndex>" in xml and "<GaugeIndex>3</GaugeIndex>" in xml
+    assert xml.count("<Notional>") == 1
+
+
+def test_export_round_trip_keeps_gauge_basket(tmp_path):
+    cdm = PhysicalRiskSwapCDM()
+    mapping = cdm.create_swap_mapping({"PhysicalSwap": {
+        "Header": {"TradeType": "PhysicalRiskSwap", "CounterParty": "CP1"},
+        "GaugeSet": {"GaugeBasketSize": 40, "Gauges": {
+            "GaugeIndex": [7, 3, 12], "GaugeID": ["G7", "G3", "G12"], "PayoutSevereFlood": [2.5e5, None, 1e5]}},
+    }})
+    mapping["trade_id"] = "TRADE_0"
+    path = str(tmp_path / "portfolio.xml")
+    write_swap_portfolio(path, [mapping])
+
+    record, = iter_swap_records(path)
+    assert record["PhysicalSwap"]["GaugeSet"] == {"GaugeBasketSize": 40, "Gauges": {
+        "GaugeIndex": [7, 3, 12], "GaugeID": ["G7", "G3", "G12"], "PayoutSevereFlood": [2.5e5, None, 1e5]}}
+    assert list(iter_swap_records(path, mapped=True)) == [mapping]
+
+
+def test_import_numbers_gauges_without_index():
+    record, = iter_swap_records(SAMPLE)
+    gauges = record["PhysicalSwap"]["GaugeSet"]["Gauges"]
+    assert gauges["GaugeIndex"] == [1, 2, 3]
+    assert record["PhysicalSwap"]["GaugeSet"]["GaugeBasketSize"] == 3
@@ -0,0 +1,68 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+"""Tests for the parallel CDM executor."""
+
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from python.mortgage_cdm import MortgageCDM
+from python.parallel import ParallelCDMExecutor
+
+
+def mortgage_records(n_rows, seed=5):
+    """Flat mortgage records, some valid and some failing validation."""
+    cdm = MortgageCDM()
+    rng = np.random.default_rng(seed)
+    records = []
+    for i in range(n_rows):
+        value = float(rng.choice([250_000.0, 400_000.0]))
+        loan = float(rng.choice([200_000.0, 300_000.0]))
+        row = {
+            'MortgageID': f"M{i}",
+            'PropertyID': f"P{i}" if i % 11 else "",
+            'PurchaseValue': value,
+            'OriginalLoan': loan,
+            'OriginalLTV': loan / value + (0.05 if i % 5 == 0 else 0.0),
+            'BorrowerAge': int(rng.integers(20, 80)),
+            'DefaultFlag': bool(i % 3 == 0),
+        }
+        records.append(cdm._fields.unmap_record(row))
+    return records
+
+
+def test_spawned_workers_match_serial_run_in_order():
+    cdm = MortgageCDM()
+    records = mortgage_records(250)
+    serial_errors = [cdm.validate_mortgage(record) for record in records]
+    serial_mappings = [cdm.create_mortgage_mapping(record) for record in records]
+    # Validation results differ between records, so any reordering would show
+    assert len({str(errors) for errors in serial_errors}) > 1
+
+    with ParallelCDMExecutor('mortgage', max_workers=2, chunk_size=7, max_pending=3,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        assert executor.map('validate_mortgage', records) == serial_errors
+        assert list(executor.imap('create_mortgage_mapping', iter(records))) == serial_mappings
+
+
+def test_rejects_unknown_cdm_and_method():
+    with pytest.raises(ValueError):
+        ParallelCDMExecutor('not_a_cdm')
+    with ParallelCDMExecutor('mortgage', max_workers=1) as executor:
+        with pytest.raises(ValueError):
+            executor.map('not_a_method', [])
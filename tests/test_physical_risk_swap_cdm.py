@@ -0,0 +1,114 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+"""Tests for the physical risk swap CDM gauge baskets."""
+
+import numpy as np
+
+from python.physical_risk_swap_cdm import GaugeBasket, PhysicalRiskSwapCDM
+
+HEADER = {"TradeType": "PhysicalRiskSwap", "CounterParty": "CP1", "PartyId": "P1"}
+
+
+def random_entries(rng, n_gauges):
+    """Legacy Gauge{i} entries in slot order, some with missing or invalid values."""
+    entries = []
+    for i in range(1, n_gauges + 1):
+        entry = {"GaugeIndex": i, "GaugeID": f"G{i}", "PayoutSevereFlood": float(rng.integers(1, 100)) * 1e4}
+        if rng.random() < 0.2:
+            entry["GaugeIndex"] = [0, "x"][int(rng.integers(2))]
+        if rng.random() < 0.2:
+            entry["GaugeID"] = ""
+        if rng.random() < 0.2:
+            entry["PayoutSevereFlood"] = "n/a"
+        entries.append(entry)
+    return entries
+
+
+def swaps(entries, basket_size):
+    """The same basket as a legacy keyed swap and as an array-layout swap."""
+    keyed = {f"Gauge{i}": entry for i, entry in enumerate(entries, 1)}
+    arrays = {field: [entry[field] for entry in entries] for field in ("GaugeIndex", "GaugeID", "PayoutSevereFlood")}
+    return ({"PhysicalSwap": {"Header": HEADER, "GaugeSet": {"GaugeBasketSize": basket_size, **keyed}}},
+            {"PhysicalSwap": {"Header": HEADER, "GaugeSet": {"GaugeBasketSize": basket_size, "Gauges": arrays}}})
+
+
+def test_array_layout_maps_and_validates_like_legacy_layout():
+    rng = np.random.default_rng(14)
+    cdm = PhysicalRiskSwapCDM(gauge_basket_size=12)
+    for _ in range(50):
+        legacy, array = swaps(random_entries(rng, int(rng.integers(1, 13))), 12)
+        assert cdm.create_swap_mapping(array) == cdm.create_swap_mapping(legacy)
+        assert cdm.validate_swap(array) == cdm.validate_swap(legacy)
+
+
+def test_gauge_basket_round_trips_through_legacy_layouts():
+    rng = np.random.default_rng(15)
+    cdm = PhysicalRiskSwapCDM(gauge_basket_size=12)
+    entries = [{"GaugeIndex": i, "GaugeID": f"G{i}", "PayoutSevereFlood": float(rng.integers(1, 100)) * 1e4}
+               for i in range(1, 10)]
+    legacy, array = swaps(entries, 12)
+
+    basket = cdm.create_gauge_basket(array)
+    keyed = GaugeBasket.from_record(legacy["PhysicalSwap"]["GaugeSet"])
+    mapped = GaugeBasket.from_mapping(cdm.create_swap_mapping(legacy))
+    for other in (keyed, mapped):
+        np.testing.assert_array_equal(other.indices, basket.indices)
+        np.testing.assert_array_equal(other.gauge_ids, basket.gauge_ids)
+        np.testing.assert_array_equal(other.payouts, basket.payouts)
+
+    assert basket.to_keyed() == {f"Gauge{i}": entry for i, entry in enumerate(entries, 1)}
+    assert basket.to_record() == array["PhysicalSwap"]["GaugeSet"]["Gauges"]
+    mapping = cdm.create_swap_mapping(legacy)
+    assert basket.to_mapping() == {column: value for column, value in mapping.items() if column[:6] == "gauge_"
+                                   and column[6].isdigit()}
+
+
+def test_gauge_basket_drops_missing_values():
+    basket = GaugeBasket.from_keyed({"Gauge1": {"GaugeID": "G1"}, "Gauge3": {"GaugeIndex": "3", "PayoutSevereFlood": "x"}})
+    assert basket.indices.tolist() == [0, 3]
+    assert basket.gauge_ids.tolist() == ["G1", None]
+    assert np.isnan(basket.payouts).all()
+    assert basket.to_keyed() == {"Gauge1": {"GaugeID": "G1"}, "Gauge2": {"GaugeIndex": 3}}
+
+
+def test_ndarray_basket_larger_than_legacy_slots():
+    cdm = PhysicalRiskSwapCDM()
+    n_gauges = 5000
+    gauges = {"GaugeIndex": np.arange(1, n_gauges + 1), "GaugeID": np.array([f"G{i}" for i in range(n_gauges)]),
+              "PayoutSevereFlood": np.full(n_gauges, 2.5e4)}
+    swap = {"PhysicalSwap": {"Header": HEADER, "GaugeSet": {"GaugeBasketSize": np.int64(n_gauges), "Gauges": gauges}}}
+
+    assert cdm.validate_swap(swap) == {}
+    mapping = cdm.create_swap_mapping(swap)
+    assert mapping[f"gauge_{n_gauges}_index"] == n_gauges
+    assert mapping[f"gauge_{n_gauges}_id"] == f"G{n_gauges - 1}"
+    assert mapping["gauge_1_payout_severe_flood"] == 2.5e4
+    basket = cdm.create_gauge_basket(swap)
+    assert len(basket) == n_gauges and basket.payouts.sum() == n_gauges * 2.5e4
+    np.testing.assert_array_equal(GaugeBasket.from_mapping(mapping).indices, gauges["GaugeIndex"])
+
+    gauges["GaugeIndex"] = gauges["GaugeIndex"][:-1]
+    assert cdm.validate_swap(swap) == {"GaugeSet": ["Gauges arrays must have the same length",
+                                                    f"Missing GaugeIndex for Gauge{n_gauges}"]}
+
+
+def test_keyed_gauge_index_accepts_numpy_integers():
+    cdm = PhysicalRiskSwapCDM()
+    gauge_set = {"Gauge1": {"GaugeIndex": np.int64(4), "GaugeID": "G4"},
+                 "Gauge2": {"GaugeIndex": np.int32(0), "GaugeID": "G0"}}
+    errors = cdm.validate_swap({"PhysicalSwap": {"Header": HEADER, "GaugeSet": gauge_set}})
+    assert errors == {"GaugeSet": ["Invalid GaugeIndex for Gauge2 - must be positive integer"]}
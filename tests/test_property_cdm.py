@@ -0,0 +1,30 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the Property CDM."""
+
+from python.property_cdm import PropertyCDM
+
+
+def test_get_field_info_returns_plain_dicts_and_lists():
+    info = PropertyCDM().get_field_info('PropertyHeader.Header.propertyType')
+    assert type(info) is dict
+    assert info['options'] == ['residential', 'commercial', 'industrial']
+    section = PropertyCDM().get_field_info('PropertyHeader.Header')
+    assert type(section) is dict and type(section['propertyType']) is dict
+
+
+def test_get_field_info_reports_unknown_paths():
+    assert 'error' in PropertyCDM().get_field_info('PropertyHeader.Nope')
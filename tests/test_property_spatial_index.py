@@ -0,0 +1,78 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+"""Tests for the grid spatial index over property coordinates."""
+
+import numpy as np
+
+from python.property_spatial_index import PropertySpatialIndex
+from python.wind_field import haversine_km
+
+
+def build_index(rng, n_points=3000):
+    """Index random points in two batches, leaving the second in the delta segment."""
+    lat = rng.uniform(51.0, 52.0, n_points)
+    lon = rng.uniform(-1.0, 0.5, n_points)
+    lat[::97] = np.nan
+    split = n_points * 9 // 10
+    index = PropertySpatialIndex.from_arrays([f"P{i}" for i in range(split)], lat[:split], lon[:split], cell_deg=0.02)
+    index.merge_fraction = 1.0
+    index.add([f"P{i}" for i in range(split, n_points)], lat[split:], lon[split:])
+    return index, lat, lon
+
+
+def test_radius_and_knn_match_brute_force():
+    rng = np.random.default_rng(21)
+    index, lat, lon = build_index(rng)
+    query_lat, query_lon = rng.uniform(50.95, 52.05, 200), rng.uniform(-1.05, 0.55, 200)
+    radius = rng.uniform(0.5, 8.0, 200)
+    distance = haversine_km(query_lat[:, None], query_lon[:, None], lat[None, :], lon[None, :])
+    distance = np.where(np.isnan(distance), np.inf, distance)
+
+    result = index.query_radius(query_lat, query_lon, radius, sort=True)
+    for i in range(len(query_lat)):
+        # Points within a micrometre of the radius may fall either way
+        certain = np.abs(distance[i] - radius[i]) > 1e-9
+        expected = np.flatnonzero(certain & (distance[i] <= radius[i]))
+        matched = result[i][certain[result[i]]]
+        np.testing.assert_array_equal(np.sort(matched), expected)
+        np.testing.assert_allclose(result.distances_km[result.offsets[i]:result.offsets[i + 1]],
+                                   distance[i, result[i]], rtol=1e-9, atol=1e-9)
+        assert np.all(np.diff(distance[i, result[i]]) >= -1e-9)
+
+    rows, knn_distance = index.query_knn(query_lat, query_lon, k=5)
+    np.testing.assert_allclose(knn_distance, np.sort(distance, axis=1)[:, :5], rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(np.take_along_axis(distance, rows, axis=1), knn_distance, rtol=1e-9, atol=1e-9)
+
+
+def test_polygon_matches_brute_force():
+    rng = np.random.default_rng(22)
+    index, lat, lon = build_index(rng)
+    outer = [(51.1, -0.9), (51.9, -0.7), (51.8, 0.4), (51.3, 0.2), (51.5, -0.3)]
+    hole = [(51.4, -0.5), (51.6, -0.5), (51.6, -0.2), (51.4, -0.2)]
+
+    def inside(y, x, rings):
+        # Even-odd rule, one point and one edge at a time
+        count = 0
+        for ring in rings:
+            for (y0, x0), (y1, x1) in zip(ring, ring[1:] + ring[:1]):
+                if (y0 > y) != (y1 > y) and x < x0 + (y - y0) * (x1 - x0) / (y1 - y0):
+                    count += 1
+        return count % 2 == 1
+
+    expected = [row for row in range(len(lat)) if not np.isnan(lat[row]) and inside(lat[row], lon[row], [outer, hole])]
+    assert len(expected) > 100
+    np.testing.assert_array_equal(index.query_polygon([outer, hole]), expected)
@@ -0,0 +1,99 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the incremental FloodGauge SensorStats aggregator."""
+
+import numpy as np
+
+from python.sensor_stats import SensorStatsAggregator
+
+GAUGE = {
+    'gauge_id': 'G1',
+    'severe_flood_warning': 3.0,
+    'historical_high_level': 4.2,
+    'historical_high_date': '2022-12-31',
+    'last_date_level_exceed_level3': '2023-01-01',
+    'frequency_exceed_level3': 3,
+}
+
+
+def test_seeded_frequency_survives_readings_below_level3():
+    aggregator = SensorStatsAggregator.from_gauge_mappings([GAUGE])
+    aggregator.update('G1', '2024-06-01', 1.5)
+    record, = aggregator.updated_records()
+    assert record['frequency_exceed_level3'] == 3
+    assert record['last_date_level_exceed_level3'] == '2023-01-01'
+
+
+def test_seeded_frequency_adds_new_exceedances():
+    aggregator = SensorStatsAggregator.from_gauge_mappings([GAUGE])
+    aggregator.update_many(['G1'] * 3, ['2024-06-01', '2024-06-02', '2024-06-03'], [3.5, 2.0, 3.1])
+    assert aggregator.sensor_stats('G1')['frequency_exceed_level3'] == 5
+
+
+def test_seeded_frequency_expires_with_window():
+    aggregator = SensorStatsAggregator.from_gauge_mappings([GAUGE])
+    aggregator.update('G1', '2027-06-01', 3.5)
+    aggregator.update('G1', '2028-06-01', 1.0)
+    # 2023-01-01 has left the 5-year window ending 2028-06-01; the 2027 exceedance has not
+    assert aggregator.sensor_stats('G1')['frequency_exceed_level3'] == 1
+
+
+def test_seeded_frequency_expires_at_as_of():
+    aggregator = SensorStatsAggregator.from_gauge_mappings([GAUGE])
+    aggregator.update('G1', '2024-06-01', 1.5)
+    assert aggregator.sensor_stats('G1', as_of='2027-12-31')['frequency_exceed_level3'] == 3
+    assert aggregator.sensor_stats('G1', as_of='2028-06-01')['frequency_exceed_level3'] == 0
+
+
+def test_seeded_frequency_survives_save_and_load(tmp_path):
+    aggregator = SensorStatsAggregator.from_gauge_mappings([GAUGE])
+    aggregator.update('G1', '2024-06-01', 1.5)
+    path = str(tmp_path / "state.json")
+    aggregator.save(path)
+    restored = SensorStatsAggregator.load(path)
+    assert restored.sensor_stats('G1') == aggregator.sensor_stats('G1')
+
+
+def test_frequency_matches_naive_window_count():
+    rng = np.random.default_rng(7)
+    times = np.sort(rng.choice(np.arange(20 * 365), 2000, replace=False)).astype('datetime64[D]')
+    times = (np.datetime64('2000-01-01') + times.astype('timedelta64[D]')).astype('datetime64[ns]')
+    levels = rng.uniform(0.0, 4.0, len(times))
+    aggregator = SensorStatsAggregator.from_gauge_mappings([{'gauge_id': 'G2', 'severe_flood_warning': 3.0}])
+    aggregator.update_many(['G2'] * len(times), times.view(np.int64), levels)
+
+    above = levels > 3.0
+    starts = times[above & ~np.concatenate([[False], above[:-1]])].view(np.int64)
+    cutoff = times[-1].view(np.int64) - aggregator._window_ns
+    stats = aggregator.sensor_stats('G2')
+    assert stats['frequency_exceed_level3'] == int(np.sum(starts > cutoff))
+    assert stats['historical_high_level'] == levels.max()
+
+
+def test_day_first_dates_are_read_and_written_day_first():
+    gauge = dict(GAUGE, historical_high_date='31/12/2022', last_date_level_exceed_level3='05/02/2023')
+    aggregator = SensorStatsAggregator.from_gauge_mappings([gauge])
+    aggregator.update('G1', '13/03/2024', 1.5)
+    record, = aggregator.updated_records()
+    assert record['historical_high_date'] == '31/12/2022'
+    assert record['last_date_level_exceed_level3'] == '05/02/2023'
+    # The seed dates from 5 February 2023, so it expires 5 years later, not in May
+    assert aggregator.sensor_stats('G1', as_of='2028-02-01')['frequency_exceed_level3'] == 3
+    assert aggregator.sensor_stats('G1', as_of='2028-02-10')['frequency_exceed_level3'] == 0
+
+    aggregator.update_many(['G1'] * 2, ['14/03/2024', '20/03/2024'], [4.5, 1.0])
+    assert aggregator.sensor_stats('G1')['historical_high_date'] == '14/03/2024'
+    assert aggregator.sensor_stats('G1')['last_date_level_exceed_level3'] == '14/03/2024'
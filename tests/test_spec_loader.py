@@ -0,0 +1,109 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+"""Tests for the CDM specification CSV loader and its on-disk cache."""
+
+import os
+import shutil
+
+import pytest
+
+from python import spec_loader
+from python.flood_gauge_cdm import FloodGaugeCDM
+from python.mortgage_cdm import MortgageCDM
+from python.schema_registry import thaw_schema
+from python.spec_loader import compile_spec, load_spec_schema, parse_menu_options, spec_digest
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+FLOOD_GAUGE_SPEC = os.path.join(ROOT, "hazard", "Flood_Gauge_CDM v1.csv")
+MORTGAGE_SPEC = os.path.join(ROOT, "mortgage", "Mortgage_CDM v5.csv")
+
+
+def leaves(node, path=()):
+    """Yield (path, definition) of every field of a nested schema."""
+    for key, value in node.items():
+        if isinstance(value, dict) and isinstance(value.get("type"), str):
+            yield path + (key,), value
+        elif isinstance(value, dict):
+            yield from leaves(value, path + (key,))
+
+
+def test_flood_gauge_spec_matches_hand_written_schema():
+    spec = dict(leaves(load_spec_schema(FLOOD_GAUGE_SPEC, use_cache=False)))
+    schema = dict(leaves(thaw_schema(FloodGaugeCDM().schema)))
+    # The hand-written schema extends the v1 spec (FloodStage, elevation) without changing its fields
+    assert len(spec) == 21
+    assert {path: schema.get(path) for path in spec} == spec
+
+
+def test_mortgage_spec_matches_hand_written_schema():
+    spec = dict(leaves(load_spec_schema(MORTGAGE_SPEC, use_cache=False)))
+    schema = dict(leaves(thaw_schema(MortgageCDM().schema)))
+    # The spec misspells DaysInArrears
+    assert ("Mortgage", "Default", "DaysInArears") in spec
+    spec.pop(("Mortgage", "Default", "DaysInArears"))
+    assert set(spec) <= set(schema)
+    for path, definition in spec.items():
+        assert definition["type"] == schema[path]["type"], path
+        if definition["type"] == "menu":
+            assert definition["options"] == schema[path]["options"], path
+
+
+def test_parse_menu_options():
+    assert parse_menu_options("{SensorGauge, Satellite, WeatherStation}") == ["SensorGauge", "Satellite",
+                                                                             "WeatherStation"]
+    assert parse_menu_options("") == []
+
+
+def test_cache_is_reused_and_invalidated_by_edits(tmp_path, monkeypatch):
+    spec_path = str(tmp_path / "Flood_Gauge_CDM v1.csv")
+    shutil.copy(FLOOD_GAUGE_SPEC, spec_path)
+    cache_dir = str(tmp_path / "cache")
+    schema = load_spec_schema(spec_path, cache_dir=cache_dir)
+    with open(spec_path, "rb") as f:
+        assert os.listdir(cache_dir) == [f"{spec_digest(f.read())}.json"]
+
+    # A warm start reads the cache without parsing the CSV
+    def no_parse(text):
+        raise AssertionError("spec parsed despite a cache entry")
+    monkeypatch.setattr(spec_loader, "parse_spec_text", no_parse)
+    assert load_spec_schema(spec_path, cache_dir=cache_dir) == schema
+    compiled = compile_spec(spec_path, cache_dir=cache_dir)
+    monkeypatch.undo()
+
+    with open(spec_path, "a", encoding="utf-8") as f:
+        f.write("\n,,,Comment,text,Free text comment,,,,,,,,,,\n")
+    edited = load_spec_schema(spec_path, cache_dir=cache_dir)
+    assert edited["FloodGauge"]["SensorDetails"]["Measurements"]["Comment"]["type"] == "text"
+    assert len(os.listdir(cache_dir)) == 2
+    edited_compiled = compile_spec(spec_path, cache_dir=cache_dir)
+    assert edited_compiled is not compiled
+    assert "FloodGauge.SensorDetails.Measurements.Comment" in edited_compiled.fields
+    assert "FloodGauge.SensorDetails.Measurements.Comment" not in compiled.fields
+
+
+def test_unreadable_cache_entry_is_reparsed(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    schema = load_spec_schema(FLOOD_GAUGE_SPEC, cache_dir=cache_dir)
+    entry, = os.listdir(cache_dir)
+    with open(os.path.join(cache_dir, entry), "w", encoding="utf-8") as f:
+        f.write("{truncated")
+    assert load_spec_schema(FLOOD_GAUGE_SPEC, cache_dir=cache_dir) == schema
+
+
+def test_non_spec_file_is_rejected():
+    with pytest.raises(ValueError):
+        load_spec_schema(os.path.join(ROOT, "property", "riskassessment.csv"), use_cache=False)
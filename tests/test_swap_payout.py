@@ -0,0 +1,69 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+
+import numpy as np
+
+from python.swap_payout import BasketPayoutEngine
+
+
+def naive_payouts(levels, severe, basket_gauges, basket_payouts):
+    """Per-scenario, per-swap loop over the basket slots."""
+    return np.array([[sum(payout for gauge, payout in zip(gauges, payouts) if gauge >= 0 and row[gauge] >= severe[gauge])
+                      for gauges, payouts in zip(basket_gauges, basket_payouts)] for row in levels])
+
+
+def test_payouts_match_naive_loop():
+    rng = np.random.default_rng(3)
+    n_gauges, n_swaps = 40, 25
+    severe = rng.uniform(2.0, 4.0, n_gauges)
+    severe[5] = np.nan
+    basket_gauges = np.stack([rng.choice(n_gauges, 6, replace=False) for _ in range(n_swaps)])
+    basket_gauges[::4, -1] = -1
+    basket_payouts = rng.uniform(1e4, 1e6, basket_gauges.shape)
+    gauge_sets = [f"GS{i % 3}" if i % 5 else None for i in range(n_swaps)]
+    engine = BasketPayoutEngine([f"G{i}" for i in range(n_gauges)], severe, basket_gauges, basket_payouts,
+                                gauge_sets, chunk_size=16)
+    levels = severe * rng.lognormal(-0.2, 0.3, (50, n_gauges))
+    levels[:, 5] = 10.0
+
+    expected = naive_payouts(levels, np.nan_to_num(severe, nan=np.inf), basket_gauges, basket_payouts)
+    payouts = engine.payouts(levels)
+    assert payouts.dtype == np.float64
+    np.testing.assert_allclose(payouts, expected, rtol=1e-12)
+
+    stats = engine.payout_statistics(levels)
+    np.testing.assert_allclose(stats['expected_payout'], expected.mean(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(stats['max_payout'], expected.max(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(stats['payout_probability'], (expected > 0).mean(axis=0))
+
+
+def test_trigger_level_compared_in_float64():
+    engine = BasketPayoutEngine(["G1"], [2.1], [[0]], [[1.0]])
+    levels = np.array([[2.1], [np.nextafter(2.1, 0.0)], [np.nextafter(2.1, 3.0)]])
+    assert engine.payouts(levels)[:, 0].tolist() == [1.0, 0.0, 1.0]
+
+
+def test_large_basket_totals_keep_precision():
+    payouts = np.full((1, 8), 123_456_789.01)
+    engine = BasketPayoutEngine([f"G{i}" for i in range(8)], np.zeros(8), np.arange(8)[None, :], payouts)
+    assert engine.payouts(np.ones((1, 8)))[0, 0] == payouts.sum()
+    assert engine.payout_statistics(np.ones((1, 8)))['max_payout'][0] == payouts.sum()
+
+
+def test_float32_is_opt_in():
+    engine = BasketPayoutEngine(["G1"], [2.0], [[0]], [[5.0]], dtype=np.float32)
+    assert engine.payouts(np.array([[3.0]])).dtype == np.float32
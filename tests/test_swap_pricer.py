@@ -0,0 +1,86 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+"""Tests for the physical risk swap Monte Carlo pricer."""
+
+import numpy as np
+import pytest
+
+from python.benchmarks.bench_swap_pricer import make_swap
+from python.swap_pricer import SwapMonteCarloPricer
+
+
+def naive_legs(pricer, latent):
+    """Walk every path period by period, paying each gauge on its first exceedance."""
+    contingent, fixed = [], []
+    for path in latent:
+        paid = np.zeros(len(pricer.payouts), dtype=bool)
+        outstanding, path_contingent, path_fixed = pricer.notional, 0.0, 0.0
+        for t, draws in enumerate(path):
+            loss = 0.0
+            for k, draw in enumerate(draws):
+                if not paid[k] and draw < np.float32(pricer.thresholds[t, k]):
+                    paid[k] = True
+                    loss += pricer.payouts[k]
+            start, outstanding = outstanding, max(outstanding - loss, 0.0)
+            path_contingent += (start - outstanding) * pricer.payout_discount[t]
+            accruing = 0.5 * (start + outstanding) if pricer.settles_accrual else outstanding
+            path_fixed += pricer.fixed_rate * accruing * pricer.accrual[t] * pricer.fixed_discount[t]
+        contingent.append(path_contingent)
+        fixed.append(path_fixed)
+    return np.array(contingent), np.array(fixed)
+
+
+def test_simulate_matches_naive_loop():
+    swap, gauges = make_swap(6)
+    # A notional below the basket total exercises the cap
+    swap['notional'] = 450_000
+    pricer = SwapMonteCarloPricer(swap, gauges, discount_rate=0.04, annual_rates={"GAUGE-0000": 0.8})
+    contingent, fixed = pricer.simulate(500, np.random.default_rng(5))
+
+    n_periods, n_gauges = pricer.thresholds.shape
+    latent = (np.random.default_rng(5).standard_normal((500, n_periods, n_gauges), dtype=np.float32)
+              @ pricer.loading.T.astype(np.float32))
+    expected_contingent, expected_fixed = naive_legs(pricer, latent)
+    assert expected_contingent.max() > 0.0
+    np.testing.assert_allclose(contingent, expected_contingent, rtol=1e-9, atol=1e-6)
+    np.testing.assert_allclose(fixed, expected_fixed, rtol=1e-9)
+
+
+def test_uncorrelated_contingent_leg_matches_poisson_expectation():
+    swap, gauges = make_swap(4)
+    # Without discounting or a fixed leg each gauge pays with probability 1 - exp(-rate * years)
+    swap['fixed_leg_rate'] = 0.0
+    rates = {f"GAUGE-{i:04d}": rate for i, rate in enumerate([0.05, 0.1, 0.2, 0.4])}
+    pricer = SwapMonteCarloPricer(swap, gauges, correlation_length_km=1e-9, annual_rates=rates)
+    years = (np.datetime64("2029-12-19") - np.datetime64("2024-12-19")).astype(int) / 365.0
+    expected = float(pricer.payouts @ (1.0 - np.exp(-np.array(list(rates.values())) * years)))
+
+    result = pricer.price(200_000, seed=3, max_workers=1)
+    assert abs(result['contingent_leg'] - expected) < 4 * result['std_error']
+    assert result['pv'] == result['contingent_leg']
+    assert pricer.price(200_000, seed=3, max_workers=1)['pv'] == result['pv']
+
+
+def test_text_flags_are_parsed_explicitly():
+    swap, gauges = make_swap(2)
+    flags = {'payer': "false", 'settles_accrual': "N", 'pays_at_default_time': "Y"}
+    pricer = SwapMonteCarloPricer(dict(swap, **flags), gauges)
+    assert pricer.sign == -1.0
+    assert not pricer.settles_accrual and pricer.pays_at_default_time
+    assert SwapMonteCarloPricer(dict(swap, payer="true"), gauges).sign == 1.0
+    with pytest.raises(ValueError):
+        SwapMonteCarloPricer(dict(swap, payer="maybe"), gauges)
@@ -0,0 +1,45 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the business-day schedule engine."""
+
+import pytest
+
+from python.swap_schedule import ScheduleEngine
+
+SWAP = {'start_date': '2024-02-29', 'end_date': '2024-08-29', 'tenor': '1M', 'calendar': 'WeekendsOnly',
+        'convention': 'U', 'term_convention': 'U', 'rule': 'Forward', 'day_counter': 'A360'}
+
+
+def accrual_ends(end_of_month):
+    periods = ScheduleEngine().schedules([dict(SWAP, end_of_month=end_of_month)])
+    return periods['accrual_end'].dt.strftime('%m-%d').tolist()
+
+
+@pytest.mark.parametrize("flag", ["false", "N", "0", "no", 0, False, None, ""])
+def test_end_of_month_false_flags(flag):
+    assert accrual_ends(flag) == accrual_ends(False)
+    assert accrual_ends(False)[:2] == ['03-29', '04-29']
+
+
+@pytest.mark.parametrize("flag", ["true", "Y", "1", "yes", 1, True])
+def test_end_of_month_true_flags(flag):
+    assert accrual_ends(flag) == accrual_ends(True)
+    assert accrual_ends(True)[:2] == ['03-31', '04-30']
+
+
+def test_end_of_month_invalid_flag_raises():
+    with pytest.raises(ValueError):
+        accrual_ends("sometimes")
@@ -0,0 +1,49 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the TC event timeseries CDM frames."""
+
+import numpy as np
+import pytest
+
+from python.tc_event_ts_cdm import TCEventTSCDM
+
+ENTRIES = [
+    {'event_id': 'AL01', 'time': '2024-08-01T00:00:00', 'lead_time': 0, 'lat': 25.123456789, 'lon': -70.5},
+    {'event_id': 'AL01', 'time': '2024-08-01T06:00:00', 'lead_time': 6, 'lat': 25.5, 'lon': -71.0},
+    {'event_id': 'AL02', 'time': '2024-08-02T00:00:00', 'lat': 30.0, 'lon': -60.0},
+]
+
+
+def test_typed_dataframe_matches_dataframe():
+    cdm = TCEventTSCDM()
+    typed = cdm.to_typed_dataframe(ENTRIES)
+    plain = cdm.to_dataframe(ENTRIES)
+    assert typed['lead_time'].dtype == 'Int16'
+    assert typed['lead_time'].tolist()[:2] == [0, 6] and typed['lead_time'].isna().tolist() == [False, False, True]
+    np.testing.assert_array_equal(typed['lat'].to_numpy(), plain['lat'].to_numpy(dtype=np.float64))
+    assert typed['event_id'].astype(str).tolist() == ['AL01', 'AL01', 'AL02']
+
+
+@pytest.mark.parametrize("lead_time", [40000, -40000])
+def test_lead_time_outside_int16_raises(lead_time):
+    entries = [dict(ENTRIES[0], lead_time=lead_time)]
+    with pytest.raises(ValueError, match="int16"):
+        TCEventTSCDM().to_typed_dataframe(entries)
+
+
+def test_lead_time_at_int16_limits():
+    entries = [dict(ENTRIES[0], lead_time=32767), dict(ENTRIES[1], lead_time=-32768)]
+    assert TCEventTSCDM().to_typed_dataframe(entries)['lead_time'].tolist() == [32767, -32768]
@@ -0,0 +1,81 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the memory-mapped TC event timeseries cube store."""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from python.tc_event_ts_store import CUBE_FILE, INDEX_FILE, TCEventTSCubeStore
+
+TIMES = pd.date_range("2024-06-01", periods=500, freq="6h")
+
+
+def test_create_leaves_cube_unallocated(tmp_path):
+    path = str(tmp_path / "store")
+    store = TCEventTSCubeStore.create(path, [f"E{i}" for i in range(2000)], TIMES, variables=["t2m", "msl"])
+    store.flush()
+    stat = os.stat(os.path.join(path, CUBE_FILE))
+    assert stat.st_size > 7_000_000
+    assert stat.st_blocks * 512 < stat.st_size / 10
+    assert np.isnan(store.variable("t2m")).all()
+
+
+def test_unwritten_values_read_as_nan_after_reopen(tmp_path):
+    path = str(tmp_path / "store")
+    store = TCEventTSCubeStore.create(path, ["E0", "E1"], TIMES[:3], variables=["t2m", "msl"])
+    frame = pd.DataFrame({"event_id": ["E0", "E1"], "time": [TIMES[0], TIMES[2]], "t2m": [290.5, 288.0]})
+    assert store.write_frame(frame) == 2
+    store.flush()
+    del store
+
+    store = TCEventTSCubeStore.open(path)
+    np.testing.assert_array_equal(store.variable("t2m"), [[290.5, np.nan, np.nan], [np.nan, np.nan, 288.0]])
+    assert np.isnan(store.variable("msl")).all()
+    assert store.sel("t2m", event_id="E1", time=TIMES[2]) == 288.0
+    track = store.to_frame("E0")
+    assert track["t2m"].iloc[0] == 290.5 and track["msl"].isna().all()
+
+
+def test_version_1_stores_count_as_filled(tmp_path):
+    path = str(tmp_path / "store")
+    store = TCEventTSCubeStore.create(path, ["E0"], TIMES[:2], variables=["t2m"])
+    store.writable_variable("t2m")[...] = 1.0
+    store.flush()
+    with open(os.path.join(path, INDEX_FILE), encoding="utf-8") as f:
+        index = json.load(f)
+    index["format_version"] = 1
+    del index["filled_variables"]
+    with open(os.path.join(path, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    np.testing.assert_array_equal(TCEventTSCubeStore.open(path).variable("t2m"), [[1.0, 1.0]])
+
+
+def test_partial_entries_keep_stored_values_and_fill_lazily(tmp_path):
+    path = str(tmp_path / "store")
+    store = TCEventTSCubeStore.create(path, ["E0"], TIMES[:2])
+    time = TIMES[0].isoformat()
+    store.write_entries([{"event_id": "E0", "time": time, "t2m": 290.5, "msl": 101_000.0}])
+    store.write_entries([{"event_id": "E0", "time": time, "t2m": 291.0},
+                         {"event_id": "E0", "time": TIMES[1].isoformat(), "msl": 100_500.0}])
+    store.flush()
+
+    assert store.sel("t2m", event_id="E0", time=TIMES[0]) == 291.0
+    np.testing.assert_array_equal(store.variable("msl"), [[101_000.0, 100_500.0]])
+    with open(os.path.join(path, INDEX_FILE), encoding="utf-8") as f:
+        assert sorted(json.load(f)["filled_variables"]) == ["msl", "t2m"]
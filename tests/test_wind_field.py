@@ -0,0 +1,105 @@
+# Copyright (c) 2025 MKM Research Labs. All rights reserved.
+#
+# This software is provided under license by MKM Research Labs.
+# Use, reproduction, distribution, or modification of this code is subject to the
+# terms and conditions of the license agreement provided with this software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the vectorized basket payout engine."""
+"""Tests for the parametric tropical cyclone wind field."""
+
+import math
+
+import numpy as np
+import pytest
+
+from python.wind_field import OMEGA, HollandWindField, haversine_km
+
+
+def storm(lat=25.0, lon=-80.0, rmax_km=40.0, pc_pa=95000.0, heading_deg=0.0, speed_ms=0.0):
+    """Single-step track arrays."""
+    return {
+        "lat": np.array([lat]),
+        "lon": np.array([lon]),
+        "rmax_km": np.array([rmax_km]),
+        "pc_pa": np.array([pc_pa]),
+        "heading_deg": np.array([heading_deg]),
+        "speed_ms": np.array([speed_ms]),
+    }
+
+
+def reference_gust(field, r_km, lat, rmax_km, pc_pa):
+    """Scalar Holland (1980) gust for a stationary storm."""
+    dp = field.penv_pa - pc_pa
+    b = min(max(1.38 + 0.00184 * dp / 100.0 - 0.00309 * rmax_km, field.b_range[0]), field.b_range[1])
+    x = (rmax_km / r_km) ** b
+    half_rf = r_km * 1000.0 * OMEGA * abs(math.sin(math.radians(lat)))
+    v = math.sqrt(b / field.rho * dp * x * math.exp(-x) + half_rf ** 2) - half_rf
+    return v * field.surface_factor * field.gust_factor
+
+
+def points_east(lat, lon, distances_km):
+    """Points on the storm's latitude at roughly the given distances to the east."""
+    dlon = np.degrees(np.asarray(distances_km) / (6371.0088 * math.cos(math.radians(lat))))
+    return np.full(len(dlon), lat), lon + dlon
+
+
+def test_gust_at_rmax_matches_scalar_reference():
+    field = HollandWindField()
+    track = storm()
+    lat, lon = points_east(25.0, -80.0, [40.0, 15.0, 120.0])
+    gusts = field.gusts(lat, lon, track)[:, 0]
+    r_km = haversine_km(25.0, -80.0, lat, lon)
+    expected = [reference_gust(field, r, 25.0, 40.0, 95000.0) for r in r_km]
+    assert gusts == pytest.approx(expected, rel=1e-5)
+
+
+def test_gust_peaks_near_rmax_and_decays_outside():
+    field = HollandWindField()
+    lat, lon = points_east(25.0, -80.0, [40.0, 60.0, 100.0, 200.0, 400.0])
+    gusts = field.gusts(lat, lon, storm())[:, 0]
+    assert np.all(np.diff(gusts) < 0)
+    inner_lat, inner_lon = points_east(25.0, -80.0, [5.0])
+    assert field.gusts(inner_lat, inner_lon, storm())[0, 0] < gusts[0]
+
+
+@pytest.mark.parametrize("lat, stronger", [(25.0, "east"), (-25.0, "west")])
+def test_translation_adds_wind_on_the_right_of_track(lat, stronger):
+    # Heading north, the right of track is east in the northern hemisphere;
+    # in the southern hemisphere the stronger side is the left (west)
+    field = HollandWindField()
+    east_lat, east_lon = points_east(lat, -80.0, [60.0])
+    west_lon = -80.0 - (east_lon - -80.0)
+    prop_lat = np.concatenate([east_lat, east_lat])
+    prop_lon = np.concatenate([east_lon, west_lon])
+    still = field.gusts(prop_lat, prop_lon, storm(lat=lat))[:, 0]
+    moving = field.gusts(prop_lat, prop_lon, storm(lat=lat, speed_ms=10.0))[:, 0]
+    assert still[0] == pytest.approx(still[1], rel=1e-6)
+    boost = field.asymmetry * 10.0 * field.surface_factor * field.gust_factor
+    sign = 1.0 if stronger == "east" else -1.0
+    assert moving - still == pytest.approx([sign * boost, -sign * boost], rel=1e-3)
+
+
+def test_chunked_peaks_match_full_grid():
+    rng = np.random.default_rng(3)
+    track = {
+        "lat": np.linspace(22.0, 28.0, 12),
+        "lon": np.linspace(-78.0, -82.0, 12),
+        "rmax_km": np.full(12, 35.0),
+        "pc_pa": np.linspace(97000.0, 94000.0, 12),
+        "heading_deg": np.full(12, 330.0),
+        "speed_ms": np.full(12, 6.0),
+    }
+    prop_lat, prop_lon = rng.uniform(21.0, 29.0, 500), rng.uniform(-83.0, -77.0, 500)
+    full = HollandWindField().gusts(prop_lat, prop_lon, track)
+    peak, step = HollandWindField(max_cells=100).peak_gusts(prop_lat, prop_lon, track)
+    assert np.array_equal(peak, full.max(axis=1))
+    assert np.array_equal(step, full.argmax(axis=1))